@@ -4,10 +4,21 @@ This module provides the core aggregation engine for token-audit, enabling:
 - Daily, weekly, and monthly token/cost aggregations
 - Model-level breakdowns per time period
 - Project-level grouping for multi-project analysis
+- Tool call tables across sessions (build_call_table(), see call_table.py)
+- MCP calls per server over a date range (server_call_counts())
 
 All cost values use microdollars (int) to avoid float precision issues:
     1 microdollar = 1/1,000,000 USD
 
+Daily aggregates are backed by persistent rollups, one file per platform
+and day (``<platform>/.rollups/<YYYY-MM-DD>.json``). A rollup keeps each
+session's totals, breakdowns and MCP calls per server with the size and
+mtime of its session file, so only sessions that are new or changed since
+the last query are loaded; weekly and monthly aggregates and per-server
+call counts merge the daily rollups. Set
+``TOKEN_AUDIT_ROLLUPS=off`` to always load every session. Sessions that do
+need loading are loaded across worker processes (see session_loader.py).
+
 Example:
     >>> from token_audit.aggregation import aggregate_daily
     >>> results = aggregate_daily(platform="claude_code", start_date=date(2025, 1, 1))
@@ -15,14 +26,20 @@ Example:
     ...     print(f"{day.date}: {day.cost_usd:.4f} USD")
 """
 
+import contextlib
+import os
 from dataclasses import dataclass, field
 from datetime import date, timedelta
 from decimal import Decimal
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
+from token_audit import json_codec
+from token_audit.archive import member_stat, split_archive_path
+from token_audit.session_summary import write_sidecar
+
 if TYPE_CHECKING:
-    from token_audit.session_manager import SessionManager
+    from token_audit.call_table import CallTable
     from token_audit.storage import Platform, StorageManager
 
 __all__ = [
@@ -34,12 +51,20 @@ __all__ = [
     "aggregate_daily",
     "aggregate_weekly",
     "aggregate_monthly",
+    "build_call_table",
+    "server_call_counts",
 ]
 
 
 # Microdollar conversion constant
 MICROS_PER_DOLLAR = Decimal(1_000_000)
 
+ROLLUP_ENV_VAR = "TOKEN_AUDIT_ROLLUPS"
+ROLLUP_DIR_NAME = ".rollups"
+
+# Bump when the rollup layout changes; older rollups are then rebuilt
+ROLLUP_VERSION = 2
+
 
 @dataclass
 class AggregateModelUsage:
@@ -434,6 +459,7 @@ def aggregate_daily(
     end_date: Optional[date] = None,
     group_by_project: bool = False,
     storage: Optional["StorageManager"] = None,
+    jobs: Optional[int] = None,
 ) -> List[DailyAggregate]:
     """Aggregate sessions by day.
 
@@ -446,6 +472,8 @@ def aggregate_daily(
         end_date: End of date range (None = today)
         group_by_project: Include project_breakdowns in results
         storage: StorageManager instance (None = create default)
+        jobs: Worker processes for loading sessions missing from the rollups
+            (default: CPU count; 1 loads them in-process)
 
     Returns:
         List of DailyAggregate sorted by date ascending.
@@ -456,13 +484,93 @@ def aggregate_daily(
         >>> for day in results:
         ...     print(f"{day.date}: {day.total_tokens} tokens, ${day.cost_usd:.4f}")
     """
-    from token_audit.session_manager import SessionManager
     from token_audit.storage import StorageManager as SM
 
     # Initialize storage manager
     storage_mgr: SM = storage if storage is not None else SM()
 
-    session_manager = SessionManager()
+    # Build aggregates
+    results: List[DailyAggregate] = []
+
+    for date_str, plat, entries in _daily_rollups(
+        storage_mgr, platform, start_date, end_date, jobs
+    ):
+        aggregate = _build_daily_aggregate(
+            date_str=date_str,
+            platform=plat,
+            entries=entries,
+            group_by_project=group_by_project,
+        )
+        if aggregate:
+            results.append(aggregate)
+
+    # Sort by date ascending
+    results.sort(key=lambda x: x.date)
+
+    return results
+
+
+def server_call_counts(
+    platform: Optional["Platform"] = None,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    storage: Optional["StorageManager"] = None,
+    jobs: Optional[int] = None,
+) -> Dict[str, int]:
+    """Count MCP tool calls per server over a date range.
+
+    Reads the daily rollups of the days in range, like aggregate_daily(), so
+    only sessions that are new or changed since the last query are loaded.
+
+    Args:
+        platform: Filter by platform (None = all platforms)
+        start_date: Start of date range (None = earliest session)
+        end_date: End of date range (None = today)
+        storage: StorageManager instance (None = create default)
+        jobs: Worker processes for loading sessions missing from the rollups
+            (default: CPU count; 1 loads them in-process)
+
+    Returns:
+        Dict mapping server names to call counts (the "builtin" pseudo-server
+        is not counted)
+    """
+    from token_audit.storage import StorageManager as SM
+
+    storage_mgr: SM = storage if storage is not None else SM()
+
+    counts: Dict[str, int] = {}
+    for _, _, entries in _daily_rollups(storage_mgr, platform, start_date, end_date, jobs):
+        for entry in entries.values():
+            for server, calls in entry["server_calls"].items():
+                counts[server] = counts.get(server, 0) + calls
+    return counts
+
+
+def _daily_rollups(
+    storage_mgr: "StorageManager",
+    platform: Optional["Platform"],
+    start_date: Optional[date],
+    end_date: Optional[date],
+    jobs: Optional[int],
+) -> List[tuple[str, "Platform", Dict[str, Dict[str, Any]]]]:
+    """Per-session rollup entries of each day with sessions in range.
+
+    Entries of sessions whose file is new or changed since the day's rollup
+    was written are rebuilt by loading the session, and the rollup file is
+    updated.
+
+    Args:
+        storage_mgr: Storage to query
+        platform: Filter by platform (None = all platforms)
+        start_date: Start of date range (None = earliest session)
+        end_date: End of date range (None = today)
+        jobs: Worker processes for loading sessions missing from the rollups
+
+    Returns:
+        (date_str, platform, entries) per day, where entries map session file
+        names to their rollup entry
+    """
+    from token_audit.session_loader import load_sessions
 
     # Determine platforms to query
     platforms_to_query = [platform] if platform else storage_mgr.list_platforms()
@@ -483,7 +591,7 @@ def aggregate_daily(
 
     # Collect sessions grouped by (date, platform)
     # Key: (date_str, platform) -> List of session paths
-    sessions_by_day: Dict[tuple[str, str], List[Path]] = {}
+    sessions_by_day: Dict[tuple[str, Platform], List[Path]] = {}
 
     for p in platforms_to_query:
         session_indexes = storage_mgr.list_sessions_in_range(p, actual_start_date, actual_end_date)
@@ -498,22 +606,60 @@ def aggregate_daily(
     if not sessions_by_day:
         return []
 
-    # Build aggregates
-    results: List[DailyAggregate] = []
+    # Rollup entries and file stats per day; sessions without a current
+    # entry are loaded together below, so they can be spread across workers
+    use_rollups = rollups_enabled()
+    days: List[
+        tuple[str, Platform, Optional[Path], Dict[str, Dict[str, Any]], Dict[Path, os.stat_result]]
+    ] = []
+    stale: List[Path] = []
 
     for (date_str, plat), session_paths in sessions_by_day.items():
-        aggregate = _build_daily_aggregate(
-            date_str=date_str,
-            platform=plat,
-            session_paths=session_paths,
-            session_manager=session_manager,
-            group_by_project=group_by_project,
-        )
-        if aggregate:
-            results.append(aggregate)
+        rollup_path = None
+        if use_rollups:
+            rollup_path = storage_mgr.get_platform_dir(plat) / ROLLUP_DIR_NAME / f"{date_str}.json"
+        cached = _load_rollup(rollup_path) if rollup_path is not None else {}
+        stats: Dict[Path, os.stat_result] = {}
+        for session_path in session_paths:
+            stat = _session_file_stat(session_path)
+            if stat is None:
+                continue
+            stats[session_path] = stat
+            entry = cached.get(session_path.name)
+            if entry is None or (entry["size"], entry["mtime_ns"]) != (
+                stat.st_size,
+                stat.st_mtime_ns,
+            ):
+                stale.append(session_path)
+        days.append((date_str, plat, rollup_path, cached, stats))
+
+    loaded = dict(
+        zip(stale, load_sessions(stale, _session_rollup_entry, storage_mgr.base_dir, jobs=jobs))
+    )
 
-    # Sort by date ascending
-    results.sort(key=lambda x: x.date)
+    results: List[tuple[str, Platform, Dict[str, Dict[str, Any]]]] = []
+
+    for date_str, plat, rollup_path, cached, stats in days:
+        entries: Dict[str, Dict[str, Any]] = {}
+
+        for session_path, stat in stats.items():
+            if session_path in loaded:
+                entries[session_path.name] = {
+                    "size": stat.st_size,
+                    "mtime_ns": stat.st_mtime_ns,
+                    # None records a file that isn't a loadable session
+                    **(loaded[session_path] or {"aggregate": None, "server_calls": {}}),
+                }
+            elif session_path.name in cached:
+                entries[session_path.name] = cached[session_path.name]
+
+        if rollup_path is not None and entries != cached:
+            rollup = {"version": ROLLUP_VERSION, "platform": plat, "date": date_str}
+            # On read-only storage, load the sessions again next time
+            with contextlib.suppress(OSError):
+                write_sidecar(rollup_path, {**rollup, "sessions": entries})
+
+        results.append((date_str, plat, entries))
 
     return results
 
@@ -521,103 +667,146 @@ def aggregate_daily(
 def _build_daily_aggregate(
     date_str: str,
     platform: str,
-    session_paths: List[Path],
-    session_manager: "SessionManager",
+    entries: Dict[str, Dict[str, Any]],
     group_by_project: bool,
 ) -> Optional[DailyAggregate]:
-    """Build a DailyAggregate from a list of session paths.
+    """Build a DailyAggregate from a day's rollup entries.
 
     Args:
         date_str: Date string (YYYY-MM-DD)
         platform: Platform identifier
-        session_paths: List of session file paths
-        session_manager: SessionManager for loading sessions
+        entries: Rollup entries of the day's session files (see _daily_rollups())
         group_by_project: Whether to include project breakdowns
 
     Returns:
         DailyAggregate with aggregated metrics, or None if no valid sessions
     """
-    # Initialize accumulators
-    total_input = 0
-    total_output = 0
-    total_cache_created = 0
-    total_cache_read = 0
-    total_tokens = 0
-    total_cost_micros = 0
-    session_count = 0
-    model_breakdowns: Dict[str, AggregateModelUsage] = {}
-    project_breakdowns: Optional[Dict[str, ProjectAggregate]] = {} if group_by_project else None
-
-    for session_path in session_paths:
-        if not session_path.exists():
-            continue
-
-        session = session_manager.load_session(session_path)
-        if session is None:
-            continue
-
-        session_count += 1
-
-        # Aggregate token usage
-        if session.token_usage:
-            total_input += session.token_usage.input_tokens
-            total_output += session.token_usage.output_tokens
-            total_cache_created += session.token_usage.cache_created_tokens
-            total_cache_read += session.token_usage.cache_read_tokens
-            total_tokens += session.token_usage.total_tokens
-
-        # Convert cost to microdollars
-        cost_micros = int(session.cost_estimate * 1_000_000)
-        total_cost_micros += cost_micros
-
-        # Aggregate model usage
-        for model_name, model_usage in session.model_usage.items():
-            if model_name not in model_breakdowns:
-                model_breakdowns[model_name] = AggregateModelUsage(model=model_name)
-
-            breakdown = model_breakdowns[model_name]
-            breakdown.input_tokens += model_usage.input_tokens
-            breakdown.output_tokens += model_usage.output_tokens
-            breakdown.cache_created_tokens += model_usage.cache_created_tokens
-            breakdown.cache_read_tokens += model_usage.cache_read_tokens
-            breakdown.total_tokens += model_usage.total_tokens
-            breakdown.cost_micros += int(model_usage.cost_usd * 1_000_000)
-            breakdown.call_count += model_usage.call_count
-
-        # Aggregate project usage (if enabled)
-        if group_by_project and project_breakdowns is not None:
-            project_path = session.working_directory or "unknown"
-            if project_path not in project_breakdowns:
-                project_breakdowns[project_path] = ProjectAggregate(project_path=project_path)
-
-            proj = project_breakdowns[project_path]
-            proj.session_count += 1
-            if session.token_usage:
-                proj.input_tokens += session.token_usage.input_tokens
-                proj.output_tokens += session.token_usage.output_tokens
-                proj.cache_created_tokens += session.token_usage.cache_created_tokens
-                proj.cache_read_tokens += session.token_usage.cache_read_tokens
-                proj.total_tokens += session.token_usage.total_tokens
-            proj.cost_micros += cost_micros
-
-    if session_count == 0:
+    sessions = [
+        DailyAggregate.from_dict(entry["aggregate"])
+        for entry in entries.values()
+        if entry["aggregate"] is not None
+    ]
+    if not sessions:
         return None
 
     return DailyAggregate(
         date=date_str,
         platform=platform,
-        input_tokens=total_input,
-        output_tokens=total_output,
-        cache_created_tokens=total_cache_created,
-        cache_read_tokens=total_cache_read,
-        total_tokens=total_tokens,
-        cost_micros=total_cost_micros,
-        session_count=session_count,
+        input_tokens=sum(s.input_tokens for s in sessions),
+        output_tokens=sum(s.output_tokens for s in sessions),
+        cache_created_tokens=sum(s.cache_created_tokens for s in sessions),
+        cache_read_tokens=sum(s.cache_read_tokens for s in sessions),
+        total_tokens=sum(s.total_tokens for s in sessions),
+        cost_micros=sum(s.cost_micros for s in sessions),
+        session_count=len(sessions),
+        model_breakdowns=_merge_model_breakdowns([s.model_breakdowns for s in sessions]),
+        project_breakdowns=(
+            _merge_project_breakdowns([s.project_breakdowns for s in sessions])
+            if group_by_project
+            else None
+        ),
+    )
+
+
+def _session_rollup_entry(session: Any) -> Dict[str, Any]:
+    """Summarizer for load_sessions(): what a session contributes to its day's rollup.
+
+    The one-session aggregate (as a dict) and MCP calls per server.
+    """
+    return {
+        "aggregate": _session_aggregate_dict(session),
+        "server_calls": {
+            name: server_session.total_calls
+            for name, server_session in session.server_sessions.items()
+            if name != "builtin" and server_session.total_calls
+        },
+    }
+
+
+def _session_aggregate_dict(session: Any) -> Dict[str, Any]:
+    """Summarizer for load_sessions(): the session's one-session aggregate as a dict.
+
+    Date and platform are left to the day it's merged into.
+    """
+    return _session_aggregate(session, "", session.platform).to_dict()
+
+
+def _session_aggregate(session: Any, date_str: str, platform: str) -> DailyAggregate:
+    """A single session's totals and breakdowns, as a one-session DailyAggregate."""
+    usage = session.token_usage
+    # Convert cost to microdollars
+    cost_micros = int(session.cost_estimate * 1_000_000)
+
+    model_breakdowns: Dict[str, AggregateModelUsage] = {}
+    for model_name, model_usage in session.model_usage.items():
+        model_breakdowns[model_name] = AggregateModelUsage(
+            model=model_name,
+            input_tokens=model_usage.input_tokens,
+            output_tokens=model_usage.output_tokens,
+            cache_created_tokens=model_usage.cache_created_tokens,
+            cache_read_tokens=model_usage.cache_read_tokens,
+            total_tokens=model_usage.total_tokens,
+            cost_micros=int(model_usage.cost_usd * 1_000_000),
+            call_count=model_usage.call_count,
+        )
+
+    project_path = session.working_directory or "unknown"
+    project = ProjectAggregate(project_path=project_path, cost_micros=cost_micros, session_count=1)
+    if usage:
+        project.input_tokens = usage.input_tokens
+        project.output_tokens = usage.output_tokens
+        project.cache_created_tokens = usage.cache_created_tokens
+        project.cache_read_tokens = usage.cache_read_tokens
+        project.total_tokens = usage.total_tokens
+
+    return DailyAggregate(
+        date=date_str,
+        platform=platform,
+        input_tokens=project.input_tokens,
+        output_tokens=project.output_tokens,
+        cache_created_tokens=project.cache_created_tokens,
+        cache_read_tokens=project.cache_read_tokens,
+        total_tokens=project.total_tokens,
+        cost_micros=cost_micros,
+        session_count=1,
         model_breakdowns=model_breakdowns,
-        project_breakdowns=project_breakdowns,
+        project_breakdowns={project_path: project},
     )
 
 
+# =============================================================================
+# Daily Rollups
+# =============================================================================
+
+
+def rollups_enabled() -> bool:
+    """Whether daily aggregates use rollups (``TOKEN_AUDIT_ROLLUPS`` is not ``off``)."""
+    return os.environ.get(ROLLUP_ENV_VAR, "").lower() != "off"
+
+
+def _load_rollup(rollup_path: Path) -> Dict[str, Dict[str, Any]]:
+    """Per-session entries of a rollup file (empty if missing, unreadable or outdated)."""
+    try:
+        with open(rollup_path, "rb") as f:
+            rollup = json_codec.load(f)
+        if rollup.get("version") != ROLLUP_VERSION:
+            return {}
+        sessions: Dict[str, Dict[str, Any]] = rollup["sessions"]
+        return sessions
+    except (OSError, ValueError, TypeError, KeyError, AttributeError):
+        return {}
+
+
+def _session_file_stat(session_path: Path) -> Optional[os.stat_result]:
+    """Stat of a session file, or of an archived one as it was archived (None if missing)."""
+    try:
+        if split_archive_path(session_path) is not None:
+            return member_stat(session_path)
+        return session_path.stat()
+    except OSError:
+        return None
+
+
 # =============================================================================
 # Helper Functions for Weekly/Monthly Aggregation
 # =============================================================================
@@ -740,6 +929,7 @@ def aggregate_weekly(
     start_of_week: int = 0,
     group_by_project: bool = False,
     storage: Optional["StorageManager"] = None,
+    jobs: Optional[int] = None,
 ) -> List[WeeklyAggregate]:
     """Aggregate sessions by week.
 
@@ -752,6 +942,8 @@ def aggregate_weekly(
         start_of_week: Day to use as week start (0=Monday/ISO 8601, 6=Sunday)
         group_by_project: Include project_breakdowns in results
         storage: StorageManager instance (None = create default)
+        jobs: Worker processes for loading sessions missing from the rollups
+            (default: CPU count; 1 loads them in-process)
 
     Returns:
         List of WeeklyAggregate sorted by week_start ascending.
@@ -769,6 +961,7 @@ def aggregate_weekly(
         end_date=end_date,
         group_by_project=group_by_project,
         storage=storage,
+        jobs=jobs,
     )
 
     if not daily_results:
@@ -838,6 +1031,7 @@ def aggregate_monthly(
     end_date: Optional[date] = None,
     group_by_project: bool = False,
     storage: Optional["StorageManager"] = None,
+    jobs: Optional[int] = None,
 ) -> List[MonthlyAggregate]:
     """Aggregate sessions by month.
 
@@ -849,6 +1043,8 @@ def aggregate_monthly(
         end_date: End of date range (None = today)
         group_by_project: Include project_breakdowns in results
         storage: StorageManager instance (None = create default)
+        jobs: Worker processes for loading sessions missing from the rollups
+            (default: CPU count; 1 loads them in-process)
 
     Returns:
         List of MonthlyAggregate sorted by (year, month) ascending.
@@ -866,6 +1062,7 @@ def aggregate_monthly(
         end_date=end_date,
         group_by_project=group_by_project,
         storage=storage,
+        jobs=jobs,
     )
 
     if not daily_results:
@@ -921,3 +1118,68 @@ def aggregate_monthly(
     results.sort(key=lambda x: (x.year, x.month))
 
     return results
+
+
+# =============================================================================
+# Call Table
+# =============================================================================
+
+
+def build_call_table(
+    platform: Optional["Platform"] = None,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    storage: Optional["StorageManager"] = None,
+    jobs: Optional[int] = None,
+) -> "CallTable":
+    """Load the tool calls of sessions in a date range into one CallTable.
+
+    Each session is flattened in a worker (see session_loader.py) and the
+    per-session tables are concatenated in date order.
+
+    Args:
+        platform: Filter by platform (None = all platforms)
+        start_date: Start of date range (None = earliest session)
+        end_date: End of date range (None = today)
+        storage: StorageManager instance (None = create default)
+        jobs: Worker processes for loading sessions (default: CPU count)
+
+    Returns:
+        CallTable of every call in the matching sessions
+
+    Example:
+        >>> table = build_call_table(start_date=date.today() - timedelta(days=90))
+        >>> table.top("tool", "total_tokens", n=10)
+    """
+    from token_audit.call_table import CallTable
+    from token_audit.session_loader import load_sessions
+    from token_audit.storage import StorageManager as SM
+
+    storage_mgr: SM = storage if storage is not None else SM()
+    platforms_to_query = [platform] if platform else storage_mgr.list_platforms()
+
+    actual_start_date = start_date
+    if actual_start_date is None:
+        actual_start_date, _ = storage_mgr.get_date_range(platform)
+    if actual_start_date is None or not platforms_to_query:
+        return CallTable()
+
+    indexes = [
+        idx
+        for p in platforms_to_query
+        for idx in storage_mgr.list_sessions_in_range(
+            p, actual_start_date, end_date or date.today()
+        )
+    ]
+    indexes.sort(key=lambda idx: idx.date)
+    paths = [storage_mgr.base_dir / idx.file_path for idx in indexes]
+
+    tables = load_sessions(paths, _session_call_table, storage_mgr.base_dir, jobs=jobs, lazy=False)
+    return CallTable.concat(table for table in tables if table is not None)
+
+
+def _session_call_table(session: Any) -> "CallTable":
+    """Summarizer for load_sessions(): the session's calls as a CallTable."""
+    from token_audit.call_table import CallTable
+
+    return CallTable.from_sessions([session])
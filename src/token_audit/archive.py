@@ -0,0 +1,336 @@
+"""Monthly archive bundles for old sessions.
+
+``token-audit storage archive`` packs session files older than a cutoff into
+one zip file per platform per month, and removes the loose files and their
+date directories::
+
+    <platform>/<YYYY-MM-DD>/<session>.json
+    ->  <platform>/archive/<YYYY-MM>.zip  (member <YYYY-MM-DD>/<session>.json)
+
+An archived session keeps a path: the member name appended to the bundle,
+e.g. ``claude-code/archive/2025-01.zip/2025-01-15/<session>.json``.
+read_session_file(), SessionManager.load_session(), load_summary() and the
+session catalog accept these paths. Members are read by random access
+through the zip's central directory (the bundle is mmapped where possible),
+so loading one archived session doesn't read the rest of the bundle.
+
+Each bundle also holds a member index (``.index.json``) with metadata
+supplied by the writer per member (the session summary and index entry),
+so listings don't decompress session bodies.
+"""
+
+import contextlib
+import mmap
+import os
+import struct
+import threading
+import time
+import zipfile
+import zlib
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from . import json_codec
+
+ARCHIVE_DIR_NAME = "archive"
+ARCHIVE_SUFFIX = ".zip"
+INDEX_MEMBER = ".index.json"
+
+# Bump when the member index layout changes
+ARCHIVE_VERSION = 1
+
+# Bundles kept open (central directory parsed, file mapped)
+MAX_OPEN_ARCHIVES = 8
+
+# Compressed (compact) session files are stored as-is
+_COMPRESSED_MAGIC = (b"\x1f\x8b", b"\x28\xb5\x2f\xfd")
+
+# Zip local file header (the last two fields are the name and extra lengths)
+_LOCAL_HEADER = struct.Struct("<4s5H3L2H")
+_MAPPED_TYPES = (zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED)
+
+
+@dataclass
+class ArchiveMember:
+    """
+    One session file in a bundle.
+
+    Attributes:
+        name: Member name, ``<YYYY-MM-DD>/<file name>``
+        mtime_ns: Modification time of the file when it was archived
+        size: Size of the session file
+        meta: Writer-supplied metadata (see StorageManager.archive_sessions())
+    """
+
+    name: str
+    mtime_ns: int
+    size: int
+    meta: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def date(self) -> str:
+        """Date directory the file was archived from (YYYY-MM-DD)."""
+        return self.name.split("/", 1)[0]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for the member index."""
+        return {"mtime_ns": self.mtime_ns, "size": self.size, "meta": self.meta}
+
+
+def month_archive_path(platform_dir: Path, month: str) -> Path:
+    """Bundle for one month (YYYY-MM) of a platform's sessions."""
+    return platform_dir / ARCHIVE_DIR_NAME / f"{month}{ARCHIVE_SUFFIX}"
+
+
+def list_archives(platform_dir: Path) -> List[Path]:
+    """A platform's bundles, oldest month first."""
+    archive_dir = platform_dir / ARCHIVE_DIR_NAME
+    try:
+        with os.scandir(archive_dir) as entries:
+            names = [e.name for e in entries if e.name.endswith(ARCHIVE_SUFFIX) and e.is_file()]
+    except OSError:
+        return []
+    return [archive_dir / name for name in sorted(names)]
+
+
+def split_archive_path(path: Union[str, Path]) -> Optional[Tuple[Path, str]]:
+    """
+    (bundle, member name) of an archived session path.
+
+    Returns None for other paths, including a bundle's own path.
+    """
+    path_str = str(path)
+    if ARCHIVE_SUFFIX + os.sep not in path_str and ARCHIVE_SUFFIX + "/" not in path_str:
+        return None  # Fast path for ordinary session files
+    path = Path(path)
+    for parent in path.parents:
+        if parent.suffix == ARCHIVE_SUFFIX and parent.parent.name == ARCHIVE_DIR_NAME:
+            return parent, path.relative_to(parent).as_posix()
+    return None
+
+
+def is_archived(path: Union[str, Path]) -> bool:
+    """Whether ``path`` names a session in an existing bundle."""
+    location = split_archive_path(path)
+    if location is None:
+        return False
+    try:
+        return location[1] in _open_archive(location[0]).members
+    except (OSError, zipfile.BadZipFile):
+        return False
+
+
+def read_member(path: Union[str, Path]) -> bytes:
+    """
+    Contents of an archived session file.
+
+    Raises:
+        FileNotFoundError: If the bundle or member doesn't exist
+        OSError: If the bundle can't be read
+    """
+    archive_path, name = _require_location(path)
+    reader = _open_archive(archive_path)
+    if name not in reader.members:
+        raise FileNotFoundError(f"Not in {archive_path.name}: {name}")
+    try:
+        return reader.read(name)
+    except (zipfile.BadZipFile, EOFError) as e:
+        raise OSError(f"Unreadable archive member {name} in {archive_path}: {e}") from e
+
+
+def member_stat(path: Union[str, Path]) -> os.stat_result:
+    """
+    Stat of an archived session file as it was before archiving.
+
+    Raises:
+        FileNotFoundError: If the bundle or member doesn't exist
+    """
+    archive_path, name = _require_location(path)
+    member = _open_archive(archive_path).members.get(name)
+    if member is None:
+        raise FileNotFoundError(f"Not in {archive_path.name}: {name}")
+    seconds = member.mtime_ns // 1_000_000_000
+    return os.stat_result(
+        (0o100444, 0, 0, 1, 0, 0, member.size, seconds, seconds, seconds),
+        {"st_atime_ns": member.mtime_ns, "st_mtime_ns": member.mtime_ns},
+    )
+
+
+def member_meta(path: Union[str, Path]) -> Optional[Dict[str, Any]]:
+    """Writer-supplied metadata of an archived session (None if not archived)."""
+    location = split_archive_path(path)
+    if location is None:
+        return None
+    try:
+        member = _open_archive(location[0]).members.get(location[1])
+    except (OSError, zipfile.BadZipFile):
+        return None
+    return member.meta if member is not None else None
+
+
+def archive_members(archive_path: Path) -> List[ArchiveMember]:
+    """
+    Sessions in a bundle, in member order.
+
+    Raises:
+        OSError: If the bundle can't be read
+    """
+    try:
+        return list(_open_archive(archive_path).members.values())
+    except zipfile.BadZipFile as e:
+        raise OSError(f"Unreadable archive {archive_path}: {e}") from e
+
+
+def write_archive(archive_path: Path, files: List[Tuple[ArchiveMember, Path]]) -> None:
+    """
+    Add session files to a bundle, creating it if needed.
+
+    Members already in the bundle are kept unless ``files`` replaces them. The
+    new bundle is written next to the old one and renamed over it, so readers
+    see either the old or the new bundle. Files are read one at a time.
+
+    Args:
+        archive_path: Bundle to write
+        files: Members and the session files to read them from
+
+    Raises:
+        OSError: If the bundle or a file can't be read, or the bundle can't be written
+    """
+    replaced = {member.name for member, _ in files}
+    kept: List[ArchiveMember] = []
+    if archive_path.exists():
+        kept = [m for m in archive_members(archive_path) if m.name not in replaced]
+
+    archive_path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = archive_path.with_name(f".{archive_path.name}.{os.getpid()}.tmp")
+    sources: List[Tuple[ArchiveMember, Path]] = [(m, archive_path / m.name) for m in kept]
+    try:
+        with zipfile.ZipFile(temp_path, "w") as bundle:
+            for member, source in sources + files:
+                if split_archive_path(source) is not None:
+                    payload = read_member(source)  # Kept from the old bundle
+                else:
+                    payload = source.read_bytes()
+                info = zipfile.ZipInfo(member.name, _zip_time(member.mtime_ns))
+                info.compress_type = (
+                    zipfile.ZIP_STORED
+                    if payload[:4].startswith(_COMPRESSED_MAGIC)
+                    else zipfile.ZIP_DEFLATED
+                )
+                bundle.writestr(info, payload)
+            index = {
+                "version": ARCHIVE_VERSION,
+                "members": {member.name: member.to_dict() for member, _ in sources + files},
+            }
+            bundle.writestr(INDEX_MEMBER, json_codec.dumps_bytes(index, default=str))
+        os.replace(temp_path, archive_path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            temp_path.unlink()
+        raise
+
+
+# =============================================================================
+# Readers
+# =============================================================================
+
+
+class _ArchiveReader:
+    """
+    An open bundle: member index plus where each member's data starts.
+
+    Member data is sliced out of an mmap of the bundle (stored members are
+    copied, deflated ones inflated) instead of going through ZipFile.open().
+    """
+
+    def __init__(self, archive_path: Path, stat: os.stat_result):
+        self.archive_path = archive_path
+        self.stamp = (stat.st_size, stat.st_mtime_ns)
+        with open(archive_path, "rb") as f:
+            with zipfile.ZipFile(f) as bundle:
+                self._infos = {info.filename: info for info in bundle.infolist()}
+                try:
+                    index = json_codec.loads(bundle.read(INDEX_MEMBER))
+                except KeyError:
+                    index = {}
+            try:
+                self._map: Optional[mmap.mmap] = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                self._map = None  # Read through ZipFile instead
+
+        entries = index.get("members", {}) if index.get("version") == ARCHIVE_VERSION else {}
+        self.members: Dict[str, ArchiveMember] = {}
+        for name, info in self._infos.items():
+            if name == INDEX_MEMBER or info.is_dir():
+                continue
+            entry = entries.get(name) or {}
+            self.members[name] = ArchiveMember(
+                name=name,
+                mtime_ns=entry.get("mtime_ns", 0),
+                size=entry.get("size", info.file_size),
+                meta=entry.get("meta", {}),
+            )
+
+    def read(self, name: str) -> bytes:
+        """
+        Contents of a member.
+
+        Raises:
+            zipfile.BadZipFile: If the member is damaged
+        """
+        info = self._infos[name]
+        if self._map is None or info.compress_type not in _MAPPED_TYPES:
+            with zipfile.ZipFile(self.archive_path) as bundle:
+                return bundle.read(name)
+
+        header = self._map[info.header_offset : info.header_offset + _LOCAL_HEADER.size]
+        if len(header) != _LOCAL_HEADER.size or header[:4] != b"PK\x03\x04":
+            raise zipfile.BadZipFile(f"Bad local header for {name}")
+        name_length, extra_length = _LOCAL_HEADER.unpack(header)[-2:]
+        start = info.header_offset + _LOCAL_HEADER.size + name_length + extra_length
+        data = self._map[start : start + info.compress_size]
+        if info.compress_type == zipfile.ZIP_DEFLATED:
+            try:
+                data = zlib.decompress(data, -zlib.MAX_WBITS)
+            except zlib.error as e:
+                raise zipfile.BadZipFile(f"Bad data for {name}: {e}") from e
+        if zlib.crc32(data) != info.CRC:
+            raise zipfile.BadZipFile(f"Bad CRC-32 for {name}")
+        return data
+
+
+_archives: "OrderedDict[Path, _ArchiveReader]" = OrderedDict()
+_archives_lock = threading.Lock()
+
+
+def _open_archive(archive_path: Path) -> _ArchiveReader:
+    """Open bundle for ``archive_path``, reopened when the file changes."""
+    stat = archive_path.stat()
+    with _archives_lock:
+        reader = _archives.get(archive_path)
+        if reader is not None and reader.stamp == (stat.st_size, stat.st_mtime_ns):
+            _archives.move_to_end(archive_path)
+            return reader
+
+    reader = _ArchiveReader(archive_path, stat)
+    with _archives_lock:
+        _archives[archive_path] = reader
+        _archives.move_to_end(archive_path)
+        while len(_archives) > MAX_OPEN_ARCHIVES:
+            _archives.popitem(last=False)
+    return reader
+
+
+def _require_location(path: Union[str, Path]) -> Tuple[Path, str]:
+    location = split_archive_path(path)
+    if location is None:
+        raise FileNotFoundError(f"Not an archived session: {path}")
+    return location
+
+
+def _zip_time(mtime_ns: int) -> Tuple[int, int, int, int, int, int]:
+    """Zip timestamp for a modification time (zip can't store dates before 1980)."""
+    stamp = time.localtime(max(mtime_ns // 1_000_000_000, 315532800 + 86400))
+    return (stamp.tm_year, stamp.tm_mon, stamp.tm_mday, stamp.tm_hour, stamp.tm_min, stamp.tm_sec)
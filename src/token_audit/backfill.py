@@ -0,0 +1,198 @@
+"""Historical bulk import of Claude Code transcripts.
+
+``token-audit collect`` only tracks events written after it starts. Backfill
+imports existing ``~/.claude/projects/*/*.jsonl`` transcripts instead:
+
+- Transcripts are parsed in worker processes (one Session per transcript)
+- Each worker writes its session file through StorageManager
+- Daily/platform indexes are updated once, in the parent, at the end
+
+Re-running a backfill overwrites the same session files and index entries
+(session IDs are derived from the transcript start time and UUID).
+"""
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Iterable, List, Optional, Tuple
+
+from .pricing_config import PricingConfig
+from .storage import Platform, SessionIndex, StorageManager
+
+BACKFILL_PLATFORM: Platform = "claude_code"
+
+# Transcripts handed to a worker per round trip
+WORKER_CHUNK_SIZE = 8
+
+# Per-process state set by _init_worker (shared across transcripts)
+_worker_storage: Optional[StorageManager] = None
+_worker_project: str = ""
+_worker_pricing: Optional[PricingConfig] = None
+
+
+@dataclass
+class BackfillResult:
+    """Outcome and throughput of a backfill run."""
+
+    files_total: int = 0
+    files_imported: int = 0
+    files_skipped: int = 0  # Transcripts without any token usage
+    files_failed: int = 0
+    events: int = 0  # Transcript lines parsed
+    elapsed_seconds: float = 0.0
+    errors: List[str] = field(default_factory=list)
+
+    @property
+    def files_per_second(self) -> float:
+        """Transcripts processed per second."""
+        return self.files_total / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+    @property
+    def events_per_second(self) -> float:
+        """Transcript lines parsed per second."""
+        return self.events / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+
+def find_claude_transcripts(projects_dir: Optional[Path] = None) -> List[Path]:
+    """
+    Find Claude Code transcripts across all projects.
+
+    Args:
+        projects_dir: Claude Code projects directory (default:
+            ~/.config/claude/projects, then ~/.claude/projects)
+
+    Returns:
+        Transcript paths sorted by path (empty if the directory is missing)
+    """
+    if projects_dir is None:
+        projects_dir = Path.home() / ".config" / "claude" / "projects"
+        if not projects_dir.exists():
+            projects_dir = Path.home() / ".claude" / "projects"
+
+    transcripts: List[Path] = []
+    try:
+        with os.scandir(projects_dir) as projects:
+            for project_entry in projects:
+                if not project_entry.is_dir():
+                    continue
+                with os.scandir(project_entry.path) as files:
+                    for entry in files:
+                        if entry.name.endswith(".jsonl") and entry.is_file():
+                            transcripts.append(Path(entry.path))
+    except OSError:
+        return []
+
+    transcripts.sort()
+    return transcripts
+
+
+def _init_worker(base_dir: str, project: str) -> None:
+    """Set up per-process state (storage and pricing are loaded once per worker)."""
+    global _worker_storage, _worker_project, _worker_pricing
+
+    _worker_storage = StorageManager(base_dir=Path(base_dir))
+    _worker_project = project
+    _worker_pricing = PricingConfig()
+
+
+def _import_transcript(path: str) -> Tuple[Optional[SessionIndex], int, Optional[str]]:
+    """
+    Build and save the session for one transcript (runs in a worker).
+
+    Returns:
+        Tuple of (index entry or None if skipped/failed, lines parsed, error message)
+    """
+    from .claude_code_adapter import ClaudeCodeAdapter
+
+    file_path = Path(path)
+    try:
+        if _worker_storage is None:
+            raise RuntimeError("backfill worker not initialized")
+        tracker = ClaudeCodeAdapter(
+            project=_worker_project,
+            claude_dir=file_path.parent,
+            pricing_config=_worker_pricing,
+            git_metadata={},
+        )
+        # The current directory's .mcp.json says nothing about past sessions
+        tracker.set_mcp_config_path(None)
+        lines = tracker.process_session_file_batch(file_path)
+        if tracker.session.message_count == 0:
+            return None, lines, None
+
+        session = tracker.finalize_session()
+        ended = tracker.transcript_end_time()
+        if ended is not None:
+            session.end_timestamp = ended
+            session.duration_seconds = (ended - session.timestamp).total_seconds()
+
+        file_name = f"{session.session_id}.json"
+        session_data = tracker.build_session_data(file_name)
+        session_path = _worker_storage.write_session_file(
+            BACKFILL_PLATFORM, session.timestamp.date(), file_name, session_data
+        )
+        index = _worker_storage.build_session_index(session_path, BACKFILL_PLATFORM, session_data)
+        return index, lines, None
+    except Exception as e:
+        return None, 0, f"{file_path.name}: {e}"
+
+
+def backfill_claude_code(
+    transcripts: Iterable[Path],
+    storage: StorageManager,
+    jobs: Optional[int] = None,
+    project: Optional[str] = None,
+    progress: Optional[Callable[[int, int], None]] = None,
+) -> BackfillResult:
+    """
+    Import Claude Code transcripts into storage.
+
+    Args:
+        transcripts: Transcript paths (see find_claude_transcripts())
+        storage: Destination StorageManager
+        jobs: Worker processes (default: CPU count; 1 runs in-process)
+        project: Project name for every session (default: per transcript,
+            from the working directory recorded in the transcript)
+        progress: Optional callback(done, total) after each transcript
+
+    Returns:
+        BackfillResult with counts and throughput
+    """
+    paths = [str(p) for p in transcripts]
+    result = BackfillResult(files_total=len(paths))
+    indexes: List[SessionIndex] = []
+    jobs = max(1, jobs or os.cpu_count() or 1)
+    start = time.perf_counter()
+
+    def _collect(outcomes: Iterable[Tuple[Optional[SessionIndex], int, Optional[str]]]) -> None:
+        for done, (index, lines, error) in enumerate(outcomes, 1):
+            result.events += lines
+            if error:
+                result.files_failed += 1
+                result.errors.append(error)
+            elif index is None:
+                result.files_skipped += 1
+            else:
+                result.files_imported += 1
+                indexes.append(index)
+            if progress:
+                progress(done, len(paths))
+
+    init_args = (str(storage.base_dir), project or "")
+    if jobs == 1 or len(paths) <= 1:
+        _init_worker(*init_args)
+        _collect(map(_import_transcript, paths))
+    else:
+        with ProcessPoolExecutor(
+            max_workers=min(jobs, len(paths)), initializer=_init_worker, initargs=init_args
+        ) as pool:
+            _collect(pool.map(_import_transcript, paths, chunksize=WORKER_CHUNK_SIZE))
+
+    # Single batched index update for everything imported
+    storage.update_indexes_for_sessions(BACKFILL_PLATFORM, indexes)
+    storage.invalidate_mtime_cache()
+
+    result.elapsed_seconds = time.perf_counter() - start
+    return result
@@ -21,6 +21,8 @@ if TYPE_CHECKING:
     from .recommendations import Recommendation
 
 from . import __version__
+from .session_format import encode_session
+from .session_summary import write_summary
 
 # Schema version (see docs/data-contract.md for compatibility guarantees)
 SCHEMA_VERSION = "1.7.0"
@@ -931,7 +933,7 @@ class BaseTracker(ABC):
         self.project = project
         self.platform = platform
         self.timestamp = _now_with_timezone()
-        self.session_id = self._generate_session_id()
+        self.session_id = self.generate_session_id()
         self.working_directory = str(Path.cwd())
 
         # Session data
@@ -960,8 +962,8 @@ class BaseTracker(ABC):
         # MCP config path for static cost calculation (v0.6.0 - task-114.2)
         self._mcp_config_path: Optional[Path] = None
 
-    def _generate_session_id(self) -> str:
-        """Generate unique session ID"""
+    def generate_session_id(self) -> str:
+        """Generate unique session ID (project and session start time)"""
         timestamp_str = self.timestamp.strftime("%Y-%m-%dT%H-%M-%S")
         return f"{self.project}-{timestamp_str}"
 
@@ -1019,6 +1021,21 @@ class BaseTracker(ABC):
         """
         pass
 
+    # ========================================================================
+    # Pricing
+    # ========================================================================
+
+    def update_session_costs(self) -> Tuple[float, float]:
+        """
+        Calculate session costs from the token usage so far and store them on the session.
+
+        Platforms with pricing override this; the default keeps the session's costs.
+
+        Returns:
+            Tuple of (cost_estimate, cost_no_cache) in USD
+        """
+        return self.session.cost_estimate, self.session.cost_no_cache
+
     # ========================================================================
     # Normalization (Shared implementation)
     # ========================================================================
@@ -1536,6 +1553,30 @@ class BaseTracker(ABC):
         self.session_dir = date_dir
         self.session_path = session_path  # Full path to session file
 
+        session_data = self.build_session_data(file_name)
+
+        # Save as single JSON file (compact if TOKEN_AUDIT_SESSION_FORMAT=compact)
+        with open(session_path, "wb") as f:
+            f.write(encode_session(session_data))
+
+        # Rewritten in place, so the catalog can't see the change from the directory
+        from .catalog import record_session_file
+
+        record_session_file(output_dir, session_path, session_data)
+        write_summary(session_path, session_data)
+
+        # Note: v1.0.4 removes separate mcp-*.json files - all data in single file
+
+    def build_session_data(self, file_name: str) -> Dict[str, Any]:
+        """
+        Build the session file contents (session dict with _file header).
+
+        Args:
+            file_name: Name of the session file (recorded in the _file header)
+
+        Returns:
+            JSON-serializable session data
+        """
         # Build the _file header
         file_header = FileHeader(
             name=file_name,
@@ -1553,12 +1594,7 @@ class BaseTracker(ABC):
         # Get session data and inject _file header
         session_data = self.session.to_dict()
         session_data["_file"] = file_header.to_dict()
-
-        # Save as single JSON file
-        with open(session_path, "w") as f:
-            json.dump(session_data, f, indent=2, default=str)
-
-        # Note: v1.0.4 removes separate mcp-*.json files - all data in single file
+        return session_data
 
     # ========================================================================
     # Unrecognized Line Handler (Shared implementation)
@@ -1592,3 +1628,40 @@ class BaseTracker(ABC):
         # Convert to stable JSON string
         json_str = json.dumps(input_data, sort_keys=True)
         return hashlib.sha256(json_str.encode()).hexdigest()
+
+
+class SingleFileTracker(BaseTracker):
+    """
+    Tracker that can follow one transcript/session file on its own.
+
+    collector.MultiCollector only creates trackers of this kind, one per
+    changed file, so a platform takes part in ``collect --multi`` by
+    implementing these methods.
+    """
+
+    @abstractmethod
+    def init_source_file(self, file_path: Path, resume: Optional[float] = None) -> None:
+        """
+        Track one transcript/session file and process its content after ``resume``.
+
+        Args:
+            file_path: File to track
+            resume: Position returned by source_resume_position() when the file
+                was last tracked (None processes the whole file)
+        """
+        pass
+
+    @abstractmethod
+    def process_source_file(self) -> None:
+        """Process content added to the file set up by init_source_file()."""
+        pass
+
+    @abstractmethod
+    def source_resume_position(self) -> float:
+        """Where to resume the tracked file in a later init_source_file()."""
+        pass
+
+    @abstractmethod
+    def source_cwd(self) -> Optional[str]:
+        """Working directory recorded in the tracked file, if known."""
+        pass
@@ -34,6 +34,7 @@ from typing import TYPE_CHECKING, Any, Pattern
 
 if TYPE_CHECKING:
     from token_audit.base_tracker import Call, Session
+    from token_audit.call_table import CallTable
 
 
 # =============================================================================
@@ -357,6 +358,77 @@ class BucketClassifier:
 
         return result
 
+    def classify_table(self, table: CallTable) -> list[BucketResult]:
+        """Classify every call in a CallTable and aggregate results.
+
+        Same rules as classify_session(), applied per column rather than per
+        call: tool name patterns are matched once per distinct tool, and a
+        call is redundant when it repeats an earlier call's content_hash in
+        the same session. Sessions in the table are pooled into one result.
+        Adds a ``bucket`` column to the table.
+
+        Args:
+            table: Calls of one or more sessions (see call_table.py)
+
+        Returns:
+            List of BucketResult, one per bucket (4 total), sorted by tokens descending
+        """
+        large_output = table.at_least("output_tokens", self.thresholds.large_payload_threshold)
+        table.label(
+            "bucket",
+            [
+                (
+                    BucketName.REDUNDANT,
+                    [
+                        table.repeats(
+                            ("session", "content_hash"),
+                            self.thresholds.redundant_min_occurrences,
+                        )
+                    ],
+                ),
+                (
+                    BucketName.TOOL_DISCOVERY,
+                    [table.matches("tool", lambda t: self._matches_patterns(t, "tool_discovery"))],
+                ),
+                (
+                    BucketName.STATE_SERIALIZATION,
+                    [
+                        table.matches(
+                            "tool", lambda t: self._matches_patterns(t, "state_serialization")
+                        ),
+                        large_output,
+                    ],
+                ),
+            ],
+            default=BucketName.DRIFT,
+        )
+
+        tokens = table.group_sum("bucket", "total_tokens")
+        counts = table.group_count("bucket")
+        tool_tokens = table.group_sum(("bucket", "tool"), "total_tokens")
+        total_tokens = sum(tokens.values())
+
+        results = []
+        for bucket_name in BucketName.all():
+            bucket_tokens = int(tokens.get(bucket_name, 0))
+            bucket_tools = [
+                (key[1], int(value)) for key, value in tool_tokens.items() if key[0] == bucket_name
+            ]
+            results.append(
+                BucketResult(
+                    bucket=bucket_name,
+                    tokens=bucket_tokens,
+                    percentage=(bucket_tokens / total_tokens * 100) if total_tokens > 0 else 0.0,
+                    call_count=counts.get(bucket_name, 0),
+                    # Top 5 tools by tokens (sorted descending)
+                    top_tools=sorted(bucket_tools, key=lambda x: x[1], reverse=True)[:5],
+                )
+            )
+
+        # Sort by tokens descending
+        results.sort(key=lambda r: r.tokens, reverse=True)
+        return results
+
     # -------------------------------------------------------------------------
     # Private: Hash Index for Redundancy Detection (Task 247.3)
     # -------------------------------------------------------------------------
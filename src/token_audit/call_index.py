@@ -0,0 +1,274 @@
+"""Tool call index for lazily loaded sessions.
+
+SessionManager.load_session(lazy=True) needs per-tool call counts and
+tokens straight away, but a tool's calls only when its ``call_history`` is
+accessed. For pretty-printed session files the index records:
+
+- Byte spans of the ``tool_calls`` and ``tool_sequence`` blocks, so the
+  rest of the file is parsed without them
+- Byte offset of every call, so one tool's calls are decoded on their own
+- Per tool: call count, total tokens and the positions of its calls
+
+The index is a sidecar next to the summary (``.summaries/<session file>.calls``).
+It is built the first time a session is loaded lazily and rebuilt when the
+session file's size or mtime change. Compact files are parsed whole instead
+(offsets into compressed data are no use), as are archived sessions, giving
+the same per-tool counts.
+"""
+
+import contextlib
+import os
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from . import json_codec
+from .archive import member_stat, read_member, split_archive_path
+from .session_format import decompress_session, is_compressed, top_level_span, unpack_session
+from .session_summary import CALL_INDEX_SUFFIX, summary_path, write_sidecar
+
+# Bump when the layout changes; older indexes are then rebuilt
+CALL_INDEX_VERSION = 1
+
+# Blocks left out when parsing the rest of a session (both grow with the call count)
+SKIPPED_BLOCKS = ("tool_calls", "tool_sequence")
+
+# Each element of the pretty-printed tool_calls array starts a line at indent 4
+_CALL_START = re.compile(rb"\n    \{")
+
+
+def call_key(call_data: Dict[str, Any]) -> Tuple[str, str]:
+    """(server, tool) a tool_calls entry is grouped under."""
+    return (
+        call_data.get("server", "unknown"),
+        call_data.get("tool", call_data.get("tool_name", "")),
+    )
+
+
+@dataclass
+class ToolCalls:
+    """Calls of one tool in a session's tool_calls array."""
+
+    server: str
+    tool: str
+    calls: int = 0
+    total_tokens: int = 0
+    positions: List[int] = field(default_factory=list)  # Indexes into tool_calls
+
+
+@dataclass
+class CallIndex:
+    """
+    Where a session's tool calls are and how they add up per tool.
+
+    Attributes:
+        session_size: Size of the session file the index was built from
+        session_mtime_ns: Modification time of that file
+        tools: Per-tool counts, tokens and call positions
+        skip_spans: Byte spans of the blocks skipped when parsing the rest
+            (empty when the file isn't pretty-printed)
+        offsets: Start of every call in the file, then the end of the last
+            (None when calls can't be read one by one)
+    """
+
+    session_size: int
+    session_mtime_ns: int
+    tools: List[ToolCalls] = field(default_factory=list)
+    skip_spans: List[Tuple[int, int]] = field(default_factory=list)
+    offsets: Optional[List[int]] = None
+
+    @classmethod
+    def build(
+        cls,
+        tool_calls_data: List[Dict[str, Any]],
+        stat: os.stat_result,
+        text: Optional[bytes] = None,
+        skip_spans: Optional[List[Tuple[int, int]]] = None,
+    ) -> "CallIndex":
+        """
+        Index decoded tool calls.
+
+        Args:
+            tool_calls_data: The session's tool_calls array
+            stat: Stat of the session file
+            text: Session file contents, to record call offsets (pretty-printed files)
+            skip_spans: Spans of the skipped blocks in ``text`` (tool_calls first)
+        """
+        tools: Dict[Tuple[str, str], ToolCalls] = {}
+        for position, call_data in enumerate(tool_calls_data):
+            key = call_key(call_data)
+            entry = tools.get(key)
+            if entry is None:
+                entry = tools[key] = ToolCalls(server=key[0], tool=key[1])
+            entry.calls += 1
+            entry.total_tokens += call_data.get("total_tokens", 0)
+            entry.positions.append(position)
+
+        offsets = None
+        if text is not None and skip_spans:
+            start, end = skip_spans[0]
+            offsets = [m.start() + 5 for m in _CALL_START.finditer(text, start, end)]
+            if len(offsets) != len(tool_calls_data):
+                offsets = None  # Not the layout we write
+            elif offsets:
+                offsets.append(text.rindex(b"}", start, end) + 1)
+
+        return cls(
+            session_size=stat.st_size,
+            session_mtime_ns=stat.st_mtime_ns,
+            tools=list(tools.values()),
+            skip_spans=list(skip_spans or []),
+            offsets=offsets,
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for the sidecar file."""
+        return {
+            "version": CALL_INDEX_VERSION,
+            "session_size": self.session_size,
+            "session_mtime_ns": self.session_mtime_ns,
+            "skip_spans": self.skip_spans,
+            "offsets": self.offsets,
+            "tools": [
+                [entry.server, entry.tool, entry.calls, entry.total_tokens, entry.positions]
+                for entry in self.tools
+            ],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> Optional["CallIndex"]:
+        """Load from a sidecar dict (None if it was written by another version)."""
+        if data.get("version") != CALL_INDEX_VERSION:
+            return None
+        return cls(
+            session_size=data["session_size"],
+            session_mtime_ns=data["session_mtime_ns"],
+            tools=[ToolCalls(*entry) for entry in data["tools"]],
+            skip_spans=[(start, end) for start, end in data["skip_spans"]],
+            offsets=data["offsets"],
+        )
+
+    def matches(self, stat: os.stat_result) -> bool:
+        """Whether the index still describes a session file with this stat."""
+        return self.session_size == stat.st_size and self.session_mtime_ns == stat.st_mtime_ns
+
+
+def read_indexed_session(session_path: Path) -> Tuple[Any, CallIndex]:
+    """
+    Read a session file without its tool calls.
+
+    Uses the index sidecar when it is current: only the bytes outside the
+    skipped blocks are read. Otherwise the file is read once, indexed, and the
+    index written for next time (pretty-printed files only).
+
+    Args:
+        session_path: Session file
+
+    Returns:
+        (session data with empty tool_calls/tool_sequence, the call index)
+
+    Raises:
+        OSError: If the file can't be read
+        json.JSONDecodeError: If it isn't a valid session file
+    """
+    archived = split_archive_path(session_path) is not None
+    if archived:
+        # See archive.py: no sidecar, the member is parsed whole
+        stat = member_stat(session_path)
+        raw = read_member(session_path)
+    else:
+        stat = session_path.stat()
+        index = _load_call_index(session_path, stat)
+        if index is not None:
+            return json_codec.loads(_read_without_spans(session_path, index.skip_spans)), index
+        with open(session_path, "rb") as f:
+            raw = f.read()
+    text = decompress_session(raw)
+
+    calls_span = None
+    if not archived and not is_compressed(raw[:4]):
+        calls_span = top_level_span(text, "tool_calls")
+    if calls_span is None:
+        # Compact, archived or other layouts: parse everything
+        data = unpack_session(json_codec.loads(text))
+        tool_calls_data = data.get("tool_calls", []) if isinstance(data, dict) else []
+        if isinstance(data, dict) and "tool_calls" in data:
+            data["tool_calls"] = []
+        return data, CallIndex.build(tool_calls_data, stat)
+
+    spans = [calls_span]
+    for key in SKIPPED_BLOCKS[1:]:
+        span = top_level_span(text, key)
+        if span is not None:
+            spans.append(span)
+    tool_calls_data = json_codec.loads(text[calls_span[0] : calls_span[1]])
+    data = json_codec.loads(_without_spans(text, spans))
+
+    index = CallIndex.build(tool_calls_data, stat, text, spans)
+    # On read-only storage, index again next time
+    with contextlib.suppress(OSError):
+        write_sidecar(summary_path(session_path, CALL_INDEX_SUFFIX), index.to_dict())
+    return data, index
+
+
+def read_indexed_calls(
+    session_path: Path, index: CallIndex, positions: List[int]
+) -> Optional[List[Dict[str, Any]]]:
+    """
+    Decode the calls at ``positions`` by their byte offsets.
+
+    Returns:
+        The calls, or None if the index has no offsets or the file has
+        changed since it was indexed (read the whole file instead)
+
+    Raises:
+        OSError: If the file can't be read
+    """
+    offsets = index.offsets
+    if offsets is None or not index.matches(session_path.stat()):
+        return None
+    calls = []
+    with open(session_path, "rb") as f:
+        for position in positions:
+            start = offsets[position]
+            f.seek(start)
+            chunk = f.read(offsets[position + 1] - start)
+            calls.append(json_codec.loads(chunk.rstrip(b", \n")))
+    return calls
+
+
+def _load_call_index(session_path: Path, stat: os.stat_result) -> Optional[CallIndex]:
+    try:
+        with open(summary_path(session_path, CALL_INDEX_SUFFIX), "rb") as f:
+            index = CallIndex.from_dict(json_codec.load(f))
+    except (OSError, ValueError, TypeError, KeyError, AttributeError):
+        return None  # Missing, unreadable or from another version
+    if index is None or not index.skip_spans or not index.matches(stat):
+        return None
+    return index
+
+
+def _without_spans(text: bytes, spans: List[Tuple[int, int]]) -> bytes:
+    """``text`` with each span replaced by an empty array."""
+    parts = []
+    position = 0
+    for start, end in sorted(spans):
+        parts += [text[position:start], b"[]"]
+        position = end
+    parts.append(text[position:])
+    return b"".join(parts)
+
+
+def _read_without_spans(session_path: Path, spans: List[Tuple[int, int]]) -> bytes:
+    """Read a file with each span replaced by an empty array (spans aren't read)."""
+    parts = []
+    position = 0
+    with open(session_path, "rb") as f:
+        for start, end in sorted(spans):
+            f.seek(position)
+            parts += [f.read(start - position), b"[]"]
+            position = end
+        f.seek(position)
+        parts.append(f.read())
+    return b"".join(parts)
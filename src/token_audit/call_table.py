@@ -0,0 +1,495 @@
+"""Columnar table of tool calls across sessions.
+
+Cross-session call analytics (top tools by tokens over a date range, bucket
+breakdowns over many sessions) would otherwise walk every session's
+``server_sessions -> tools -> call_history`` for each question.
+CallTable.from_sessions() flattens the calls once, into one column per field:
+
+- Numeric columns: timestamp (epoch seconds), the token counts, duration
+  and the call's index within its session
+- String columns (session, tool, server, model, content hash): integer
+  codes into a dictionary per column, so each distinct string is stored
+  once; empty values (no model, no hash) have code -1
+
+The group-by, sum and percentile helpers run over whole columns, with NumPy
+when it is installed and in plain Python otherwise; both give the same
+results. Masks (``where``) are the boolean columns returned by matches(),
+at_least() and repeats().
+
+Example:
+    >>> table = build_call_table(start_date=date.today() - timedelta(days=90))
+    >>> table.top("tool", "total_tokens", n=5)
+    [('mcp__zen__chat', 1203344), ...]
+"""
+
+from array import array
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+try:
+    import numpy
+
+    np: Any = numpy
+except ImportError:
+    np = None
+
+from .base_tracker import Session
+
+# Numeric columns and their array type codes
+NUMERIC_COLUMNS: Dict[str, str] = {
+    "timestamp": "d",
+    "call_index": "q",
+    "input_tokens": "q",
+    "output_tokens": "q",
+    "cache_created_tokens": "q",
+    "cache_read_tokens": "q",
+    "total_tokens": "q",
+    "duration_ms": "q",
+}
+
+STRING_COLUMNS = ("session", "tool", "server", "model", "content_hash")
+
+# Group-by column name(s); keys are strings for one column, tuples for several
+GroupBy = Union[str, Sequence[str]]
+GroupKey = Union[str, Tuple[str, ...]]
+
+# Boolean column: a NumPy bool array, or a list of bools without NumPy
+Mask = Any
+
+
+class CallTable:
+    """
+    Tool calls of a set of sessions, one column per field.
+
+    Build with from_sessions() or concat(); tables aren't modified after
+    that, apart from label() adding a column.
+    """
+
+    def __init__(self) -> None:
+        self._columns: Dict[str, Any] = {
+            name: array(typecode) for name, typecode in NUMERIC_COLUMNS.items()
+        }
+        self._columns.update({name: array("q") for name in STRING_COLUMNS})
+        self._strings: Dict[str, List[str]] = {name: [] for name in STRING_COLUMNS}
+        self._codes: Dict[str, Dict[str, int]] = {name: {} for name in STRING_COLUMNS}
+
+    @classmethod
+    def from_sessions(cls, sessions: Iterable[Session]) -> "CallTable":
+        """
+        Flatten the calls of sessions, in session order.
+
+        Within a session, rows follow ``server_sessions -> tools ->
+        call_history`` order. Sessions are keyed by session ID (the start
+        time for sessions without one).
+        """
+        table = cls()
+        for session in sessions:
+            table._append_session(session)
+        return table
+
+    @classmethod
+    def concat(cls, tables: Iterable["CallTable"]) -> "CallTable":
+        """
+        Rows of several tables in order (e.g. per-session tables built in workers).
+
+        Columns added by label() aren't kept.
+        """
+        result = cls()
+        for table in tables:
+            for name, typecode in NUMERIC_COLUMNS.items():
+                result._columns[name].extend(array(typecode, table._columns[name]))
+            for name in STRING_COLUMNS:
+                recode = [result._code(name, value) for value in table._strings[name]]
+                recode.append(-1)  # Code -1 stays -1
+                result._columns[name].extend(recode[code] for code in table._columns[name])
+        return result
+
+    def __len__(self) -> int:
+        return len(self._columns["timestamp"])
+
+    @property
+    def column_names(self) -> List[str]:
+        """Names of all columns, including ones added by label()."""
+        return list(self._columns)
+
+    def column(self, name: str) -> Any:
+        """
+        A column: NumPy array with NumPy installed, otherwise array.array.
+
+        String columns hold codes into strings(name).
+
+        Raises:
+            KeyError: If there is no such column
+        """
+        values = self._columns[name]
+        if np is None or not isinstance(values, array):
+            return values
+        dtype = np.float64 if values.typecode == "d" else np.int64
+        return np.frombuffer(values, dtype=dtype) if len(values) else np.zeros(0, dtype=dtype)
+
+    def strings(self, name: str) -> List[str]:
+        """Dictionary of a string column (value of each code)."""
+        return list(self._strings[name])
+
+    def decoded(self, name: str) -> List[Optional[str]]:
+        """A string column's values per row (None for empty values)."""
+        values: List[Optional[str]] = [*self._strings[name], None]
+        return [values[code] for code in self._columns[name]]
+
+    # -------------------------------------------------------------------------
+    # Selection
+    # -------------------------------------------------------------------------
+
+    def between(
+        self, start: Optional[datetime] = None, end: Optional[datetime] = None
+    ) -> "CallTable":
+        """Calls made at or after ``start`` and before ``end``."""
+        low = start.timestamp() if start is not None else float("-inf")
+        high = end.timestamp() if end is not None else float("inf")
+        if np is not None:
+            timestamps = self.column("timestamp")
+            return self._select((timestamps >= low) & (timestamps < high))
+        return self._select([low <= t < high for t in self._columns["timestamp"]])
+
+    def matches(self, name: str, predicate: Callable[[str], bool]) -> Mask:
+        """Rows whose string value satisfies ``predicate`` (called once per distinct value)."""
+        lookup = [bool(predicate(value)) for value in self._strings[name]]
+        lookup.append(False)  # Code -1 (empty) never matches
+        if np is not None:
+            return np.array(lookup, dtype=bool)[self.column(name)]
+        return [lookup[code] for code in self._columns[name]]
+
+    def at_least(self, name: str, threshold: float) -> Mask:
+        """Rows whose numeric value is at least ``threshold``."""
+        if np is not None:
+            return self.column(name) >= threshold
+        return [value >= threshold for value in self._columns[name]]
+
+    def repeats(self, by: GroupBy, min_count: int = 2) -> Mask:
+        """
+        Rows repeating an earlier row's values in ``by``.
+
+        Only groups of at least ``min_count`` rows count; the first row of
+        each group isn't a repeat, nor is any row with an empty value.
+        """
+        keys, inverse, rows = self._groups(by, None)
+        if np is not None:
+            counts = np.bincount(inverse, minlength=len(keys))
+            # First row of each group: group starts in a stable sort by group
+            starts = np.concatenate(([0], np.cumsum(counts)[:-1])).astype(np.int64)
+            first = np.argsort(inverse, kind="stable")[starts]
+            repeated = (counts[inverse] >= min_count) & (np.arange(len(rows)) != first[inverse])
+            result = np.zeros(len(self), dtype=bool)
+            result[rows[repeated]] = True
+            return result
+        counts = [0] * len(keys)
+        for group in inverse:
+            counts[group] += 1
+        mask = [False] * len(self)
+        seen = [False] * len(keys)
+        for group, row in zip(inverse, rows):
+            if seen[group] and counts[group] >= min_count:
+                mask[row] = True
+            seen[group] = True
+        return mask
+
+    def label(self, name: str, rules: Sequence[Tuple[str, Sequence[Mask]]], default: str) -> None:
+        """
+        Add a string column naming the first rule each row satisfies.
+
+        Args:
+            name: New column name (it can then be grouped by)
+            rules: (label, masks) in priority order; a row satisfies a rule
+                if any of its masks is True for the row
+            default: Label of rows satisfying no rule
+        """
+        labels = [label for label, _ in rules] + [default]
+        if np is not None:
+            result = np.full(len(self), len(rules), dtype=np.int64)
+            for code in reversed(range(len(rules))):
+                hit = np.zeros(len(self), dtype=bool)
+                for mask in rules[code][1]:
+                    hit |= np.asarray(mask, dtype=bool)
+                result[hit] = code
+            column: Any = result
+        else:
+            column = array("q", [len(rules)] * len(self))
+            for row in range(len(self)):
+                for code, (_, masks) in enumerate(rules):
+                    if any(mask[row] for mask in masks):
+                        column[row] = code
+                        break
+        self._columns[name] = column
+        self._strings[name] = labels
+        self._codes[name] = {label: code for code, label in enumerate(labels)}
+
+    # -------------------------------------------------------------------------
+    # Aggregation
+    # -------------------------------------------------------------------------
+
+    def group_sum(
+        self, by: GroupBy, column: str = "total_tokens", where: Optional[Mask] = None
+    ) -> Dict[GroupKey, Union[int, float]]:
+        """
+        Sum of a numeric column per group.
+
+        Rows with an empty value in ``by`` are left out. Groups are ordered
+        by first appearance of each value (per column, for several columns).
+        """
+        if np is None and isinstance(by, str):
+            return self._tally(by, column, where)
+        keys, inverse, rows = self._groups(by, where)
+        return dict(zip(self._decode_keys(by, keys), self._sums(column, inverse, rows, len(keys))))
+
+    def group_count(self, by: GroupBy, where: Optional[Mask] = None) -> Dict[GroupKey, int]:
+        """Rows per group (see group_sum())."""
+        if np is None and isinstance(by, str):
+            return self._tally(by, None, where)  # type: ignore[return-value]
+        keys, inverse, rows = self._groups(by, where)
+        if np is not None:
+            counts = np.bincount(inverse, minlength=len(keys)).tolist()
+        else:
+            counts = [0] * len(keys)
+            for group in inverse:
+                counts[group] += 1
+        return dict(zip(self._decode_keys(by, keys), counts))
+
+    def total(
+        self, column: str = "total_tokens", where: Optional[Mask] = None
+    ) -> Union[int, float]:
+        """Sum of a numeric column."""
+        result: Union[int, float]
+        if np is not None:
+            values = self.column(column)
+            if where is not None:
+                values = values[np.asarray(where, dtype=bool)]
+            result = values.sum().item()
+        else:
+            result = sum(self._column_values(column, where))
+        return result
+
+    def top(
+        self,
+        by: GroupBy,
+        column: str = "total_tokens",
+        n: int = 10,
+        where: Optional[Mask] = None,
+    ) -> List[Tuple[GroupKey, Union[int, float]]]:
+        """The ``n`` groups with the highest sums (ties in group order)."""
+        sums = self.group_sum(by, column, where)
+        return sorted(sums.items(), key=lambda item: item[1], reverse=True)[:n]
+
+    def percentile(
+        self,
+        column: str,
+        q: float,
+        by: Optional[GroupBy] = None,
+        where: Optional[Mask] = None,
+    ) -> Any:
+        """
+        Percentile ``q`` (0-100) of a numeric column, interpolating linearly.
+
+        Returns:
+            The percentile (0.0 when no rows), or a dict of them per group if ``by`` is set
+        """
+        if by is None:
+            if np is not None:
+                values = self.column(column)
+                if where is not None:
+                    values = values[np.asarray(where, dtype=bool)]
+                return float(np.percentile(values, q)) if len(values) else 0.0
+            return _percentile(sorted(self._column_values(column, where)), q)
+
+        keys, inverse, rows = self._groups(by, where)
+        if np is not None and len(keys):
+            # Sort values within groups, then interpolate at each group's position
+            values = self.column(column)[rows].astype(np.float64)
+            order = np.lexsort((values, inverse))
+            ordered = values[order]
+            counts = np.bincount(inverse, minlength=len(keys))
+            starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+            position = (counts - 1) * q / 100
+            low = np.floor(position).astype(np.int64)
+            high = np.minimum(low + 1, counts - 1)
+            below = ordered[starts + low]
+            result = below + (ordered[starts + high] - below) * (position - low)
+            return dict(zip(self._decode_keys(by, keys), result.tolist()))
+
+        per_group: List[List[float]] = [[] for _ in keys]
+        values = self._columns[column]
+        for group, row in zip(inverse, rows):
+            per_group[group].append(values[row])
+        return dict(
+            zip(
+                self._decode_keys(by, keys),
+                (_percentile(sorted(group_values), q) for group_values in per_group),
+            )
+        )
+
+    # -------------------------------------------------------------------------
+    # Private
+    # -------------------------------------------------------------------------
+
+    def _append_session(self, session: Session) -> None:
+        columns = self._columns
+        session_code = self._code("session", session.session_id or session.timestamp.isoformat())
+        for server_name, server_session in session.server_sessions.items():
+            for tool_name, tool_stats in server_session.tools.items():
+                for call in tool_stats.call_history:
+                    columns["timestamp"].append(call.timestamp.timestamp())
+                    columns["call_index"].append(call.index)
+                    columns["input_tokens"].append(call.input_tokens)
+                    columns["output_tokens"].append(call.output_tokens)
+                    columns["cache_created_tokens"].append(call.cache_created_tokens)
+                    columns["cache_read_tokens"].append(call.cache_read_tokens)
+                    columns["total_tokens"].append(call.total_tokens)
+                    columns["duration_ms"].append(call.duration_ms or 0)
+                    columns["session"].append(session_code)
+                    columns["tool"].append(self._code("tool", call.tool_name or tool_name))
+                    columns["server"].append(self._code("server", call.server or server_name))
+                    columns["model"].append(self._code("model", call.model))
+                    columns["content_hash"].append(self._code("content_hash", call.content_hash))
+
+    def _code(self, name: str, value: Optional[str]) -> int:
+        """Code of a string value, adding it to the column's dictionary."""
+        if not value:
+            return -1
+        codes = self._codes[name]
+        code = codes.get(value)
+        if code is None:
+            code = codes[value] = len(codes)
+            self._strings[name].append(value)
+        return code
+
+    def _select(self, keep: Mask) -> "CallTable":
+        """Table of the rows where ``keep`` is True (dictionaries are shared)."""
+        result = CallTable()
+        if np is not None:
+            for name in self._columns:
+                result._columns[name] = self.column(name)[keep]
+            result._strings = self._strings
+            result._codes = self._codes
+            return result
+        for name, values in self._columns.items():
+            typecode = values.typecode if isinstance(values, array) else "q"
+            result._columns[name] = array(typecode, (v for v, k in zip(values, keep) if k))
+        result._strings = self._strings
+        result._codes = self._codes
+        return result
+
+    def _groups(self, by: GroupBy, where: Optional[Mask]) -> Tuple[List[Tuple[int, ...]], Any, Any]:
+        """
+        Group rows by the codes of the ``by`` columns.
+
+        Returns:
+            (code tuple per group, in code order; group of each grouped row;
+            the grouped rows)
+        """
+        names = [by] if isinstance(by, str) else list(by)
+        if np is not None:
+            codes = [self.column(name) for name in names]
+            keep = np.ones(len(self), dtype=bool) if where is None else np.array(where, dtype=bool)
+            for column in codes:
+                keep &= column >= 0
+            rows = np.flatnonzero(keep)
+            # One integer key per row, ordered like the code tuples
+            sizes = [len(self._strings[name]) for name in names]
+            key = codes[0][rows]
+            for column, size in zip(codes[1:], sizes[1:]):
+                key = key * size + column[rows]
+            space = 1
+            for size in sizes:
+                space *= size
+            if space <= 4 * len(rows) + 1024:
+                # Dense keys: count each, no sort
+                present = np.bincount(key, minlength=space) > 0
+                unique = np.flatnonzero(present)
+                inverse = (np.cumsum(present) - 1)[key]
+            else:
+                unique, inverse = np.unique(key, return_inverse=True)
+            keys: Any = np.stack(np.unravel_index(unique, sizes), axis=1) if len(unique) else []
+            return [tuple(k) for k in np.asarray(keys).tolist()], inverse.reshape(-1), rows
+
+        columns = [self._columns[name] for name in names]
+        groups: Dict[Tuple[int, ...], int] = {}
+        inverse_list: List[int] = []
+        row_list: List[int] = []
+        for row in range(len(self)):
+            if where is not None and not where[row]:
+                continue
+            key = tuple(column[row] for column in columns)
+            if -1 in key:
+                continue
+            inverse_list.append(groups.setdefault(key, len(groups)))
+            row_list.append(row)
+        # Renumber groups in code order, like np.unique
+        ordered = sorted(groups)
+        renumber = [0] * len(groups)
+        for position, key in enumerate(ordered):
+            renumber[groups[key]] = position
+        return ordered, [renumber[group] for group in inverse_list], row_list
+
+    def _tally(
+        self, by: str, column: Optional[str], where: Optional[Mask]
+    ) -> Dict[GroupKey, Union[int, float]]:
+        """
+        Sums (or counts, without ``column``) per value of one string column.
+
+        Plain Python path: one pass accumulating by code, without building groups.
+        """
+        size = len(self._strings[by])
+        counts = [0] * (size + 1)  # Code -1 lands in the extra last slot
+        zero = 0.0 if NUMERIC_COLUMNS.get(column or "") == "d" else 0
+        sums: List[Union[int, float]] = [zero] * (size + 1)
+        codes: Sequence[int] = self._columns[by]
+        if column is None:
+            if where is not None:
+                codes = [code for code, keep in zip(codes, where) if keep]
+            for code in codes:
+                counts[code] += 1
+        else:
+            pairs: Iterable[Tuple[int, Any]] = zip(codes, self._columns[column])
+            if where is not None:
+                pairs = (pair for pair, keep in zip(pairs, where) if keep)
+            for code, value in pairs:
+                counts[code] += 1
+                sums[code] += value
+        totals = counts if column is None else sums
+        strings = self._strings[by]
+        return {strings[code]: totals[code] for code in range(size) if counts[code]}
+
+    def _decode_keys(self, by: GroupBy, keys: List[Tuple[int, ...]]) -> List[GroupKey]:
+        if isinstance(by, str):
+            strings = self._strings[by]
+            return [strings[key[0]] for key in keys]
+        dictionaries = [self._strings[name] for name in by]
+        return [tuple(d[code] for d, code in zip(dictionaries, key)) for key in keys]
+
+    def _sums(self, column: str, inverse: Any, rows: Any, groups: int) -> List[Union[int, float]]:
+        if np is not None:
+            values = self.column(column)
+            sums = np.bincount(inverse, weights=values[rows], minlength=groups)
+            if values.dtype != np.float64:
+                sums = np.rint(sums).astype(np.int64)  # Exact below 2**53
+            return sums.tolist()  # type: ignore[no-any-return]
+        values = self._columns[column]
+        result: List[Union[int, float]] = [0.0 if values.typecode == "d" else 0] * groups
+        for group, row in zip(inverse, rows):
+            result[group] += values[row]
+        return result
+
+    def _column_values(self, column: str, where: Optional[Mask]) -> List[Union[int, float]]:
+        values = self._columns[column]
+        if where is None:
+            return list(values)
+        return [value for value, keep in zip(values, where) if keep]
+
+
+def _percentile(values: List[Union[int, float]], q: float) -> float:
+    """Percentile of sorted values, interpolating linearly (NumPy's default method)."""
+    if not values:
+        return 0.0
+    position = (len(values) - 1) * q / 100
+    low = int(position)
+    high = min(low + 1, len(values) - 1)
+    return float(values[low] + (values[high] - values[low]) * (position - low))
@@ -0,0 +1,670 @@
+"""SQLite catalog of stored sessions.
+
+Session queries (list_sessions, list_sessions_in_range, get_date_range,
+find_session, get_storage_stats) used to list every platform/date directory,
+glob its session files and stat or open each one. The catalog keeps one row
+per session file in ``<base_dir>/.catalog.sqlite3`` (WAL mode, so the CLI, TUI
+and MCP server can share it):
+
+- Rows hold the SessionIndex fields plus model, smells count and duration
+- StorageManager.write_session_file(), BaseTracker.save_session() and
+  StreamingStorage.move_to_complete() upsert their session's row directly
+- Before answering a query, each date directory's mtime is compared with the
+  one recorded when it was last scanned; only changed directories are
+  rescanned, and only new or changed files in them are read
+- find_session() is a single lookup on the session_id index; missing files
+  are dropped from the catalog when found, and the directories are only
+  synced when the ID is not catalogued
+- Sessions in archive bundles (see archive.py) are catalogued from each
+  bundle when it is new or its size or mtime changed
+- ``token-audit sessions reindex`` rebuilds the catalog from the files on disk
+
+Set ``TOKEN_AUDIT_CATALOG=off`` to query the directories directly.
+"""
+
+import os
+import re
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import date
+from pathlib import Path
+from typing import Any, Dict, Generator, Iterable, List, Optional, Set, Tuple
+
+from .archive import archive_members, is_archived, list_archives, member_stat
+from .session_format import read_session_file
+from .storage import SUPPORTED_PLATFORMS, Platform, SessionIndex
+
+CATALOG_ENV_VAR = "TOKEN_AUDIT_CATALOG"
+CATALOG_FILE_NAME = ".catalog.sqlite3"
+
+# Bump to drop and rebuild catalogs written by older versions
+CATALOG_SCHEMA_VERSION = 2
+
+# Seconds to wait for another process's write transaction
+BUSY_TIMEOUT = 10.0
+
+# A directory modified this close to its last scan is scanned again next time:
+# a file added within the same mtime tick as the scan leaves the mtime unchanged
+_RACY_NS = 2_000_000_000
+
+_DATE_DIR = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+_SESSION_SUFFIXES = (".json", ".jsonl")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    file_path TEXT PRIMARY KEY,
+    session_id TEXT NOT NULL,
+    platform TEXT NOT NULL,
+    date TEXT NOT NULL,
+    schema_version TEXT NOT NULL,
+    started_at TEXT NOT NULL,
+    ended_at TEXT,
+    project TEXT,
+    model TEXT,
+    total_tokens INTEGER NOT NULL,
+    total_cost REAL NOT NULL,
+    tool_count INTEGER NOT NULL,
+    server_count INTEGER NOT NULL,
+    smells_count INTEGER NOT NULL,
+    duration_seconds REAL,
+    is_complete INTEGER NOT NULL,
+    is_session INTEGER NOT NULL,
+    file_size_bytes INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    archive TEXT
+);
+CREATE INDEX IF NOT EXISTS sessions_platform_date ON sessions (platform, date);
+CREATE INDEX IF NOT EXISTS sessions_session_id ON sessions (session_id);
+CREATE INDEX IF NOT EXISTS sessions_mtime ON sessions (mtime_ns);
+CREATE TABLE IF NOT EXISTS dirs (
+    platform TEXT NOT NULL,
+    date TEXT NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    synced_ns INTEGER NOT NULL,
+    PRIMARY KEY (platform, date)
+);
+CREATE TABLE IF NOT EXISTS archives (
+    file_path TEXT PRIMARY KEY,
+    platform TEXT NOT NULL,
+    size_bytes INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL
+);
+"""
+
+_COLUMNS = (
+    "file_path, session_id, platform, date, schema_version, started_at, ended_at, "
+    "project, model, total_tokens, total_cost, tool_count, server_count, smells_count, "
+    "duration_seconds, is_complete, is_session, file_size_bytes, mtime_ns"
+)
+_UPSERT = f"INSERT OR REPLACE INTO sessions ({_COLUMNS}) VALUES ({', '.join('?' * 19)})"
+# Rows of archived sessions also name their bundle
+_UPSERT_ARCHIVED = (
+    f"INSERT OR REPLACE INTO sessions ({_COLUMNS}, archive) VALUES ({', '.join('?' * 20)})"
+)
+
+
+def catalog_enabled() -> bool:
+    """Whether queries should use the catalog (``TOKEN_AUDIT_CATALOG`` is not ``off``)."""
+    return os.environ.get(CATALOG_ENV_VAR, "").lower() != "off"
+
+
+@dataclass
+class CatalogEntry:
+    """A catalogued session: its index entry plus the catalog-only columns."""
+
+    index: SessionIndex
+    model: Optional[str]
+    smells_count: int
+    duration_seconds: Optional[float]
+
+
+class SessionCatalog:
+    """
+    SQLite index of the session files under a storage base directory.
+
+    Example:
+        >>> catalog = SessionCatalog(storage.base_dir)
+        >>> catalog.list_paths(platform="claude_code", limit=10)
+    """
+
+    # Errors that mean the catalog can't be used (callers fall back to scanning)
+    errors = (sqlite3.Error, OSError)
+
+    def __init__(self, base_dir: Path, path: Optional[Path] = None):
+        """
+        Initialize catalog (the database is opened on first use).
+
+        Args:
+            base_dir: Session storage base directory
+            path: Database file (default: <base_dir>/.catalog.sqlite3)
+        """
+        self.base_dir = base_dir
+        self.path = path or base_dir / CATALOG_FILE_NAME
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.RLock()
+        # Directories written in place by this process since their last scan
+        self._dirty: Set[Path] = set()
+
+    def __enter__(self) -> "SessionCatalog":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    # =========================================================================
+    # Connection
+    # =========================================================================
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(
+                str(self.path),
+                timeout=BUSY_TIMEOUT,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            try:
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+                version = conn.execute("PRAGMA user_version").fetchone()[0]
+                if version != CATALOG_SCHEMA_VERSION:
+                    conn.executescript(
+                        "BEGIN IMMEDIATE;"
+                        "DROP TABLE IF EXISTS sessions;"
+                        "DROP TABLE IF EXISTS dirs;"
+                        "DROP TABLE IF EXISTS archives;"
+                        f"{_SCHEMA}"
+                        f"PRAGMA user_version = {CATALOG_SCHEMA_VERSION};"
+                        "COMMIT;"
+                    )
+            except sqlite3.Error:
+                conn.close()
+                raise
+            self._conn = conn
+        return self._conn
+
+    @contextmanager
+    def _transaction(self) -> Generator[sqlite3.Connection, None, None]:
+        """Write transaction (taken up front, so concurrent writers queue)."""
+        with self._lock:
+            conn = self._connection()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+    # =========================================================================
+    # Maintenance
+    # =========================================================================
+
+    def mark_dirty(self, directory: Path) -> None:
+        """Rescan ``directory`` before the next query (after an in-place write)."""
+        self._dirty.add(directory)
+
+    def record(self, session_path: Path, session_data: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Add or update the row for a session file that was just written.
+
+        Args:
+            session_path: Session file under <base_dir>/<platform>/<YYYY-MM-DD>/
+            session_data: Session dict that was written (read from disk if None)
+        """
+        location = self._locate(session_path)
+        if location is None:
+            return
+        platform, date_str = location
+        stat = session_path.stat()
+        row = self._build_row(session_path, platform, date_str, stat, session_data)
+        with self._transaction() as conn:
+            conn.execute(_UPSERT, row)
+
+    def remove(self, session_path: Path) -> None:
+        """Remove the row for a deleted session file."""
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM sessions WHERE file_path = ?", (self._rel(session_path),))
+
+    def rebuild(self) -> int:
+        """
+        Recreate the catalog from the session files on disk.
+
+        Returns:
+            Number of session files catalogued
+        """
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM sessions")
+            conn.execute("DELETE FROM dirs")
+            conn.execute("DELETE FROM archives")
+        self.sync()
+        with self._lock:
+            count: int = self._connection().execute("SELECT COUNT(*) FROM sessions").fetchone()[0]
+        return count
+
+    def sync(self, platforms: Optional[Iterable[Platform]] = None) -> None:
+        """Rescan date directories that changed since they were catalogued."""
+        with self._lock:
+            for platform in platforms or SUPPORTED_PLATFORMS:
+                self._sync_platform(platform)
+                self._sync_archives(platform)
+
+    def _sync_platform(self, platform: Platform) -> None:
+        platform_dir = self.base_dir / platform.replace("_", "-")
+        on_disk: Dict[str, int] = {}
+        try:
+            with os.scandir(platform_dir) as entries:
+                for entry in entries:
+                    if _DATE_DIR.match(entry.name) and entry.is_dir():
+                        on_disk[entry.name] = entry.stat().st_mtime_ns
+        except OSError:
+            pass  # Missing platform directory: drop whatever was catalogued
+
+        known = {
+            row[0]: (row[1], row[2])
+            for row in self._connection().execute(
+                "SELECT date, mtime_ns, synced_ns FROM dirs WHERE platform = ?", (platform,)
+            )
+        }
+        stale = [
+            date_str
+            for date_str, mtime_ns in on_disk.items()
+            if date_str not in known
+            or known[date_str][0] != mtime_ns
+            or known[date_str][1] - mtime_ns < _RACY_NS
+            or platform_dir / date_str in self._dirty
+        ]
+        removed = [date_str for date_str in known if date_str not in on_disk]
+        if not stale and not removed:
+            return
+
+        with self._transaction() as conn:
+            for date_str in removed:
+                conn.execute(
+                    "DELETE FROM sessions WHERE platform = ? AND date = ? AND archive IS NULL",
+                    (platform, date_str),
+                )
+                conn.execute(
+                    "DELETE FROM dirs WHERE platform = ? AND date = ?", (platform, date_str)
+                )
+            for date_str in stale:
+                self._sync_dir(conn, platform, date_str, on_disk[date_str])
+                self._dirty.discard(platform_dir / date_str)
+
+    def _sync_dir(
+        self, conn: sqlite3.Connection, platform: Platform, date_str: str, dir_mtime_ns: int
+    ) -> None:
+        """Bring one date directory's rows in line with its files."""
+        date_dir = self.base_dir / platform.replace("_", "-") / date_str
+        synced_ns = time.time_ns()
+        existing = {
+            row[0]: (row[1], row[2])
+            for row in conn.execute(
+                "SELECT file_path, file_size_bytes, mtime_ns FROM sessions "
+                "WHERE platform = ? AND date = ? AND archive IS NULL",
+                (platform, date_str),
+            )
+        }
+
+        seen: Set[str] = set()
+        try:
+            with os.scandir(date_dir) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if name.startswith(".") or not name.endswith(_SESSION_SUFFIXES):
+                        continue
+                    try:
+                        if not entry.is_file():
+                            continue
+                        stat = entry.stat()
+                    except OSError:
+                        continue
+                    rel_path = self._rel(Path(entry.path))
+                    seen.add(rel_path)
+                    if existing.get(rel_path) == (stat.st_size, stat.st_mtime_ns):
+                        continue
+                    conn.execute(
+                        _UPSERT, self._build_row(Path(entry.path), platform, date_str, stat)
+                    )
+        except OSError:
+            pass
+
+        for rel_path in existing.keys() - seen:
+            conn.execute("DELETE FROM sessions WHERE file_path = ?", (rel_path,))
+        conn.execute(
+            "INSERT OR REPLACE INTO dirs (platform, date, mtime_ns, synced_ns) "
+            "VALUES (?, ?, ?, ?)",
+            (platform, date_str, dir_mtime_ns, synced_ns),
+        )
+
+    def _sync_archives(self, platform: Platform) -> None:
+        """Catalog the sessions of new or changed archive bundles (see archive.py)."""
+        on_disk: Dict[str, Tuple[Path, os.stat_result]] = {}
+        for archive_path in list_archives(self.base_dir / platform.replace("_", "-")):
+            try:
+                on_disk[self._rel(archive_path)] = (archive_path, archive_path.stat())
+            except OSError:
+                continue
+
+        known = {
+            row[0]: (row[1], row[2])
+            for row in self._connection().execute(
+                "SELECT file_path, size_bytes, mtime_ns FROM archives WHERE platform = ?",
+                (platform,),
+            )
+        }
+        changed = [
+            rel_path
+            for rel_path, (_, stat) in on_disk.items()
+            if known.get(rel_path) != (stat.st_size, stat.st_mtime_ns)
+        ]
+        removed = known.keys() - on_disk.keys()
+        if not changed and not removed:
+            return
+
+        with self._transaction() as conn:
+            for rel_path in removed:
+                conn.execute("DELETE FROM sessions WHERE archive = ?", (rel_path,))
+                conn.execute("DELETE FROM archives WHERE file_path = ?", (rel_path,))
+            for rel_path in changed:
+                archive_path, stat = on_disk[rel_path]
+                try:
+                    members = archive_members(archive_path)
+                except OSError:
+                    continue  # Unreadable bundle: try again on the next query
+                conn.execute("DELETE FROM sessions WHERE archive = ?", (rel_path,))
+                for member in members:
+                    path = archive_path / member.name
+                    row = self._build_row(path, platform, member.date, member_stat(path))
+                    conn.execute(_UPSERT_ARCHIVED, (*row, rel_path))
+                conn.execute(
+                    "INSERT OR REPLACE INTO archives (file_path, platform, size_bytes, mtime_ns) "
+                    "VALUES (?, ?, ?, ?)",
+                    (rel_path, platform, stat.st_size, stat.st_mtime_ns),
+                )
+
+    # =========================================================================
+    # Queries
+    # =========================================================================
+
+    def list_paths(
+        self,
+        platform: Optional[Platform] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        limit: Optional[int] = None,
+    ) -> List[Path]:
+        """Session file paths, newest modification first."""
+        where, params = self._filters(platform, start_date, end_date)
+        sql = f"SELECT file_path FROM sessions{where} ORDER BY mtime_ns DESC, file_path"
+        if limit:
+            sql += f" LIMIT {int(limit)}"
+        rows = self._query([platform] if platform else None, sql, params)
+        return [self.base_dir / row[0] for row in rows]
+
+    def list_indexes(
+        self, platform: Platform, start_date: date, end_date: date
+    ) -> List[SessionIndex]:
+        """Index entries for session files dated within a range (inclusive)."""
+        return [entry.index for entry in self.entries(platform, start_date, end_date)]
+
+    def entries(
+        self,
+        platform: Optional[Platform] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> List[CatalogEntry]:
+        """Catalog entries for parseable session files, oldest date first."""
+        where, params = self._filters(platform, start_date, end_date)
+        where += " AND is_session = 1" if where else " WHERE is_session = 1"
+        sql = f"SELECT {_COLUMNS} FROM sessions{where} ORDER BY date, started_at, file_path"
+        return [_entry(row) for row in self._query([platform] if platform else None, sql, params)]
+
+    def event_logs(
+        self, platform: Platform, start_date: date, end_date: date
+    ) -> List[Tuple[Path, date]]:
+        """
+        JSONL files (with their dates) dated within a range.
+
+        Only the file's own bytes are catalogued, so a streamed or migrated
+        session whose metadata lives in the DailyIndex is not an is_session
+        row; StorageManager.list_sessions_in_range() resolves these itself.
+        """
+        where, params = self._filters(platform, start_date, end_date)
+        sql = (
+            f"SELECT file_path, date FROM sessions{where} AND file_path LIKE '%.jsonl' "
+            "ORDER BY date, file_path"
+        )
+        rows = self._query([platform], sql, params)
+        return [(self.base_dir / row[0], date.fromisoformat(row[1])) for row in rows]
+
+    def date_range(
+        self, platform: Optional[Platform] = None
+    ) -> Tuple[Optional[date], Optional[date]]:
+        """First and last session dates ((None, None) if there are no sessions)."""
+        where, params = self._filters(platform, None, None)
+        rows = self._query(
+            [platform] if platform else None,
+            f"SELECT MIN(date), MAX(date) FROM sessions{where}",
+            params,
+        )
+        first, last = rows[0]
+        return (
+            date.fromisoformat(first) if first else None,
+            date.fromisoformat(last) if last else None,
+        )
+
+    def find(self, session_id: str) -> Optional[Path]:
+        """
+        Path of the session with this ID (a .json file is preferred over .jsonl).
+
+        Answered from the session_id index without scanning directories. Rows
+        whose file has gone are deleted; the directories are only synced when
+        no catalogued file exists (an ID written by another process, or a
+        stale row).
+        """
+        with self._lock:
+            path = self._find_existing(session_id)
+            if path is None:
+                self.sync()
+                path = self._find_existing(session_id)
+        return path
+
+    def _find_existing(self, session_id: str) -> Optional[Path]:
+        rows = self._connection().execute(
+            "SELECT file_path FROM sessions WHERE session_id = ? "
+            "ORDER BY file_path LIKE '%.jsonl', mtime_ns DESC",
+            (session_id,),
+        )
+        stale = []
+        found = None
+        for (file_path,) in rows.fetchall():
+            path = self.base_dir / file_path
+            if path.exists() or is_archived(path):
+                found = path
+                break
+            stale.append(file_path)
+        if stale:
+            with self._transaction() as conn:
+                conn.executemany("DELETE FROM sessions WHERE file_path = ?", [(p,) for p in stale])
+        return found
+
+    def platform_stats(self, platform: Platform) -> Dict[str, int]:
+        """Session count, date directory count and total size for a platform."""
+        self.sync([platform])
+        with self._lock:
+            conn = self._connection()
+            count, size = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(file_size_bytes), 0) FROM sessions "
+                "WHERE platform = ?",
+                (platform,),
+            ).fetchone()
+            dates = conn.execute(
+                "SELECT COUNT(*) FROM dirs WHERE platform = ?", (platform,)
+            ).fetchone()[0]
+        return {"session_count": count, "date_count": dates, "size_bytes": size}
+
+    def _query(
+        self, platforms: Optional[List[Platform]], sql: str, params: List[Any]
+    ) -> List[Tuple[Any, ...]]:
+        self.sync(platforms)
+        with self._lock:
+            return self._connection().execute(sql, params).fetchall()
+
+    @staticmethod
+    def _filters(
+        platform: Optional[Platform], start_date: Optional[date], end_date: Optional[date]
+    ) -> Tuple[str, List[Any]]:
+        clauses: List[str] = []
+        params: List[Any] = []
+        if platform:
+            clauses.append("platform = ?")
+            params.append(platform)
+        if start_date:
+            clauses.append("date >= ?")
+            params.append(start_date.isoformat())
+        if end_date:
+            clauses.append("date <= ?")
+            params.append(end_date.isoformat())
+        return (" WHERE " + " AND ".join(clauses) if clauses else ""), params
+
+    # =========================================================================
+    # Rows
+    # =========================================================================
+
+    def _rel(self, path: Path) -> str:
+        try:
+            return str(path.relative_to(self.base_dir))
+        except ValueError:
+            return str(path)
+
+    def _locate(self, session_path: Path) -> Optional[Tuple[Platform, str]]:
+        """(platform, date) of a file laid out as <platform>/<YYYY-MM-DD>/<file>."""
+        try:
+            parts = session_path.relative_to(self.base_dir).parts
+        except ValueError:
+            return None
+        if len(parts) != 3 or not _DATE_DIR.match(parts[1]):
+            return None
+        platform = parts[0].replace("-", "_")
+        for supported in SUPPORTED_PLATFORMS:
+            if supported == platform:
+                return supported, parts[1]
+        return None
+
+    def _build_row(
+        self,
+        path: Path,
+        platform: Platform,
+        date_str: str,
+        stat: os.stat_result,
+        data: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[Any, ...]:
+        """Catalog row for a session file (JSON files are read if ``data`` is None)."""
+        if data is None and path.suffix == ".json":
+            try:
+                data = read_session_file(path)
+            except (ValueError, OSError):
+                data = None
+        if not isinstance(data, dict):
+            data = {}
+
+        header = data.get("_file") or {}
+        session = data.get("session") or {}
+        token_usage = data.get("token_usage") or {}
+        mcp_summary = data.get("mcp_summary") or {}
+        smells = data.get("smells")
+        ended_at = session.get("ended_at", header.get("ended_at"))
+        total_cost = data.get("cost_estimate_usd", data.get("cost_estimate"))
+
+        return (
+            self._rel(path),
+            path.stem,
+            platform,
+            date_str,
+            header.get("schema_version", "1.0.0"),
+            session.get("started_at") or header.get("started_at") or "",
+            ended_at,
+            session.get("project") or header.get("project"),
+            session.get("model"),
+            token_usage.get("total_tokens", header.get("total_tokens", 0)) or 0,
+            (total_cost if total_cost is not None else header.get("total_cost", 0.0)) or 0.0,
+            mcp_summary.get("unique_tools", header.get("tool_count", 0)) or 0,
+            mcp_summary.get("unique_servers", header.get("server_count", 0)) or 0,
+            len(smells) if isinstance(smells, list) else 0,
+            session.get("duration_seconds"),
+            ended_at is not None,
+            bool(header or session),
+            stat.st_size,
+            stat.st_mtime_ns,
+        )
+
+
+def _entry(row: Tuple[Any, ...]) -> CatalogEntry:
+    (
+        file_path,
+        session_id,
+        platform,
+        date_str,
+        schema_version,
+        started_at,
+        ended_at,
+        project,
+        model,
+        total_tokens,
+        total_cost,
+        tool_count,
+        server_count,
+        smells_count,
+        duration_seconds,
+        is_complete,
+        _is_session,
+        file_size_bytes,
+        _mtime_ns,
+    ) = row
+    index = SessionIndex(
+        schema_version=schema_version,
+        session_id=session_id,
+        platform=platform,
+        date=date_str,
+        started_at=started_at,
+        ended_at=ended_at,
+        project=project,
+        total_tokens=total_tokens,
+        total_cost=total_cost,
+        tool_count=tool_count,
+        server_count=server_count,
+        is_complete=bool(is_complete),
+        file_path=file_path,
+        file_size_bytes=file_size_bytes,
+    )
+    return CatalogEntry(
+        index=index,
+        model=model,
+        smells_count=smells_count,
+        duration_seconds=duration_seconds,
+    )
+
+
+def record_session_file(
+    base_dir: Path, session_path: Path, session_data: Optional[Dict[str, Any]] = None
+) -> None:
+    """Catalog a session file written outside StorageManager (never raises)."""
+    if not catalog_enabled():
+        return
+    try:
+        with SessionCatalog(base_dir) as catalog:
+            catalog.record(session_path, session_data)
+    except SessionCatalog.errors:
+        pass  # The directory scan picks the file up on the next query
@@ -8,12 +8,16 @@ Implements BaseTracker for Claude Code's debug.log format.
 import json
 import subprocess
 import time
-from datetime import datetime
+from collections import deque
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple
+from typing import TYPE_CHECKING, Any, Deque, Dict, Iterable, List, Optional, Set, Tuple
 
-from .base_tracker import BaseTracker, DataQuality
+from . import json_codec
+from .base_tracker import DataQuality, SingleFileTracker
+from .file_watcher import FileWatcher, create_watcher
 from .pricing_config import PricingConfig
+from .tail_reader import TailReader
 
 if TYPE_CHECKING:
     from .display import DisplayAdapter, DisplaySnapshot
@@ -69,6 +73,21 @@ CLAUDE_CODE_BUILTIN_TOOLS: Set[str] = {
 # Default exchange rate (used if not in config)
 DEFAULT_USD_TO_AUD = 1.54
 
+# Display refresh timing for monitor(): idle refresh interval, and the minimum
+# gap between refreshes triggered by new events (bounds redraw rate under load)
+DISPLAY_REFRESH_INTERVAL = 0.5
+DISPLAY_MIN_INTERVAL = 0.1
+
+# Number of recent events-to-display latency samples kept for stats
+LATENCY_SAMPLE_SIZE = 256
+
+# Substrings every usage-bearing transcript line contains. Lines without both
+# (user turns, tool results, summaries) are skipped before JSON decoding.
+_ASSISTANT_MARKER = '"assistant"'
+_USAGE_MARKER = '"usage"'
+_ASSISTANT_MARKER_BYTES = _ASSISTANT_MARKER.encode("utf-8")
+_USAGE_MARKER_BYTES = _USAGE_MARKER.encode("utf-8")
+
 
 def _get_model_priority(model_id: str) -> int:
     """Get priority for a model ID. Higher = more capable."""
@@ -81,6 +100,19 @@ def _get_model_priority(model_id: str) -> int:
     return 0
 
 
+def _may_have_usage(line: Any) -> bool:
+    """Cheap pre-check: could this raw transcript line be an assistant message with usage?
+
+    False negatives are impossible (both markers appear as JSON strings in any
+    such line); false positives are settled by the full decode.
+    """
+    if isinstance(line, str):
+        return _ASSISTANT_MARKER in line and _USAGE_MARKER in line
+    if isinstance(line, (bytes, bytearray)):
+        return _ASSISTANT_MARKER_BYTES in line and _USAGE_MARKER_BYTES in line
+    return True
+
+
 def _get_git_metadata(working_dir: Optional[Path] = None) -> Dict[str, str]:
     """Collect git metadata for the session (task-46.5).
 
@@ -140,7 +172,20 @@ def _get_git_metadata(working_dir: Optional[Path] = None) -> Dict[str, str]:
     return metadata
 
 
-class ClaudeCodeAdapter(BaseTracker):
+def _parse_event_time(value: Optional[str]) -> Optional[datetime]:
+    """Parse a transcript ISO 8601 timestamp (``...Z`` suffix allowed)."""
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except (TypeError, ValueError):
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+class ClaudeCodeAdapter(SingleFileTracker):
     """
     Claude Code platform adapter.
 
@@ -148,26 +193,39 @@ class ClaudeCodeAdapter(BaseTracker):
     Uses file watcher approach to tail debug logs in real-time.
     """
 
-    def __init__(self, project: str, project_path: str = "", claude_dir: Optional[Path] = None):
+    def __init__(
+        self,
+        project: str,
+        project_path: str = "",
+        claude_dir: Optional[Path] = None,
+        pricing_config: Optional[PricingConfig] = None,
+        git_metadata: Optional[Dict[str, str]] = None,
+    ):
         """
         Initialize Claude Code adapter.
 
         Args:
-            project: Project name (e.g., "token-audit")
+            project: Project name (e.g., "token-audit"). May be empty for
+                process_session_file_batch(), which then names the project
+                after the transcript's working directory.
             project_path: Relative project path (e.g., "wp-navigator-pro/main")
             claude_dir: Optional Claude Code directory (for testing)
+            pricing_config: Shared PricingConfig (bulk import reuses one per process)
+            git_metadata: Precomputed git metadata (skips the git subprocess calls)
         """
         super().__init__(project=project, platform="claude-code")
 
         self.project_path = project_path or project
         self.file_positions: Dict[Path, int] = {}  # Track read positions
+        # Transcript followed by init_source_file() (multi-source collector)
+        self._source_file: Optional[Path] = None
         self.claude_dir: Optional[Path] = claude_dir
         self.detected_model: Optional[str] = None
         self.model_name: str = "Unknown Model"
         self._tracking_start_time: float = 0.0  # Track when monitoring started
 
         # Initialize pricing config for cost calculation
-        self._pricing_config = PricingConfig()
+        self._pricing_config = pricing_config or PricingConfig()
         self._usd_to_aud = DEFAULT_USD_TO_AUD
         if self._pricing_config.loaded:
             rates = self._pricing_config.metadata.get("exchange_rates", {})
@@ -186,7 +244,9 @@ class ClaudeCodeAdapter(BaseTracker):
         self._builtin_tool_stats: Dict[str, Dict[str, int]] = {}  # tool -> {calls, tokens}
 
         # Git metadata (task-46.5)
-        self._git_metadata = _get_git_metadata(Path.cwd())
+        self._git_metadata = (
+            git_metadata if git_metadata is not None else _get_git_metadata(Path.cwd())
+        )
 
         # Warnings tracking (task-46.10)
         self._warnings: List[Dict[str, Any]] = []
@@ -210,6 +270,17 @@ class ClaudeCodeAdapter(BaseTracker):
         # Source file tracking (task-50)
         self._active_source_files: Set[str] = set()
 
+        # File watcher state (inotify with polling fallback)
+        self._watcher_backend: str = "none"
+        self._tail_readers: Dict[Path, TailReader] = {}  # Partial-line-safe readers per file
+        self._pending_event_time: Optional[float] = None  # mtime of oldest undisplayed event
+        self._display_latencies: Deque[float] = deque(maxlen=LATENCY_SAMPLE_SIZE)
+
+        # Transcript metadata (bounds sessions built by process_session_file_batch)
+        self._first_event_time: Optional[str] = None
+        self._last_event_time: Optional[str] = None
+        self._transcript_cwd: Optional[str] = None
+
         # Find Claude Code directory (only if not provided)
         if self.claude_dir is None:
             self._find_claude_directory()
@@ -294,87 +365,63 @@ class ClaudeCodeAdapter(BaseTracker):
         print(f"[Claude Code] Initializing tracker for: {self.project_path}")
         print(f"[Claude Code] Monitoring directory: {self.claude_dir}")
 
+        # Start watching before discovery so files created in between aren't missed
+        watcher = self._open_watcher()
+        print(f"[Claude Code] File watcher: {watcher.backend}")
+
         # Initial file discovery
         files = self._find_jsonl_files()
         print(f"[Claude Code] Found {len(files)} .jsonl files")
 
         # Initialize file positions (start from end - track NEW content only)
-        for file_path in files:
-            try:
-                self.file_positions[file_path] = file_path.stat().st_size
-            except Exception:
-                continue
+        self._init_file_positions(files)
 
         print("[Claude Code] Tracking started. Press Ctrl+C to stop.")
 
-        # Main monitoring loop
-        while True:
-            try:
-                files = self._find_jsonl_files()
-
-                for file_path in files:
-                    # Initialize position for new files
-                    if file_path not in self.file_positions:
-                        try:
-                            # Check if this file was created after we started tracking
-                            creation_time = self._get_file_creation_time(file_path)
-                            if creation_time >= self._tracking_start_time:
-                                # New session file - read from beginning
-                                self.file_positions[file_path] = 0
-                            else:
-                                # Existing file - read only new content
-                                self.file_positions[file_path] = file_path.stat().st_size
-                        except Exception:
-                            continue
-
-                    # Read new content
-                    try:
-                        with open(file_path) as f:
-                            # Seek to last position
-                            f.seek(self.file_positions[file_path])
-
-                            # Read new content
-                            new_content = f.read()
-                            if new_content:
-                                # Process each new line
-                                for line in new_content.split("\n"):
-                                    if line.strip():
-                                        result = self.parse_event(line)
-                                        if result:
-                                            # Track source file (task-50)
-                                            self._active_source_files.add(file_path.name)
-                                            tool_name, usage = result
-                                            self._process_tool_call(tool_name, usage)
-
-                            # Update position
-                            self.file_positions[file_path] = f.tell()
-                    except Exception as e:
-                        self.handle_unrecognized_line(f"Error reading {file_path.name}: {e}")
-                        continue
-
-                # Sleep briefly
-                time.sleep(0.5)
-
-            except KeyboardInterrupt:
-                print("\n[Claude Code] Stopping tracker...")
-                # Populate source_files before exit (task-50)
-                self.session.source_files = sorted(self._active_source_files)
-                break
+        # Main monitoring loop - wakes only for files that were appended/created
+        try:
+            while True:
+                try:
+                    changed = watcher.wait(timeout=0.5)
+                    self._process_changed_files(changed)
+
+                except KeyboardInterrupt:
+                    print("\n[Claude Code] Stopping tracker...")
+                    # Populate source_files before exit (task-50)
+                    self.session.source_files = sorted(self._active_source_files)
+                    break
+        finally:
+            watcher.close()
 
     def parse_event(self, event_data: Any) -> Optional[Tuple[str, Dict[str, Any]]]:
         """
         Parse Claude Code debug.log event.
 
         Args:
-            event_data: JSONL line from debug.log
+            event_data: JSONL line from debug.log (str or UTF-8 bytes)
 
         Returns:
             Tuple of (tool_name, usage_dict) for MCP tool calls, or
             Tuple of ("__builtin__:<tool>", usage_dict) for built-in tool calls, or
             Tuple of ("__session__", usage_dict) for text-only assistant messages
         """
+        # Skip lines that can't carry usage without decoding them. Tool results
+        # make user lines the bulk of a transcript's bytes. The first event is
+        # always decoded so the transcript start time and cwd are recorded.
+        if self._first_event_time is not None and not _may_have_usage(event_data):
+            return None
+
         try:
-            data = json.loads(event_data)
+            data = json_codec.loads(event_data)
+
+            # Record transcript timestamps/cwd (used when importing whole files)
+            event_time = data.get("timestamp")
+            if event_time:
+                if self._first_event_time is None:
+                    self._first_event_time = event_time
+                self._last_event_time = event_time
+            if self._transcript_cwd is None:
+                self._transcript_cwd = data.get("cwd")
 
             # Only process assistant messages with usage data
             if data.get("type") != "assistant":
@@ -464,6 +511,8 @@ class ClaudeCodeAdapter(BaseTracker):
             "claude_dir": str(self.claude_dir),
             "project_path": self.project_path,
             "files_monitored": len(self.file_positions),
+            "watcher_backend": self._watcher_backend,
+            "display_latency_ms": self.get_display_latency_stats(),
         }
 
     # ========================================================================
@@ -499,108 +548,60 @@ class ClaudeCodeAdapter(BaseTracker):
         print(f"[Claude Code] Initializing tracker for: {self.project_path}")
         print(f"[Claude Code] Monitoring directory: {self.claude_dir}")
 
+        # Start watching before discovery so files created in between aren't missed
+        watcher = self._open_watcher()
+
         # Initial file discovery
         files = self._find_jsonl_files()
         print(f"[Claude Code] Found {len(files)} .jsonl files")
 
         # Initialize file positions (start from end - track NEW content only)
-        for file_path in files:
-            try:
-                self.file_positions[file_path] = file_path.stat().st_size
-            except Exception:
-                continue
-
-        # Main monitoring loop
-        while True:
-            try:
-                files = self._find_jsonl_files()
-
-                for file_path in files:
-                    # Initialize position for new files
-                    if file_path not in self.file_positions:
-                        try:
-                            # Check if this file was created after we started tracking
-                            creation_time = self._get_file_creation_time(file_path)
-                            if creation_time >= self._tracking_start_time:
-                                # New session file - read from beginning
-                                self.file_positions[file_path] = 0
-                            else:
-                                # Existing file - read only new content
-                                self.file_positions[file_path] = file_path.stat().st_size
-                        except Exception:
-                            continue
-
-                    # Read new content
-                    try:
-                        with open(file_path) as f:
-                            # Seek to last position
-                            f.seek(self.file_positions[file_path])
-
-                            # Read new content
-                            new_content = f.read()
-                            if new_content:
-                                # Process each new line
-                                for line in new_content.split("\n"):
-                                    if line.strip():
-                                        result = self.parse_event(line)
-                                        if result:
-                                            # Track source file (task-50)
-                                            self._active_source_files.add(file_path.name)
-                                            tool_name, usage = result
-                                            self._process_tool_call(tool_name, usage)
-
-                            # Update position
-                            self.file_positions[file_path] = f.tell()
-                    except Exception as e:
-                        self.handle_unrecognized_line(f"Error reading {file_path.name}: {e}")
-                        continue
-
-                # Update display periodically (every 0.5 seconds)
-                if display:
-                    now = time.time()
-                    if now - self._last_display_update >= 0.5:
-                        self._last_display_update = now
-                        snapshot = self._build_display_snapshot()
-                        action = display.update(snapshot)
-                        # Handle [Q] quit keybinding (v0.7.0 - task-105.8)
-                        if action == "quit":
-                            self.session.source_files = sorted(self._active_source_files)
-                            break
-
-                # Sleep briefly
-                time.sleep(0.2)
-
-            except KeyboardInterrupt:
-                # Populate source_files before exit (task-50)
-                self.session.source_files = sorted(self._active_source_files)
-                break
-
-    def _build_display_snapshot(self) -> "DisplaySnapshot":
-        """Build DisplaySnapshot from current session state."""
-        from .display import DisplaySnapshot
+        self._init_file_positions(files)
 
-        # Calculate duration
-        duration_seconds = (datetime.now() - self._start_time).total_seconds()
+        # Main monitoring loop - wakes only for files that were appended/created
+        try:
+            while True:
+                try:
+                    # Wake for file changes, or at the latest for the next display refresh
+                    timeout = DISPLAY_REFRESH_INTERVAL
+                    if display:
+                        timeout = self._next_display_timeout(time.time())
+                    changed = watcher.wait(timeout=timeout)
+                    self._process_changed_files(changed)
+
+                    # Update display promptly on new events, otherwise every 0.5 seconds
+                    if display:
+                        now = time.time()
+                        if self._display_due(now):
+                            self._last_display_update = now
+                            snapshot = self._build_display_snapshot()
+                            action = display.update(snapshot)
+                            self._record_display_latency()
+                            # Handle [Q] quit keybinding (v0.7.0 - task-105.8)
+                            if action == "quit":
+                                self.session.source_files = sorted(self._active_source_files)
+                                break
+
+                except KeyboardInterrupt:
+                    # Populate source_files before exit (task-50)
+                    self.session.source_files = sorted(self._active_source_files)
+                    break
+        finally:
+            watcher.close()
+
+    def update_session_costs(self) -> Tuple[float, float]:
+        """
+        Calculate session costs and persist them on the session.
 
-        # Get token usage
+        Returns:
+            Tuple of (cost_estimate, cost_no_cache) in USD
+        """
         usage = self.session.token_usage
         input_tokens = usage.input_tokens
         output_tokens = usage.output_tokens
         cache_created = usage.cache_created_tokens
         cache_read = usage.cache_read_tokens
-        total_tokens = usage.total_tokens
-
-        # Calculate cache tokens (for display purposes)
-        cache_tokens = cache_read + cache_created
-
-        # Calculate cache efficiency: percentage of INPUT tokens served from cache
-        # (cache_read saves money, cache_created costs more - only count cache_read)
-        total_input = input_tokens + cache_created + cache_read
-        cache_efficiency = cache_read / total_input if total_input > 0 else 0.0
 
-        # ================================================================
-        # Cost Calculation (AC #1, #2, #3, #4, #11, #12)
-        # ================================================================
         model = self.detected_model or "claude-sonnet-4-5-20250929"  # Default fallback
 
         # Calculate actual cost (with cache)
@@ -631,14 +632,43 @@ class ClaudeCodeAdapter(BaseTracker):
                 ((input_tokens + cache_created + cache_read) * 3.0) + (output_tokens * 15.0)
             ) / 1_000_000
 
+        # Store in session for cache_analysis (task-47.3)
+        self.session.cost_no_cache = cost_no_cache
+        self.session.cache_savings_usd = cost_no_cache - cost_estimate
+        return cost_estimate, cost_no_cache
+
+    def _build_display_snapshot(self) -> "DisplaySnapshot":
+        """Build DisplaySnapshot from current session state."""
+        from .display import DisplaySnapshot
+
+        # Calculate duration
+        duration_seconds = (datetime.now() - self._start_time).total_seconds()
+
+        # Get token usage
+        usage = self.session.token_usage
+        input_tokens = usage.input_tokens
+        output_tokens = usage.output_tokens
+        cache_created = usage.cache_created_tokens
+        cache_read = usage.cache_read_tokens
+        total_tokens = usage.total_tokens
+
+        # Calculate cache tokens (for display purposes)
+        cache_tokens = cache_read + cache_created
+
+        # Calculate cache efficiency: percentage of INPUT tokens served from cache
+        # (cache_read saves money, cache_created costs more - only count cache_read)
+        total_input = input_tokens + cache_created + cache_read
+        cache_efficiency = cache_read / total_input if total_input > 0 else 0.0
+
+        # ================================================================
+        # Cost Calculation (AC #1, #2, #3, #4, #11, #12)
+        # ================================================================
+        cost_estimate, cost_no_cache = self.update_session_costs()
+
         # Calculate savings (AC #4)
         cache_savings = cost_no_cache - cost_estimate
         savings_percent = (cache_savings / cost_no_cache * 100) if cost_no_cache > 0 else 0.0
 
-        # Store in session for cache_analysis (task-47.3)
-        self.session.cost_no_cache = cost_no_cache
-        self.session.cache_savings_usd = cache_savings
-
         # ================================================================
         # Server Hierarchy (AC #7, #8, #9, #13, #14)
         # ================================================================
@@ -770,6 +800,254 @@ class ClaudeCodeAdapter(BaseTracker):
             zombie_context_tax=0,  # TODO: Calculate from schema_analyzer
         )
 
+    # ========================================================================
+    # File Watching
+    # ========================================================================
+
+    def _open_watcher(self) -> FileWatcher:
+        """Create a watcher for the Claude Code directory (inotify or polling)."""
+        watcher = create_watcher(
+            self.claude_dir or Path.home() / ".claude" / "projects",
+            suffix=".jsonl",
+            poll_interval=DISPLAY_REFRESH_INTERVAL,
+        )
+        self._watcher_backend = watcher.backend
+        return watcher
+
+    def _init_file_positions(self, files: Iterable[Path]) -> None:
+        """Start existing files at their current end (track NEW content only)."""
+        for file_path in files:
+            try:
+                self.file_positions[file_path] = file_path.stat().st_size
+            except Exception:
+                continue
+
+    def _process_changed_files(self, files: Iterable[Path]) -> int:
+        """Read new content from files reported by the watcher.
+
+        Args:
+            files: Paths that were created or appended to
+
+        Returns:
+            Number of events processed
+        """
+        processed = 0
+        for file_path in sorted(files):
+            # Initialize position for new files
+            if file_path not in self.file_positions:
+                try:
+                    # Check if this file was created after we started tracking
+                    creation_time = self._get_file_creation_time(file_path)
+                    if creation_time >= self._tracking_start_time:
+                        # New session file - read from beginning
+                        self.file_positions[file_path] = 0
+                    else:
+                        # Existing file - read only new content
+                        self.file_positions[file_path] = file_path.stat().st_size
+                except Exception:
+                    continue
+
+            try:
+                processed += self._read_new_content(file_path)
+            except Exception as e:
+                self.handle_unrecognized_line(f"Error reading {file_path.name}: {e}")
+                continue
+        return processed
+
+    def _get_tail_reader(self, file_path: Path) -> TailReader:
+        """Get the tail reader for a file, resynced if file_positions was changed."""
+        position = self.file_positions[file_path]
+        reader = self._tail_readers.get(file_path)
+        if reader is None or reader.offset != position:
+            reader = TailReader(file_path, offset=position)
+            self._tail_readers[file_path] = reader
+        return reader
+
+    def _read_new_content(self, file_path: Path) -> int:
+        """Process lines appended to a file since the last read.
+
+        A trailing line without its newline yet is held by the tail reader
+        and processed once Claude Code finishes writing it.
+
+        Returns:
+            Number of events processed
+        """
+        processed = 0
+        reader = self._get_tail_reader(file_path)
+        oversized_before = reader.oversized_lines
+
+        for batch in reader.read_batches():
+            for raw_line in batch:
+                result = self.parse_event(raw_line)
+                if result:
+                    # Track source file (task-50)
+                    self._active_source_files.add(file_path.name)
+                    tool_name, usage = result
+                    self._process_tool_call(tool_name, usage)
+                    processed += 1
+
+        if reader.oversized_lines > oversized_before:
+            self.handle_unrecognized_line(
+                f"Skipped {reader.oversized_lines - oversized_before} oversized line(s) "
+                f"in {file_path.name}"
+            )
+
+        if processed and self._pending_event_time is None:
+            # File mtime approximates when the events were written
+            try:
+                self._pending_event_time = file_path.stat().st_mtime
+            except OSError:
+                self._pending_event_time = time.time()
+
+        # Update position (complete lines only)
+        self.file_positions[file_path] = reader.offset
+        return processed
+
+    def _display_due(self, now: float) -> bool:
+        """Check whether monitor() should refresh the display."""
+        elapsed = now - self._last_display_update
+        if self._pending_event_time is not None:
+            return elapsed >= DISPLAY_MIN_INTERVAL
+        return elapsed >= DISPLAY_REFRESH_INTERVAL
+
+    def _next_display_timeout(self, now: float) -> float:
+        """Seconds the watcher may block before the next display refresh."""
+        interval = (
+            DISPLAY_MIN_INTERVAL
+            if self._pending_event_time is not None
+            else DISPLAY_REFRESH_INTERVAL
+        )
+        return max(0.0, interval - (now - self._last_display_update))
+
+    def _record_display_latency(self) -> None:
+        """Record the delay between the oldest pending event and the display update."""
+        if self._pending_event_time is None:
+            return
+        latency = max(0.0, time.time() - self._pending_event_time)
+        self._display_latencies.append(latency)
+        self._pending_event_time = None
+
+    def get_display_latency_stats(self) -> Dict[str, float]:
+        """Events-to-display latency over recent display updates.
+
+        Returns:
+            Dictionary with samples, last_ms, avg_ms and max_ms (zeros if no samples)
+        """
+        samples = list(self._display_latencies)
+        if not samples:
+            return {"samples": 0, "last_ms": 0.0, "avg_ms": 0.0, "max_ms": 0.0}
+        return {
+            "samples": len(samples),
+            "last_ms": round(samples[-1] * 1000, 1),
+            "avg_ms": round(sum(samples) / len(samples) * 1000, 1),
+            "max_ms": round(max(samples) * 1000, 1),
+        }
+
+    # ========================================================================
+    # Single-Transcript Tracking (multi-source collector)
+    # ========================================================================
+
+    def init_source_file(self, file_path: Path, resume: Optional[float] = None) -> None:
+        """
+        Track one transcript from a byte offset (see collector.MultiCollector).
+
+        Content before the offset is skipped, but the first line is still
+        parsed so the transcript's working directory and start are known.
+
+        Args:
+            file_path: Transcript to track
+            resume: Byte offset of the first line to process (None: the start)
+        """
+        offset = int(resume or 0)
+        self._tracking_start_time = time.time()
+        if offset > 0:
+            try:
+                with open(file_path, "rb") as f:
+                    first_line = f.readline(offset)
+            except OSError:
+                first_line = b""
+            if first_line.endswith(b"\n"):
+                self.parse_event(first_line)  # Metadata only; usage was already written
+        self._source_file = file_path
+        self.file_positions[file_path] = offset
+        self._process_changed_files([file_path])
+
+    def process_source_file(self) -> None:
+        """Process lines appended to the transcript set up by init_source_file()."""
+        if self._source_file is not None:
+            self._process_changed_files([self._source_file])
+
+    def source_resume_position(self) -> float:
+        """Byte offset reached in the transcript (complete lines only)."""
+        if self._source_file is None:
+            return 0
+        return self.file_positions.get(self._source_file, 0)
+
+    def source_cwd(self) -> Optional[str]:
+        """Working directory recorded in the transcript, if seen yet."""
+        return self._transcript_cwd
+
+    # ========================================================================
+    # Batch Processing (historical import)
+    # ========================================================================
+
+    def process_session_file_batch(self, file_path: Path) -> int:
+        """
+        Process a complete transcript in batch mode (no live monitoring).
+
+        Used by ``collect --backfill`` to import existing transcripts. The
+        session is dated by its first and last event timestamps (file mtime
+        if the transcript has none), and the session ID includes the
+        transcript's UUID prefix so re-importing a transcript overwrites the
+        same session.
+
+        Args:
+            file_path: Path to a Claude Code ``.jsonl`` transcript
+
+        Returns:
+            Number of transcript lines parsed
+        """
+        self.session.source_files = [file_path.name]
+
+        lines = 0
+        reader = TailReader(file_path)
+        for batch in reader.read_batches(final=True):
+            for raw_line in batch:
+                lines += 1
+                result = self.parse_event(raw_line)
+                if result:
+                    tool_name, usage = result
+                    self._process_tool_call(tool_name, usage)
+
+        if reader.oversized_lines:
+            self.handle_unrecognized_line(
+                f"Skipped {reader.oversized_lines} oversized line(s) in {file_path.name}"
+            )
+
+        if self._transcript_cwd:
+            self.session.working_directory = self._transcript_cwd
+        if not self.project:
+            # Name the project after the directory Claude Code ran in
+            self.project = (
+                Path(self._transcript_cwd).name if self._transcript_cwd else file_path.parent.name
+            )
+            self.session.project = self.project
+
+        mtime = datetime.fromtimestamp(file_path.stat().st_mtime, tz=timezone.utc)
+        started = _parse_event_time(self._first_event_time) or mtime
+        self.timestamp = started.astimezone()
+        self.session.timestamp = self.timestamp
+        self.session_id = f"{self.generate_session_id()}-{file_path.stem[:8]}"
+        self.session.session_id = self.session_id
+
+        self.update_session_costs()
+        return lines
+
+    def transcript_end_time(self) -> Optional[datetime]:
+        """Timestamp of the last decoded event (the last usage-bearing message), if any."""
+        ended = _parse_event_time(self._last_event_time)
+        return ended.astimezone() if ended else None
+
     # ========================================================================
     # Helper Methods
     # ========================================================================
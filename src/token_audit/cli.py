@@ -292,6 +292,26 @@ analyzed later with the 'report' command.
         help="Include existing session data (Codex/Gemini CLI only). Default: track new events only.",
     )
 
+    collect_parser.add_argument(
+        "--backfill",
+        action="store_true",
+        help="Import all existing Claude Code transcripts (~/.claude/projects) and exit",
+    )
+
+    collect_parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        metavar="N",
+        help="Worker processes for --backfill (default: CPU count)",
+    )
+
+    collect_parser.add_argument(
+        "--multi",
+        action="store_true",
+        help="Track every concurrent Claude/Codex/Gemini session from one process",
+    )
+
     # ========================================================================
     # report command
     # ========================================================================
@@ -328,6 +348,14 @@ EXAMPLES:
         "session_dir", type=Path, help="Session directory or parent directory containing sessions"
     )
 
+    report_parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        metavar="N",
+        help="Worker processes for loading sessions (default: CPU count)",
+    )
+
     # ---- Analysis Mode Selection ----
     mode_group = report_parser.add_argument_group(
         "analysis modes",
@@ -937,6 +965,9 @@ Examples:
 
   # Delete specific session
   token-audit sessions delete <session-id>
+
+  # Rebuild the session catalog and index totals from the files on disk
+  token-audit sessions reindex
         """,
         formatter_class=argparse.RawDescriptionHelpFormatter,
     )
@@ -1036,6 +1067,106 @@ Examples:
         help="Show what would be deleted without actually deleting",
     )
 
+    # sessions reindex subcommand
+    sessions_subparsers.add_parser(
+        "reindex",
+        help="Rebuild the session catalog and indexes",
+        description=(
+            "Recalculate the platform index totals and recreate the SQLite session "
+            "catalog from the session files on disk."
+        ),
+    )
+
+    # ========================================================================
+    # storage command
+    # ========================================================================
+    storage_parser = subparsers.add_parser(
+        "storage",
+        help="Manage the on-disk session format",
+        description="""
+Manage how collected sessions are stored on disk.
+
+New sessions are written in the compact format (no indentation, tool calls
+as positional rows, zstd or gzip compressed) when
+TOKEN_AUDIT_SESSION_FORMAT=compact is set. Both formats are read
+transparently.
+
+Old sessions can be packed into one zip bundle per platform per month
+(<platform>/archive/<YYYY-MM>.zip). Archived sessions still appear in
+listings, reports and aggregations.
+
+Examples:
+  # Convert existing sessions to the compact format
+  token-audit storage compact
+
+  # Report the savings without rewriting anything
+  token-audit storage compact --dry-run
+
+  # Convert back to pretty-printed JSON
+  token-audit storage compact --expand
+
+  # Archive sessions older than 180 days
+  token-audit storage archive --older-than 180
+        """,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+
+    storage_subparsers = storage_parser.add_subparsers(
+        title="storage commands",
+        description="Available storage commands",
+        dest="storage_command",
+        help="Storage command to execute",
+    )
+
+    storage_compact_parser = storage_subparsers.add_parser(
+        "compact",
+        help="Convert session files to the compact format",
+        description="Rewrite stored session files in the compact format and report the savings.",
+    )
+    storage_compact_parser.add_argument(
+        "--platform",
+        choices=["claude-code", "codex-cli", "gemini-cli"],
+        default=None,
+        help="Only convert sessions from this platform",
+    )
+    storage_compact_parser.add_argument(
+        "--expand",
+        action="store_true",
+        help="Convert compact session files back to pretty-printed JSON",
+    )
+    storage_compact_parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Measure the savings without rewriting any files",
+    )
+
+    storage_archive_parser = storage_subparsers.add_parser(
+        "archive",
+        help="Pack old sessions into monthly archive bundles",
+        description=(
+            "Move session files older than a cutoff into one zip bundle per platform "
+            "per month. Archived sessions stay readable by every command."
+        ),
+    )
+    storage_archive_parser.add_argument(
+        "--older-than",
+        type=int,
+        default=90,
+        metavar="DAYS",
+        help="Archive sessions from date directories older than DAYS days (default: 90)",
+    )
+    storage_archive_parser.add_argument(
+        "--platform",
+        choices=["claude-code", "codex-cli", "gemini-cli"],
+        default=None,
+        help="Only archive sessions from this platform",
+    )
+    storage_archive_parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Count the sessions that would be archived without moving anything",
+    )
+
     # ========================================================================
     # daily command (v1.0.0 - task-226.1)
     # ========================================================================
@@ -1076,6 +1207,13 @@ By default shows the last 7 days with data.
         action="store_true",
         help="Show per-model breakdown",
     )
+    daily_parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        metavar="N",
+        help="Worker processes for loading sessions (default: CPU count)",
+    )
 
     # ========================================================================
     # weekly command (v1.0.0 - task-226.2)
@@ -1123,6 +1261,13 @@ By default shows the last 4 weeks with data.
         action="store_true",
         help="Show per-model breakdown",
     )
+    weekly_parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        metavar="N",
+        help="Worker processes for loading sessions (default: CPU count)",
+    )
 
     # ========================================================================
     # monthly command (v1.0.0 - task-226.3)
@@ -1164,6 +1309,13 @@ By default shows the last 3 months with data.
         action="store_true",
         help="Show per-model breakdown",
     )
+    monthly_parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        metavar="N",
+        help="Worker processes for loading sessions (default: CPU count)",
+    )
 
     # ========================================================================
     # bucket command (v1.0.4 - task-247.4)
@@ -1450,6 +1602,8 @@ Examples:
         return cmd_pin(args)
     elif args.command == "sessions":
         return cmd_sessions(args)
+    elif args.command == "storage":
+        return cmd_storage(args)
     elif args.command == "best-practices":
         return cmd_best_practices(args)
     elif args.command == "daily":
@@ -1561,10 +1715,88 @@ def _check_first_run() -> bool:
         return True
 
 
+def _cmd_collect_backfill(args: argparse.Namespace) -> int:
+    """Import historical Claude Code transcripts (collect --backfill)."""
+    from .backfill import backfill_claude_code, find_claude_transcripts
+    from .storage import StorageManager
+
+    if args.platform not in ("auto", "claude-code"):
+        print("Error: --backfill currently supports Claude Code transcripts only")
+        return 1
+    if args.jobs is not None and args.jobs < 1:
+        print("Error: --jobs must be at least 1")
+        return 1
+
+    transcripts = find_claude_transcripts()
+    if not transcripts:
+        print("No Claude Code transcripts found (~/.claude/projects)")
+        return 0
+
+    storage = StorageManager(base_dir=args.output)
+    if not args.quiet:
+        print(f"Backfilling {len(transcripts)} Claude Code transcripts into {storage.base_dir}")
+
+    result = backfill_claude_code(transcripts, storage, jobs=args.jobs, project=args.project)
+
+    if not args.quiet:
+        print(
+            f"Imported {result.files_imported} sessions "
+            f"({result.files_skipped} without token usage, {result.files_failed} failed)"
+        )
+        print(
+            f"Processed {result.files_total} files / {result.events:,} events in "
+            f"{result.elapsed_seconds:.2f}s "
+            f"({result.files_per_second:.1f} files/sec, {result.events_per_second:,.0f} events/sec)"
+        )
+        for error in result.errors[:10]:
+            print(f"  Failed: {error}")
+    return 1 if result.files_failed and not result.files_imported else 0
+
+
+def _cmd_collect_multi(args: argparse.Namespace) -> int:
+    """Track all concurrent sessions from one process (collect --multi)."""
+    from .collector import PLATFORMS, MultiCollector
+    from .storage import StorageManager
+
+    platforms = None if args.platform == "auto" else [args.platform]
+    collector = MultiCollector(
+        StorageManager(base_dir=args.output), platforms=platforms, project=args.project
+    )
+
+    def _stop(signum: int, frame: object) -> None:
+        collector.stop()
+
+    previous = signal.signal(signal.SIGTERM, _stop)
+    if not args.quiet:
+        names = ", ".join(platforms or PLATFORMS)
+        print(f"Tracking all {names} sessions (Ctrl+C to stop)")
+    try:
+        stats = collector.run()
+    except KeyboardInterrupt:
+        collector.close()
+        stats = collector.stats
+    finally:
+        signal.signal(signal.SIGTERM, previous)
+
+    if not args.quiet:
+        print(
+            f"Saved {stats.sessions_saved} sessions from {stats.sources_opened} sources "
+            f"({stats.evictions} idle evictions)"
+        )
+        for error in stats.errors[:10]:
+            print(f"  Failed: {error}")
+    return 0
+
+
 def cmd_collect(args: argparse.Namespace) -> int:
     """Execute collect command."""
     global _active_tracker, _active_display, _shutdown_in_progress, _session_saved
 
+    if args.backfill:
+        return _cmd_collect_backfill(args)
+    if args.multi:
+        return _cmd_collect_multi(args)
+
     from .display import DisplaySnapshot, create_display
 
     # Check for first run (interactive welcome)
@@ -1945,7 +2177,7 @@ def _cmd_report_smells(args: argparse.Namespace) -> int:
     """
     from .smell_aggregator import SmellAggregator
 
-    aggregator = SmellAggregator()
+    aggregator = SmellAggregator(jobs=getattr(args, "jobs", None))
     result = aggregator.aggregate(
         days=args.days,
         platform=getattr(args, "platform", None),
@@ -2279,6 +2511,11 @@ def cmd_report(args: argparse.Namespace) -> int:
     - Smell analysis: --smells (formerly smells command)
     - Bucket analysis: --buckets (v1.0.4 - task-247.17)
     """
+    jobs = getattr(args, "jobs", None)
+    if jobs is not None and jobs < 1:
+        print("Error: --jobs must be at least 1")
+        return 1
+
     # v1.0.0: Check for --smells flag first (merged from smells command)
     if getattr(args, "smells", False):
         return _cmd_report_smells(args)
@@ -2322,7 +2559,7 @@ def cmd_report(args: argparse.Namespace) -> int:
     else:
         # Multiple sessions (parent directory or JSON files)
         print(f"Loading sessions from: {session_dir}")
-        sessions = []
+        session_paths: List[Path] = []
 
         # Check if this is a platform directory (contains date-formatted subdirectories)
         date_pattern = re.compile(r"^\d{4}-\d{2}-\d{2}$")
@@ -2335,21 +2572,27 @@ def cmd_report(args: argparse.Namespace) -> int:
                 # Look for session JSON files inside date directory
                 for json_file in s_dir.glob("*.json"):
                     if json_file.name != "summary.json" and not json_file.name.startswith("."):
-                        session = manager.load_session(json_file)
-                        if session:
-                            sessions.append(session)
+                        session_paths.append(json_file)
             else:
                 # Try loading as v1.0.0 format session directory
-                session = manager.load_session(s_dir)
-                if session:
-                    sessions.append(session)
+                session_paths.append(s_dir)
 
         # Also try direct JSON files in the current directory (v1.0.4 format)
         for json_file in session_dir.glob("*.json"):
             if json_file.name != "summary.json" and not json_file.name.startswith("."):
-                session = manager.load_session(json_file)
-                if session:
-                    sessions.append(session)
+                session_paths.append(json_file)
+
+        # Loaded across worker processes, in the order found
+        from .session_loader import full_session, load_sessions
+
+        loaded = load_sessions(
+            session_paths,
+            full_session,
+            session_dir,
+            jobs=jobs,
+            lazy=False,
+        )
+        sessions = [session for session in loaded if session]
 
         if not sessions:
             print("Error: No valid sessions found in directory")
@@ -2386,7 +2629,7 @@ def cmd_smells(args: argparse.Namespace) -> int:
     """Execute smells command - cross-session smell aggregation."""
     from .smell_aggregator import SmellAggregator
 
-    aggregator = SmellAggregator()
+    aggregator = SmellAggregator(jobs=getattr(args, "jobs", None))
     result = aggregator.aggregate(
         days=args.days,
         platform=normalize_platform(args.platform),
@@ -4269,8 +4512,9 @@ def cmd_validate(args: argparse.Namespace) -> int:
 
     # Load session file
     try:
-        with open(session_file, encoding="utf-8") as f:
-            session_data = json.load(f)
+        from .session_format import read_session_file
+
+        session_data = read_session_file(session_file)
     except json.JSONDecodeError as e:
         print(f"Error: Invalid session JSON: {e}", file=sys.stderr)
         return 1
@@ -4480,6 +4724,8 @@ def cmd_sessions(args: argparse.Namespace) -> int:
         return _cmd_sessions_show(args, storage)
     elif subcommand == "delete":
         return _cmd_sessions_delete(args, storage)
+    elif subcommand == "reindex":
+        return _cmd_sessions_reindex(storage)
     else:
         # No subcommand - show help
         print("Usage: token-audit sessions <command>")
@@ -4488,11 +4734,88 @@ def cmd_sessions(args: argparse.Namespace) -> int:
         print("  list     List recent sessions")
         print("  show     Show session details")
         print("  delete   Delete sessions")
+        print("  reindex  Rebuild the session catalog and indexes")
         print()
         print("Run 'token-audit sessions <command> --help' for more info.")
         return 1
 
 
+def cmd_storage(args: argparse.Namespace) -> int:
+    """Execute storage command - manage the on-disk session format."""
+    from .storage import StorageManager
+
+    storage = StorageManager()
+
+    if getattr(args, "storage_command", None) == "compact":
+        return _cmd_storage_compact(args, storage)
+    if getattr(args, "storage_command", None) == "archive":
+        return _cmd_storage_archive(args, storage)
+
+    print("Usage: token-audit storage <command>")
+    print()
+    print("Commands:")
+    print("  compact  Convert session files to the compact format")
+    print("  archive  Pack old sessions into monthly archive bundles")
+    print()
+    print("Run 'token-audit storage <command> --help' for more info.")
+    return 1
+
+
+def _cmd_storage_compact(args: argparse.Namespace, storage: Any) -> int:
+    """Convert stored sessions between the JSON and compact formats."""
+    expand = getattr(args, "expand", False)
+    dry_run = getattr(args, "dry_run", False)
+    result = storage.convert_session_files(
+        compact=not expand,
+        platform=normalize_platform(getattr(args, "platform", None)),
+        dry_run=dry_run,
+    )
+
+    target = "JSON" if expand else "compact"
+    verb = "Would convert" if dry_run else "Converted"
+    print(
+        f"{verb} {result.converted} session files to {target} format "
+        f"({result.already_converted} already {target}, {result.failed} failed)"
+    )
+    if result.converted:
+        before_mb = result.bytes_before / (1024 * 1024)
+        after_mb = result.bytes_after / (1024 * 1024)
+        saved = 1 - result.bytes_after / result.bytes_before if result.bytes_before else 0.0
+        print(f"  Size:      {before_mb:.2f} MB -> {after_mb:.2f} MB ({saved:.0%} smaller)")
+        before_ms = result.load_seconds_before * 1000
+        after_ms = result.load_seconds_after * 1000
+        speedup = before_ms / after_ms if after_ms else 0.0
+        print(f"  Load time: {before_ms:.0f} ms -> {after_ms:.0f} ms ({speedup:.1f}x)")
+    return 1 if result.failed else 0
+
+
+def _cmd_storage_archive(args: argparse.Namespace, storage: Any) -> int:
+    """Pack sessions older than --older-than days into monthly bundles."""
+    older_than = getattr(args, "older_than", 90)
+    if older_than < 0:
+        print("Error: --older-than must not be negative", file=sys.stderr)
+        return 1
+    dry_run = getattr(args, "dry_run", False)
+    result = storage.archive_sessions(
+        older_than,
+        platform=normalize_platform(getattr(args, "platform", None)),
+        dry_run=dry_run,
+    )
+
+    verb = "Would archive" if dry_run else "Archived"
+    print(
+        f"{verb} {result.archived} session files older than {older_than} days "
+        f"({result.failed} failed)"
+    )
+    if result.archived and not dry_run:
+        before_mb = result.bytes_before / (1024 * 1024)
+        after_mb = result.bytes_after / (1024 * 1024)
+        saved = 1 - result.bytes_after / result.bytes_before if result.bytes_before else 0.0
+        print(f"  Bundles:   {result.bundles} written")
+        print(f"  Size:      {before_mb:.2f} MB -> {after_mb:.2f} MB ({saved:.0%} smaller)")
+    return 1 if result.failed else 0
+
+
 def _build_active_session_entry(
     path: Path, session_id: str, verbose: bool, use_json: bool
 ) -> Optional[dict[str, Any]]:
@@ -4596,30 +4919,31 @@ def _cmd_sessions_list(args: argparse.Namespace, storage: Any) -> int:
 
             if verbose or use_json:
                 # Load session for detailed info
-                with open(session_path) as f:
-                    first_line = f.readline()
-                    if first_line.strip():
-                        header = json.loads(first_line)
-                        if isinstance(header, dict):
-                            entry["project"] = header.get("project", "unknown")
-                            entry["model"] = header.get("model", "unknown")
-
-                            # Get token usage if available
-                            token_usage = header.get("token_usage", {})
-                            if isinstance(token_usage, dict):
-                                entry["total_tokens"] = token_usage.get("total_tokens", 0)
-                                entry["cached_tokens"] = token_usage.get("cached_tokens", 0)
-
-                            # Get duration if available
-                            start = header.get("start_time")
-                            end = header.get("end_time")
-                            if start and end:
-                                try:
-                                    start_dt = datetime.fromisoformat(start.replace("Z", "+00:00"))
-                                    end_dt = datetime.fromisoformat(end.replace("Z", "+00:00"))
-                                    entry["duration_seconds"] = (end_dt - start_dt).total_seconds()
-                                except (ValueError, AttributeError):
-                                    pass
+                data = _read_session_header(session_path)
+                if isinstance(data, dict):
+                    # v1.0.0+ JSON nests the session block; legacy JSONL header is flat
+                    session = data.get("session", data)
+                    entry["project"] = session.get("project", "unknown")
+                    entry["model"] = session.get("model", "unknown")
+
+                    # Get token usage if available
+                    token_usage = data.get("token_usage", session.get("token_usage", {}))
+                    if isinstance(token_usage, dict):
+                        entry["total_tokens"] = token_usage.get("total_tokens", 0)
+                        entry["cached_tokens"] = token_usage.get(
+                            "cache_read_tokens", token_usage.get("cached_tokens", 0)
+                        )
+
+                    # Get duration if available
+                    start = session.get("started_at", session.get("start_time"))
+                    end = session.get("ended_at", session.get("end_time"))
+                    if start and end:
+                        try:
+                            start_dt = datetime.fromisoformat(start.replace("Z", "+00:00"))
+                            end_dt = datetime.fromisoformat(end.replace("Z", "+00:00"))
+                            entry["duration_seconds"] = (end_dt - start_dt).total_seconds()
+                        except (ValueError, AttributeError):
+                            pass
 
             session_data.append(entry)
         except Exception as e:
@@ -4679,6 +5003,23 @@ def _cmd_sessions_list(args: argparse.Namespace, storage: Any) -> int:
     return 0
 
 
+def _read_session_header(session_path: Path) -> Any:
+    """
+    Session document for listings, in either on-disk format.
+
+    Legacy JSONL files contribute only their header line.
+    """
+    import json
+
+    from .session_format import read_session_file, read_session_prefix
+
+    if session_path.suffix != ".jsonl":
+        return read_session_file(session_path)
+    # Header lines are small; 1 MiB bounds the read for huge event logs
+    first_line = read_session_prefix(session_path, 1 << 20).split(b"\n", 1)[0]
+    return json.loads(first_line) if first_line.strip() else None
+
+
 def _cmd_sessions_show(args: argparse.Namespace, storage: Any) -> int:
     """Show session details."""
     import json
@@ -4709,16 +5050,14 @@ def _cmd_sessions_show(args: argparse.Namespace, storage: Any) -> int:
 
     # Load and display session
     try:
-        with open(session_path) as f:
-            content = f.read()
+        from .session_format import read_session_file
 
-        if not content.strip():
+        # Parse session - either on-disk format, loose or archived
+        data = read_session_file(session_path)
+        if not data:
             print("Empty session file.", file=sys.stderr)
             return 1
 
-        # Parse session - could be JSON or JSONL format
-        data = json.loads(content)
-
         # Handle token-audit v1.0.0+ JSON format: {"_file": {...}, "session": {...}}
         if isinstance(data, dict) and "session" in data:
             session = data["session"]
@@ -4789,6 +5128,24 @@ def _cmd_sessions_show(args: argparse.Namespace, storage: Any) -> int:
     return 0
 
 
+def _cmd_sessions_reindex(storage: Any) -> int:
+    """Rebuild the platform indexes and session catalog from disk."""
+    import time
+
+    start = time.perf_counter()
+    platforms = storage.list_platforms()
+    for platform in platforms:
+        storage.rebuild_platform_index(platform)
+    print(f"Rebuilt {len(platforms)} platform indexes")
+    try:
+        count = storage.rebuild_catalog()
+    except RuntimeError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    print(f"Catalogued {count} session files in {time.perf_counter() - start:.2f}s")
+    return 0
+
+
 def _cmd_sessions_delete(args: argparse.Namespace, storage: Any) -> int:
     """Delete sessions."""
     import re
@@ -4896,7 +5253,7 @@ def _cmd_sessions_delete(args: argparse.Namespace, storage: Any) -> int:
     errors = 0
     for path in to_delete:
         try:
-            path.unlink()
+            storage.delete_session(path)
             deleted += 1
         except OSError as e:
             print(f"Error deleting {path.stem}: {e}", file=sys.stderr)
@@ -5117,12 +5474,18 @@ def cmd_daily(args: argparse.Namespace) -> int:
     # Normalize platform format
     platform = normalize_platform(args.platform)
 
+    jobs = getattr(args, "jobs", None)
+    if jobs is not None and jobs < 1:
+        print("Error: --jobs must be at least 1")
+        return 1
+
     # Get aggregated data
     results = aggregate_daily(
         platform=platform,
         start_date=start_date,
         end_date=end_date,
         group_by_project=args.instances,
+        jobs=jobs,
     )
 
     # Output
@@ -5159,6 +5522,11 @@ def cmd_weekly(args: argparse.Namespace) -> int:
     # Normalize platform format
     platform = normalize_platform(args.platform)
 
+    jobs = getattr(args, "jobs", None)
+    if jobs is not None and jobs < 1:
+        print("Error: --jobs must be at least 1")
+        return 1
+
     # Get aggregated data
     results = aggregate_weekly(
         platform=platform,
@@ -5166,6 +5534,7 @@ def cmd_weekly(args: argparse.Namespace) -> int:
         end_date=end_date,
         start_of_week=start_of_week,
         group_by_project=args.instances,
+        jobs=jobs,
     )
 
     # Output
@@ -5205,12 +5574,18 @@ def cmd_monthly(args: argparse.Namespace) -> int:
     # Normalize platform format
     platform = normalize_platform(args.platform)
 
+    jobs = getattr(args, "jobs", None)
+    if jobs is not None and jobs < 1:
+        print("Error: --jobs must be at least 1")
+        return 1
+
     # Get aggregated data
     results = aggregate_monthly(
         platform=platform,
         start_date=start_date,
         end_date=end_date,
         group_by_project=args.instances,
+        jobs=jobs,
     )
 
     # Output
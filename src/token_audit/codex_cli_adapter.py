@@ -17,8 +17,10 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple
 
-from .base_tracker import BaseTracker, DataQuality
+from . import json_codec
+from .base_tracker import DataQuality, SingleFileTracker
 from .pricing_config import PricingConfig
+from .tail_reader import TailReader
 from .token_estimator import TokenEstimator
 
 if TYPE_CHECKING:
@@ -48,6 +50,9 @@ MODEL_DISPLAY_NAMES: Dict[str, str] = {
     "gpt-4o-mini": "GPT-4o Mini",
 }
 
+# Tool calls queued in batch mode before their tokens are estimated together
+ESTIMATE_BATCH_SIZE = 512
+
 # Codex CLI built-in tools - from official source:
 # https://github.com/openai/codex/tree/main/codex-rs/core/src/tools/handlers
 CODEX_BUILTIN_TOOLS: set[str] = {
@@ -68,7 +73,7 @@ CODEX_BUILTIN_TOOLS: set[str] = {
 DEFAULT_USD_TO_AUD = 1.54
 
 
-class CodexCLIAdapter(BaseTracker):
+class CodexCLIAdapter(SingleFileTracker):
     """
     Codex CLI platform adapter.
 
@@ -131,7 +136,11 @@ class CodexCLIAdapter(BaseTracker):
             self._usd_to_aud = rates.get("USD_to_AUD", DEFAULT_USD_TO_AUD)
 
         # File monitoring state
+        # The tail reader keeps the byte offset (plus inode) so each poll reads only
+        # appended bytes; size + mtime let unchanged files be skipped without a read
         self._processed_lines: int = 0
+        self._tail: Optional[TailReader] = None
+        self._file_size: int = 0
         self._last_file_mtime: float = 0.0
         self._has_received_events: bool = False
 
@@ -157,6 +166,11 @@ class CodexCLIAdapter(BaseTracker):
         # Counts MCP tool calls that use estimated tokens
         self._estimated_tool_calls: int = 0
 
+        # Batch estimation: while reading whole files, completed tool calls are
+        # queued and tokenized together by _flush_deferred_estimates()
+        self._defer_estimation: bool = False
+        self._deferred_estimates: List[Dict[str, Any]] = []
+
         # Data quality (v1.5.0 - task-103.5)
         # Codex CLI: Session tokens are native from API, MCP tool tokens are estimated
         # We report "estimated" because MCP tool breakdowns use tiktoken
@@ -273,10 +287,10 @@ class CodexCLIAdapter(BaseTracker):
             # Try to extract session ID from first line
             session_id = None
             try:
-                with open(path) as f:
+                with open(path, "rb") as f:
                     first_line = f.readline()
                     if first_line:
-                        data = json.loads(first_line)
+                        data = json_codec.loads(first_line)
                         if data.get("type") == "session_meta":
                             session_id = data.get("payload", {}).get("id")
             except (json.JSONDecodeError, OSError):
@@ -300,12 +314,12 @@ class CodexCLIAdapter(BaseTracker):
         Yields:
             Parsed JSON event dictionaries
         """
-        with open(file_path) as f:
+        with open(file_path, "rb") as f:
             for line in f:
                 line = line.strip()
                 if line:
                     try:
-                        yield json.loads(line)
+                        yield json_codec.loads(line)
                     except json.JSONDecodeError:
                         continue
 
@@ -354,31 +368,7 @@ class CodexCLIAdapter(BaseTracker):
         print(f"[Codex CLI] Monitoring: {session_file}")
         self.session.source_files = [session_file.name]
 
-        # Auto-detect completed sessions (v0.9.1 - #68)
-        # If session file is stale (>5 seconds old) and has data, auto-enable from_start
-        if not self._from_start:
-            file_mtime = session_file.stat().st_mtime
-            file_age_seconds = time.time() - file_mtime
-            if file_age_seconds > 5:
-                with open(session_file) as f:
-                    line_count = sum(1 for _ in f)
-                if line_count > 0:
-                    print(
-                        f"[Codex CLI] Auto-detected completed session "
-                        f"({line_count} lines, {file_age_seconds:.0f}s old)"
-                    )
-                    self._from_start = True
-
-        # Initialize file position based on from_start flag
-        if not self._from_start:
-            # Skip to end - only track NEW events
-            with open(session_file) as f:
-                self._processed_lines = sum(1 for _ in f)
-            print(
-                f"[Codex CLI] Tracking NEW events only (skipped {self._processed_lines} existing lines)"
-            )
-        else:
-            print("[Codex CLI] Processing from start (--from-start)")
+        self._init_file_position(session_file)
 
         print("[Codex CLI] Tracking started. Press Ctrl+C to stop.")
 
@@ -405,6 +395,44 @@ class CodexCLIAdapter(BaseTracker):
                 print("\n[Codex CLI] Stopping tracker...")
                 break
 
+    def update_session_costs(self) -> Tuple[float, float]:
+        """
+        Calculate session costs and persist them on the session.
+
+        Returns:
+            Tuple of (cost_estimate, cost_no_cache) in USD (0.0 without pricing
+            for the detected model)
+        """
+        usage = self.session.token_usage
+        pricing = PricingConfig()
+        model_id = self.detected_model or ""
+
+        # NOTE: For OpenAI/Codex API, input_tokens INCLUDES cache_read_tokens as a subset.
+        # So: non_cached_input = input_tokens - cache_read_tokens (task-69.32.2)
+        cost_with_cache = 0.0
+        cost_without_cache = 0.0
+        if pricing.loaded and model_id:
+            # Cost with cache: charge non-cached at input_rate, cached at cache_rate
+            non_cached_input = usage.input_tokens - usage.cache_read_tokens
+            cost_with_cache = pricing.calculate_cost(
+                model_id,
+                non_cached_input,
+                usage.output_tokens,
+                usage.cache_created_tokens,
+                usage.cache_read_tokens,
+            )
+            # Cost without cache: all input at full input_rate (no cache_read)
+            # input_tokens already represents total input, so no addition needed
+            cost_without_cache = pricing.calculate_cost(
+                model_id, usage.input_tokens, usage.output_tokens, 0, 0
+            )
+
+            # Save costs to session for persistence (task-66.8)
+            self.session.cost_estimate = cost_with_cache
+            self.session.cost_no_cache = cost_without_cache
+            self.session.cache_savings_usd = cost_without_cache - cost_with_cache
+        return cost_with_cache, cost_without_cache
+
     def _build_display_snapshot(self) -> "DisplaySnapshot":
         """Build DisplaySnapshot from current session state."""
         from .display import DisplaySnapshot
@@ -440,29 +468,8 @@ class CodexCLIAdapter(BaseTracker):
                 top_tools.append((tool_name, tool_stats.calls, tool_stats.total_tokens, avg_tokens))
         top_tools.sort(key=lambda x: x[2], reverse=True)
 
-        # Get pricing for cost calculation
-        pricing = PricingConfig()
-        model_id = self.detected_model or ""
-
         # Calculate costs
-        # NOTE: For OpenAI/Codex API, input_tokens INCLUDES cache_read_tokens as a subset.
-        # So: non_cached_input = input_tokens - cache_read_tokens (task-69.32.2)
-        cost_with_cache = 0.0
-        cost_without_cache = 0.0
-        if pricing.loaded and model_id:
-            # Cost with cache: charge non-cached at input_rate, cached at cache_rate
-            non_cached_input = input_tokens - cache_read
-            cost_with_cache = pricing.calculate_cost(
-                model_id, non_cached_input, output_tokens, cache_created, cache_read
-            )
-            # Cost without cache: all input at full input_rate (no cache_read)
-            # input_tokens already represents total input, so no addition needed
-            cost_without_cache = pricing.calculate_cost(model_id, input_tokens, output_tokens, 0, 0)
-
-            # Save costs to session for persistence (task-66.8)
-            self.session.cost_estimate = cost_with_cache
-            self.session.cost_no_cache = cost_without_cache
-            self.session.cache_savings_usd = cost_without_cache - cost_with_cache
+        cost_with_cache, cost_without_cache = self.update_session_costs()
 
         # Build server hierarchy for live TUI display (task-68.1)
         # Exclude "builtin" pseudo-server - built-in tools are shown separately (task-69.32.1)
@@ -572,31 +579,7 @@ class CodexCLIAdapter(BaseTracker):
         print(f"[Codex CLI] Monitoring: {session_file}")
         self.session.source_files = [session_file.name]
 
-        # Auto-detect completed sessions (v0.9.1 - #68)
-        # If session file is stale (>5 seconds old) and has data, auto-enable from_start
-        if not self._from_start:
-            file_mtime = session_file.stat().st_mtime
-            file_age_seconds = time.time() - file_mtime
-            if file_age_seconds > 5:
-                with open(session_file) as f:
-                    line_count = sum(1 for _ in f)
-                if line_count > 0:
-                    print(
-                        f"[Codex CLI] Auto-detected completed session "
-                        f"({line_count} lines, {file_age_seconds:.0f}s old)"
-                    )
-                    self._from_start = True
-
-        # Initialize file position based on from_start flag
-        if not self._from_start:
-            # Skip to end - only track NEW events
-            with open(session_file) as f:
-                self._processed_lines = sum(1 for _ in f)
-            print(
-                f"[Codex CLI] Tracking NEW events only (skipped {self._processed_lines} existing lines)"
-            )
-        else:
-            print("[Codex CLI] Processing from start (--from-start)")
+        self._init_file_position(session_file)
 
         print("[Codex CLI] Tracking started. Press Ctrl+C to stop.")
 
@@ -676,7 +659,7 @@ class CodexCLIAdapter(BaseTracker):
                 line = str(event_data).strip()
                 if not line:
                     return None
-                data = json.loads(line)
+                data = json_codec.loads(line)
 
             event_type = data.get("type", "")
             payload = data.get("payload", {})
@@ -846,13 +829,15 @@ class CodexCLIAdapter(BaseTracker):
 
         Token estimation uses tiktoken o200k_base encoding for ~99-100% accuracy
         with OpenAI/Codex models. Both MCP and built-in tools are estimated.
+        While reading whole files the call is queued instead, and recorded by
+        _flush_deferred_estimates() with the rest of the batch.
 
         Args:
             payload: The event payload with output and call_id
 
         Returns:
             Tuple of (tool_name, usage_dict) with estimated tokens for all tools,
-            None if no matching pending call
+            None if no matching pending call or the call was queued
         """
         call_id = payload.get("call_id")
 
@@ -881,26 +866,19 @@ class CodexCLIAdapter(BaseTracker):
             with contextlib.suppress(ValueError):
                 duration_ms = int(float(match.group(1)) * 1000)
 
-        # Estimate tokens from arguments and result (task-69.8, task-69.24)
-        input_tokens, output_tokens = self._estimator.estimate_tool_call(arguments_str, output)
-
         # Track estimated tool calls for TUI display (task-69.10)
         self._estimated_tool_calls += 1
 
-        # Update builtin_tool_stats with estimated tokens (task-69.24)
-        if is_builtin and tool_name in self.session.builtin_tool_stats:
-            self.session.builtin_tool_stats[tool_name]["tokens"] += input_tokens + output_tokens
-
         # Parse tool params for duplicate detection
         try:
-            tool_params = json.loads(arguments_str)
+            tool_params = json_codec.loads(arguments_str)
         except json.JSONDecodeError:
             tool_params = {}
 
-        # Build usage dict with estimated tokens
+        # Build usage dict; tokens are filled in by _apply_estimate()
         usage_dict = {
-            "input_tokens": input_tokens,
-            "output_tokens": output_tokens,
+            "input_tokens": 0,
+            "output_tokens": 0,
             "cache_created_tokens": 0,  # Codex doesn't have cache creation
             "cache_read_tokens": 0,  # Codex caching tracked at session level
             "tool_params": tool_params,
@@ -910,13 +888,78 @@ class CodexCLIAdapter(BaseTracker):
             "is_estimated": True,
             "estimation_method": self._estimator.method_name,
             "estimation_encoding": self._estimator.encoding_name,
+            # Model active when the call completed (recorded later if deferred)
+            "model": self.detected_model,
+            "model_name": self.model_name,
         }
 
+        # Batch mode: queue the call and estimate tokens for the whole queue at once
+        if self._defer_estimation:
+            self._deferred_estimates.append(
+                {
+                    "tool_name": tool_name,
+                    "is_builtin": is_builtin,
+                    "usage": usage_dict,
+                    "arguments_str": arguments_str,
+                    "output": output,
+                }
+            )
+            if len(self._deferred_estimates) >= ESTIMATE_BATCH_SIZE:
+                self._flush_deferred_estimates()
+            return None
+
+        # Estimate tokens from arguments and result (task-69.8, task-69.24)
+        input_tokens, output_tokens = self._estimator.estimate_tool_call(arguments_str, output)
+        return self._apply_estimate(tool_name, is_builtin, usage_dict, input_tokens, output_tokens)
+
+    def _apply_estimate(
+        self,
+        tool_name: str,
+        is_builtin: bool,
+        usage_dict: Dict[str, Any],
+        input_tokens: int,
+        output_tokens: int,
+    ) -> Tuple[str, Dict[str, Any]]:
+        """Store estimated tokens for a completed tool call.
+
+        Returns:
+            Tuple of (tool_name, usage_dict), prefixed "__builtin__:" for built-ins
+        """
+        usage_dict["input_tokens"] = input_tokens
+        usage_dict["output_tokens"] = output_tokens
+
+        # Update builtin_tool_stats with estimated tokens (task-69.24)
+        if is_builtin and tool_name in self.session.builtin_tool_stats:
+            self.session.builtin_tool_stats[tool_name]["tokens"] += input_tokens + output_tokens
+
         # Return with correct prefix for built-in vs MCP tools (task-69.24)
         if is_builtin:
             return (f"__builtin__:{tool_name}", usage_dict)
         return (tool_name, usage_dict)
 
+    def _flush_deferred_estimates(self) -> None:
+        """Estimate tokens for all queued tool calls in one batch, then record them.
+
+        Calls are recorded in the order they completed, each with the model
+        stored in its usage dict when it completed.
+        """
+        deferred, self._deferred_estimates = self._deferred_estimates, []
+        if not deferred:
+            return
+
+        estimates = self._estimator.estimate_tool_calls_batch(
+            [(entry["arguments_str"], entry["output"]) for entry in deferred]
+        )
+        for entry, (input_tokens, output_tokens) in zip(deferred, estimates):
+            tool_name, usage = self._apply_estimate(
+                entry["tool_name"],
+                entry["is_builtin"],
+                entry["usage"],
+                input_tokens,
+                output_tokens,
+            )
+            self._process_tool_call(tool_name, usage)
+
     def _update_call_duration(self, tool_name: str, call_id: str, duration_ms: int) -> None:
         """
         Update duration for a recorded tool call (task-68.5).
@@ -979,44 +1022,132 @@ class CodexCLIAdapter(BaseTracker):
     # File Monitoring (Task 60.8)
     # ========================================================================
 
+    def _init_file_position(self, session_file: Path) -> None:
+        """Set the starting read offset for live tracking.
+
+        Stale files (>5 seconds old) with data switch to from_start; otherwise
+        the offset is placed at end-of-file so only NEW events are tracked.
+        Both checks use a single stat() instead of scanning the file.
+        """
+        stat = session_file.stat()
+
+        # Auto-detect completed sessions (v0.9.1 - #68)
+        # If session file is stale (>5 seconds old) and has data, auto-enable from_start
+        if not self._from_start:
+            file_age_seconds = time.time() - stat.st_mtime
+            if file_age_seconds > 5 and stat.st_size > 0:
+                print(
+                    f"[Codex CLI] Auto-detected completed session "
+                    f"({stat.st_size:,} bytes, {file_age_seconds:.0f}s old)"
+                )
+                self._from_start = True
+
+        # Initialize file position based on from_start flag
+        if not self._from_start:
+            # Seek to end - only track NEW events
+            self._tail = TailReader(session_file, offset=stat.st_size)
+            self._tail.inode = stat.st_ino
+            print(
+                f"[Codex CLI] Tracking NEW events only "
+                f"(skipped {stat.st_size:,} bytes of existing events)"
+            )
+        else:
+            print("[Codex CLI] Processing from start (--from-start)")
+
     def _process_session_file(self, file_path: Path) -> None:
-        """Read and process session file for new events."""
-        if not file_path.exists():
+        """Read and process session file for new events.
+
+        Resumes from the byte offset reached by the previous call, so each
+        poll costs O(new bytes). A changed inode (file replaced) or a size
+        below the saved offset (file truncated) restarts from byte 0, and a
+        line still being written is held until its newline arrives.
+        """
+        try:
+            stat = file_path.stat()
+        except OSError:
             return
 
         # Check if file was modified
-        current_mtime = file_path.stat().st_mtime
-        if current_mtime == self._last_file_mtime:
+        if stat.st_mtime == self._last_file_mtime and stat.st_size == self._file_size:
             return
 
-        self._last_file_mtime = current_mtime
+        self._last_file_mtime = stat.st_mtime
+        self._file_size = stat.st_size
+
+        if self._tail is None or self._tail.path != file_path:
+            self._tail = TailReader(file_path)
+        resets = self._tail.resets
 
+        self._defer_estimation = True
         try:
-            with open(file_path) as f:
-                # Skip already processed lines
-                for _ in range(self._processed_lines):
-                    f.readline()
+            # Reads from the saved offset; a replaced inode or a file shorter
+            # than the offset restarts at byte 0, partial lines wait for their newline
+            for batch in self._tail.read_batches():
+                if self._tail.resets != resets:
+                    resets = self._tail.resets
+                    self._processed_lines = 0
 
                 # Process new lines
-                line_count = self._processed_lines
-                for line in f:
-                    line = line.strip()
-                    if line:
-                        try:
-                            event = json.loads(line)
-                            result = self.parse_event(event)
-                            if result:
-                                self._has_received_events = True
-                                tool_name, usage = result
-                                self._process_tool_call(tool_name, usage)
-                        except json.JSONDecodeError:
-                            pass
-                    line_count += 1
-
-                self._processed_lines = line_count
+                for line in batch:
+                    self._processed_lines += 1
+                    try:
+                        event = json_codec.loads(line)
+                        result = self.parse_event(event)
+                        if result:
+                            self._has_received_events = True
+                            tool_name, usage = result
+                            self._process_tool_call(tool_name, usage)
+                    except (json.JSONDecodeError, UnicodeDecodeError):
+                        pass
+
+            if self._tail.resets != resets:
+                self._processed_lines = 0  # Truncated to nothing new
 
         except OSError as e:
             self.handle_unrecognized_line(f"Error reading session file: {e}")
+        finally:
+            # Tool calls completed in this read are tokenized together
+            self._defer_estimation = False
+            self._flush_deferred_estimates()
+
+    def init_source_file(self, file_path: Path, resume: Optional[float] = None) -> None:
+        """Track one session file from a byte offset (see collector.MultiCollector).
+
+        Content before the offset is skipped, but a session_meta first line is
+        still parsed so the session's working directory is known.
+
+        Args:
+            file_path: Session file to track
+            resume: Byte offset of the first line to process (None: the start)
+        """
+        offset = int(resume or 0)
+        self._session_file = file_path
+        self._from_start = offset == 0
+        self._tail = TailReader(file_path, offset=offset)
+        if offset > 0:
+            try:
+                with open(file_path, "rb") as f:
+                    first_line = f.readline(offset)
+                if first_line.endswith(b"\n"):
+                    event = json_codec.loads(first_line)
+                    if event.get("type") == "session_meta":
+                        self.parse_event(event)
+            except (json.JSONDecodeError, OSError):
+                pass
+        self._process_session_file(file_path)
+
+    def process_source_file(self) -> None:
+        """Process events appended to the file set up by init_source_file()."""
+        if self._session_file is not None:
+            self._process_session_file(self._session_file)
+
+    def source_resume_position(self) -> float:
+        """Byte offset reached in the session file (complete lines only)."""
+        return self._tail.offset if self._tail is not None else 0
+
+    def source_cwd(self) -> Optional[str]:
+        """Working directory from the session_meta event, if seen yet."""
+        return self.session_cwd
 
     # ========================================================================
     # Helper Methods
@@ -1042,6 +1173,9 @@ class CodexCLIAdapter(BaseTracker):
         # REPLACE values (not add) because we use cumulative total_token_usage
         # to avoid double-counting from duplicate events. See Task 79.
         if tool_name == "__session__":
+            # Record queued tool calls first, so events stay in file order
+            self._flush_deferred_estimates()
+
             self.session.token_usage.input_tokens = usage["input_tokens"]
             self.session.token_usage.output_tokens = usage["output_tokens"]
             self.session.token_usage.cache_created_tokens = usage["cache_created_tokens"]
@@ -1067,10 +1201,13 @@ class CodexCLIAdapter(BaseTracker):
         if tool_params:
             content_hash = self.compute_content_hash(tool_params)
 
+        # Model active when the call completed (it may have changed since, if deferred)
+        model = usage.get("model", self.detected_model)
+
         # Get platform metadata - include call_id for duration update (task-68.5)
         platform_data = {
-            "model": self.detected_model,
-            "model_name": self.model_name,
+            "model": model,
+            "model_name": usage.get("model_name", self.model_name),
             "call_id": usage.get("call_id"),
         }
 
@@ -1090,7 +1227,7 @@ class CodexCLIAdapter(BaseTracker):
             estimation_method=usage.get("estimation_method"),
             estimation_encoding=usage.get("estimation_encoding"),
             # v1.6.0: Multi-model tracking (task-108.2.3)
-            model=self.detected_model,
+            model=model,
         )
 
         # Notify display for Recent Activity feed (task-68.2)
@@ -1122,12 +1259,18 @@ class CodexCLIAdapter(BaseTracker):
         stat = file_path.stat()
         self.session.timestamp = datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc)
 
-        # Process all events
-        for event in self.iter_session_events(file_path):
-            result = self.parse_event(event)
-            if result:
-                tool_name, usage = result
-                self._process_tool_call(tool_name, usage)
+        # Process all events (tool call estimation is batched, see
+        # _flush_deferred_estimates)
+        self._defer_estimation = True
+        try:
+            for event in self.iter_session_events(file_path):
+                result = self.parse_event(event)
+                if result:
+                    tool_name, usage = result
+                    self._process_tool_call(tool_name, usage)
+        finally:
+            self._defer_estimation = False
+            self._flush_deferred_estimates()
 
 
 # ============================================================================
@@ -0,0 +1,411 @@
+"""Track many concurrent agent sessions from one process.
+
+``token-audit collect`` follows one project on one platform, with its own
+polling loop. ``collect --multi`` runs a single-threaded event loop instead:
+
+- One FileWatcher covers every Claude Code project directory, today's (and
+  yesterday's) Codex CLI session directory and every Gemini CLI chats
+  directory; new directories are picked up by a periodic rescan
+- Each transcript/session file that changes gets its own tracker
+  (ClaudeCodeAdapter, CodexCLIAdapter or GeminiCLIAdapter), created lazily
+- Content that existed before the collector started is skipped, like a
+  plain ``collect`` run without ``--from-start``
+
+Memory stays bounded: a source idle for ``idle_timeout`` seconds, or the
+least recently active one once ``max_sources`` are open, is saved as a
+session and its tracker dropped. Only its resume position is kept, so new
+activity on the file starts a fresh tracker (and session) from there.
+"""
+
+import os
+import time
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+from .base_tracker import SingleFileTracker
+from .file_watcher import FileWatcher, create_watcher
+from .pricing_config import PricingConfig
+from .storage import Platform, StorageManager
+
+# Collector platform names (CLI spelling) and their storage names
+PLATFORMS: Dict[str, Platform] = {
+    "claude-code": "claude_code",
+    "codex-cli": "codex_cli",
+    "gemini-cli": "gemini_cli",
+}
+
+# Seconds without new data before a source is saved and its tracker dropped
+DEFAULT_IDLE_TIMEOUT = 15 * 60
+
+# Trackers kept open at once (least recently active is evicted first)
+DEFAULT_MAX_SOURCES = 64
+
+# Seconds between scans for new project/session directories
+RESCAN_INTERVAL = 5.0
+
+# Longest single watcher wait, so stop() and idle eviction stay responsive
+_WAIT_TIMEOUT = 1.0
+
+
+@dataclass
+class _Root:
+    """A watched directory and the platform whose files it holds."""
+
+    platform: str
+    suffix: str
+
+
+@dataclass
+class _Source:
+    """Tracker state for one transcript/session file."""
+
+    platform: str
+    path: Path
+    tracker: SingleFileTracker
+    last_activity: float
+
+
+@dataclass
+class CollectorStats:
+    """Counters reported by ``collect --multi``."""
+
+    sources_opened: int = 0
+    sessions_saved: int = 0
+    evictions: int = 0
+    changes: int = 0  # File change notifications handled
+    errors: List[str] = field(default_factory=list)
+
+
+class MultiCollector:
+    """
+    Single-process collector for many concurrent sessions.
+
+    Example:
+        >>> collector = MultiCollector(StorageManager())
+        >>> collector.run()  # Until stop() is called (e.g. from a signal handler)
+    """
+
+    def __init__(
+        self,
+        storage: StorageManager,
+        platforms: Optional[List[str]] = None,
+        project: Optional[str] = None,
+        idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+        max_sources: int = DEFAULT_MAX_SOURCES,
+        claude_dir: Optional[Path] = None,
+        codex_dir: Optional[Path] = None,
+        gemini_dir: Optional[Path] = None,
+    ):
+        """
+        Initialize collector.
+
+        Args:
+            storage: Destination for saved sessions and indexes
+            platforms: Platforms to track (default: all of PLATFORMS)
+            project: Project name for every session (default: per source,
+                from the working directory recorded in the file)
+            idle_timeout: Seconds without new data before a source is saved
+            max_sources: Trackers kept open at once
+            claude_dir: Claude Code projects directory (default:
+                ~/.config/claude/projects, then ~/.claude/projects)
+            codex_dir: Codex CLI directory (default: ~/.codex)
+            gemini_dir: Gemini CLI directory (default: ~/.gemini)
+        """
+        self.storage = storage
+        self.platforms = platforms or list(PLATFORMS)
+        self.project = project
+        self.idle_timeout = idle_timeout
+        self.max_sources = max(1, max_sources)
+        self.stats = CollectorStats()
+
+        if claude_dir is None:
+            claude_dir = Path.home() / ".config" / "claude" / "projects"
+            if not claude_dir.exists():
+                claude_dir = Path.home() / ".claude" / "projects"
+        self.claude_dir = claude_dir
+        self.codex_dir = codex_dir or Path.home() / ".codex"
+        self.gemini_dir = gemini_dir or Path.home() / ".gemini"
+
+        self._watcher: Optional[FileWatcher] = None
+        self._roots: Dict[Path, _Root] = {}
+        self._sources: Dict[Path, _Source] = {}
+        # Where to pick a file up again: byte offset (Claude/Codex) or the
+        # epoch time before which Gemini messages are skipped
+        self._resume: Dict[Path, Union[int, float]] = {}
+        self._pricing = PricingConfig()
+        self._started = time.time()
+        self._last_rescan = 0.0
+        self._stopping = False
+
+    # ========================================================================
+    # Event Loop
+    # ========================================================================
+
+    def start(self) -> None:
+        """Watch existing directories; their current content is skipped."""
+        self._started = time.time()
+        self._rescan(initial=True)
+
+    def run(self, duration: Optional[float] = None) -> CollectorStats:
+        """
+        Run the event loop until stop() is called (or ``duration`` elapses).
+
+        All sources are saved before returning.
+        """
+        self.start()
+        deadline = time.monotonic() + duration if duration is not None else None
+        try:
+            while not self._stopping:
+                timeout = _WAIT_TIMEOUT
+                if deadline is not None:
+                    timeout = min(timeout, deadline - time.monotonic())
+                    if timeout <= 0:
+                        break
+                self.poll(timeout)
+        finally:
+            self.close()
+        return self.stats
+
+    def poll(self, timeout: float = 0.0) -> int:
+        """
+        Wait up to ``timeout`` seconds for changes and process them.
+
+        Returns:
+            Number of changed files processed
+        """
+        now = time.time()
+        changed: List[Path] = []
+        if now - self._last_rescan >= RESCAN_INTERVAL:
+            changed.extend(self._rescan())
+
+        if self._watcher is not None:
+            changed.extend(self._watcher.wait(max(0.0, timeout)))
+        elif timeout > 0:
+            time.sleep(timeout)
+
+        for path in dict.fromkeys(changed):
+            self._dispatch(path)
+        self._evict_idle()
+        return len(changed)
+
+    def stop(self) -> None:
+        """Ask run() to return (safe to call from a signal handler)."""
+        self._stopping = True
+
+    def close(self) -> None:
+        """Save every open source and release the watcher."""
+        for path in list(self._sources):
+            self._evict(path)
+        if self._watcher is not None:
+            self._watcher.close()
+            self._watcher = None
+
+    @property
+    def active_sources(self) -> int:
+        """Number of trackers currently open."""
+        return len(self._sources)
+
+    # ========================================================================
+    # Directory Discovery
+    # ========================================================================
+
+    def _candidate_roots(self) -> List[Tuple[Path, _Root]]:
+        """Directories that hold session files for the enabled platforms."""
+        roots: List[Tuple[Path, _Root]] = []
+        if "claude-code" in self.platforms:
+            roots.extend(
+                (path, _Root("claude-code", ".jsonl")) for path in _subdirectories(self.claude_dir)
+            )
+        if "codex-cli" in self.platforms:
+            today = date.today()
+            for day in (today - timedelta(days=1), today):
+                path = self.codex_dir / "sessions" / day.strftime("%Y/%m/%d")
+                if path.is_dir():
+                    roots.append((path, _Root("codex-cli", ".jsonl")))
+        if "gemini-cli" in self.platforms:
+            for project_dir in _subdirectories(self.gemini_dir / "tmp"):
+                chats = project_dir / "chats"
+                if chats.is_dir():
+                    roots.append((chats, _Root("gemini-cli", ".json")))
+        return roots
+
+    def _rescan(self, initial: bool = False) -> List[Path]:
+        """
+        Add newly created directories to the watcher.
+
+        Returns:
+            Files already present in directories added after start() (their
+            creation happened before the watch existed)
+        """
+        self._last_rescan = time.time()
+        new_files: List[Path] = []
+        for path, root in self._candidate_roots():
+            if path in self._roots:
+                continue
+            if self._watcher is None:
+                self._watcher = create_watcher(path, root.suffix)
+            elif not self._watcher.add_directory(path, root.suffix):
+                continue
+            self._roots[path] = root
+            for file_path in _list_files(path, root.suffix):
+                if initial:
+                    self._resume[file_path] = self._baseline(file_path, root.platform)
+                else:
+                    new_files.append(file_path)
+        return new_files
+
+    def _baseline(self, path: Path, platform: str) -> Union[int, float]:
+        """Resume point that skips what ``path`` holds at start-up."""
+        if platform == "gemini-cli":
+            return self._started
+        try:
+            return path.stat().st_size
+        except OSError:
+            return 0
+
+    # ========================================================================
+    # Sources
+    # ========================================================================
+
+    def _dispatch(self, path: Path) -> None:
+        """Process new data in ``path``, opening a tracker for it if needed."""
+        root = self._roots.get(path.parent)
+        if root is None:
+            return
+        self.stats.changes += 1
+        source = self._sources.get(path)
+        try:
+            if source is None:
+                source = self._open(path, root.platform)
+            else:
+                self._process(source)
+        except Exception as e:
+            self.stats.errors.append(f"{path.name}: {e}")
+            return
+        source.last_activity = time.time()
+
+    def _open(self, path: Path, platform: str) -> _Source:
+        """Create a tracker for ``path`` and process its new content."""
+        if len(self._sources) >= self.max_sources:
+            oldest = min(self._sources.values(), key=lambda s: s.last_activity)
+            self._evict(oldest.path)
+            self.stats.evictions += 1
+
+        tracker = self._create_tracker(platform, path)
+        tracker.init_source_file(path, resume=self._resume.pop(path, None))
+
+        source = _Source(platform=platform, path=path, tracker=tracker, last_activity=time.time())
+        self._sources[path] = source
+        self.stats.sources_opened += 1
+        return source
+
+    def _create_tracker(self, platform: str, path: Path) -> SingleFileTracker:
+        project = self.project or ""
+        tracker: SingleFileTracker
+        if platform == "claude-code":
+            from .claude_code_adapter import ClaudeCodeAdapter
+
+            tracker = ClaudeCodeAdapter(
+                project=project,
+                claude_dir=path.parent,
+                pricing_config=self._pricing,
+                git_metadata={},
+            )
+        elif platform == "codex-cli":
+            from .codex_cli_adapter import CodexCLIAdapter
+
+            tracker = CodexCLIAdapter(project=project, codex_dir=self.codex_dir, session_file=path)
+        else:
+            from .gemini_cli_adapter import GeminiCLIAdapter
+
+            tracker = GeminiCLIAdapter(
+                project=project,
+                gemini_dir=self.gemini_dir,
+                project_hash=path.parent.parent.name,
+                session_file=path,
+            )
+        # The collector's own working directory says nothing about the sources
+        tracker.set_mcp_config_path(None)
+        return tracker
+
+    @staticmethod
+    def _process(source: _Source) -> None:
+        source.tracker.process_source_file()
+
+    def _evict_idle(self) -> None:
+        cutoff = time.time() - self.idle_timeout
+        for source in list(self._sources.values()):
+            if source.last_activity < cutoff:
+                self._evict(source.path)
+                self.stats.evictions += 1
+
+    def _evict(self, path: Path) -> None:
+        """Save the source's session, drop its tracker and remember where it stopped."""
+        source = self._sources.pop(path)
+        self._resume[path] = source.tracker.source_resume_position()
+
+        try:
+            if self._save(source):
+                self.stats.sessions_saved += 1
+        except Exception as e:
+            self.stats.errors.append(f"{path.name}: {e}")
+
+    def _save(self, source: _Source) -> bool:
+        """Write the source's session and index entry (False if it saw no usage)."""
+        tracker = source.tracker
+        session = tracker.session
+        if session.message_count == 0 and session.token_usage.total_tokens == 0:
+            return False
+
+        if not tracker.project:
+            tracker.project = _project_name(source)
+            session.project = tracker.project
+        session.source_files = [source.path.name]
+        tracker.session_id = f"{tracker.generate_session_id()}-{source.path.stem[:8]}"
+        session.session_id = tracker.session_id
+
+        # Costs are otherwise only computed for the live display
+        tracker.update_session_costs()
+        session = tracker.finalize_session()
+        ended = datetime.fromtimestamp(source.last_activity).astimezone()
+        if ended > session.timestamp:
+            session.end_timestamp = ended
+            session.duration_seconds = (ended - session.timestamp).total_seconds()
+
+        platform = PLATFORMS[source.platform]
+        file_name = f"{session.session_id}.json"
+        session_data = tracker.build_session_data(file_name)
+        session_path = self.storage.write_session_file(
+            platform, session.timestamp.date(), file_name, session_data
+        )
+        index = self.storage.build_session_index(session_path, platform, session_data)
+        self.storage.update_indexes_for_session(platform, session.timestamp.date(), index)
+        return True
+
+
+def _project_name(source: _Source) -> str:
+    """Project for a source: its recorded working directory, else its directory name."""
+    cwd = source.tracker.source_cwd()
+    if cwd:
+        return Path(cwd).name
+    if source.platform == "gemini-cli":
+        return source.path.parent.parent.name[:12]  # Project hash directory
+    return source.path.parent.name
+
+
+def _subdirectories(directory: Path) -> List[Path]:
+    try:
+        with os.scandir(directory) as entries:
+            return sorted(Path(e.path) for e in entries if e.is_dir())
+    except OSError:
+        return []
+
+
+def _list_files(directory: Path, suffix: str) -> List[Path]:
+    try:
+        with os.scandir(directory) as entries:
+            return [Path(e.path) for e in entries if e.name.endswith(suffix) and e.is_file()]
+    except OSError:
+        return []
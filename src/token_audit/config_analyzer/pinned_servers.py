@@ -624,6 +624,15 @@ class PinnedServerDetector:
     ) -> Dict[str, int]:
         """Load aggregated server usage from session storage.
 
+        Reads the daily rollups of the days in the window (see
+        aggregation.server_call_counts()), so older sessions aren't read and
+        unchanged ones aren't loaded again. Rollups are refreshed here on
+        read, not when a session is saved: checking each file's size and mtime
+        keeps them correct for sessions written by other processes or by any
+        of the save paths. A stale day's rollup file is therefore rewritten
+        by this call. Sessions are loaded in-process (jobs=1) so a config
+        check never starts a worker pool.
+
         Args:
             platform: Platform name (e.g., "claude-code", "codex-cli")
             days: Number of days of history to aggregate
@@ -631,50 +640,25 @@ class PinnedServerDetector:
         Returns:
             Dict mapping server names to total call counts
         """
-        usage: Dict[str, int] = {}
-
         try:
             # Lazy import to avoid circular dependency
-            from ..session_manager import SessionManager
-
-            manager = SessionManager(base_dir=self.base_dir)
-            cutoff = date.today() - timedelta(days=days)
-
-            # Load sessions from storage (returns list of Path objects)
-            session_paths = manager.list_sessions()
-
-            # Aggregate MCP tool calls per server
-            for session_path in session_paths:
-                session = manager.load_session(session_path)
-                if session and hasattr(session, "mcp_calls"):
-                    # Filter by platform and date if session has metadata
-                    session_platform = getattr(session, "platform", None)
-                    session_start = getattr(session, "start_time", None)
-
-                    # Skip if wrong platform
-                    if session_platform and session_platform != platform:
-                        continue
-
-                    # Skip if too old (if we can determine the date)
-                    if session_start:
-                        try:
-                            session_date = (
-                                session_start.date()
-                                if hasattr(session_start, "date")
-                                else session_start
-                            )
-                            if session_date < cutoff:
-                                continue
-                        except (AttributeError, TypeError):
-                            pass
-
-                    for call in session.mcp_calls:
-                        server = getattr(call, "server", None)
-                        if server:
-                            usage[server] = usage.get(server, 0) + 1
-
-        except (ImportError, OSError, AttributeError):
-            # If session loading fails, return empty usage
-            pass
+            from ..aggregation import server_call_counts
+            from ..storage import SUPPORTED_PLATFORMS, StorageManager
+
+            # Storage platforms use underscores (claude_code)
+            storage_platform = platform.replace("-", "_")
+            if storage_platform not in SUPPORTED_PLATFORMS:
+                return {}
+
+            end_date = date.today()
+            return server_call_counts(
+                platform=storage_platform,
+                start_date=end_date - timedelta(days=days),
+                end_date=end_date,
+                storage=StorageManager(base_dir=self.base_dir),
+                jobs=1,
+            )
 
-        return usage
+        except (ImportError, OSError, ValueError):
+            # If session loading fails, return empty usage
+            return {}
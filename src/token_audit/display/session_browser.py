@@ -8,7 +8,6 @@ v0.7.0 - task-105.1, task-105.3, task-105.4
 v0.8.0 - task-106.7 (Comparison), task-106.9 (Notifications)
 """
 
-import json
 import time
 from collections import defaultdict
 from dataclasses import dataclass, field
@@ -28,6 +27,8 @@ from rich.text import Text
 
 from .. import __version__
 from ..preferences import PreferencesManager
+from ..session_format import read_session_file
+from ..session_summary import load_summary
 from ..smell_aggregator import SmellAggregator
 from ..storage import SUPPORTED_PLATFORMS, Platform, StorageManager
 from .ascii_mode import (
@@ -985,77 +986,42 @@ class SessionBrowser:
         self.state.is_refreshing = False
 
     def _load_session_entry(self, session_path: Path) -> Optional[SessionEntry]:
-        """Load session metadata into a SessionEntry."""
-        try:
-            # Load the JSON file
-            with open(session_path) as f:
-                data = json.load(f)
-
-            # Extract data from session format
-            session_info = data.get("session", data)  # Handle both formats
-
-            # Parse timestamp (keep full datetime for time display)
-            # Try started_at first (v1.0+ format), then timestamp (legacy)
-            timestamp_str = session_info.get("started_at", "") or session_info.get("timestamp", "")
-            if timestamp_str:
-                try:
-                    session_date = datetime.fromisoformat(timestamp_str)
-                    # Convert to naive datetime for comparison with datetime.now()
-                    if session_date.tzinfo is not None:
-                        # Convert to local time and strip timezone
-                        session_date = session_date.astimezone().replace(tzinfo=None)
-                except ValueError:
-                    session_date = datetime.now()
-            else:
-                session_date = datetime.now()
-
-            # Get token usage
-            token_usage = data.get("token_usage", {})
-            total_tokens = token_usage.get("total_tokens", 0)
-
-            # Get cost
-            cost_estimate = data.get("cost_estimate_usd", data.get("cost_estimate", 0))
-
-            # Get tool count
-            mcp_summary = data.get("mcp_summary", data.get("mcp_tool_calls", {}))
-            tool_count = mcp_summary.get("unique_tools", 0)
-
-            # Get smells count
-            smells = data.get("smells", [])
-
-            # Get model
-            model = session_info.get("model", "")
-
-            # Get accuracy level (v0.7.0 - task-105.5)
-            data_quality = data.get("data_quality", {})
-            accuracy_level = data_quality.get("accuracy_level", "exact")
+        """Load session metadata into a SessionEntry (from the summary sidecar)."""
+        summary = load_summary(session_path)
+        if summary is None:
+            return None
 
-            # Detect live/active sessions (v1.0.0)
-            # Session is live if file modified in last 5 minutes
-            is_live = False
+        # Parse timestamp (keep full datetime for time display)
+        session_date = datetime.now()
+        if summary.started_at:
             try:
-                mtime = session_path.stat().st_mtime
-                file_age_seconds = datetime.now().timestamp() - mtime
-                is_live = file_age_seconds < 300  # 5 minutes
-            except OSError:
+                session_date = datetime.fromisoformat(summary.started_at)
+                # Convert to naive datetime for comparison with datetime.now()
+                if session_date.tzinfo is not None:
+                    # Convert to local time and strip timezone
+                    session_date = session_date.astimezone().replace(tzinfo=None)
+            except ValueError:
                 pass
 
-            return SessionEntry(
-                path=session_path,
-                session_date=session_date,
-                platform=session_info.get("platform", "unknown"),
-                project=session_info.get("project", session_path.stem),
-                duration_seconds=session_info.get("duration_seconds", 0),
-                total_tokens=total_tokens,
-                cost_estimate=float(cost_estimate) if cost_estimate else 0.0,
-                tool_count=tool_count,
-                smell_count=len(smells),
-                model_name=model,
-                accuracy_level=accuracy_level,
-                is_live=is_live,
-            )
-        except Exception:
-            return None
+        # Detect live/active sessions (v1.0.0)
+        # Session is live if file modified in last 5 minutes
+        file_age_seconds = datetime.now().timestamp() - summary.session_mtime_ns / 1e9
+        is_live = file_age_seconds < 300  # 5 minutes
+
+        return SessionEntry(
+            path=session_path,
+            session_date=session_date,
+            platform=summary.platform or "unknown",
+            project=summary.project if summary.project is not None else session_path.stem,
+            duration_seconds=summary.duration_seconds,
+            total_tokens=summary.total_tokens,
+            cost_estimate=summary.cost_usd,
+            tool_count=summary.unique_tools,
+            smell_count=summary.smells_count,
+            model_name=summary.model,
+            accuracy_level=summary.accuracy_level,
+            is_live=is_live,
+        )
 
     def _load_tool_detail(self, server: str, tool_name: str) -> Optional[ToolDetailData]:
         """Load detailed metrics for a specific tool (v0.7.0 - task-105.7).
@@ -1818,7 +1784,7 @@ class SessionBrowser:
     def _load_session_data(self, path: Path) -> Optional[Dict[str, Any]]:
         """Load full session data from path (v0.8.0 - task-106.7)."""
         try:
-            data: Dict[str, Any] = json.loads(path.read_text())
+            data: Dict[str, Any] = read_session_file(path)
             return data
         except Exception:
             return None
@@ -2231,9 +2197,8 @@ class SessionBrowser:
             return None
         entry = self.state.sessions[self.state.selected_index]
         try:
-            with open(entry.path) as f:
-                data: Dict[str, Any] = json.load(f)
-                return data
+            data: Dict[str, Any] = read_session_file(entry.path)
+            return data
         except Exception:
             return None
 
@@ -3885,13 +3850,8 @@ class SessionBrowser:
             return
 
         try:
-            # Delete session file
-            session.path.unlink()
-
-            # Delete associated .jsonl file if exists
-            jsonl_path = session.path.with_suffix(".jsonl")
-            if jsonl_path.exists():
-                jsonl_path.unlink()
+            # Delete session file and associated .jsonl file if exists
+            self.storage.delete_session(session.path)
 
             self.show_notification("Session deleted", "success")
 
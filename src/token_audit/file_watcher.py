@@ -0,0 +1,317 @@
+"""File change notification for tailed transcript directories.
+
+Adapters that tail append-only logs (Claude Code's ``*.jsonl`` transcripts)
+previously re-globbed the directory and reopened every file on a fixed
+interval. A watcher reports only the files that were created or appended to,
+so idle transcripts cost nothing.
+
+Backends:
+- InotifyWatcher: Linux inotify via ctypes (no extra dependencies)
+- PollingWatcher: os.scandir + (size, mtime) comparison, used everywhere else
+
+Set ``TOKEN_AUDIT_WATCHER=polling`` to force the polling backend.
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+# inotify event masks (from <sys/inotify.h>)
+_IN_MODIFY = 0x00000002
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE_SELF = 0x00000400
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_CLOEXEC = 0o2000000
+_IN_NONBLOCK = 0o0004000
+
+_WATCH_MASK = _IN_MODIFY | _IN_CLOSE_WRITE | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE_SELF
+
+# struct inotify_event { int wd; uint32_t mask; uint32_t cookie; uint32_t len; char name[]; }
+_EVENT_HEADER = struct.Struct("iIII")
+_READ_SIZE = 64 * 1024
+
+# Default polling interval when no native backend is available
+DEFAULT_POLL_INTERVAL = 0.5
+
+WATCHER_ENV_VAR = "TOKEN_AUDIT_WATCHER"
+
+
+class FileWatcher(ABC):
+    """Base class for directory watchers.
+
+    Watchers report files (matching ``suffix``) in the watched directories
+    that were created or modified since the previous ``wait()`` call. Further
+    directories, each with its own suffix, can be added with add_directory().
+    """
+
+    backend = "none"
+
+    def __init__(self, directory: Path, suffix: str = ".jsonl") -> None:
+        self.directory = directory
+        self.suffix = suffix
+        # Watched directory -> file suffix reported for it
+        self.directories: Dict[Path, str] = {directory: suffix}
+
+    def add_directory(self, directory: Path, suffix: Optional[str] = None) -> bool:
+        """Also watch ``directory`` (not recursive).
+
+        Args:
+            directory: Directory to watch
+            suffix: Only report files ending with this suffix (default: the
+                watcher's suffix)
+
+        Returns:
+            True if the directory is watched (including already watched)
+        """
+        if directory not in self.directories:
+            self.directories[directory] = suffix or self.suffix
+        return True
+
+    def list_files(self) -> List[Path]:
+        """List all matching files currently in the watched directories."""
+        files: List[Path] = []
+        for directory, suffix in self.directories.items():
+            try:
+                with os.scandir(directory) as it:
+                    for entry in it:
+                        if entry.name.endswith(suffix) and entry.is_file():
+                            files.append(Path(entry.path))
+            except OSError:
+                pass
+        return files
+
+    @abstractmethod
+    def wait(self, timeout: float) -> Set[Path]:
+        """Block up to ``timeout`` seconds and return the changed files.
+
+        Returns as soon as at least one change is seen. An empty set means
+        the timeout expired with nothing to do.
+        """
+        pass
+
+    @abstractmethod
+    def close(self) -> None:
+        """Release any OS resources held by the watcher."""
+        pass
+
+    def __enter__(self) -> "FileWatcher":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+
+class PollingWatcher(FileWatcher):
+    """Portable watcher that compares (size, mtime) snapshots.
+
+    Still lists the directory each interval, but only stats entries (no file
+    is opened) and only reports files whose size or mtime moved.
+    """
+
+    backend = "polling"
+
+    def __init__(
+        self,
+        directory: Path,
+        suffix: str = ".jsonl",
+        interval: float = DEFAULT_POLL_INTERVAL,
+    ) -> None:
+        super().__init__(directory, suffix)
+        self.interval = interval
+        self._stats: Dict[Path, Tuple[int, int]] = self._scan()
+
+    def add_directory(self, directory: Path, suffix: Optional[str] = None) -> bool:
+        if directory not in self.directories:
+            super().add_directory(directory, suffix)
+            # Files already present are the baseline, not changes
+            self._stats.update(self._scan_directory(directory, self.directories[directory]))
+        return True
+
+    def _scan(self) -> Dict[Path, Tuple[int, int]]:
+        stats: Dict[Path, Tuple[int, int]] = {}
+        for directory, suffix in self.directories.items():
+            stats.update(self._scan_directory(directory, suffix))
+        return stats
+
+    @staticmethod
+    def _scan_directory(directory: Path, suffix: str) -> Dict[Path, Tuple[int, int]]:
+        stats: Dict[Path, Tuple[int, int]] = {}
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    if not entry.name.endswith(suffix):
+                        continue
+                    try:
+                        if not entry.is_file():
+                            continue
+                        st = entry.stat()
+                    except OSError:
+                        continue
+                    stats[Path(entry.path)] = (st.st_size, st.st_mtime_ns)
+        except OSError:
+            pass
+        return stats
+
+    def _diff(self) -> Set[Path]:
+        current = self._scan()
+        changed = {path for path, sig in current.items() if self._stats.get(path) != sig}
+        self._stats = current
+        return changed
+
+    def wait(self, timeout: float) -> Set[Path]:
+        deadline = time.monotonic() + timeout
+        while True:
+            changed = self._diff()
+            remaining = deadline - time.monotonic()
+            if changed or remaining <= 0:
+                return changed
+            time.sleep(min(self.interval, remaining))
+
+    def close(self) -> None:
+        pass  # No OS resources: only (size, mtime) snapshots are kept
+
+
+class InotifyWatcher(FileWatcher):
+    """Linux inotify watcher (kernel pushes change events, no polling).
+
+    Raises:
+        OSError: If inotify is unavailable or the directory can't be watched
+    """
+
+    backend = "inotify"
+
+    def __init__(self, directory: Path, suffix: str = ".jsonl") -> None:
+        super().__init__(directory, suffix)
+        libc_name = ctypes.util.find_library("c")
+        libc = ctypes.CDLL(libc_name, use_errno=True)
+        if not hasattr(libc, "inotify_init1"):
+            raise OSError("inotify not supported by libc")
+
+        fd = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+
+        self._libc = libc
+        self._fd: Optional[int] = fd
+        self._wd_dirs: Dict[int, Path] = {}  # Watch descriptor -> directory
+        try:
+            self._add_watch(directory)
+        except OSError:
+            self.close()
+            raise
+
+    def _add_watch(self, directory: Path) -> None:
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(str(directory)), _WATCH_MASK)
+        if wd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno), str(directory))
+        self._wd_dirs[wd] = directory
+
+    def add_directory(self, directory: Path, suffix: Optional[str] = None) -> bool:
+        if directory in self.directories:
+            return True
+        if self._fd is None:
+            return False
+        try:
+            self._add_watch(directory)
+        except OSError:
+            return False
+        return super().add_directory(directory, suffix)
+
+    def _drain(self) -> Set[Path]:
+        changed: Set[Path] = set()
+        overflow = False
+        while self._fd is not None:
+            try:
+                buf = os.read(self._fd, _READ_SIZE)
+            except BlockingIOError:
+                break
+            if not buf:
+                break
+
+            offset = 0
+            while offset + _EVENT_HEADER.size <= len(buf):
+                wd, mask, _cookie, name_len = _EVENT_HEADER.unpack_from(buf, offset)
+                offset += _EVENT_HEADER.size
+                raw_name = buf[offset : offset + name_len].rstrip(b"\0")
+                offset += name_len
+
+                if mask & _IN_Q_OVERFLOW:
+                    overflow = True
+                    continue
+                if mask & _IN_IGNORED:
+                    # Watched directory is gone; allow it to be re-added
+                    gone = self._wd_dirs.pop(wd, None)
+                    if gone is not None and gone != self.directory:
+                        self.directories.pop(gone, None)
+                    continue
+                if mask & _IN_DELETE_SELF:
+                    continue
+                directory = self._wd_dirs.get(wd)
+                if directory is None:
+                    continue
+                name = os.fsdecode(raw_name)
+                if name and name.endswith(self.directories.get(directory, self.suffix)):
+                    changed.add(directory / name)
+
+        if overflow:
+            # Kernel queue overflowed - events were dropped, report everything
+            changed.update(self.list_files())
+        return changed
+
+    def wait(self, timeout: float) -> Set[Path]:
+        if self._fd is None:
+            return set()
+        try:
+            ready, _, _ = select.select([self._fd], [], [], max(timeout, 0.0))
+        except InterruptedError:
+            return set()
+        if not ready:
+            return set()
+        return self._drain()
+
+    def close(self) -> None:
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+
+def create_watcher(
+    directory: Path,
+    suffix: str = ".jsonl",
+    poll_interval: float = DEFAULT_POLL_INTERVAL,
+    prefer_native: bool = True,
+) -> FileWatcher:
+    """Create the best available watcher for ``directory``.
+
+    Uses inotify on Linux and falls back to polling when inotify is
+    unavailable, the directory can't be watched, or ``TOKEN_AUDIT_WATCHER``
+    is set to ``polling``.
+
+    Args:
+        directory: Directory to watch (not recursive)
+        suffix: Only report files ending with this suffix
+        poll_interval: Interval for the polling fallback
+        prefer_native: Set False to always use polling
+
+    Returns:
+        A FileWatcher instance (check ``.backend`` for which one)
+    """
+    forced = os.environ.get(WATCHER_ENV_VAR, "").lower()
+    if prefer_native and forced != "polling" and sys.platform.startswith("linux"):
+        try:
+            return InotifyWatcher(directory, suffix)
+        except (OSError, AttributeError):
+            pass
+    return PollingWatcher(directory, suffix, interval=poll_interval)
@@ -17,7 +17,8 @@ from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Set, Tuple
 
-from .base_tracker import BaseTracker, DataQuality
+from . import json_codec
+from .base_tracker import DataQuality, SingleFileTracker
 from .pricing_config import PricingConfig
 from .token_estimator import TokenEstimator
 
@@ -182,8 +183,8 @@ class GeminiSession:
     @classmethod
     def from_file(cls, file_path: Path) -> "GeminiSession":
         """Parse session from JSON file."""
-        with open(file_path) as f:
-            data = json.load(f)
+        with open(file_path, "rb") as f:
+            data = json_codec.load(f)
 
         # Parse timestamps
         start_time_str = data.get("startTime", "")
@@ -214,7 +215,153 @@ class GeminiSession:
         )
 
 
-class GeminiCLIAdapter(BaseTracker):
+# Incremental chat ingestion: bytes kept from just before the resume offset and
+# compared on the next read to confirm earlier messages were not rewritten
+CHAT_ANCHOR_SIZE = 64
+
+_JSON_WHITESPACE = " \t\r\n"
+
+
+def _skip_json_separators(text: str, pos: int, separators: str = _JSON_WHITESPACE) -> int:
+    """Advance pos past whitespace (and any other given separator characters)."""
+    length = len(text)
+    while pos < length and text[pos] in separators:
+        pos += 1
+    return pos
+
+
+def _scan_message_array(
+    text: str, pos: int, decoder: json.JSONDecoder
+) -> Tuple[List[Dict[str, Any]], int]:
+    """Decode complete elements of a JSON array starting at pos.
+
+    Stops at the closing bracket, at end of input, or at an element that is
+    still being written (incomplete JSON).
+
+    Returns:
+        Tuple of (decoded message dicts, position just past the last complete element)
+    """
+    messages: List[Dict[str, Any]] = []
+    end = pos
+    while True:
+        pos = _skip_json_separators(text, end, _JSON_WHITESPACE + ",")
+        if pos >= len(text) or text[pos] == "]":
+            break
+        try:
+            value, pos = decoder.raw_decode(text, pos)
+        except json.JSONDecodeError:
+            break  # Partially written element - wait for the rest
+        if isinstance(value, dict):
+            messages.append(value)
+        end = pos
+    return messages, end
+
+
+class GeminiChatReader:
+    """Incremental reader for a live Gemini CLI chat file.
+
+    Gemini CLI rewrites the whole chat JSON on every update, but messages
+    already written keep their byte positions. The reader remembers the byte
+    offset just past the last complete message and decodes only what follows
+    it. If the bytes before that offset changed (a message was edited or the
+    file was replaced), it falls back to a full parse.
+
+    Attributes:
+        offset: Byte offset just past the last decoded message (0 = not primed)
+        message_count: Number of messages decoded from the file so far
+        full_parses: Number of full-file parses performed
+        incremental_reads: Number of tail-only reads performed
+    """
+
+    def __init__(self, file_path: Path):
+        self.file_path = file_path
+        self.offset = 0
+        self.message_count = 0
+        self.full_parses = 0
+        self.incremental_reads = 0
+        self._anchor = b""
+        self._decoder = json.JSONDecoder()
+
+    def read_new_messages(self) -> List[Dict[str, Any]]:
+        """Return raw message dicts added since the previous call.
+
+        After a full-parse fallback every message in the file is returned,
+        so callers should skip message IDs they have already processed.
+
+        Raises:
+            OSError: If the file can't be read
+            ValueError: If the file is not a Gemini chat JSON object
+        """
+        if self.offset:
+            messages = self._read_tail()
+            if messages is not None:
+                self.incremental_reads += 1
+                return messages
+        self.full_parses += 1
+        return self._read_full()
+
+    def _read_tail(self) -> Optional[List[Dict[str, Any]]]:
+        """Decode messages after the saved offset (None if a full parse is needed)."""
+        start = self.offset - len(self._anchor)
+        with open(self.file_path, "rb") as f:
+            f.seek(start)
+            data = f.read()
+
+        if not data.startswith(self._anchor):
+            return None
+        try:
+            tail = data[len(self._anchor) :].decode("utf-8")
+        except UnicodeDecodeError:
+            return None
+
+        messages, end = _scan_message_array(tail, 0, self._decoder)
+        if messages:
+            self._advance(data, len(self._anchor) + len(tail[:end].encode("utf-8")), start)
+            self.message_count += len(messages)
+        return messages
+
+    def _read_full(self) -> List[Dict[str, Any]]:
+        """Parse the whole file, locating the messages array by scanning top-level keys."""
+        with open(self.file_path, "rb") as f:
+            data = f.read()
+        text = data.decode("utf-8")
+        decoder = self._decoder
+
+        self.offset = 0
+        self.message_count = 0
+        self._anchor = b""
+
+        pos = _skip_json_separators(text, 0)
+        if pos >= len(text) or text[pos] != "{":
+            raise json.JSONDecodeError("Expected chat JSON object", text, pos)
+        pos += 1
+
+        while True:
+            pos = _skip_json_separators(text, pos, _JSON_WHITESPACE + ",")
+            if pos >= len(text) or text[pos] == "}":
+                return []
+            key, pos = decoder.raw_decode(text, pos)
+            pos = _skip_json_separators(text, pos)
+            if pos >= len(text) or text[pos] != ":":
+                raise json.JSONDecodeError("Expected ':' after key", text, pos)
+            pos = _skip_json_separators(text, pos + 1)
+
+            if key == "messages" and text.startswith("[", pos):
+                messages, end = _scan_message_array(text, pos + 1, decoder)
+                self._advance(data, len(text[:end].encode("utf-8")), 0)
+                self.message_count = len(messages)
+                return messages
+
+            # Skip any other top-level value
+            _, pos = decoder.raw_decode(text, pos)
+
+    def _advance(self, data: bytes, end: int, base: int) -> None:
+        """Move the offset to base + end and remember the bytes just before it."""
+        self.offset = base + end
+        self._anchor = data[max(0, end - CHAT_ANCHOR_SIZE) : end]
+
+
+class GeminiCLIAdapter(SingleFileTracker):
     """
     Gemini CLI platform adapter.
 
@@ -278,6 +425,7 @@ class GeminiCLIAdapter(BaseTracker):
         # Session tracking
         self._processed_message_ids: set[str] = set()
         self._last_file_mtime: float = 0.0
+        self._chat_reader: Optional[GeminiChatReader] = None  # Incremental live ingestion
 
         # ========================================================================
         # v0.1 Parity Enhancements (task-70)
@@ -304,6 +452,10 @@ class GeminiCLIAdapter(BaseTracker):
         # Counts MCP tool calls that use estimated tokens
         self._estimated_tool_calls: int = 0
 
+        # Batch estimation: (input, output) tokens precomputed for a whole
+        # session file, keyed by id() of the tool call dict
+        self._batch_estimates: Dict[int, Tuple[int, int]] = {}
+
         # Native session token tracking (task-69.27)
         # Track native Gemini session tokens separately to avoid double-counting
         # with tool estimation tokens. These accumulate per-message tokens and
@@ -591,16 +743,7 @@ class GeminiCLIAdapter(BaseTracker):
 
         # Initialize position based on from_start flag
         if not self._from_start:
-            # Skip existing messages - only track NEW events
-            try:
-                existing_session = self.parse_session_file(session_file)
-                for msg in existing_session.messages:
-                    self._processed_message_ids.add(msg.id)
-                print(
-                    f"[Gemini CLI] Tracking NEW events only (skipped {len(self._processed_message_ids)} existing messages)"
-                )
-            except Exception:
-                pass  # Continue even if we can't count existing messages
+            self._skip_existing_messages(session_file)
         else:
             print("[Gemini CLI] Processing from start (--from-start)")
 
@@ -666,16 +809,7 @@ class GeminiCLIAdapter(BaseTracker):
 
         # Initialize position based on from_start flag
         if not self._from_start:
-            # Skip existing messages - only track NEW events
-            try:
-                existing_session = self.parse_session_file(session_file)
-                for msg in existing_session.messages:
-                    self._processed_message_ids.add(msg.id)
-                print(
-                    f"[Gemini CLI] Tracking NEW events only (skipped {len(self._processed_message_ids)} existing messages)"
-                )
-            except Exception:
-                pass  # Continue even if we can't count existing messages
+            self._skip_existing_messages(session_file)
         else:
             print("[Gemini CLI] Processing from start (--from-start)")
 
@@ -718,6 +852,47 @@ class GeminiCLIAdapter(BaseTracker):
                 print("\n[Gemini CLI] Stopping tracker...")
                 break
 
+    def update_session_costs(self) -> Tuple[float, float]:
+        """
+        Calculate session costs and persist them on the session.
+
+        Returns:
+            Tuple of (cost_estimate, cost_no_cache) in USD (0.0 without pricing
+            for the detected model)
+        """
+        usage = self.session.token_usage
+        pricing = PricingConfig()
+        model_id = self.detected_model or ""
+
+        # NOTE: For Gemini CLI, cache_read is a SUBSET of input_tokens (not additive)
+        # - input_tokens = total input/prompt tokens
+        # - cache_read = portion of input_tokens served from cache
+        # - fresh_input = input_tokens - cache_read (tokens at full price)
+        cost_with_cache = 0.0
+        cost_without_cache = 0.0
+        if pricing.loaded and model_id:
+            # Fresh input tokens (not served from cache) - charged at full rate
+            fresh_input_tokens = usage.input_tokens - usage.cache_read_tokens
+
+            # Cost with cache: fresh at full rate, cached at discounted rate
+            cost_with_cache = pricing.calculate_cost(
+                model_id,
+                fresh_input_tokens,
+                usage.output_tokens,
+                usage.cache_created_tokens,
+                usage.cache_read_tokens,
+            )
+            # Cost without cache: all input at full rate
+            cost_without_cache = pricing.calculate_cost(
+                model_id, usage.input_tokens, usage.output_tokens, 0, 0
+            )
+
+            # Save costs to session for persistence (task-66.8)
+            self.session.cost_estimate = cost_with_cache
+            self.session.cost_no_cache = cost_without_cache
+            self.session.cache_savings_usd = cost_without_cache - cost_with_cache
+        return cost_with_cache, cost_without_cache
+
     def _build_display_snapshot(self) -> "DisplaySnapshot":
         """Build DisplaySnapshot from current session state."""
         from .display import DisplaySnapshot
@@ -749,32 +924,8 @@ class GeminiCLIAdapter(BaseTracker):
                 top_tools.append((tool_name, tool_stats.calls, tool_stats.total_tokens, avg_tokens))
         top_tools.sort(key=lambda x: x[2], reverse=True)
 
-        # Get pricing for cost calculation
-        pricing = PricingConfig()
-        model_id = self.detected_model or ""
-
         # Calculate costs
-        # NOTE: For Gemini CLI, cache_read is a SUBSET of input_tokens (not additive)
-        # - input_tokens = total input/prompt tokens
-        # - cache_read = portion of input_tokens served from cache
-        # - fresh_input = input_tokens - cache_read (tokens at full price)
-        cost_with_cache = 0.0
-        cost_without_cache = 0.0
-        if pricing.loaded and model_id:
-            # Fresh input tokens (not served from cache) - charged at full rate
-            fresh_input_tokens = input_tokens - cache_read
-
-            # Cost with cache: fresh at full rate, cached at discounted rate
-            cost_with_cache = pricing.calculate_cost(
-                model_id, fresh_input_tokens, output_tokens, cache_created, cache_read
-            )
-            # Cost without cache: all input at full rate
-            cost_without_cache = pricing.calculate_cost(model_id, input_tokens, output_tokens, 0, 0)
-
-            # Save costs to session for persistence (task-66.8)
-            self.session.cost_estimate = cost_with_cache
-            self.session.cost_no_cache = cost_without_cache
-            self.session.cache_savings_usd = cost_without_cache - cost_with_cache
+        cost_with_cache, cost_without_cache = self.update_session_costs()
 
         # ================================================================
         # Warnings/Health Check (task-70)
@@ -956,6 +1107,46 @@ class GeminiCLIAdapter(BaseTracker):
             return False  # Already in Claude/normalized format
         return "__" in tool_name  # Server__tool pattern (Gemini native format)
 
+    def _should_estimate(self, tool_name: str) -> bool:
+        """True for tools whose tokens are estimated (MCP and built-in tools)."""
+        return (
+            self._is_gemini_mcp_tool(tool_name)
+            or tool_name.startswith("mcp__")
+            or tool_name in GEMINI_BUILTIN_TOOLS
+        )
+
+    @staticmethod
+    def _estimation_texts(tool_call: Dict[str, Any]) -> Tuple[str, str]:
+        """Serialize a tool call's args and result for token estimation."""
+        params = tool_call.get("args", {})
+        args_str = json.dumps(params, separators=(",", ":")) if params else ""
+
+        result = tool_call.get("result")
+        if isinstance(result, list):
+            result_str = "\n".join(str(r) for r in result)
+        elif result is not None:
+            result_str = str(result)
+        else:
+            result_str = ""
+        return args_str, result_str
+
+    def _precompute_estimates(self, messages: List[GeminiMessage]) -> None:
+        """Estimate tokens for every tool call in messages with one batch call."""
+        tool_calls = [
+            tool_call
+            for msg in messages
+            if msg.message_type != "user" and msg.tool_calls
+            for tool_call in msg.tool_calls
+            if self._should_estimate(tool_call.get("name", ""))
+        ]
+        if not tool_calls:
+            return
+        estimates = self._token_estimator.estimate_tool_calls_batch(
+            [self._estimation_texts(tool_call) for tool_call in tool_calls]
+        )
+        for tool_call, estimate in zip(tool_calls, estimates):
+            self._batch_estimates[id(tool_call)] = estimate
+
     def _parse_tool_call(
         self, tool_call: Dict[str, Any], msg: GeminiMessage
     ) -> Optional[Tuple[str, Dict[str, Any]]]:
@@ -993,8 +1184,7 @@ class GeminiCLIAdapter(BaseTracker):
         is_gemini_mcp_tool = self._is_gemini_mcp_tool(tool_name)
         is_normalized_mcp_tool = tool_name.startswith("mcp__")
         is_mcp_tool = is_gemini_mcp_tool or is_normalized_mcp_tool
-        is_builtin_tool = tool_name in GEMINI_BUILTIN_TOOLS
-        should_estimate = is_mcp_tool or is_builtin_tool
+        should_estimate = self._should_estimate(tool_name)
 
         input_tokens = 0
         output_tokens = tool_tokens
@@ -1003,22 +1193,13 @@ class GeminiCLIAdapter(BaseTracker):
         estimation_encoding: Optional[str] = None
 
         if should_estimate:
-            # Serialize args for estimation
-            args_str = json.dumps(params, separators=(",", ":")) if params else ""
-
-            # Get result for output estimation
-            result = tool_call.get("result")
-            if isinstance(result, list):
-                result_str = "\n".join(str(r) for r in result)
-            elif result is not None:
-                result_str = str(result)
-            else:
-                result_str = ""
-
-            # Estimate tokens using platform tokenizer
-            input_tokens, output_tokens = self._token_estimator.estimate_tool_call(
-                args_str, result_str
-            )
+            # Estimate tokens using platform tokenizer (precomputed in batch mode)
+            estimate = self._batch_estimates.pop(id(tool_call), None)
+            if estimate is None:
+                estimate = self._token_estimator.estimate_tool_call(
+                    *self._estimation_texts(tool_call)
+                )
+            input_tokens, output_tokens = estimate
             is_estimated = True
             estimation_method = self._token_estimator.method_name
             estimation_encoding = self._token_estimator.encoding_name
@@ -1058,8 +1239,34 @@ class GeminiCLIAdapter(BaseTracker):
     # File Monitoring (Task 60.3)
     # ========================================================================
 
+    def _get_chat_reader(self, file_path: Path) -> GeminiChatReader:
+        """Get the incremental reader for file_path (new reader on file switch)."""
+        if self._chat_reader is None or self._chat_reader.file_path != file_path:
+            self._chat_reader = GeminiChatReader(file_path)
+        return self._chat_reader
+
+    def _skip_existing_messages(self, session_file: Path) -> None:
+        """Mark messages already in the file as processed (track NEW events only).
+
+        Also primes the incremental reader so the next change decodes only
+        the appended messages.
+        """
+        try:
+            for data in self._get_chat_reader(session_file).read_new_messages():
+                self._processed_message_ids.add(data.get("id", ""))
+            print(
+                f"[Gemini CLI] Tracking NEW events only (skipped {len(self._processed_message_ids)} existing messages)"
+            )
+        except Exception:
+            pass  # Continue even if we can't count existing messages
+
     def _process_session_file(self, file_path: Path) -> None:
-        """Read and process session file for new messages."""
+        """Read and process session file for new messages.
+
+        Uses GeminiChatReader so each change decodes only messages appended
+        since the last read, falling back to a full parse if earlier content
+        was rewritten.
+        """
         if not file_path.exists():
             return
 
@@ -1071,24 +1278,63 @@ class GeminiCLIAdapter(BaseTracker):
         self._last_file_mtime = current_mtime
 
         try:
-            session = self.parse_session_file(file_path)
+            new_messages = self._get_chat_reader(file_path).read_new_messages()
+            self._process_new_messages(new_messages)
+        except (ValueError, OSError) as e:
+            self.handle_unrecognized_line(f"Error reading session file: {e}")
 
-            # Process new messages
-            for msg in self.iter_messages(session, skip_processed=True):
-                result = self.parse_event(msg)
-                if result:
-                    tool_name, usage = result
-                    self._process_parsed_event(tool_name, usage)
+    def _process_new_messages(self, new_messages: List[Dict[str, Any]]) -> None:
+        """Process decoded messages, skipping any already processed."""
+        for msg_data in new_messages:
+            msg = GeminiMessage.from_json(msg_data)
+            if msg.id in self._processed_message_ids:
+                continue
 
-                # Mark as processed
-                self._processed_message_ids.add(msg.id)
+            result = self.parse_event(msg)
+            if result:
+                tool_name, usage = result
+                self._process_parsed_event(tool_name, usage)
 
-                # Increment message count for gemini messages
-                if msg.message_type == "gemini":
-                    self.session.message_count += 1
+            # Mark as processed
+            self._processed_message_ids.add(msg.id)
 
-        except (json.JSONDecodeError, OSError) as e:
+            # Increment message count for gemini messages
+            if msg.message_type == "gemini":
+                self.session.message_count += 1
+
+    def init_source_file(self, file_path: Path, resume: Optional[float] = None) -> None:
+        """Track one chat file (see collector.MultiCollector).
+
+        Args:
+            file_path: Chat file to track
+            resume: Skip messages timestamped before this time (epoch seconds);
+                None processes the whole file
+        """
+        self._session_file = file_path
+        self._from_start = resume is None
+        try:
+            messages = self._get_chat_reader(file_path).read_new_messages()
+        except (ValueError, OSError) as e:
             self.handle_unrecognized_line(f"Error reading session file: {e}")
+            return
+        if resume is not None:
+            for msg_data in messages:
+                if GeminiMessage.from_json(msg_data).timestamp.timestamp() < resume:
+                    self._processed_message_ids.add(msg_data.get("id", ""))
+        self._process_new_messages(messages)
+
+    def process_source_file(self) -> None:
+        """Process messages added to the file set up by init_source_file()."""
+        if self._session_file is not None:
+            self._process_session_file(self._session_file)
+
+    def source_resume_position(self) -> float:
+        """The current time: chat files are rewritten whole, so messages are skipped by time."""
+        return time.time()
+
+    def source_cwd(self) -> Optional[str]:
+        """None: chat files don't record the working directory."""
+        return None
 
     def _process_parsed_event(self, tool_name: str, usage: Dict[str, Any]) -> None:
         """
@@ -1262,16 +1508,22 @@ class GeminiCLIAdapter(BaseTracker):
         self.session.timestamp = session.start_time
         self.session.end_timestamp = session.last_updated
 
+        # Tokenize all tool calls at once instead of one call at a time
+        self._precompute_estimates(session.messages)
+
         # Process all messages
-        for msg in session.messages:
-            result = self.parse_event(msg)
-            if result:
-                tool_name, usage = result
-                self._process_parsed_event(tool_name, usage)
+        try:
+            for msg in session.messages:
+                result = self.parse_event(msg)
+                if result:
+                    tool_name, usage = result
+                    self._process_parsed_event(tool_name, usage)
 
-            # Increment message count for gemini messages
-            if msg.message_type == "gemini":
-                self.session.message_count += 1
+                # Increment message count for gemini messages
+                if msg.message_type == "gemini":
+                    self.session.message_count += 1
+        finally:
+            self._batch_estimates.clear()
 
     def get_active_source_files(self) -> List[str]:
         """
@@ -0,0 +1,130 @@
+"""JSON encode/decode for hot paths, using orjson when installed.
+
+Transcript parsing, JSONL streaming, index files and session files all go
+through this module. With ``orjson`` installed (``pip install
+token-audit[fast]``) decoding and encoding are several times faster; without
+it the stdlib ``json`` module is used. Output is equivalent either way:
+
+- Errors are stdlib types (``json.JSONDecodeError`` / ``TypeError``); input
+  orjson rejects but the stdlib accepts (NaN, Infinity, big ints) is retried
+  with the stdlib, so both backends accept the same documents
+- ``default`` is also applied to datetimes and dataclasses (orjson would
+  serialize them natively), so ``default=str`` output doesn't change
+- Encoded bytes are UTF-8 (non-ASCII is not ``\\uXXXX``-escaped with orjson);
+  write them in binary mode
+
+Set ``TOKEN_AUDIT_JSON=stdlib`` to force the stdlib backend.
+"""
+
+import json
+import os
+from typing import IO, Any, Callable, Optional, Union
+
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+except ImportError:
+    orjson = None  # type: ignore
+    _HAS_ORJSON = False
+
+JSON_ENV_VAR = "TOKEN_AUDIT_JSON"
+
+JSONDecodeError = json.JSONDecodeError
+
+_USE_ORJSON = _HAS_ORJSON and os.environ.get(JSON_ENV_VAR, "").lower() != "stdlib"
+
+# Active backend name ("orjson" or "json")
+BACKEND = "orjson" if _USE_ORJSON else "json"
+
+if _HAS_ORJSON:
+    # Route datetimes/dataclasses/subclasses through ``default`` like the stdlib,
+    # and stringify non-str dict keys like the stdlib does
+    _ORJSON_BASE_OPTIONS = (
+        orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+        | orjson.OPT_PASSTHROUGH_SUBCLASS
+        | orjson.OPT_NON_STR_KEYS
+    )
+
+
+def loads(data: Union[str, bytes, bytearray, memoryview]) -> Any:
+    """Decode a JSON document from str or UTF-8 bytes.
+
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON
+    """
+    if _USE_ORJSON:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass  # Retry with stdlib: accepts NaN/Infinity, gives stdlib messages
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        data = bytes(data).decode("utf-8", errors="replace")
+    return json.loads(data)
+
+
+def load(fp: IO[Any]) -> Any:
+    """Decode a JSON document from a file object (text or binary mode)."""
+    return loads(fp.read())
+
+
+def dumps_bytes(
+    obj: Any,
+    *,
+    indent: bool = False,
+    sort_keys: bool = False,
+    default: Optional[Callable[[Any], Any]] = None,
+) -> bytes:
+    """Encode ``obj`` as UTF-8 JSON bytes.
+
+    Args:
+        obj: Object to encode
+        indent: Pretty-print with 2-space indentation
+        sort_keys: Sort dictionary keys
+        default: Fallback serializer for non-JSON types (e.g. ``str``)
+
+    Raises:
+        TypeError: If ``obj`` contains a type that can't be serialized
+    """
+    if _USE_ORJSON:
+        option = _ORJSON_BASE_OPTIONS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        try:
+            result: bytes = orjson.dumps(obj, default=default, option=option)
+            return result
+        except orjson.JSONEncodeError:
+            pass  # Retry with stdlib (e.g. ints beyond 64 bits, NaN)
+    text = json.dumps(
+        obj,
+        indent=2 if indent else None,
+        sort_keys=sort_keys,
+        default=default,
+        ensure_ascii=False,
+    )
+    return text.encode("utf-8")
+
+
+def dumps(
+    obj: Any,
+    *,
+    indent: bool = False,
+    sort_keys: bool = False,
+    default: Optional[Callable[[Any], Any]] = None,
+) -> str:
+    """Encode ``obj`` as a JSON string (see dumps_bytes())."""
+    return dumps_bytes(obj, indent=indent, sort_keys=sort_keys, default=default).decode("utf-8")
+
+
+def dump(
+    obj: Any,
+    fp: IO[bytes],
+    *,
+    indent: bool = False,
+    default: Optional[Callable[[Any], Any]] = None,
+) -> None:
+    """Encode ``obj`` into a file opened in binary mode."""
+    fp.write(dumps_bytes(obj, indent=indent, default=default))
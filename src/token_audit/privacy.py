@@ -355,8 +355,9 @@ def sanitize_session_file(
         output_path: Output sanitized file
         redact_tool_inputs: Whether to redact tool inputs
     """
-    with open(input_path) as f:
-        session_data = json.load(f)
+    from .session_format import read_session_file
+
+    session_data = read_session_file(input_path)
 
     filter = SessionPrivacyFilter(redact_tool_inputs=redact_tool_inputs)
     sanitized = filter.sanitize_session(session_data)
@@ -2008,11 +2008,10 @@ def list_sessions(
     Returns:
         Paginated list of session summaries
     """
-    from ..session_manager import SessionManager
+    from ..session_summary import load_summary
     from ..storage import StorageManager
 
     storage = StorageManager()
-    session_manager = SessionManager()
 
     # Parse date filters
     start_date = date.fromisoformat(since) if since else None
@@ -2028,65 +2027,53 @@ def list_sessions(
         end_date=end_date,
     )
 
-    # Load session data for sorting and filtering
+    # Load session summaries (sidecars, not session bodies) for sorting and filtering
     sessions_data: List[Dict[str, Any]] = []
     for path in session_paths:
-        session = session_manager.load_session(path)
-        if session is None:
+        summary = load_summary(path)
+        if summary is None or not (summary.schema_version or "").startswith("1."):
             continue
 
         # Filter by project if specified
-        if project and session.working_directory != project:
+        if project and summary.working_directory != project:
             continue
 
+        try:
+            started = datetime.fromisoformat(summary.started_at) if summary.started_at else None
+            ended = datetime.fromisoformat(summary.ended_at) if summary.ended_at else None
+        except ValueError:
+            continue  # Unreadable timestamps (as when loading the session)
+
         # Calculate duration
-        if session.end_timestamp and session.timestamp:
+        if started and ended:
             try:
-                # Both are datetime objects
-                duration_seconds = int((session.end_timestamp - session.timestamp).total_seconds())
-            except (ValueError, TypeError):
+                duration_seconds = int((ended - started).total_seconds())
+            except TypeError:  # Mixed naive and aware timestamps
                 duration_seconds = 0
         else:
             duration_seconds = 0
 
         # Determine data quality
-        if session.token_usage and session.token_usage.total_tokens > 0:
+        if summary.total_tokens > 0:
             data_quality = DataQuality.EXACT
-        elif session.mcp_tool_calls and session.mcp_tool_calls.total_calls > 0:
+        elif summary.mcp_calls > 0:
             data_quality = DataQuality.CALLS_ONLY
         else:
             data_quality = DataQuality.ESTIMATED
 
-        # Get primary model
-        primary_model = None
-        if session.model_usage:
-            # Get model with most calls
-            max_calls = 0
-            for model_name, usage in session.model_usage.items():
-                if usage.call_count > max_calls:
-                    max_calls = usage.call_count
-                    primary_model = model_name
-
-        # Count smells
-        smells_count = len(session.smells) if session.smells else 0
-
-        # Convert timestamps to ISO strings
-        started_at_str = session.timestamp.isoformat() if session.timestamp else ""
-        ended_at_str = session.end_timestamp.isoformat() if session.end_timestamp else None
-
         sessions_data.append(
             {
                 "session_id": path.stem,
-                "platform": session.platform or "unknown",
-                "project": session.working_directory,
-                "started_at": started_at_str,
-                "ended_at": ended_at_str,
+                "platform": summary.platform or "unknown",
+                "project": summary.working_directory,
+                "started_at": started.isoformat() if started else "",
+                "ended_at": ended.isoformat() if ended else None,
                 "duration_seconds": duration_seconds,
-                "total_tokens": session.token_usage.total_tokens if session.token_usage else 0,
-                "cost_usd": session.cost_estimate or 0.0,
-                "model": primary_model,
-                "tool_calls": session.mcp_tool_calls.total_calls if session.mcp_tool_calls else 0,
-                "smells_detected": smells_count,
+                "total_tokens": summary.total_tokens,
+                "cost_usd": summary.cost_usd,
+                "model": summary.primary_model,
+                "tool_calls": summary.mcp_calls,
+                "smells_detected": summary.smells_count,
                 "data_quality": data_quality,
             }
         )
@@ -2466,13 +2453,8 @@ def delete_session(
         )
 
     try:
-        # Delete the session file
-        session_path.unlink()
-
-        # Also delete any associated .jsonl file
-        jsonl_path = session_path.with_suffix(".jsonl")
-        if jsonl_path.exists():
-            jsonl_path.unlink()
+        # Delete the session file and any associated .jsonl file
+        storage.delete_session(session_path)
 
         deleted_at = datetime.now().isoformat()
 
@@ -0,0 +1,280 @@
+"""On-disk encoding of completed session files.
+
+Sessions are written as pretty-printed JSON by default. The opt-in compact
+format trades readability for size:
+
+- No indentation
+- ``tool_calls`` stored as positional rows: each distinct set of call keys
+  is stored once in ``shapes`` and every call as ``[shape, value, ...]``
+- Compressed with zstd (``pip install token-audit[fast]``) or gzip
+
+Compact files keep the ``.json`` name, so discovery, indexes and the catalog
+are unaffected; readers detect the compression from the file's leading
+bytes. Every reader goes through read_session_file() (or
+read_session_prefix() for header peeks), which returns the same dict for
+both formats.
+
+Set ``TOKEN_AUDIT_SESSION_FORMAT=compact`` to write new sessions compactly;
+``token-audit storage compact`` converts existing ones.
+"""
+
+import gzip
+import os
+import zlib
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Dict, List, Optional, Tuple, Type, Union
+
+from . import json_codec
+from .archive import read_member, split_archive_path
+
+try:
+    import zstandard
+
+    _HAS_ZSTD = True
+    _ZSTD_ERRORS: Tuple[Type[BaseException], ...] = (zstandard.ZstdError,)
+except ImportError:
+    zstandard = None  # type: ignore
+    _HAS_ZSTD = False
+    _ZSTD_ERRORS = ()
+
+SESSION_FORMAT_ENV_VAR = "TOKEN_AUDIT_SESSION_FORMAT"
+
+# Marker key holding the compact layout version
+COMPACT_KEY = "_compact"
+COMPACT_VERSION = 1
+
+GZIP_MAGIC = b"\x1f\x8b"
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+GZIP_LEVEL = 6
+ZSTD_LEVEL = 9
+
+# Errors raised by either decompressor on corrupt data
+_DECOMPRESS_ERRORS: Tuple[Type[BaseException], ...] = (
+    OSError,
+    EOFError,
+    ValueError,
+    zlib.error,
+) + _ZSTD_ERRORS
+
+# Compression used for new compact files ("zstd" or "gzip")
+COMPRESSION = "zstd" if _HAS_ZSTD else "gzip"
+
+
+def compact_enabled() -> bool:
+    """Whether new session files are written in the compact format."""
+    return os.environ.get(SESSION_FORMAT_ENV_VAR, "").lower() == "compact"
+
+
+# =============================================================================
+# Encoding
+# =============================================================================
+
+
+def encode_session(
+    session_data: Dict[str, Any],
+    compact: Optional[bool] = None,
+    default: Optional[Callable[[Any], Any]] = str,
+) -> bytes:
+    """
+    Encode session data for writing to a session file.
+
+    Args:
+        session_data: Session dict (v1.x layout)
+        compact: Use the compact format (None follows TOKEN_AUDIT_SESSION_FORMAT)
+        default: Fallback serializer for non-JSON types
+
+    Returns:
+        File contents
+    """
+    if compact is None:
+        compact = compact_enabled()
+    if not compact:
+        return json_codec.dumps_bytes(session_data, indent=True, default=default)
+    raw = json_codec.dumps_bytes(pack_session(session_data), default=default)
+    return compress(raw)
+
+
+def pack_session(session_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Return session data with ``tool_calls`` as positional rows (key order kept)."""
+    calls = session_data.get("tool_calls")
+    if not isinstance(calls, list) or not all(isinstance(c, dict) for c in calls):
+        return session_data
+
+    shape_ids: Dict[Tuple[str, ...], int] = {}
+    rows: List[List[Any]] = []
+    for call in calls:
+        keys = tuple(call)
+        shape = shape_ids.setdefault(keys, len(shape_ids))
+        rows.append([shape, *call.values()])
+
+    packed: Dict[str, Any] = {}
+    for key, value in session_data.items():
+        if key == "tool_calls":
+            value = {"shapes": [list(keys) for keys in shape_ids], "rows": rows}
+        packed[key] = value
+    packed[COMPACT_KEY] = {"version": COMPACT_VERSION}
+    return packed
+
+
+def unpack_session(data: Any) -> Any:
+    """Reverse pack_session() (other documents are returned unchanged)."""
+    if not isinstance(data, dict) or COMPACT_KEY not in data:
+        return data
+    data.pop(COMPACT_KEY)
+    calls = data.get("tool_calls")
+    if isinstance(calls, dict):
+        shapes = calls.get("shapes", [])
+        data["tool_calls"] = [dict(zip(shapes[row[0]], row[1:])) for row in calls.get("rows", [])]
+    return data
+
+
+def compress(raw: bytes, method: Optional[str] = None) -> bytes:
+    """Compress with ``method`` ("zstd" or "gzip", default COMPRESSION)."""
+    method = method or COMPRESSION
+    if method == "zstd":
+        if not _HAS_ZSTD:
+            raise ValueError("zstd compression requires the zstandard package")
+        result: bytes = zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(raw)
+        return result
+    # mtime=0 keeps the output identical for identical sessions
+    return gzip.compress(raw, compresslevel=GZIP_LEVEL, mtime=0)
+
+
+# =============================================================================
+# Decoding
+# =============================================================================
+
+
+def is_compressed(head: bytes) -> bool:
+    """Whether file contents starting with ``head`` are compressed."""
+    return head.startswith(GZIP_MAGIC) or head.startswith(ZSTD_MAGIC)
+
+
+def decode_session(raw: bytes) -> Any:
+    """
+    Decode session file contents in either format.
+
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON, the compressed
+            data is corrupt, or it is zstd-compressed and zstandard isn't installed
+            (so existing handlers for unreadable session files apply unchanged)
+    """
+    return unpack_session(json_codec.loads(decompress_session(raw)))
+
+
+def decompress_session(raw: bytes) -> bytes:
+    """
+    JSON text of session file contents in either format (still packed if compact).
+
+    Raises:
+        json.JSONDecodeError: As for decode_session()
+    """
+    try:
+        if raw.startswith(GZIP_MAGIC):
+            return gzip.decompress(raw)
+        if raw.startswith(ZSTD_MAGIC):
+            result: bytes = _zstd_decompressor().decompressobj().decompress(raw)
+            return result
+    except _DECOMPRESS_ERRORS as e:
+        raise json_codec.JSONDecodeError(f"Unreadable compact session file ({e})", "", 0) from e
+    return raw
+
+
+def read_session_file(path: Union[str, Path]) -> Any:
+    """
+    Read and decode a session file in either format (see decode_session()).
+
+    Archived session paths (see archive.py) are read from their bundle.
+    """
+    if split_archive_path(path) is not None:
+        return decode_session(read_member(path))
+    with open(path, "rb") as f:
+        return decode_session(f.read())
+
+
+def read_session_prefix(path: Union[str, Path], max_bytes: int) -> bytes:
+    """
+    First ``max_bytes`` of a session file's JSON text.
+
+    Only that much is decompressed from compact files. The ``_file`` header
+    comes first in both formats.
+
+    Raises:
+        OSError: If the file can't be read or the compressed data is corrupt
+        ValueError: If the file is zstd-compressed and zstandard isn't installed
+    """
+    if split_archive_path(path) is not None:
+        return decompress_session(read_member(path))[:max_bytes]
+    with open(path, "rb") as f:
+        head = f.read(4)
+        f.seek(0)
+        if head.startswith(GZIP_MAGIC):
+            reader: Union[BinaryIO, gzip.GzipFile] = gzip.GzipFile(fileobj=f, mode="rb")
+        elif head.startswith(ZSTD_MAGIC):
+            reader = _zstd_decompressor().stream_reader(f)
+        else:
+            return f.read(max_bytes)
+        # Stream readers may return short reads before the end
+        chunks = []
+        remaining = max_bytes
+        while remaining > 0:
+            chunk = reader.read(remaining)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            remaining -= len(chunk)
+        return b"".join(chunks)
+
+
+# Pretty-printed files start every top-level key on a line indented by two
+# spaces; JSON strings can't hold raw newlines and nested keys are indented
+# further, so this marker only ever begins a top-level key.
+_TOP_LEVEL_KEY = b'\n  "'
+
+
+def top_level_span(text: bytes, key: str) -> Optional[Tuple[int, int]]:
+    """
+    Byte span of a top-level value in pretty-printed session JSON, without parsing.
+
+    Lets readers skip large blocks (``tool_calls``, ``tool_sequence``) and
+    decode them later straight from the file.
+
+    Args:
+        text: Session JSON text (as written with compact=False)
+        key: Top-level key
+
+    Returns:
+        (start, end) of the value's text, or None if the key is missing or the
+        text isn't in the pretty-printed layout (compact files, other writers)
+    """
+    if not text.startswith(b'{\n  "'):
+        return None
+    marker = _TOP_LEVEL_KEY + key.encode() + b'": '
+    start = text.find(marker)
+    if start < 0:
+        return None
+    start += len(marker)
+
+    end = text.find(_TOP_LEVEL_KEY, start)
+    if end < 0:
+        end = text.rfind(b"\n}")  # Last key
+        if end < start:
+            return None
+    elif text[end - 1 : end] == b",":
+        end -= 1
+    else:
+        return None
+    return start, end
+
+
+def _zstd_decompressor() -> Any:
+    if not _HAS_ZSTD:
+        raise ValueError("session file is zstd-compressed; install the zstandard package")
+    return zstandard.ZstdDecompressor()
+
+
+def file_is_compact(path: Union[str, Path]) -> bool:
+    """Whether a session file is in the compact format."""
+    with open(path, "rb") as f:
+        return is_compressed(f.read(4))
@@ -0,0 +1,101 @@
+"""Parallel session loading.
+
+Queries that read many session files (daily aggregates with cold rollups,
+smell trends, reports) load them through load_sessions():
+
+- Sessions are loaded in worker processes
+- Each session is reduced by a ``summarize`` function in the worker, so only
+  what the query needs is sent back (e.g. totals, or just the smells)
+- Results come back in the order of the paths, whatever the number of workers
+
+A handful of sessions is loaded in-process, where starting workers would
+cost more than it saves.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, List, Optional, Sequence
+
+from .base_tracker import Session
+from .session_manager import SessionManager
+
+# Sessions handed to a worker per round trip
+WORKER_CHUNK_SIZE = 8
+
+# Fewer sessions than this are loaded in-process
+MIN_PARALLEL_SESSIONS = 32
+
+Summarizer = Callable[[Session], Any]
+
+# Per-process state set by _init_worker
+_worker_manager: Optional[SessionManager] = None
+_worker_summarize: Optional[Summarizer] = None
+_worker_lazy: bool = True
+
+
+def load_sessions(
+    session_paths: Sequence[Path],
+    summarize: Summarizer,
+    base_dir: Path,
+    jobs: Optional[int] = None,
+    lazy: bool = True,
+) -> List[Any]:
+    """
+    Load sessions and summarize each one, across worker processes.
+
+    Args:
+        session_paths: Session files (or v1.0.0 session directories)
+        summarize: Module-level function mapping a loaded Session to the
+            result (it runs in the workers, so it must be picklable)
+        base_dir: Existing directory for the workers' SessionManager
+        jobs: Worker processes (default: CPU count; 1 runs in-process)
+        lazy: Load sessions lazily (see SessionManager.load_session())
+
+    Returns:
+        One result per path, in order (None where a session couldn't be loaded)
+    """
+    paths = [str(p) for p in session_paths]
+    jobs = max(1, jobs or os.cpu_count() or 1)
+    init_args = (str(base_dir), summarize, lazy)
+
+    if jobs == 1 or len(paths) < MIN_PARALLEL_SESSIONS:
+        # Local state rather than the worker globals: callers may be threads
+        manager = SessionManager(base_dir=base_dir)
+        return [_summarize_session(manager, summarize, lazy, path) for path in paths]
+
+    with ProcessPoolExecutor(
+        max_workers=min(jobs, len(paths)), initializer=_init_worker, initargs=init_args
+    ) as pool:
+        return list(pool.map(_load_in_worker, paths, chunksize=WORKER_CHUNK_SIZE))
+
+
+def _init_worker(base_dir: str, summarize: Summarizer, lazy: bool) -> None:
+    """Set up per-process state (one SessionManager per worker)."""
+    global _worker_manager, _worker_summarize, _worker_lazy
+
+    _worker_manager = SessionManager(base_dir=Path(base_dir))
+    _worker_summarize = summarize
+    _worker_lazy = lazy
+
+
+def _load_in_worker(path: str) -> Any:
+    """Load and summarize one session (runs in a worker)."""
+    if _worker_manager is None or _worker_summarize is None:
+        raise RuntimeError("session loader worker not initialized")
+    return _summarize_session(_worker_manager, _worker_summarize, _worker_lazy, path)
+
+
+def _summarize_session(
+    manager: SessionManager, summarize: Summarizer, lazy: bool, path: str
+) -> Any:
+    try:
+        session = manager.load_session(Path(path), lazy=lazy)
+        return summarize(session) if session is not None else None
+    except Exception:
+        return None  # Unreadable sessions are skipped, as in the serial loaders
+
+
+def full_session(session: Session) -> Session:
+    """Summarizer that keeps the whole session (use with ``lazy=False``)."""
+    return session
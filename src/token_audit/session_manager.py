@@ -15,8 +15,13 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
-from . import __version__
-from .base_tracker import SCHEMA_VERSION, Call, FileHeader, ServerSession, Session
+from . import __version__, json_codec
+from .archive import archive_members, is_archived, list_archives
+from .base_tracker import SCHEMA_VERSION, Call, FileHeader, ServerSession, Session, ToolStats
+from .call_index import CallIndex, call_key, read_indexed_calls, read_indexed_session
+from .session_format import encode_session, read_session_file
+from .session_summary import load_summary, write_summary
+from .storage import list_directory
 
 
 def _now_with_timezone() -> datetime:
@@ -115,14 +120,15 @@ class SessionManager:
         session_data = session.to_dict()
         session_data["_file"] = file_header.to_dict()
 
-        # Save as single JSON file
-        with open(session_path, "w") as f:
-            json.dump(session_data, f, indent=2, default=str)
+        # Save as single JSON file (compact if TOKEN_AUDIT_SESSION_FORMAT=compact)
+        with open(session_path, "wb") as f:
+            f.write(encode_session(session_data))
+        write_summary(session_path, session_data)
         saved_files["session"] = session_path
 
         return saved_files
 
-    def load_session(self, session_path: Path) -> Optional[Session]:
+    def load_session(self, session_path: Path, lazy: bool = False) -> Optional[Session]:
         """
         Load session from disk.
 
@@ -130,40 +136,52 @@ class SessionManager:
         - v1.0.0: Directory containing summary.json + mcp-{server}.json files
         - v1.0.4: Single <project>-<timestamp>.json file (or directory containing it)
 
+        With ``lazy=True`` (v1.x files), totals, smells, model usage and per-tool
+        call counts and tokens load immediately, but each tool's ``call_history``
+        is only decoded from the file when first accessed (see LazyCallHistory).
+        Use it when only totals or a few tools' calls are needed.
+
         Args:
-            session_path: Path to session file (v1.0.4) or directory (v1.0.0/v1.0.4)
+            session_path: Path to session file (v1.0.4, or archived - see archive.py)
+                or directory (v1.0.0/v1.0.4)
+            lazy: Defer decoding tool calls until a call_history is accessed
 
         Returns:
             Session object if successful, None otherwise
         """
-        # Handle file path (v1.0.4 direct file reference)
-        if session_path.is_file():
-            return self._load_session_from_file(session_path)
+        # Handle file path (v1.0.4 direct file reference, or archived session)
+        if session_path.is_file() or is_archived(session_path):
+            return self._load_session_from_file(session_path, lazy)
 
         # Handle directory path
         session_dir = session_path
 
         # Try v1.0.4 format first (single JSON file in directory)
-        v1_1_session = self._load_session_v1_1(session_dir)
+        v1_1_session = self._load_session_v1_1(session_dir, lazy)
         if v1_1_session:
             return v1_1_session
 
         # Fall back to v1.0.0 format (summary.json + mcp-*.json)
         return self._load_session_v1_0(session_dir)
 
-    def _load_session_from_file(self, session_file: Path) -> Optional[Session]:
+    def _load_session_from_file(self, session_file: Path, lazy: bool = False) -> Optional[Session]:
         """
         Load session directly from a v1.0.4 session file.
 
         Args:
             session_file: Path to session JSON file
+            lazy: Defer decoding tool calls (see load_session())
 
         Returns:
             Session object if successful, None otherwise
         """
         try:
-            with open(session_file) as f:
-                data = json.load(f)
+            call_history: Optional[LazyCallHistory] = None
+            if lazy:
+                data, index = read_indexed_session(session_file)
+                call_history = LazyCallHistory(session_file, index)
+            else:
+                data = read_session_file(session_file)
 
             # Check for _file header (v1.0.4 indicator)
             if "_file" not in data:
@@ -176,7 +194,7 @@ class SessionManager:
                 return None
 
             # Reconstruct Session from v1.x format
-            return self._reconstruct_session_v1_1(data)
+            return self._reconstruct_session_v1_1(data, call_history)
 
         except (json.JSONDecodeError, KeyError, ValueError) as e:
             print(f"Error loading v1.x session from {session_file}: {e}")
@@ -209,12 +227,13 @@ class SessionManager:
         # If it has a timestamp, it's v1.0.4; if not, it's v1.0.0 server file
         return not has_timestamp
 
-    def _load_session_v1_1(self, session_dir: Path) -> Optional[Session]:
+    def _load_session_v1_1(self, session_dir: Path, lazy: bool = False) -> Optional[Session]:
         """
         Load session from v1.0.4 format (single JSON file).
 
         Args:
             session_dir: Directory containing session file
+            lazy: Defer decoding tool calls (see load_session())
 
         Returns:
             Session object if successful, None otherwise
@@ -233,28 +252,7 @@ class SessionManager:
 
         # Use the most recent file if multiple exist
         session_files.sort(key=lambda f: f.stat().st_mtime, reverse=True)
-        session_file = session_files[0]
-
-        try:
-            with open(session_file) as f:
-                data = json.load(f)
-
-            # Check for _file header (v1.0.4 indicator)
-            if "_file" not in data:
-                return None
-
-            # Validate schema version (accept any v1.x)
-            file_header = data.get("_file", {})
-            schema_version = file_header.get("schema_version", "")
-            if not schema_version.startswith("1."):
-                return None
-
-            # Reconstruct Session from v1.x format
-            return self._reconstruct_session_v1_1(data)
-
-        except (json.JSONDecodeError, KeyError, ValueError) as e:
-            print(f"Error loading v1.x session from {session_file}: {e}")
-            return None
+        return self._load_session_from_file(session_files[0], lazy)
 
     def _load_session_v1_0(self, session_dir: Path) -> Optional[Session]:
         """
@@ -271,8 +269,8 @@ class SessionManager:
             return None
 
         try:
-            with open(summary_path) as f:
-                data = json.load(f)
+            with open(summary_path, "rb") as f:
+                data = json_codec.load(f)
 
             # Validate schema version
             if not self._validate_schema_version(data):
@@ -435,12 +433,15 @@ class SessionManager:
 
         return session
 
-    def _reconstruct_session_v1_1(self, data: Dict[str, Any]) -> Session:
+    def _reconstruct_session_v1_1(
+        self, data: Dict[str, Any], call_history: Optional["LazyCallHistory"] = None
+    ) -> Session:
         """
         Reconstruct Session object from v1.0.4 format.
 
         Args:
             data: Session data dictionary with _file header
+            call_history: Source of the tool calls for a lazy load (data has none)
 
         Returns:
             Session object
@@ -451,7 +452,6 @@ class SessionManager:
             ServerSession,
             Smell,
             TokenUsage,
-            ToolStats,
         )
 
         # Extract _file header info
@@ -502,52 +502,12 @@ class SessionManager:
             mcp_calls_data = data.get("mcp_tool_calls", {})
             mcp_tool_calls = MCPToolCalls(**mcp_calls_data) if mcp_calls_data else MCPToolCalls()
 
-        # Reconstruct tool_calls
-        tool_calls_data = data.get("tool_calls", [])
-        # Group by server for server_sessions
-        server_tools: Dict[str, Dict[str, ToolStats]] = {}
-        for call_data in tool_calls_data:
-            server = call_data.get("server", "unknown")
-            tool_name = call_data.get("tool", call_data.get("tool_name", ""))
-
-            if server not in server_tools:
-                server_tools[server] = {}
-
-            if tool_name not in server_tools[server]:
-                server_tools[server][tool_name] = ToolStats()
-
-            # Update tool stats
-            stats = server_tools[server][tool_name]
-            stats.calls += 1
-            stats.total_tokens += call_data.get("total_tokens", 0)
-            if stats.calls > 0:
-                stats.avg_tokens = stats.total_tokens // stats.calls
-
-            # Create Call object and add to call_history (task-247.4: bucket classification)
-            call_timestamp_str = call_data.get("timestamp", "")
-            call_timestamp = timestamp  # Fallback to session timestamp
-            if call_timestamp_str:
-                with contextlib.suppress(ValueError, TypeError):
-                    call_timestamp = datetime.fromisoformat(call_timestamp_str)
-
-            call = Call(
-                timestamp=call_timestamp,
-                tool_name=tool_name,
-                server=server,
-                index=call_data.get("index", len(stats.call_history)),
-                input_tokens=call_data.get("input_tokens", 0),
-                output_tokens=call_data.get("output_tokens", 0),
-                cache_created_tokens=call_data.get("cache_created_tokens", 0),
-                cache_read_tokens=call_data.get("cache_read_tokens", 0),
-                total_tokens=call_data.get("total_tokens", 0),
-                duration_ms=call_data.get("duration_ms", 0) or 0,
-                content_hash=call_data.get("content_hash"),
-                is_estimated=call_data.get("is_estimated", False),
-                estimation_method=call_data.get("estimation_method"),
-                estimation_encoding=call_data.get("estimation_encoding"),
-                model=call_data.get("model"),
-            )
-            stats.call_history.append(call)
+        # Reconstruct tool_calls, grouped by server for server_sessions
+        if call_history is not None:
+            call_history.fallback_timestamp = timestamp
+            server_tools = call_history.tool_stats()
+        else:
+            server_tools = _group_tool_calls(data.get("tool_calls", []), timestamp)
 
         # Build server_sessions
         server_sessions = {}
@@ -636,8 +596,8 @@ class SessionManager:
             ServerSession object if successful, None otherwise
         """
         try:
-            with open(server_file) as f:
-                data = json.load(f)
+            with open(server_file, "rb") as f:
+                data = json_codec.load(f)
 
             # Import needed for type reconstruction
             from .base_tracker import Call, ToolStats
@@ -712,11 +672,14 @@ class SessionManager:
             return []
 
         sessions: List[Tuple[Path, datetime]] = []
+        # v1.0.4 session files and their modification times
+        session_files: List[Tuple[Path, float]] = []
 
-        # Iterate through base_dir
-        for item in self.base_dir.iterdir():
-            if not item.is_dir():
+        # Iterate through base_dir (listings cached by directory mtime)
+        for entry in list_directory(self.base_dir):
+            if not entry.is_dir:
                 continue
+            item = entry.path
 
             # Check for v1.0.0 format (summary.json in directory)
             if (item / "summary.json").exists():
@@ -741,27 +704,37 @@ class SessionManager:
                 continue  # Not a date directory
 
             # Find all session files in this date directory
-            for session_file in item.glob("*.json"):
+            for file_entry in list_directory(item):
+                session_file = file_entry.path
+                if file_entry.is_dir or session_file.suffix != ".json":
+                    continue
                 if session_file.name == "summary.json" or session_file.name.startswith("mcp-"):
                     continue  # Skip v1.0.0 files in date directories (shouldn't happen)
+                session_files.append((session_file, file_entry.mtime))
 
-                # Check if it's a v1.0.4 file (has _file header)
-                try:
-                    with open(session_file) as f:
-                        data = json.load(f)
-                    if "_file" in data:
-                        # Extract timestamp from session data
-                        session_data = data.get("session", {})
-                        ts_str = session_data.get("started_at", "")
-                        if ts_str:
-                            ts = datetime.fromisoformat(ts_str)
-                        else:
-                            ts = datetime.fromtimestamp(session_file.stat().st_mtime)
-                        # Return the session file's parent (date directory) with file as marker
-                        # Store file path directly for v1.0.4
-                        sessions.append((session_file, ts))
-                except (json.JSONDecodeError, KeyError, ValueError):
-                    continue
+        # Sessions packed into monthly bundles (see archive.py)
+        for archive_path in list_archives(self.base_dir):
+            try:
+                members = archive_members(archive_path)
+            except OSError:
+                continue
+            for member in members:
+                session_files.append((archive_path / member.name, member.mtime_ns / 1e9))
+
+        for session_file, mtime in session_files:
+            # Check if it's a v1.0.4 file (has _file header), from its summary sidecar
+            summary = load_summary(session_file)
+            if summary is None or summary.schema_version is None:
+                continue
+            try:
+                if summary.started_at:
+                    ts = datetime.fromisoformat(summary.started_at)
+                else:
+                    ts = datetime.fromtimestamp(mtime)
+            except ValueError:
+                continue
+            # Store file path directly for v1.0.4
+            sessions.append((session_file, ts))
 
         # Sort by timestamp (newest first)
         sessions.sort(key=lambda x: x[1], reverse=True)
@@ -865,6 +838,145 @@ class SessionManager:
         return deleted_count
 
 
+# ============================================================================
+# Tool Calls and Lazy Loading
+# ============================================================================
+
+
+def _call_from_dict(call_data: Dict[str, Any], position: int, fallback_timestamp: datetime) -> Call:
+    """Rebuild a Call from a tool_calls entry (``position`` within its tool)."""
+    # Fallback to session timestamp
+    call_timestamp = fallback_timestamp
+    call_timestamp_str = call_data.get("timestamp", "")
+    if call_timestamp_str:
+        with contextlib.suppress(ValueError, TypeError):
+            call_timestamp = datetime.fromisoformat(call_timestamp_str)
+
+    # task-247.4: bucket classification
+    return Call(
+        timestamp=call_timestamp,
+        tool_name=call_data.get("tool", call_data.get("tool_name", "")),
+        server=call_data.get("server", "unknown"),
+        index=call_data.get("index", position),
+        input_tokens=call_data.get("input_tokens", 0),
+        output_tokens=call_data.get("output_tokens", 0),
+        cache_created_tokens=call_data.get("cache_created_tokens", 0),
+        cache_read_tokens=call_data.get("cache_read_tokens", 0),
+        total_tokens=call_data.get("total_tokens", 0),
+        duration_ms=call_data.get("duration_ms", 0) or 0,
+        content_hash=call_data.get("content_hash"),
+        is_estimated=call_data.get("is_estimated", False),
+        estimation_method=call_data.get("estimation_method"),
+        estimation_encoding=call_data.get("estimation_encoding"),
+        model=call_data.get("model"),
+    )
+
+
+def _group_tool_calls(
+    tool_calls_data: List[Dict[str, Any]], fallback_timestamp: datetime
+) -> Dict[str, Dict[str, ToolStats]]:
+    """Rebuild per-server ToolStats (with call histories) from a tool_calls array."""
+    server_tools: Dict[str, Dict[str, ToolStats]] = {}
+    for call_data in tool_calls_data:
+        server, tool_name = call_key(call_data)
+        tools = server_tools.setdefault(server, {})
+        if tool_name not in tools:
+            tools[tool_name] = ToolStats()
+
+        # Update tool stats
+        stats = tools[tool_name]
+        stats.calls += 1
+        stats.total_tokens += call_data.get("total_tokens", 0)
+        stats.avg_tokens = stats.total_tokens // stats.calls
+        stats.call_history.append(
+            _call_from_dict(call_data, len(stats.call_history), fallback_timestamp)
+        )
+    return server_tools
+
+
+class LazyCallHistory:
+    """
+    Tool calls of a session loaded with ``load_session(lazy=True)``.
+
+    Per-tool call counts and tokens come from the session's call index (see
+    call_index.py). Each tool's ``call_history`` is decoded on first access:
+    by byte offset for pretty-printed files, otherwise by reading the file
+    again (the other tools' calls are then kept until they are accessed). If
+    the file has changed since it was loaded, its current calls are used.
+    """
+
+    def __init__(self, session_file: Path, index: CallIndex) -> None:
+        """
+        Args:
+            session_file: Session file the calls are read from
+            index: The file's call index
+        """
+        self.session_file = session_file
+        self.index = index
+        self.fallback_timestamp = _now_with_timezone()
+        self._tools = {(entry.server, entry.tool): entry for entry in index.tools}
+        self._pending: Optional[Dict[Tuple[str, str], List[Dict[str, Any]]]] = None
+
+    def tool_stats(self) -> Dict[str, Dict[str, ToolStats]]:
+        """Per-server ToolStats whose call histories decode on first access."""
+        server_tools: Dict[str, Dict[str, ToolStats]] = {}
+        for entry in self.index.tools:
+            server_tools.setdefault(entry.server, {})[entry.tool] = _LazyToolStats(
+                self,
+                entry.server,
+                entry.tool,
+                calls=entry.calls,
+                total_tokens=entry.total_tokens,
+                avg_tokens=entry.total_tokens // entry.calls,
+            )
+        return server_tools
+
+    def calls_for(self, server: str, tool_name: str) -> List[Call]:
+        """
+        Decode one tool's calls.
+
+        Raises:
+            OSError: If the session file can no longer be read
+            json.JSONDecodeError: If it is no longer valid
+        """
+        calls_data = None
+        entry = self._tools.get((server, tool_name))
+        if self._pending is None and entry is not None:
+            calls_data = read_indexed_calls(self.session_file, self.index, entry.positions)
+        if calls_data is None:
+            if self._pending is None:
+                pending: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
+                for call_data in read_session_file(self.session_file).get("tool_calls", []):
+                    pending.setdefault(call_key(call_data), []).append(call_data)
+                self._pending = pending
+            calls_data = self._pending.pop((server, tool_name), [])
+
+        return [
+            _call_from_dict(call_data, position, self.fallback_timestamp)
+            for position, call_data in enumerate(calls_data)
+        ]
+
+
+class _LazyToolStats(ToolStats):
+    """ToolStats whose call_history is decoded by a LazyCallHistory on first access."""
+
+    def __init__(self, source: LazyCallHistory, server: str, tool_name: str, **kwargs: Any):
+        super().__init__(**kwargs)
+        self._source = (source, server, tool_name)
+        self._call_history: Optional[List[Call]] = None
+
+    @property
+    def call_history(self) -> List[Call]:
+        if self._call_history is None:
+            source, server, tool_name = self._source
+            self._call_history = source.calls_for(server, tool_name)
+        return self._call_history
+
+    @call_history.setter
+    def call_history(self, value: List[Call]) -> None:
+        self._call_history = value
+
+
 # ============================================================================
 # Convenience Functions
 # ============================================================================
@@ -0,0 +1,287 @@
+"""Summary sidecars for session listings.
+
+Every session file written by token-audit gets a small fixed-schema summary
+next to it::
+
+    <date dir>/<project>-<timestamp>.json
+    <date dir>/.summaries/<project>-<timestamp>.json
+
+The summary holds everything the list views show (tokens, cost, model,
+project, duration, smell count, accuracy), so the session browser,
+SessionManager.list_sessions() and the MCP list_sessions tool read a few
+hundred bytes per session instead of decoding whole session bodies. It also
+carries a digest of the session's smells (see smell_digest()), which smell
+trends read instead of the session.
+
+Each summary records the size and mtime of the session file it describes.
+A summary that is missing (sessions written by older versions) or doesn't
+match the file any more is rebuilt from the session on the next read, so
+the sidecars never need a migration step. The hidden directory keeps them
+out of ``*.json`` globs and session discovery. Archived sessions (see
+archive.py) have their summary in the bundle instead.
+"""
+
+import contextlib
+import os
+from dataclasses import asdict, dataclass, field, fields
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from . import json_codec
+from .archive import member_meta, member_stat, split_archive_path
+from .session_format import read_session_file
+
+SUMMARY_DIR_NAME = ".summaries"
+
+# Suffix of the tool call index sidecar (see call_index.py)
+CALL_INDEX_SUFFIX = ".calls"
+
+# Bump when fields change; older summaries are then rebuilt on read
+SUMMARY_VERSION = 2
+
+# pattern -> {"count": n, "severity": {severity: n}, "tools": {tool: n}}
+SmellDigest = Dict[str, Dict[str, Any]]
+
+
+def smell_digest(smells: Iterable[Tuple[str, str, Optional[str]]]) -> SmellDigest:
+    """
+    Per-pattern counts of a session's smells.
+
+    Args:
+        smells: (pattern, severity, tool) of each smell
+
+    Returns:
+        Digest mapping each pattern to its count, per-severity counts and
+        per-tool counts (smells without a tool are not counted per tool)
+    """
+    digest: SmellDigest = {}
+    for pattern, severity, tool in smells:
+        entry = digest.setdefault(pattern, {"count": 0, "severity": {}, "tools": {}})
+        entry["count"] += 1
+        entry["severity"][severity] = entry["severity"].get(severity, 0) + 1
+        if tool:
+            entry["tools"][tool] = entry["tools"].get(tool, 0) + 1
+    return digest
+
+
+@dataclass
+class SessionSummary:
+    """
+    List-view fields of one session file.
+
+    Attributes:
+        session_size: Size of the session file the summary was built from
+        session_mtime_ns: Modification time of that file
+        schema_version: ``_file.schema_version`` (None if the file has no ``_file`` header)
+        session_id: Session ID from the session block ("" if absent)
+        platform: Platform recorded in the session ("" if absent)
+        project: Project name (None if absent)
+        working_directory: Working directory recorded in the session
+        model: Session model
+        primary_model: Model with the most calls in ``model_usage``
+        started_at: ISO start timestamp ("" if absent)
+        ended_at: ISO end timestamp
+        duration_seconds: Recorded session duration
+        total_tokens: Total tokens
+        cost_usd: Estimated cost in USD
+        mcp_calls: Total MCP tool calls
+        unique_tools: Distinct MCP tools used
+        smells_count: Number of detected smells
+        accuracy_level: ``data_quality.accuracy_level``
+        smells: Digest of the detected smells (see smell_digest())
+    """
+
+    session_size: int
+    session_mtime_ns: int
+    schema_version: Optional[str] = None
+    session_id: str = ""
+    platform: str = ""
+    project: Optional[str] = None
+    working_directory: str = ""
+    model: str = ""
+    primary_model: Optional[str] = None
+    started_at: str = ""
+    ended_at: Optional[str] = None
+    duration_seconds: float = 0.0
+    total_tokens: int = 0
+    cost_usd: float = 0.0
+    mcp_calls: int = 0
+    unique_tools: int = 0
+    smells_count: int = 0
+    accuracy_level: str = "exact"
+    smells: SmellDigest = field(default_factory=dict)
+
+    @classmethod
+    def from_session_data(cls, data: Dict[str, Any], stat: os.stat_result) -> "SessionSummary":
+        """
+        Summarize a session dict (v1.x layout, with the legacy fallbacks readers accept).
+
+        Args:
+            data: Decoded session file
+            stat: Stat of the session file
+        """
+        session_info = data.get("session", data)
+        file_header = data.get("_file")
+
+        primary_model = None
+        max_calls = 0
+        for model_name, usage in (data.get("model_usage") or {}).items():
+            if usage.get("call_count", 0) > max_calls:
+                max_calls = usage["call_count"]
+                primary_model = model_name
+
+        mcp_summary = data.get("mcp_summary") or data.get("mcp_tool_calls") or {}
+        smells = data.get("smells") or []
+        cost = data.get("cost_estimate_usd", data.get("cost_estimate", 0))
+
+        return cls(
+            session_size=stat.st_size,
+            session_mtime_ns=stat.st_mtime_ns,
+            schema_version=(
+                file_header.get("schema_version", "") if isinstance(file_header, dict) else None
+            ),
+            session_id=session_info.get("id", data.get("session_id", "")) or "",
+            platform=session_info.get("platform", data.get("platform", "")) or "",
+            project=session_info.get("project", data.get("project")),
+            working_directory=(
+                session_info.get("working_directory", data.get("working_directory", "")) or ""
+            ),
+            model=session_info.get("model", "") or "",
+            primary_model=primary_model,
+            started_at=(
+                session_info.get("started_at")
+                or session_info.get("start_time")
+                or session_info.get("timestamp")
+                or ""
+            ),
+            ended_at=session_info.get(
+                "ended_at", session_info.get("end_time", data.get("end_timestamp"))
+            ),
+            duration_seconds=session_info.get("duration_seconds") or 0.0,
+            total_tokens=(data.get("token_usage") or {}).get("total_tokens", 0),
+            cost_usd=float(cost) if cost else 0.0,
+            mcp_calls=mcp_summary.get("total_calls", 0),
+            unique_tools=mcp_summary.get("unique_tools", 0),
+            smells_count=len(smells),
+            accuracy_level=(data.get("data_quality") or {}).get("accuracy_level", "exact"),
+            smells=smell_digest(
+                (s.get("pattern", ""), s.get("severity", "info"), s.get("tool")) for s in smells
+            ),
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for the sidecar file."""
+        return {"version": SUMMARY_VERSION, **asdict(self)}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> Optional["SessionSummary"]:
+        """Load from a sidecar dict (None if it was written by another version)."""
+        if data.get("version") != SUMMARY_VERSION:
+            return None
+        return cls(**{f.name: data[f.name] for f in fields(cls) if f.name in data})
+
+    def matches(self, stat: os.stat_result) -> bool:
+        """Whether the summary still describes a session file with this stat."""
+        return self.session_size == stat.st_size and self.session_mtime_ns == stat.st_mtime_ns
+
+
+def summary_path(session_path: Path, suffix: str = "") -> Path:
+    """Sidecar path for a session file (``suffix`` selects another sidecar kind)."""
+    return session_path.parent / SUMMARY_DIR_NAME / (session_path.name + suffix)
+
+
+def write_sidecar(path: Path, data: Dict[str, Any]) -> None:
+    """
+    Write a sidecar file atomically, creating the sidecar directory.
+
+    Raises:
+        OSError: If the file can't be written
+    """
+    path.parent.mkdir(exist_ok=True)
+    # Write-then-rename so concurrent readers never see a partial sidecar
+    temp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    temp_path.write_bytes(json_codec.dumps_bytes(data, default=str))
+    os.replace(temp_path, path)
+
+
+def write_summary(session_path: Path, session_data: Dict[str, Any]) -> None:
+    """
+    Write the summary sidecar for a session file that was just written.
+
+    Never raises: a missing sidecar is rebuilt by the next load_summary().
+
+    Args:
+        session_path: Session file (already written)
+        session_data: The data written to it
+    """
+    try:
+        summary = SessionSummary.from_session_data(session_data, session_path.stat())
+        _write_sidecar(session_path, summary)
+    except (OSError, AttributeError, TypeError, ValueError):
+        pass
+
+
+def load_summary(session_path: Path) -> Optional[SessionSummary]:
+    """
+    Summary of a session file, from its sidecar.
+
+    Falls back to reading the session file when the sidecar is missing or
+    stale, and writes a fresh sidecar for next time. Archived sessions whose
+    bundle holds a summary from another version are summarized on each read.
+
+    Args:
+        session_path: Session file
+
+    Returns:
+        SessionSummary, or None if the file is missing or not a readable session
+    """
+    archived = split_archive_path(session_path) is not None
+    if archived:
+        # Archived sessions keep their summary in the bundle's member index
+        try:
+            summary = SessionSummary.from_dict((member_meta(session_path) or {})["summary"])
+        except (KeyError, TypeError):
+            return None
+        if summary is not None:
+            return summary
+        # Bundled by another version: summarize the member (not stored back)
+
+    try:
+        stat = member_stat(session_path) if archived else session_path.stat()
+    except OSError:
+        return None
+
+    if not archived:
+        try:
+            with open(summary_path(session_path), "rb") as f:
+                sidecar = json_codec.load(f)
+            summary = SessionSummary.from_dict(sidecar)
+            if summary is not None and summary.matches(stat):
+                return summary
+        except (OSError, ValueError, TypeError, AttributeError):
+            pass  # Missing, unreadable or from another version
+
+    try:
+        data = read_session_file(session_path)
+        if not isinstance(data, dict):
+            return None
+        summary = SessionSummary.from_session_data(data, stat)
+    except (OSError, AttributeError, TypeError, ValueError):
+        return None
+
+    if not archived:
+        # On read-only storage, summarize again next time
+        with contextlib.suppress(OSError):
+            _write_sidecar(session_path, summary)
+    return summary
+
+
+def remove_summary(session_path: Path) -> None:
+    """Delete a session file's sidecars, if any."""
+    for suffix in ("", CALL_INDEX_SUFFIX):
+        with contextlib.suppress(OSError):
+            summary_path(session_path, suffix).unlink()
+
+
+def _write_sidecar(session_path: Path, summary: SessionSummary) -> None:
+    write_sidecar(summary_path(session_path), summary.to_dict())
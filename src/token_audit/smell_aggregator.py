@@ -16,11 +16,13 @@ from collections import defaultdict
 from dataclasses import dataclass, field
 from datetime import date, datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple, Union
 
 from .base_tracker import Session
+from .session_loader import load_sessions
 from .session_manager import SessionManager
-from .storage import get_default_base_dir
+from .session_summary import SmellDigest, load_summary, smell_digest
+from .storage import get_default_base_dir, list_directory
 
 # Threshold for determining trend direction
 TREND_STABILITY_THRESHOLD = 10.0  # +-10% is considered stable
@@ -105,13 +107,16 @@ class SmellAggregator:
             print(f"{smell.pattern}: {smell.frequency_percent:.1f}% ({smell.trend})")
     """
 
-    def __init__(self, base_dir: Optional[Path] = None):
+    def __init__(self, base_dir: Optional[Path] = None, jobs: Optional[int] = None):
         """Initialize with session storage base directory.
 
         Args:
             base_dir: Base directory for session data. Defaults to ~/.token-audit/sessions/
+            jobs: Worker processes for loading sessions (default: CPU count;
+                1 loads them in-process)
         """
         self.base_dir = base_dir or get_default_base_dir()
+        self.jobs = jobs
 
     def aggregate(
         self,
@@ -139,7 +144,7 @@ class SmellAggregator:
         if start_date is None:
             start_date = end_date - timedelta(days=days)
 
-        # Load sessions
+        # Load each session's smell digest
         sessions = self._load_sessions(
             start_date=start_date,
             end_date=end_date,
@@ -155,15 +160,9 @@ class SmellAggregator:
                 project_filter=project,
             )
 
-        # Calculate frequencies
+        # Calculate frequencies and trends
         aggregated = self._calculate_frequencies(sessions)
 
-        # Detect trends for each smell
-        for pattern, agg_smell in aggregated.items():
-            trend, change_pct = self._detect_trend(sessions, pattern)
-            agg_smell.trend = trend
-            agg_smell.trend_change_percent = change_pct
-
         # Sort by frequency (highest first)
         sorted_smells = sorted(
             aggregated.values(),
@@ -191,8 +190,12 @@ class SmellAggregator:
         end_date: date,
         platform: Optional[str] = None,
         project: Optional[str] = None,
-    ) -> List[Session]:
-        """Load sessions matching filters.
+    ) -> List["SessionSmells"]:
+        """Load the smell digests of sessions matching filters.
+
+        Digests come from the session summaries (see session_summary.py);
+        only sessions without a usable summary (v1.0.0 session directories,
+        unreadable sidecars) are loaded to build one.
 
         Args:
             start_date: Start of date range (inclusive)
@@ -201,9 +204,9 @@ class SmellAggregator:
             project: Project filter
 
         Returns:
-            List of Session objects with smell data
+            SessionSmells of the matching sessions, oldest first
         """
-        sessions: List[Session] = []
+        sessions: List[SessionSmells] = []
 
         # Iterate through platform directories
         if not self.base_dir.exists():
@@ -215,14 +218,14 @@ class SmellAggregator:
         # Check if base_dir contains platform subdirectories
         # Platform directories use hyphens (claude-code, codex-cli, gemini-cli)
         valid_platforms = ("claude-code", "codex-cli", "gemini-cli", "ollama-cli", "custom")
-        for item in self.base_dir.iterdir():
+        for entry in list_directory(self.base_dir):
             # If the item looks like a platform directory
             if (
-                item.is_dir()
-                and item.name in valid_platforms
-                and (platform is None or item.name == platform)
+                entry.is_dir
+                and entry.name in valid_platforms
+                and (platform is None or entry.name == platform)
             ):
-                platform_dirs.append(item)
+                platform_dirs.append(entry.path)
 
         if not platform_dirs:
             # Fallback: base_dir might BE a platform directory
@@ -239,12 +242,19 @@ class SmellAggregator:
                 # Fall back to directly iterating session files
                 session_paths = self._find_session_files(platform_dir)
 
+            candidates: List[Optional[SessionSmells]] = []
+            unsummarized: List[Path] = []
             for session_path in session_paths:
-                try:
-                    session = manager.load_session(session_path)
-                except Exception:
-                    continue
+                digest = _summary_smells(session_path)
+                if digest is None:
+                    unsummarized.append(session_path)
+                else:
+                    candidates.append(digest)
+            candidates.extend(
+                load_sessions(unsummarized, _session_smells, platform_dir, jobs=self.jobs)
+            )
 
+            for session in candidates:
                 if session is None:
                     continue
 
@@ -288,9 +298,10 @@ class SmellAggregator:
         """
         session_files: List[Path] = []
 
-        # Look for date directories (YYYY-MM-DD format)
-        for item in platform_dir.iterdir():
-            if not item.is_dir():
+        # Look for date directories (YYYY-MM-DD format); listings come from
+        # the shared cache, so unchanged days are not listed again
+        for item in list_directory(platform_dir):
+            if not item.is_dir:
                 continue
 
             # Try parsing as date directory
@@ -300,20 +311,30 @@ class SmellAggregator:
                 continue
 
             # Find .json files in date directory
-            for session_file in item.glob("*.json"):
-                if not session_file.name.startswith("."):
-                    session_files.append(session_file)
+            for entry in list_directory(item.path):
+                if (
+                    not entry.is_dir
+                    and entry.path.suffix == ".json"
+                    and not entry.name.startswith(".")
+                ):
+                    session_files.append(entry.path)
 
         return session_files
 
     def _calculate_frequencies(
         self,
-        sessions: List[Session],
+        sessions: Sequence[Union[Session, "SessionSmells"]],
+        comparison_ratio: float = 0.5,
     ) -> Dict[str, AggregatedSmell]:
-        """Calculate smell frequencies across sessions.
+        """Calculate smell frequencies and trends across sessions, in one pass.
+
+        Trends use split-window comparison: sessions are divided into old
+        and new halves, and each pattern's occurrence rate (sessions
+        affected / sessions) in the two halves is compared.
 
         Args:
-            sessions: List of sessions to analyze
+            sessions: Sessions (or their smell digests) sorted by date, oldest first
+            comparison_ratio: Split point for old/new comparison (0.5 = 50/50)
 
         Returns:
             Dictionary mapping pattern name to AggregatedSmell
@@ -322,28 +343,30 @@ class SmellAggregator:
             return {}
 
         total_sessions = len(sessions)
+        split_idx = max(1, int(total_sessions * comparison_ratio))
         aggregated: Dict[str, AggregatedSmell] = {}
 
-        # Track which sessions have each pattern
-        sessions_per_pattern: Dict[str, set[int]] = defaultdict(set)
+        # Sessions with each pattern, overall and in the old half
+        sessions_per_pattern: Dict[str, int] = defaultdict(int)
+        old_sessions_per_pattern: Dict[str, int] = defaultdict(int)
         tool_counts: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
         severity_counts: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
         first_seen: Dict[str, datetime] = {}
         last_seen: Dict[str, datetime] = {}
 
         for i, session in enumerate(sessions):
-            for smell in session.smells:
-                pattern = smell.pattern
-
-                # Track session occurrence
-                sessions_per_pattern[pattern].add(i)
+            if isinstance(session, Session):
+                session = _session_smells(session)
 
-                # Track severity
-                severity_counts[pattern][smell.severity] += 1
+            for pattern, digest in session.smells.items():
+                sessions_per_pattern[pattern] += 1
+                if i < split_idx:
+                    old_sessions_per_pattern[pattern] += 1
 
-                # Track tool
-                if smell.tool:
-                    tool_counts[pattern][smell.tool] += 1
+                for severity, count in digest["severity"].items():
+                    severity_counts[pattern][severity] += count
+                for tool, count in digest["tools"].items():
+                    tool_counts[pattern][tool] += count
 
                 # Track first/last seen
                 if pattern not in first_seen:
@@ -351,8 +374,7 @@ class SmellAggregator:
                 last_seen[pattern] = session.timestamp
 
         # Build AggregatedSmell for each pattern
-        for pattern, session_indices in sessions_per_pattern.items():
-            sessions_affected = len(session_indices)
+        for pattern, sessions_affected in sessions_per_pattern.items():
             total_occurrences = sum(severity_counts[pattern].values())
 
             # Get top tools
@@ -362,12 +384,22 @@ class SmellAggregator:
                 reverse=True,
             )[:5]
 
+            old_affected = old_sessions_per_pattern[pattern]
+            trend, change_percent = _split_trend(
+                old_affected,
+                split_idx,
+                sessions_affected - old_affected,
+                total_sessions - split_idx,
+            )
+
             aggregated[pattern] = AggregatedSmell(
                 pattern=pattern,
                 total_occurrences=total_occurrences,
                 sessions_affected=sessions_affected,
                 total_sessions=total_sessions,
                 frequency_percent=(sessions_affected / total_sessions) * 100,
+                trend=trend,
+                trend_change_percent=change_percent,
                 severity_breakdown=dict(severity_counts[pattern]),
                 top_tools=top_tools,
                 first_seen=first_seen.get(pattern),
@@ -378,17 +410,14 @@ class SmellAggregator:
 
     def _detect_trend(
         self,
-        sessions: List[Session],
+        sessions: Sequence[Union[Session, "SessionSmells"]],
         pattern: str,
         comparison_ratio: float = 0.5,
     ) -> Tuple[str, float]:
-        """Detect trend by comparing recent vs older sessions.
-
-        Uses split-window comparison: divides sessions into old and new halves,
-        calculates occurrence rate in each, and compares.
+        """Detect one pattern's trend by comparing recent vs older sessions.
 
         Args:
-            sessions: Sessions sorted by date (oldest first)
+            sessions: Sessions (or their smell digests) sorted by date, oldest first
             pattern: Smell pattern to analyze
             comparison_ratio: Split point for old/new comparison (0.5 = 50/50)
 
@@ -397,43 +426,69 @@ class SmellAggregator:
             - trend_direction: "improving", "worsening", "stable"
             - change_percent: Percentage change (negative = improving)
         """
-        if len(sessions) < 2:
+        smell = self._calculate_frequencies(sessions, comparison_ratio).get(pattern)
+        if smell is None:
             return ("stable", 0.0)
+        return (smell.trend, smell.trend_change_percent)
 
-        # Split into old and new halves
-        split_idx = max(1, int(len(sessions) * comparison_ratio))
-        old_sessions = sessions[:split_idx]
-        new_sessions = sessions[split_idx:]
 
-        if not old_sessions or not new_sessions:
-            return ("stable", 0.0)
+class SessionSmells(NamedTuple):
+    """The parts of a session smell trends use."""
 
-        def occurrence_rate(session_list: List[Session]) -> float:
-            """Calculate occurrence rate for a list of sessions."""
-            if not session_list:
-                return 0.0
-            count = sum(1 for s in session_list if any(sm.pattern == pattern for sm in s.smells))
-            return count / len(session_list)
-
-        old_rate = occurrence_rate(old_sessions)
-        new_rate = occurrence_rate(new_sessions)
-
-        # Calculate change
-        if old_rate == 0:
-            if new_rate == 0:
-                return ("stable", 0.0)
-            else:
-                return ("worsening", 100.0)  # Newly appearing
-
-        change_percent = ((new_rate - old_rate) / old_rate) * 100
-
-        # Determine trend with stability threshold
-        if change_percent > TREND_STABILITY_THRESHOLD:
-            return ("worsening", change_percent)
-        elif change_percent < -TREND_STABILITY_THRESHOLD:
-            return ("improving", change_percent)
+    timestamp: datetime
+    platform: str
+    project: Optional[str]
+    smells: SmellDigest  # See session_summary.smell_digest()
+
+
+def _split_trend(
+    old_affected: int, old_sessions: int, new_affected: int, new_sessions: int
+) -> Tuple[str, float]:
+    """Trend from a pattern's occurrence rates in the old and new halves."""
+    if old_sessions == 0 or new_sessions == 0:
+        return ("stable", 0.0)
+
+    old_rate = old_affected / old_sessions
+    new_rate = new_affected / new_sessions
+
+    # Calculate change
+    if old_rate == 0:
+        if new_rate == 0:
+            return ("stable", 0.0)
         else:
-            return ("stable", change_percent)
+            return ("worsening", 100.0)  # Newly appearing
+
+    change_percent = ((new_rate - old_rate) / old_rate) * 100
+
+    # Determine trend with stability threshold
+    if change_percent > TREND_STABILITY_THRESHOLD:
+        return ("worsening", change_percent)
+    elif change_percent < -TREND_STABILITY_THRESHOLD:
+        return ("improving", change_percent)
+    else:
+        return ("stable", change_percent)
+
+
+def _summary_smells(session_path: Path) -> Optional[SessionSmells]:
+    """SessionSmells from a session's summary (None if it has none)."""
+    summary = load_summary(session_path)
+    if summary is None or not summary.started_at:
+        return None
+    try:
+        timestamp = datetime.fromisoformat(summary.started_at)
+    except ValueError:
+        return None
+    return SessionSmells(timestamp, summary.platform, summary.project, summary.smells)
+
+
+def _session_smells(session: Session) -> SessionSmells:
+    """Summarizer for load_sessions(): SessionSmells of a loaded session."""
+    return SessionSmells(
+        session.timestamp,
+        session.platform,
+        session.project,
+        smell_digest((s.pattern, s.severity, s.tool) for s in session.smells),
+    )
 
 
 def aggregate_smells(
@@ -441,6 +496,7 @@ def aggregate_smells(
     platform: Optional[str] = None,
     project: Optional[str] = None,
     base_dir: Optional[Path] = None,
+    jobs: Optional[int] = None,
 ) -> SmellAggregationResult:
     """Convenience function to aggregate smells.
 
@@ -449,9 +505,10 @@ def aggregate_smells(
         platform: Filter by platform
         project: Filter by project
         base_dir: Base directory for session data
+        jobs: Worker processes for loading sessions (default: CPU count)
 
     Returns:
         SmellAggregationResult with aggregated statistics
     """
-    aggregator = SmellAggregator(base_dir=base_dir)
+    aggregator = SmellAggregator(base_dir=base_dir, jobs=jobs)
     return aggregator.aggregate(days=days, platform=platform, project=project)
@@ -9,21 +9,43 @@ This module provides:
 - Platform-separated session storage
 - Date-based organization for efficient queries
 - Index files for cross-session discovery
+- Directory listings (os.scandir) cached by directory mtime
 - Migration helpers from v0.x format
 - Automatic migration from ~/.mcp-audit to ~/.token-audit
 """
 
+import atexit
 import fcntl
+import hashlib
 import json
 import os
+import re
+import shutil
+import sys
 import tempfile
 import threading
 import time
-from contextlib import contextmanager
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from contextlib import contextmanager, suppress
 from dataclasses import asdict, dataclass, field
-from datetime import date, datetime
+from datetime import date, datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, Generator, Iterator, List, Literal, Optional
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    BinaryIO,
+    Callable,
+    Dict,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Set,
+    Tuple,
+)
 
 try:
     from filelock import FileLock
@@ -33,6 +55,27 @@ except ImportError:
     FileLock = None  # type: ignore
     _HAS_FILELOCK = False
 
+from . import json_codec
+from .archive import (
+    ArchiveMember,
+    archive_members,
+    list_archives,
+    month_archive_path,
+    write_archive,
+)
+from .session_format import (
+    decode_session,
+    encode_session,
+    is_compressed,
+    read_session_file,
+    read_session_prefix,
+)
+from .session_summary import SessionSummary, remove_summary, write_summary
+from .tail_reader import TailReader
+
+if TYPE_CHECKING:
+    from .catalog import SessionCatalog
+
 # Schema version for storage format
 STORAGE_SCHEMA_VERSION = "1.0.0"
 
@@ -49,11 +92,31 @@ SUPPORTED_PLATFORMS: List[Platform] = [
 # Active session directory for live streaming
 ACTIVE_SESSION_DIR = "active"
 
+# Active session writer: "buffered" batches appends on a background thread
+STREAM_WRITER_ENV_VAR = "TOKEN_AUDIT_STREAM_WRITER"
+
+# What is done per written batch: "none" (nothing; the batch may stay in this
+# process's write buffer until it fills, flush() or the session completes, so a
+# process crash can lose it), "flush" (hand it to the OS; survives a process
+# crash) or "fsync" (also survives power loss)
+STREAM_DURABILITY_ENV_VAR = "TOKEN_AUDIT_STREAM_DURABILITY"
+Durability = Literal["none", "flush", "fsync"]
+DURABILITY_LEVELS: Tuple[Durability, ...] = ("none", "flush", "fsync")
+
+# The buffered writer writes a batch this long after its first event,
+# or sooner once this many bytes are pending
+STREAM_FLUSH_INTERVAL = 0.05
+STREAM_FLUSH_BYTES = 64 * 1024
+
 # Lock timeout in seconds for file operations
 FILE_LOCK_TIMEOUT = 10.0
 
+_DATE_DIR = re.compile(r"^\d{4}-\d{2}-\d{2}$")
 
-def _atomic_write_json(target_path: Path, data: Dict[str, Any]) -> None:
+
+def _atomic_write_json(
+    target_path: Path, data: Dict[str, Any], default: Optional[Callable[[Any], Any]] = None
+) -> None:
     """
     Write JSON data atomically using temp file + rename pattern.
 
@@ -62,6 +125,21 @@ def _atomic_write_json(target_path: Path, data: Dict[str, Any]) -> None:
     Args:
         target_path: Path to write the JSON data to
         data: Dictionary data to write as JSON
+        default: Fallback serializer for non-JSON types (e.g. ``str``)
+
+    Raises:
+        OSError: If file operations fail
+    """
+    _atomic_write_bytes(target_path, json_codec.dumps_bytes(data, indent=True, default=default))
+
+
+def _atomic_write_bytes(target_path: Path, payload: bytes) -> None:
+    """
+    Write file contents atomically using temp file + rename pattern.
+
+    Args:
+        target_path: Path to write to
+        payload: File contents
 
     Raises:
         OSError: If file operations fail
@@ -76,8 +154,8 @@ def _atomic_write_json(target_path: Path, data: Dict[str, Any]) -> None:
     )
     temp_path = Path(temp_path_str)
     try:
-        with os.fdopen(fd, "w") as f:
-            json.dump(data, f, indent=2)
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
         # Atomic rename (POSIX guarantees atomicity for same filesystem)
         temp_path.rename(target_path)
     except Exception:
@@ -117,6 +195,131 @@ def _index_file_lock(index_path: Path) -> Generator[None, None, None]:
         yield
 
 
+@dataclass(frozen=True)
+class DirEntry:
+    """One entry of a directory listing (size and mtime are 0 for directories)."""
+
+    path: Path
+    is_dir: bool
+    size: int
+    mtime: float
+
+    @property
+    def name(self) -> str:
+        return self.path.name
+
+
+class DirectoryListingCache:
+    """
+    Directory listings keyed by the directory's own mtime.
+
+    Session discovery lists the same platform and date directories over and
+    over; a date directory only changes when a session file is added, renamed
+    or removed. A listing is reused until the directory's mtime changes, so
+    checking an unchanged day costs one stat() instead of a scandir() plus
+    a stat() per file.
+
+    Files rewritten in place keep their directory's mtime: StorageManager
+    invalidates the directory after such writes, other writers' changes show
+    up once the directory itself changes.
+    """
+
+    # A directory modified this close to its listing is listed again next
+    # time: a file added within the same mtime tick leaves the mtime unchanged
+    RACY_NS = 2_000_000_000
+
+    def __init__(self, max_dirs: int = 4096):
+        """
+        Initialize cache.
+
+        Args:
+            max_dirs: Directory listings kept (least recently used are evicted)
+        """
+        self.max_dirs = max_dirs
+        self._listings: OrderedDict[Path, Tuple[int, int, List[DirEntry]]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def list(self, directory: Path) -> List[DirEntry]:
+        """
+        List ``directory`` (empty if it doesn't exist).
+
+        Args:
+            directory: Directory to list
+
+        Returns:
+            Entries in directory order, including dot files
+        """
+        try:
+            dir_mtime_ns = os.stat(directory).st_mtime_ns
+        except OSError:
+            self.invalidate(directory)
+            return []
+
+        with self._lock:
+            cached = self._listings.get(directory)
+            if cached is not None:
+                mtime_ns, listed_ns, entries = cached
+                if mtime_ns == dir_mtime_ns and listed_ns - mtime_ns >= self.RACY_NS:
+                    self._listings.move_to_end(directory)
+                    return entries
+
+        listed_ns = time.time_ns()
+        entries = []
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir():
+                            entries.append(DirEntry(Path(entry.path), True, 0, 0.0))
+                        else:
+                            stat = entry.stat()
+                            entries.append(
+                                DirEntry(Path(entry.path), False, stat.st_size, stat.st_mtime)
+                            )
+                    except OSError:
+                        continue  # Removed while listing
+        except OSError:
+            return []
+
+        with self._lock:
+            self._listings[directory] = (dir_mtime_ns, listed_ns, entries)
+            self._listings.move_to_end(directory)
+            while len(self._listings) > self.max_dirs:
+                self._listings.popitem(last=False)
+        return entries
+
+    def invalidate(self, directory: Optional[Path] = None) -> None:
+        """Drop the listing of ``directory`` (all listings if None)."""
+        with self._lock:
+            if directory is None:
+                self._listings.clear()
+            else:
+                self._listings.pop(directory, None)
+
+
+# Shared by every StorageManager in the process (CLI, TUI and MCP server)
+_listing_cache = DirectoryListingCache()
+
+
+def list_directory(directory: Path) -> List[DirEntry]:
+    """List a directory through the shared DirectoryListingCache."""
+    return _listing_cache.list(directory)
+
+
+def _is_date_dir(entry: DirEntry) -> bool:
+    return (
+        entry.is_dir and not entry.name.startswith(".") and _DATE_DIR.match(entry.name) is not None
+    )
+
+
+def _is_session_file(entry: DirEntry) -> bool:
+    return (
+        not entry.is_dir
+        and not entry.name.startswith(".")
+        and entry.path.suffix in (".json", ".jsonl")
+    )
+
+
 def _migrate_legacy_storage() -> None:
     """
     One-time migration from ~/.mcp-audit to ~/.token-audit.
@@ -290,6 +493,38 @@ class PlatformIndex:
         return cls(**data)
 
 
+# (total_tokens, total_cost, session_count) of a daily index
+_IndexTotals = Tuple[int, float, int]
+
+
+def _daily_totals(daily_index: DailyIndex) -> _IndexTotals:
+    return (daily_index.total_tokens, daily_index.total_cost, daily_index.session_count)
+
+
+@dataclass
+class FormatConversionResult:
+    """Outcome of StorageManager.convert_session_files()."""
+
+    converted: int = 0
+    already_converted: int = 0
+    failed: int = 0
+    bytes_before: int = 0
+    bytes_after: int = 0
+    load_seconds_before: float = 0.0  # Time to decode the converted files as they were
+    load_seconds_after: float = 0.0  # ... and in their new format
+
+
+@dataclass
+class ArchiveResult:
+    """Outcome of StorageManager.archive_sessions()."""
+
+    archived: int = 0
+    bundles: int = 0  # Monthly bundles created or extended
+    failed: int = 0
+    bytes_before: int = 0  # Size of the archived session files
+    bytes_after: int = 0  # Growth of the bundles (not measured on a dry run)
+
+
 class StorageManager:
     """
     Manages session storage with the standardized directory structure.
@@ -303,8 +538,10 @@ class StorageManager:
         │   │   │   ├── .index.json          # Daily index
         │   │   │   ├── session-abc123.jsonl # Session events
         │   │   │   └── session-def456.jsonl
-        │   │   └── 2025-11-25/
-        │   │       └── ...
+        │   │   ├── 2025-11-25/
+        │   │   │   └── ...
+        │   │   └── archive/
+        │   │       └── 2025-10.zip          # Archived sessions (see archive.py)
         │   ├── codex_cli/
         │   │   └── ...
         │   └── gemini_cli/
@@ -328,11 +565,10 @@ class StorageManager:
         self.base_dir = base_dir or get_default_base_dir()
         self.base_dir.mkdir(parents=True, exist_ok=True)
 
-        # Performance optimization: mtime caching (v0.9.0 - task-107.3)
-        # Cache file modification times to reduce stat() calls in list_sessions
-        self._mtime_cache: Dict[Path, float] = {}
-        self._mtime_cache_timestamp: float = 0.0
-        self._mtime_cache_ttl: float = 60.0  # Refresh cache every 60 seconds
+        # SQLite session catalog (see catalog.py), opened on first query;
+        # disabled for this instance if the database can't be used
+        self._catalog: Optional[SessionCatalog] = None
+        self._catalog_failed = False
 
     # =========================================================================
     # Path Generation
@@ -430,8 +666,9 @@ class StorageManager:
             session_path: Path to the session .jsonl file
             event: Event data to append
         """
-        with open(session_path, "a") as f:
-            f.write(json.dumps(event, default=str) + "\n")
+        with open(session_path, "ab") as f:
+            f.write(json_codec.dumps_bytes(event, default=str) + b"\n")
+        self._mark_dir_changed(session_path)
 
     def write_session_events(self, session_path: Path, events: List[Dict[str, Any]]) -> None:
         """
@@ -441,9 +678,118 @@ class StorageManager:
             session_path: Path to the session .jsonl file
             events: List of events to write
         """
-        with open(session_path, "w") as f:
+        with open(session_path, "wb") as f:
             for event in events:
-                f.write(json.dumps(event, default=str) + "\n")
+                f.write(json_codec.dumps_bytes(event, default=str) + b"\n")
+        self._mark_dir_changed(session_path)
+
+    def write_session_file(
+        self,
+        platform: Platform,
+        session_date: date,
+        file_name: str,
+        session_data: Dict[str, Any],
+    ) -> Path:
+        """
+        Write a complete session JSON file with atomic write.
+
+        Written in the compact format when TOKEN_AUDIT_SESSION_FORMAT=compact
+        (see session_format.py). Does not touch the indexes - pair with build_session_index() and
+        update_indexes_for_session(s)().
+
+        Args:
+            platform: Platform identifier
+            session_date: Date directory to write into
+            file_name: Session file name (e.g., "<project>-<timestamp>.json")
+            session_data: Session dict (as produced by BaseTracker.build_session_data)
+
+        Returns:
+            Path to the written session file
+        """
+        session_path = self.get_date_dir(platform, session_date) / file_name
+        _atomic_write_bytes(session_path, encode_session(session_data))
+        write_summary(session_path, session_data)
+
+        catalog = self._get_catalog()
+        if catalog is not None:
+            try:
+                catalog.record(session_path, session_data)
+            except catalog.errors:
+                self._catalog_failed = True
+        return session_path
+
+    def delete_session(self, session_path: Path) -> None:
+        """
+        Delete a session file, its companion .jsonl event file and its catalog row.
+
+        Args:
+            session_path: Session file to delete
+
+        Raises:
+            OSError: If the session file can't be deleted
+        """
+        session_path.unlink()
+        remove_summary(session_path)
+        jsonl_path = session_path.with_suffix(".jsonl")
+        if jsonl_path != session_path and jsonl_path.exists():
+            jsonl_path.unlink()
+
+        catalog = self._get_catalog()
+        if catalog is not None:
+            try:
+                catalog.remove(session_path)
+                catalog.remove(jsonl_path)
+            except catalog.errors:
+                self._catalog_failed = True
+
+    def build_session_index(
+        self,
+        session_path: Path,
+        platform: Platform,
+        session_data: Dict[str, Any],
+    ) -> SessionIndex:
+        """
+        Build a SessionIndex from in-memory session data.
+
+        Avoids re-reading the file when the caller just wrote it.
+
+        Args:
+            session_path: Path the session was written to
+            platform: Platform identifier
+            session_data: Session dict (v1.0.4+ format)
+
+        Returns:
+            SessionIndex entry for the session
+        """
+        session = session_data.get("session", {})
+        mcp_summary = session_data.get("mcp_summary", {})
+
+        try:
+            rel_path = str(session_path.relative_to(self.base_dir))
+        except ValueError:
+            rel_path = str(session_path)
+
+        try:
+            file_size = session_path.stat().st_size
+        except OSError:
+            file_size = 0
+
+        return SessionIndex(
+            schema_version=session_data.get("_file", {}).get("schema_version", "1.0.0"),
+            session_id=session_path.stem,
+            platform=platform,
+            date=session_path.parent.name,
+            started_at=session.get("started_at", ""),
+            ended_at=session.get("ended_at"),
+            project=session.get("project"),
+            total_tokens=session_data.get("token_usage", {}).get("total_tokens", 0),
+            total_cost=session_data.get("cost_estimate_usd", 0.0),
+            tool_count=mcp_summary.get("unique_tools", 0),
+            server_count=mcp_summary.get("unique_servers", 0),
+            is_complete=session.get("ended_at") is not None,
+            file_path=rel_path,
+            file_size_bytes=file_size,
+        )
 
     # =========================================================================
     # Session Reading
@@ -462,13 +808,13 @@ class StorageManager:
         if not session_path.exists():
             return
 
-        with open(session_path) as f:
+        with open(session_path, "rb") as f:
             for line_num, line in enumerate(f, 1):
                 line = line.strip()
                 if not line:
                     continue
                 try:
-                    yield json.loads(line)
+                    yield json_codec.loads(line)
                 except json.JSONDecodeError as e:
                     # Log warning but continue (graceful degradation)
                     print(f"Warning: Invalid JSON at {session_path}:{line_num}: {e}")
@@ -513,8 +859,8 @@ class StorageManager:
             return None
 
         try:
-            with open(index_path) as f:
-                data = json.load(f)
+            with open(index_path, "rb") as f:
+                data = json_codec.load(f)
             return DailyIndex.from_dict(data)
         except (json.JSONDecodeError, KeyError) as e:
             print(f"Warning: Invalid daily index at {index_path}: {e}")
@@ -556,8 +902,8 @@ class StorageManager:
             return None
 
         try:
-            with open(index_path) as f:
-                data = json.load(f)
+            with open(index_path, "rb") as f:
+                data = json_codec.load(f)
             return PlatformIndex.from_dict(data)
         except (json.JSONDecodeError, KeyError) as e:
             print(f"Warning: Invalid platform index at {index_path}: {e}")
@@ -593,18 +939,93 @@ class StorageManager:
         CLI, and TUI. Holds locks during read-modify-write cycles to prevent
         data loss from simultaneous updates.
 
+        Only the session's own daily index is read: the platform totals are
+        adjusted by the change in that day's totals rather than recalculated
+        from every daily index (see rebuild_platform_index() for a full
+        recalculation).
+
         Args:
             platform: Platform identifier
             session_date: Date of the session
             session_index: Index entry for the session
         """
-        date_str = session_date.strftime("%Y-%m-%d")
+        change = self._merge_daily_index(platform, session_date, [session_index])
+        self._refresh_platform_index(platform, {session_date.strftime("%Y-%m-%d"): change})
 
-        # Get paths for locking
-        daily_index_path = self.get_daily_index_path(platform, session_date)
+    def update_indexes_for_sessions(
+        self, platform: Platform, session_indexes: Iterable[SessionIndex]
+    ) -> None:
+        """
+        Update indexes for many sessions at once (bulk import).
+
+        Each affected daily index is locked, read and written once, and the
+        platform index is updated once at the end, instead of once per
+        session as with update_indexes_for_session().
+
+        Args:
+            platform: Platform identifier
+            session_indexes: Index entries (grouped by their ``date`` field)
+        """
+        by_date: Dict[str, List[SessionIndex]] = {}
+        for session_index in session_indexes:
+            by_date.setdefault(session_index.date, []).append(session_index)
+        if not by_date:
+            return
+
+        changes: Dict[str, Tuple[_IndexTotals, _IndexTotals]] = {}
+        for date_str, entries in by_date.items():
+            session_date = datetime.strptime(date_str, "%Y-%m-%d").date()
+            changes[date_str] = self._merge_daily_index(platform, session_date, entries)
+
+        self._refresh_platform_index(platform, changes)
+
+    def rebuild_platform_index(self, platform: Platform) -> PlatformIndex:
+        """
+        Recalculate a platform index from its daily indexes.
+
+        update_indexes_for_session() maintains the platform totals
+        incrementally; this repairs them if they have drifted (e.g. daily
+        indexes edited or removed by hand). Dates are taken from the
+        directories on disk.
+
+        Args:
+            platform: Platform identifier
+
+        Returns:
+            The rewritten platform index
+        """
         platform_index_path = self.get_platform_index_path(platform)
 
-        # Update daily index under lock
+        with _index_file_lock(platform_index_path):
+            platform_index = PlatformIndex(
+                schema_version=STORAGE_SCHEMA_VERSION,
+                platform=platform,
+            )
+            for session_date in self.list_dates(platform):
+                daily = self.load_daily_index(platform, session_date)
+                if daily is None:
+                    continue
+                platform_index.dates.append(daily.date)
+                platform_index.total_tokens += daily.total_tokens
+                platform_index.total_cost += daily.total_cost
+                platform_index.total_sessions += daily.session_count
+
+            self._finish_platform_index(platform_index)
+            self.save_platform_index(platform_index)
+        return platform_index
+
+    def _merge_daily_index(
+        self, platform: Platform, session_date: date, session_indexes: List[SessionIndex]
+    ) -> Tuple[_IndexTotals, _IndexTotals]:
+        """
+        Add or replace session entries in a daily index under lock.
+
+        Returns:
+            The day's (tokens, cost, sessions) totals before and after the merge
+        """
+        date_str = session_date.strftime("%Y-%m-%d")
+        daily_index_path = self.get_daily_index_path(platform, session_date)
+
         with _index_file_lock(daily_index_path):
             daily_index = self.load_daily_index(platform, session_date)
             if daily_index is None:
@@ -613,25 +1034,35 @@ class StorageManager:
                     platform=platform,
                     date=date_str,
                 )
+            before = _daily_totals(daily_index)
 
-            # Check if session already exists (update) or is new (add)
-            existing_idx = next(
-                (
-                    i
-                    for i, s in enumerate(daily_index.sessions)
-                    if s.session_id == session_index.session_id
-                ),
-                None,
-            )
-            if existing_idx is not None:
-                daily_index.sessions[existing_idx] = session_index
-                daily_index.recalculate_totals()
-            else:
-                daily_index.add_session(session_index)
+            # Replace existing entries by ID (update), append new ones (add)
+            merged = {s.session_id: s for s in daily_index.sessions}
+            for session_index in session_indexes:
+                merged[session_index.session_id] = session_index
+            daily_index.sessions = list(merged.values())
+            daily_index.recalculate_totals()
+            daily_index.last_updated = datetime.now().isoformat()
 
             self.save_daily_index(daily_index)
+        return before, _daily_totals(daily_index)
+
+    def _refresh_platform_index(
+        self, platform: Platform, changes: Dict[str, Tuple[_IndexTotals, _IndexTotals]]
+    ) -> None:
+        """
+        Apply daily index changes to the platform index under lock.
+
+        Dates already in the platform index contribute the change in their
+        totals; newly registered dates contribute their full totals, so the
+        platform totals stay the sum of its registered daily indexes.
+
+        Args:
+            platform: Platform identifier
+            changes: Date -> daily totals before and after, from _merge_daily_index()
+        """
+        platform_index_path = self.get_platform_index_path(platform)
 
-        # Update platform index under lock
         with _index_file_lock(platform_index_path):
             platform_index = self.load_platform_index(platform)
             if platform_index is None:
@@ -640,31 +1071,283 @@ class StorageManager:
                     platform=platform,
                 )
 
-            if date_str not in platform_index.dates:
-                platform_index.dates.append(date_str)
-                platform_index.dates.sort()
-
-            platform_index.first_session_date = (
-                platform_index.dates[0] if platform_index.dates else None
-            )
-            platform_index.last_session_date = (
-                platform_index.dates[-1] if platform_index.dates else None
-            )
-            platform_index.last_updated = datetime.now().isoformat()
-
-            # Recalculate totals
-            platform_index.total_tokens = 0
-            platform_index.total_cost = 0.0
-            platform_index.total_sessions = 0
-            for d_str in platform_index.dates:
-                daily = self.load_daily_index(platform, datetime.strptime(d_str, "%Y-%m-%d").date())
-                if daily:
-                    platform_index.total_tokens += daily.total_tokens
-                    platform_index.total_cost += daily.total_cost
-                    platform_index.total_sessions += daily.session_count
+            known_dates = set(platform_index.dates)
+            for date_str, (before, after) in changes.items():
+                if date_str not in known_dates:
+                    platform_index.dates.append(date_str)
+                    before = (0, 0.0, 0)
+                platform_index.total_tokens += after[0] - before[0]
+                platform_index.total_cost += after[1] - before[1]
+                platform_index.total_sessions += after[2] - before[2]
 
+            self._finish_platform_index(platform_index)
             self.save_platform_index(platform_index)
 
+    @staticmethod
+    def _finish_platform_index(platform_index: PlatformIndex) -> None:
+        """Sort dates and set the date range and timestamp."""
+        platform_index.dates.sort()
+        platform_index.first_session_date = (
+            platform_index.dates[0] if platform_index.dates else None
+        )
+        platform_index.last_session_date = (
+            platform_index.dates[-1] if platform_index.dates else None
+        )
+        platform_index.last_updated = datetime.now().isoformat()
+
+    # =========================================================================
+    # Session Catalog
+    # =========================================================================
+
+    def _get_catalog(self) -> Optional["SessionCatalog"]:
+        """Session catalog, or None if disabled (queries then scan directories)."""
+        if self._catalog is None and not self._catalog_failed:
+            from .catalog import SessionCatalog, catalog_enabled
+
+            if not catalog_enabled():
+                self._catalog_failed = True
+                return None
+            self._catalog = SessionCatalog(self.base_dir)
+        return None if self._catalog_failed else self._catalog
+
+    def _mark_dir_changed(self, session_path: Path) -> None:
+        """Forget cached listings of a directory after an in-place file write."""
+        _listing_cache.invalidate(session_path.parent)
+        if self._catalog is not None:
+            self._catalog.mark_dirty(session_path.parent)
+
+    def rebuild_catalog(self) -> int:
+        """
+        Recreate the session catalog from the files on disk.
+
+        Returns:
+            Number of session files catalogued
+
+        Raises:
+            RuntimeError: If the catalog is disabled or can't be written
+        """
+        from .catalog import SessionCatalog, catalog_enabled
+
+        if not catalog_enabled():
+            raise RuntimeError("session catalog is disabled (TOKEN_AUDIT_CATALOG=off)")
+        catalog = self._catalog or SessionCatalog(self.base_dir)
+        try:
+            count = catalog.rebuild()
+        except catalog.errors as e:
+            raise RuntimeError(f"cannot rebuild session catalog: {e}") from e
+        self._catalog = catalog
+        self._catalog_failed = False
+        return count
+
+    # =========================================================================
+    # Session Format
+    # =========================================================================
+
+    def convert_session_files(
+        self,
+        compact: bool = True,
+        platform: Optional[Platform] = None,
+        dry_run: bool = False,
+    ) -> FormatConversionResult:
+        """
+        Rewrite stored session files in the compact (or pretty JSON) format.
+
+        Modification times are preserved, so session ordering is unchanged.
+        Event logs (.jsonl) and files without a ``_file`` header are left alone.
+
+        Args:
+            compact: Convert to the compact format (False converts back to JSON)
+            platform: Only convert this platform's sessions (None for all)
+            dry_run: Measure the savings without writing anything
+
+        Returns:
+            Counts, sizes and decode times of the converted files
+        """
+        result = FormatConversionResult()
+        catalog = self._get_catalog()
+
+        for session_path in self.list_sessions(platform=platform):
+            if session_path.suffix != ".json":
+                continue
+            try:
+                raw = session_path.read_bytes()
+                if is_compressed(raw[:4]) == compact:
+                    result.already_converted += 1
+                    continue
+
+                start = time.perf_counter()
+                session_data = decode_session(raw)
+                load_before = time.perf_counter() - start
+                if not isinstance(session_data, dict) or "_file" not in session_data:
+                    continue
+
+                converted = encode_session(session_data, compact=compact)
+                start = time.perf_counter()
+                decode_session(converted)
+                load_after = time.perf_counter() - start
+
+                if not dry_run:
+                    stat = session_path.stat()
+                    _atomic_write_bytes(session_path, converted)
+                    os.utime(session_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+                    write_summary(session_path, session_data)
+                    if catalog is not None and not self._catalog_failed:
+                        try:
+                            catalog.record(session_path, session_data)
+                        except catalog.errors:
+                            self._catalog_failed = True
+            except (OSError, ValueError):
+                result.failed += 1
+                continue
+
+            result.converted += 1
+            result.bytes_before += len(raw)
+            result.bytes_after += len(converted)
+            result.load_seconds_before += load_before
+            result.load_seconds_after += load_after
+
+        if result.converted and not dry_run:
+            _listing_cache.invalidate()
+        return result
+
+    # =========================================================================
+    # Archive
+    # =========================================================================
+
+    def archive_sessions(
+        self,
+        older_than_days: int,
+        platform: Optional[Platform] = None,
+        dry_run: bool = False,
+    ) -> ArchiveResult:
+        """
+        Pack session files older than a cutoff into monthly bundles.
+
+        Each month of a platform's sessions goes into
+        ``<platform>/archive/<YYYY-MM>.zip`` (see archive.py), extending the
+        bundle if it exists. The archived files and their sidecars are then
+        deleted, along with date directories left without session files.
+        Archived sessions still load, list and aggregate through their
+        archived paths. Event logs (.jsonl) are left in place.
+
+        Args:
+            older_than_days: Archive date directories older than this many days
+            platform: Only archive this platform's sessions (None for all)
+            dry_run: Count what would be archived without writing anything
+
+        Returns:
+            Counts and sizes of the archived files
+        """
+        result = ArchiveResult()
+        cutoff = date.today() - timedelta(days=older_than_days)
+
+        for p in [platform] if platform else self.list_platforms():
+            months: Dict[str, List[date]] = {}
+            for session_date in self.list_dates(p):
+                if session_date < cutoff:
+                    months.setdefault(session_date.strftime("%Y-%m"), []).append(session_date)
+            for month, dates in sorted(months.items()):
+                self._archive_month(p, month, sorted(dates), dry_run, result)
+
+        if result.archived and not dry_run:
+            _listing_cache.invalidate()
+        return result
+
+    def _archive_month(
+        self,
+        platform: Platform,
+        month: str,
+        dates: List[date],
+        dry_run: bool,
+        result: ArchiveResult,
+    ) -> None:
+        """Archive the session files of one month's date directories."""
+        archive_path = month_archive_path(self.get_platform_dir(platform), month)
+        files: List[Tuple[ArchiveMember, Path]] = []
+
+        for session_date in dates:
+            date_dir = self.get_date_dir(platform, session_date)
+            for entry in list_directory(date_dir):
+                if not _is_session_file(entry) or entry.path.suffix != ".json":
+                    continue
+                try:
+                    stat = entry.path.stat()
+                    session_data = decode_session(entry.path.read_bytes())
+                except (OSError, ValueError):
+                    result.failed += 1
+                    continue
+                if not isinstance(session_data, dict):
+                    result.failed += 1
+                    continue
+
+                # Listings read these instead of the member (see archive.py)
+                member = ArchiveMember(
+                    f"{date_dir.name}/{entry.name}", stat.st_mtime_ns, stat.st_size
+                )
+                index = self.build_session_index(archive_path / member.name, platform, session_data)
+                index.file_size_bytes = stat.st_size
+                member.meta = {
+                    "summary": SessionSummary.from_session_data(session_data, stat).to_dict(),
+                    "index": index.to_dict(),
+                }
+                files.append((member, entry.path))
+                result.bytes_before += stat.st_size
+
+        if not files or dry_run:
+            result.archived += len(files)
+            return
+
+        try:
+            size_before = archive_path.stat().st_size if archive_path.exists() else 0
+            write_archive(archive_path, files)
+            result.bytes_after += archive_path.stat().st_size - size_before
+        except OSError:
+            result.failed += len(files)
+            return
+        result.archived += len(files)
+        result.bundles += 1
+
+        for _, session_path in files:
+            with suppress(OSError):
+                session_path.unlink()
+            remove_summary(session_path)
+        for session_date in dates:
+            self._tidy_archived_dir(platform, session_date, {path for _, path in files})
+
+    def _tidy_archived_dir(
+        self, platform: Platform, session_date: date, archived: Set[Path]
+    ) -> None:
+        """Remove a date directory emptied by archiving, or drop archived sessions from its index."""
+        date_dir = self.get_date_dir(platform, session_date)
+        try:
+            remaining = [e for e in os.scandir(date_dir) if not e.name.startswith(".")]
+        except OSError:
+            return
+        if not remaining:
+            # Only the daily index and sidecar directory are left
+            shutil.rmtree(date_dir, ignore_errors=True)
+            return
+
+        daily_index = self.load_daily_index(platform, session_date)
+        if daily_index is None:
+            return
+        archived_paths = {str(path.relative_to(self.base_dir)) for path in archived}
+        kept = [s for s in daily_index.sessions if s.file_path not in archived_paths]
+        if len(kept) != len(daily_index.sessions):
+            daily_index.sessions = kept
+            daily_index.recalculate_totals()
+            self.save_daily_index(daily_index)
+
+    def _archived_sessions(self, platform: Platform) -> List[Tuple[Path, ArchiveMember]]:
+        """Archived session paths of a platform, with their members (unreadable bundles skipped)."""
+        found: List[Tuple[Path, ArchiveMember]] = []
+        for archive_path in list_archives(self.get_platform_dir(platform)):
+            try:
+                found.extend((archive_path / m.name, m) for m in archive_members(archive_path))
+            except OSError:
+                continue
+        return found
+
     # =========================================================================
     # Session Discovery
     # =========================================================================
@@ -676,12 +1359,11 @@ class StorageManager:
         Returns:
             List of platform identifiers
         """
-        platforms = []
-        for platform in SUPPORTED_PLATFORMS:
-            platform_dir = self.get_platform_dir(platform)
-            if platform_dir.exists() and any(platform_dir.iterdir()):
-                platforms.append(platform)
-        return platforms
+        return [
+            platform
+            for platform in SUPPORTED_PLATFORMS
+            if list_directory(self.get_platform_dir(platform))
+        ]
 
     def list_dates(self, platform: Platform) -> List[date]:
         """
@@ -693,16 +1375,11 @@ class StorageManager:
         Returns:
             List of dates, sorted newest first
         """
-        platform_dir = self.get_platform_dir(platform)
-        if not platform_dir.exists():
-            return []
-
         dates = []
-        for item in platform_dir.iterdir():
-            if item.is_dir() and not item.name.startswith("."):
+        for entry in list_directory(self.get_platform_dir(platform)):
+            if _is_date_dir(entry):
                 try:
-                    session_date = datetime.strptime(item.name, "%Y-%m-%d").date()
-                    dates.append(session_date)
+                    dates.append(datetime.strptime(entry.name, "%Y-%m-%d").date())
                 except ValueError:
                     continue
 
@@ -713,35 +1390,6 @@ class StorageManager:
     # Performance Optimizations (v0.9.0 - task-107.3)
     # =========================================================================
 
-    def _get_cached_mtime(self, path: Path) -> float:
-        """Get file modification time with caching.
-
-        Uses a cache with TTL to reduce stat() system calls during list_sessions.
-        Cache is invalidated after _mtime_cache_ttl seconds (default 60s).
-
-        Args:
-            path: Path to get mtime for
-
-        Returns:
-            File modification time as Unix timestamp
-        """
-        now = time.time()
-
-        # Invalidate cache if TTL expired
-        if now - self._mtime_cache_timestamp > self._mtime_cache_ttl:
-            self._mtime_cache.clear()
-            self._mtime_cache_timestamp = now
-
-        # Return cached value or compute and cache
-        if path not in self._mtime_cache:
-            try:
-                self._mtime_cache[path] = path.stat().st_mtime
-            except OSError:
-                # File might have been deleted, use 0
-                self._mtime_cache[path] = 0.0
-
-        return self._mtime_cache[path]
-
     def peek_session_header(
         self, session_path: Path, max_bytes: int = 4096
     ) -> Optional[Dict[str, Any]]:
@@ -749,6 +1397,8 @@ class StorageManager:
 
         Extracts the _file metadata block from the first few KB of a session file.
         Much faster than json.load() for large sessions when only metadata is needed.
+        List views use the summary sidecars instead (see session_summary.py), which
+        also cover tokens, cost and smells.
 
         Args:
             session_path: Path to session JSON file
@@ -761,9 +1411,8 @@ class StorageManager:
             return None
 
         try:
-            with open(session_path) as f:
-                # Read first chunk
-                chunk = f.read(max_bytes)
+            # Read first chunk (decompressing only that much of compact files)
+            chunk = read_session_prefix(session_path, max_bytes).decode("utf-8", errors="replace")
 
             # Quick check for _file key
             if '"_file"' not in chunk:
@@ -785,19 +1434,18 @@ class StorageManager:
                     return result
                 return None
 
-        except (OSError, json.JSONDecodeError, KeyError):
+        except (OSError, ValueError, KeyError):
             pass
 
         return None
 
     def invalidate_mtime_cache(self) -> None:
-        """Force invalidation of the mtime cache.
+        """Force invalidation of the cached directory listings.
 
-        Call this after creating or modifying session files to ensure
-        subsequent list_sessions calls see fresh data.
+        Call this after modifying session files in place to ensure
+        subsequent list_sessions calls see fresh sizes and mtimes.
         """
-        self._mtime_cache.clear()
-        self._mtime_cache_timestamp = 0.0
+        _listing_cache.invalidate()
 
     def list_sessions(
         self,
@@ -818,7 +1466,15 @@ class StorageManager:
         Returns:
             List of session file paths, sorted by date (newest first)
         """
-        sessions = []
+        catalog = self._get_catalog()
+        if catalog is not None:
+            try:
+                return catalog.list_paths(platform, start_date, end_date, limit)
+            except catalog.errors:
+                self._catalog_failed = True
+
+        # (modification time, path) of each session file
+        sessions: List[Tuple[float, Path]] = []
 
         platforms_to_check = [platform] if platform else self.list_platforms()
 
@@ -830,21 +1486,26 @@ class StorageManager:
                 if end_date and session_date > end_date:
                     continue
 
-                date_dir = self.get_date_dir(p, session_date)
                 # Support both .json (actual sessions) and .jsonl (storage module design)
-                for pattern in ["*.json", "*.jsonl"]:
-                    for session_file in date_dir.glob(pattern):
-                        if not session_file.name.startswith("."):
-                            sessions.append(session_file)
+                date_dir = self.get_date_dir(p, session_date)
+                sessions.extend(
+                    (e.mtime, e.path) for e in list_directory(date_dir) if _is_session_file(e)
+                )
+
+            for path, member in self._archived_sessions(p):
+                if start_date and member.date < start_date.isoformat():
+                    continue
+                if end_date and member.date > end_date.isoformat():
+                    continue
+                sessions.append((member.mtime_ns / 1e9, path))
 
-        # Sort by modification time (newest first)
-        # Uses cached mtimes to reduce stat() calls (v0.9.0 - task-107.3)
-        sessions.sort(key=lambda p: self._get_cached_mtime(p), reverse=True)
+        # Sort by modification time (newest first), from the cached listings
+        sessions.sort(key=lambda s: s[0], reverse=True)
 
         if limit:
             sessions = sessions[:limit]
 
-        return sessions
+        return [path for _, path in sessions]
 
     def list_sessions_in_range(
         self,
@@ -856,8 +1517,9 @@ class StorageManager:
         List SessionIndex objects for sessions within a date range.
 
         Returns SessionIndex objects (not paths) for efficient aggregation
-        without loading full session data. Uses DailyIndex when available,
-        falls back to directory scan if not.
+        without loading full session data. Answered from the session catalog;
+        without it, uses DailyIndex when available and falls back to a
+        directory scan if not.
 
         Args:
             platform: Platform to query
@@ -867,6 +1529,21 @@ class StorageManager:
         Returns:
             List of SessionIndex objects for sessions in the date range
         """
+        catalog = self._get_catalog()
+        if catalog is not None:
+            try:
+                indexes = catalog.list_indexes(platform, start_date, end_date)
+                event_logs = catalog.event_logs(platform, start_date, end_date)
+            except catalog.errors:
+                self._catalog_failed = True
+            else:
+                if not event_logs:
+                    return indexes
+                indexes.extend(self._event_log_indexes(platform, event_logs))
+                return sorted(
+                    indexes, key=lambda idx: (idx.date, idx.started_at or "", idx.file_path)
+                )
+
         result: List[SessionIndex] = []
 
         # Get dates in range
@@ -881,16 +1558,19 @@ class StorageManager:
                 result.extend(daily_index.sessions)
             else:
                 # Fall back to directory scan (slower path)
-                date_dir = self.get_date_dir(platform, session_date)
-                if date_dir.exists():
-                    for pattern in ["*.json", "*.jsonl"]:
-                        for session_file in date_dir.glob(pattern):
-                            if not session_file.name.startswith("."):
-                                idx = self._build_session_index_from_file(
-                                    session_file, platform, date_str
-                                )
-                                if idx:
-                                    result.append(idx)
+                for entry in list_directory(self.get_date_dir(platform, session_date)):
+                    if _is_session_file(entry):
+                        idx = self._build_session_index_from_file(entry.path, platform, date_str)
+                        if idx:
+                            result.append(idx)
+
+        # Archived sessions keep their index entry in the bundle
+        for _, member in self._archived_sessions(platform):
+            if start_date.isoformat() <= member.date <= end_date.isoformat():
+                try:
+                    result.append(SessionIndex.from_dict(member.meta["index"]))
+                except (KeyError, TypeError):
+                    continue
 
         return result
 
@@ -906,6 +1586,13 @@ class StorageManager:
         Returns:
             Tuple of (first_date, last_date) or (None, None) if no sessions
         """
+        catalog = self._get_catalog()
+        if catalog is not None:
+            try:
+                return catalog.date_range(platform)
+            except catalog.errors:
+                self._catalog_failed = True
+
         first_date: Optional[date] = None
         last_date: Optional[date] = None
 
@@ -934,8 +1621,14 @@ class StorageManager:
                     except ValueError:
                         pass
             else:
-                # Fall back to directory listing
+                # Fall back to directory listing (and archived session dates)
                 dates = self.list_dates(p)
+                for _, member in self._archived_sessions(p):
+                    try:
+                        dates.append(datetime.strptime(member.date, "%Y-%m-%d").date())
+                    except ValueError:
+                        continue
+                dates.sort(reverse=True)
                 if dates:
                     # list_dates returns newest first, so last is first, first is last
                     p_last = dates[0]
@@ -947,6 +1640,35 @@ class StorageManager:
 
         return (first_date, last_date)
 
+    def _event_log_indexes(
+        self, platform: Platform, event_logs: List[Tuple[Path, date]]
+    ) -> List[SessionIndex]:
+        """
+        Resolve JSONL files to SessionIndex entries, as the uncatalogued path does.
+
+        The date's DailyIndex entry is used when there is one (migrated and
+        streamed sessions), otherwise the file's own _file header. Files with
+        neither (plain event logs) are skipped.
+        """
+        result: List[SessionIndex] = []
+        by_date: Dict[date, Dict[str, SessionIndex]] = {}
+        for path, session_date in event_logs:
+            if session_date not in by_date:
+                daily_index = self.load_daily_index(platform, session_date)
+                by_date[session_date] = (
+                    {idx.file_path: idx for idx in daily_index.sessions} if daily_index else {}
+                )
+            try:
+                rel_path = str(path.relative_to(self.base_dir))
+            except ValueError:
+                rel_path = str(path)
+            idx = by_date[session_date].get(rel_path) or self._build_session_index_from_file(
+                path, platform, session_date.isoformat()
+            )
+            if idx:
+                result.append(idx)
+        return result
+
     def _build_session_index_from_file(
         self,
         session_file: Path,
@@ -1017,11 +1739,21 @@ class StorageManager:
         Returns:
             Path to session file if found, None otherwise
         """
+        catalog = self._get_catalog()
+        if catalog is not None:
+            try:
+                return catalog.find(session_id)
+            except catalog.errors:
+                self._catalog_failed = True
+
         for platform in self.list_platforms():
             for session_date in self.list_dates(platform):
                 session_path = self.get_session_path(platform, session_date, session_id)
                 if session_path.exists():
                     return session_path
+            for path, _ in self._archived_sessions(platform):
+                if path.stem == session_id:
+                    return path
         return None
 
     # =========================================================================
@@ -1039,19 +1771,33 @@ class StorageManager:
         total_sessions = 0
         total_size_bytes = 0
 
+        catalog = self._get_catalog()
         for platform in self.list_platforms():
+            if catalog is not None and not self._catalog_failed:
+                try:
+                    platform_stats = catalog.platform_stats(platform)
+                    platforms_dict[platform] = platform_stats
+                    total_sessions += platform_stats["session_count"]
+                    total_size_bytes += platform_stats["size_bytes"]
+                    continue
+                except catalog.errors:
+                    self._catalog_failed = True
+
             session_count = 0
             size_bytes = 0
 
             dates = self.list_dates(platform)
 
             for session_date in dates:
-                date_dir = self.get_date_dir(platform, session_date)
                 # Support both .json and .jsonl formats
-                for pattern in ["*.json", "*.jsonl"]:
-                    for session_file in date_dir.glob(pattern):
+                for entry in list_directory(self.get_date_dir(platform, session_date)):
+                    if _is_session_file(entry):
                         session_count += 1
-                        size_bytes += session_file.stat().st_size
+                        size_bytes += entry.size
+
+            for _, member in self._archived_sessions(platform):
+                session_count += 1
+                size_bytes += member.size
 
             platforms_dict[platform] = {
                 "session_count": session_count,
@@ -1092,15 +1838,41 @@ class StreamingStorage:
     Thread Safety:
         - Per-session thread locks for intra-process safety
         - Advisory file locks (fcntl) for cross-process safety
+
+    Buffered Writer:
+        By default every append_event() opens, locks, writes and closes the
+        session file. With ``buffered=True`` (or TOKEN_AUDIT_STREAM_WRITER=buffered)
+        append_event() only queues the encoded event; a background thread
+        writes queued events in batches through one open file per session,
+        STREAM_FLUSH_INTERVAL after the first queued event or once
+        STREAM_FLUSH_BYTES are pending. Readers in this process (read_events,
+        tail_events, move_to_complete) flush first; other processes see events
+        once their batch is written. ``durability`` sets what is done per
+        batch, so every batch written under "flush" or "fsync" is readable by
+        crash recovery. Under "none" written batches can stay in the session
+        file's userspace write buffer, where a crash of this process loses
+        them (not just a power loss).
     """
 
-    def __init__(self, base_dir: Optional[Path] = None):
+    def __init__(
+        self,
+        base_dir: Optional[Path] = None,
+        buffered: Optional[bool] = None,
+        durability: Optional[Durability] = None,
+    ):
         """
         Initialize streaming storage.
 
         Args:
             base_dir: Base directory for session storage.
                       Defaults to ~/.token-audit/sessions/
+            buffered: Batch appends on a background thread
+                      (None follows TOKEN_AUDIT_STREAM_WRITER)
+            durability: "none", "flush" or "fsync" per written batch
+                        (None follows TOKEN_AUDIT_STREAM_DURABILITY, default "flush")
+
+        Raises:
+            ValueError: If durability is not a known level
         """
         self.base_dir = base_dir or get_default_base_dir()
         self._active_dir = self.base_dir / ACTIVE_SESSION_DIR
@@ -1110,6 +1882,28 @@ class StreamingStorage:
         self._thread_locks: Dict[str, threading.Lock] = {}
         self._locks_lock = threading.Lock()  # Lock for accessing _thread_locks
 
+        if buffered is None:
+            buffered = os.environ.get(STREAM_WRITER_ENV_VAR, "").lower() == "buffered"
+        level = durability or os.environ.get(STREAM_DURABILITY_ENV_VAR, "").lower() or "flush"
+        if level not in DURABILITY_LEVELS:
+            raise ValueError(
+                f"durability must be one of {', '.join(DURABILITY_LEVELS)}, got: {level}"
+            )
+        self.buffered = buffered
+        self.durability = level
+
+        # Buffered writer state: encoded events per session waiting for the
+        # flush thread, guarded by _pending_cond
+        self._pending: Dict[str, List[bytes]] = {}
+        self._pending_bytes = 0
+        self._pending_cond = threading.Condition()
+        # Held while a batch is taken and written, so batches stay in order
+        self._write_lock = threading.Lock()
+        self._handles: Dict[str, BinaryIO] = {}
+        self._known_sessions: Set[str] = set()
+        self._flush_thread: Optional[threading.Thread] = None
+        self._closing = False
+
     def _get_thread_lock(self, session_id: str) -> threading.Lock:
         """Get or create a thread lock for a session."""
         with self._locks_lock:
@@ -1177,23 +1971,154 @@ class StreamingStorage:
         Raises:
             FileNotFoundError: If session file doesn't exist
         """
+        if self.buffered and session_id in self._known_sessions:
+            self._queue_event(session_id, json_codec.dumps_bytes(event, default=str) + b"\n")
+            return
+
         session_path = self.get_active_session_path(session_id)
 
         if not session_path.exists():
             raise FileNotFoundError(f"Session not found: {session_id}")
 
+        if self.buffered:
+            self._known_sessions.add(session_id)
+            self._queue_event(session_id, json_codec.dumps_bytes(event, default=str) + b"\n")
+            return
+
         thread_lock = self._get_thread_lock(session_id)
 
         with thread_lock:
-            with open(session_path, "a") as f:
+            with open(session_path, "ab") as f:
                 # Acquire exclusive lock for writing
                 fcntl.flock(f.fileno(), fcntl.LOCK_EX)
                 try:
-                    f.write(json.dumps(event, default=str) + "\n")
+                    f.write(json_codec.dumps_bytes(event, default=str) + b"\n")
                     f.flush()  # Ensure data is written
+                    if self.durability == "fsync":
+                        os.fsync(f.fileno())
                 finally:
                     fcntl.flock(f.fileno(), fcntl.LOCK_UN)
 
+    def flush(self, session_id: Optional[str] = None) -> None:
+        """
+        Write events queued by the buffered writer and hand them to the OS.
+
+        Args:
+            session_id: Only this session's events (None for all sessions)
+        """
+        if not self.buffered:
+            return
+        with self._write_lock:
+            self._write_pending(session_id)
+            session_ids = list(self._handles) if session_id is None else [session_id]
+            for flushed_id in session_ids:
+                handle = self._handles.get(flushed_id)
+                if handle is not None:
+                    handle.flush()
+
+    def close(self) -> None:
+        """Write queued events, stop the flush thread and close session files."""
+        if not self.buffered:
+            return
+        with self._pending_cond:
+            self._closing = True
+            self._pending_cond.notify()
+        thread = self._flush_thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+        self.flush()
+        with self._write_lock:
+            for handle in self._handles.values():
+                handle.close()
+            self._handles.clear()
+        atexit.unregister(self.close)
+
+    def _queue_event(self, session_id: str, line: bytes) -> None:
+        """Queue an encoded event for the flush thread (buffered writer)."""
+        with self._pending_cond:
+            if self._flush_thread is None or self._closing:
+                self._closing = False
+                self._start_flush_thread()
+            wake = not self._pending or self._pending_bytes < STREAM_FLUSH_BYTES <= (
+                self._pending_bytes + len(line)
+            )
+            self._pending.setdefault(session_id, []).append(line)
+            self._pending_bytes += len(line)
+            if wake:  # First event of a batch, or the batch just got big enough
+                self._pending_cond.notify()
+
+    def _start_flush_thread(self) -> None:
+        self._flush_thread = threading.Thread(
+            target=self._flush_loop, name="token-audit-stream-writer", daemon=True
+        )
+        self._flush_thread.start()
+        # Daemon threads don't outlive the interpreter: write what is left at exit
+        atexit.register(self.close)
+
+    def _flush_loop(self) -> None:
+        """Flush thread: write a batch once the interval has passed or enough is queued."""
+        while True:
+            with self._pending_cond:
+                while not self._pending and not self._closing:
+                    self._pending_cond.wait()
+                self._pending_cond.wait_for(
+                    lambda: self._closing or self._pending_bytes >= STREAM_FLUSH_BYTES,
+                    timeout=STREAM_FLUSH_INTERVAL,
+                )
+                closing = self._closing
+            try:
+                with self._write_lock:
+                    self._write_pending()
+            except OSError as e:
+                # stderr: stdout may be the MCP server's protocol stream
+                print(f"Warning: Could not write active session events: {e}", file=sys.stderr)
+            if closing:
+                return
+
+    def _write_pending(self, session_id: Optional[str] = None) -> None:
+        """Write queued events, one batch per session (caller holds _write_lock)."""
+        with self._pending_cond:
+            if session_id is None:
+                batches = self._pending
+                self._pending = {}
+            else:
+                batch = self._pending.pop(session_id, None)
+                batches = {session_id: batch} if batch else {}
+            self._pending_bytes -= sum(len(line) for lines in batches.values() for line in lines)
+
+        for batch_session_id, lines in batches.items():
+            handle = self._handles.get(batch_session_id)
+            if handle is None:
+                path = self.get_active_session_path(batch_session_id)
+                # Kept open until the session completes
+                handle = self._handles[batch_session_id] = open(path, "ab")  # noqa: SIM115
+            with self._get_thread_lock(batch_session_id):
+                fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+                try:
+                    handle.write(b"".join(lines))
+                    if self.durability != "none":
+                        handle.flush()
+                    if self.durability == "fsync":
+                        os.fsync(handle.fileno())
+                finally:
+                    fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+
+    def _close_session_writer(self, session_id: str, discard: bool = False) -> None:
+        """Write (or drop) a session's queued events and close its file."""
+        if not self.buffered:
+            return
+        with self._write_lock:
+            if discard:
+                with self._pending_cond:
+                    dropped = self._pending.pop(session_id, [])
+                    self._pending_bytes -= sum(len(line) for line in dropped)
+            else:
+                self._write_pending(session_id)
+            handle = self._handles.pop(session_id, None)
+            if handle is not None:
+                handle.close()
+        self._known_sessions.discard(session_id)
+
     def read_events(self, session_id: str) -> Iterator[Dict[str, Any]]:
         """
         Read events from active session.
@@ -1209,6 +2134,7 @@ class StreamingStorage:
         Raises:
             FileNotFoundError: If session file doesn't exist
         """
+        self.flush(session_id)
         session_path = self.get_active_session_path(session_id)
 
         if not session_path.exists():
@@ -1217,21 +2143,73 @@ class StreamingStorage:
         thread_lock = self._get_thread_lock(session_id)
 
         with thread_lock:
-            with open(session_path) as f:
+            with open(session_path, "rb") as f:
                 # Acquire shared lock for reading
                 fcntl.flock(f.fileno(), fcntl.LOCK_SH)
                 try:
-                    for line_num, line in enumerate(f, 1):
-                        line = line.strip()
-                        if not line:
-                            continue
-                        try:
-                            yield json.loads(line)
-                        except json.JSONDecodeError as e:
-                            print(f"Warning: Invalid JSON at {session_path}:{line_num}: {e}")
+                    reader = TailReader(session_path)
+                    event_num = 0
+                    for batch in reader.read_batches(final=True):
+                        for line in batch:
+                            event_num += 1
+                            try:
+                                yield json_codec.loads(line)
+                            except (json.JSONDecodeError, UnicodeDecodeError) as e:
+                                print(
+                                    f"Warning: Invalid JSON at {session_path} "
+                                    f"(event {event_num}): {e}"
+                                )
                 finally:
                     fcntl.flock(f.fileno(), fcntl.LOCK_UN)
 
+    def tail_events(
+        self, session_id: str, reader: Optional[TailReader] = None
+    ) -> Tuple[List[Dict[str, Any]], TailReader]:
+        """
+        Read events appended to an active session since the previous call.
+
+        Intended for live consumers that poll an active session. Pass the
+        returned reader back in on the next call; a partially written line
+        stays buffered in it until complete.
+
+        Args:
+            session_id: Session identifier
+            reader: Reader returned by the previous call (None to start at byte 0)
+
+        Returns:
+            Tuple of (new event dictionaries, reader to pass to the next call)
+
+        Raises:
+            FileNotFoundError: If session file doesn't exist
+        """
+        self.flush(session_id)
+        session_path = self.get_active_session_path(session_id)
+
+        if not session_path.exists():
+            raise FileNotFoundError(f"Session not found: {session_id}")
+
+        if reader is None or reader.path != session_path:
+            reader = TailReader(session_path)
+
+        events: List[Dict[str, Any]] = []
+        thread_lock = self._get_thread_lock(session_id)
+
+        with thread_lock:
+            with open(session_path, "rb") as f:
+                # Acquire shared lock for reading
+                fcntl.flock(f.fileno(), fcntl.LOCK_SH)
+                try:
+                    for batch in reader.read_batches():
+                        for line in batch:
+                            try:
+                                events.append(json_codec.loads(line))
+                            except (json.JSONDecodeError, UnicodeDecodeError) as e:
+                                print(f"Warning: Invalid JSON at {session_path}: {e}")
+                finally:
+                    fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+        return events, reader
+
     def load_all_events(self, session_id: str) -> List[Dict[str, Any]]:
         """
         Load all events from active session into memory.
@@ -1277,6 +2255,9 @@ class StreamingStorage:
         if not active_path.exists():
             raise FileNotFoundError(f"Active session not found: {session_id}")
 
+        # Write queued events before the JSONL file goes away
+        self._close_session_writer(session_id)
+
         # Create completed session path
         # Convert underscore to hyphen for directory name (e.g., claude_code -> claude-code)
         platform_dir = platform.replace("_", "-")
@@ -1291,9 +2272,9 @@ class StreamingStorage:
         thread_lock = self._get_thread_lock(session_id)
 
         with thread_lock:
-            # Write final JSON
-            with open(completed_path, "w") as f:
-                json.dump(final_data, f, indent=2, default=str)
+            # Write final JSON (compact if TOKEN_AUDIT_SESSION_FORMAT=compact)
+            with open(completed_path, "wb") as f:
+                f.write(encode_session(final_data))
 
             # Remove active JSONL file
             active_path.unlink()
@@ -1301,6 +2282,11 @@ class StreamingStorage:
         # Clean up thread lock
         self._cleanup_thread_lock(session_id)
 
+        from .catalog import record_session_file
+
+        record_session_file(self.base_dir, completed_path, final_data)
+        write_summary(completed_path, final_data)
+
         return completed_path
 
     def get_active_sessions(self) -> List[str]:
@@ -1334,6 +2320,7 @@ class StreamingStorage:
         Args:
             session_id: Session identifier
         """
+        self._close_session_writer(session_id, discard=True)
         session_path = self.get_active_session_path(session_id)
         if session_path.exists():
             session_path.unlink()
@@ -1379,6 +2366,16 @@ class StreamingStorage:
 # =============================================================================
 
 
+# Checkpoint journal of migrate_all_v0_sessions() (in the v1.x base directory)
+MIGRATION_JOURNAL_NAME = ".migration-journal.jsonl"
+
+# Seconds between migration progress lines
+MIGRATION_PROGRESS_INTERVAL = 1.0
+
+# (source directory, platform, new session file, index entry, error) of one migration
+_MigrationOutcome = Tuple[Path, Platform, Optional[Path], Optional[SessionIndex], Optional[str]]
+
+
 def migrate_v0_session(
     v0_session_dir: Path, storage: StorageManager, platform: Platform = "claude_code"
 ) -> Optional[Path]:
@@ -1400,13 +2397,33 @@ def migrate_v0_session(
     Returns:
         Path to new session file if successful, None otherwise
     """
+    session_id = storage.generate_session_id(platform)
+    new_session_path, session_index = _migrate_v0_session(
+        v0_session_dir, storage, platform, session_id
+    )
+    if session_index is not None:
+        session_date = datetime.strptime(session_index.date, "%Y-%m-%d").date()
+        storage.update_indexes_for_session(platform, session_date, session_index)
+    return new_session_path
+
+
+def _migrate_v0_session(
+    v0_session_dir: Path, storage: StorageManager, platform: Platform, session_id: str
+) -> Tuple[Optional[Path], Optional[SessionIndex]]:
+    """
+    Copy a v0.x session into v1.x storage without touching the indexes.
+
+    Returns:
+        Tuple of (new session file or None if there was nothing to migrate,
+        index entry or None without a readable summary.json)
+    """
     # Check for events.jsonl (primary source)
     events_file = v0_session_dir / "events.jsonl"
     summary_file = v0_session_dir / "summary.json"
 
     if not events_file.exists() and not summary_file.exists():
         print(f"Warning: No events.jsonl or summary.json in {v0_session_dir}")
-        return None
+        return None, None
 
     # Extract date from directory name
     # Format: {project}-{YYYY}-{MM}-{DD}-{HHMMSS}
@@ -1425,9 +2442,6 @@ def migrate_v0_session(
     except (ValueError, IndexError):
         session_date = date.today()
 
-    # Generate new session ID
-    session_id = storage.generate_session_id(platform)
-
     # Create new session file
     new_session_path = storage.create_session_file(platform, session_id, session_date)
 
@@ -1438,6 +2452,7 @@ def migrate_v0_session(
                 dst.write(line)
 
     # If we have summary.json, extract metadata for index
+    session_index = None
     if summary_file.exists():
         try:
             with open(summary_file) as f:
@@ -1461,34 +2476,55 @@ def migrate_v0_session(
                 file_size_bytes=new_session_path.stat().st_size,
             )
 
-            # Update indexes
-            storage.update_indexes_for_session(platform, session_date, session_index)
-
         except (json.JSONDecodeError, KeyError) as e:
             print(f"Warning: Could not parse summary.json: {e}")
 
-    return new_session_path
+    return new_session_path, session_index
 
 
 def migrate_all_v0_sessions(
-    v0_base_dir: Path, storage: StorageManager, platform: Platform = "claude_code"
+    v0_base_dir: Path,
+    storage: StorageManager,
+    platform: Platform = "claude_code",
+    jobs: Optional[int] = None,
+    resume: bool = True,
+    quiet: bool = False,
 ) -> Dict[str, Any]:
     """
     Migrate all v0.x sessions from a directory.
 
+    Session directories are migrated on a thread pool (the work is file
+    copying). Each finished directory is appended to a checkpoint journal
+    (MIGRATION_JOURNAL_NAME in the v1.x base directory), so an interrupted
+    run resumes where it stopped; the journal is removed once a run leaves
+    no failed directories. Session IDs are derived from the source
+    directory, so a directory migrated again rewrites the same file. The
+    indexes are updated in one batched pass at the end.
+
     Args:
         v0_base_dir: Base directory containing v0.x sessions (e.g., logs/sessions/)
         storage: StorageManager instance for v1.x storage
         platform: Default platform for migrated sessions
+        jobs: Worker threads (default: the executor's default; 1 runs in-process)
+        resume: Skip directories recorded in the journal (False starts over)
+        quiet: Don't print the progress line (stderr)
 
     Returns:
         Migration results dictionary
+
+    Raises:
+        ValueError: If jobs is less than 1
     """
+    if jobs is not None and jobs < 1:
+        raise ValueError(f"jobs must be at least 1, got {jobs}")
+
     total = 0
     migrated = 0
     failed = 0
     skipped = 0
+    resumed = 0
     errors: List[str] = []
+    start = time.perf_counter()
 
     if not v0_base_dir.exists():
         return {
@@ -1496,10 +2532,19 @@ def migrate_all_v0_sessions(
             "migrated": migrated,
             "failed": failed,
             "skipped": skipped,
+            "resumed": resumed,
             "errors": errors,
+            "elapsed_seconds": 0.0,
         }
 
-    for session_dir in v0_base_dir.iterdir():
+    journal_path = storage.base_dir / MIGRATION_JOURNAL_NAME
+    journal = _load_migration_journal(journal_path) if resume else {}
+
+    # Index entries per platform, for the batched update at the end
+    indexes: Dict[Platform, List[SessionIndex]] = {}
+    pending: List[Tuple[Path, Platform]] = []
+
+    for session_dir in sorted(v0_base_dir.iterdir()):
         if not session_dir.is_dir():
             continue
 
@@ -1514,25 +2559,139 @@ def migrate_all_v0_sessions(
         elif "ollama" in session_dir.name.lower():
             detected_platform = "ollama_cli"
 
+        entry = journal.get(str(session_dir.resolve()))
+        if entry is None:
+            pending.append((session_dir, detected_platform))
+            continue
+
+        # Finished by an earlier run (its index entry is merged again below)
+        resumed += 1
+        if entry.get("path") is None:
+            skipped += 1
+            continue
+        migrated += 1
+        if entry.get("index") is not None:
+            indexes.setdefault(detected_platform, []).append(SessionIndex.from_dict(entry["index"]))
+
+    def _migrate(item: Tuple[Path, Platform]) -> _MigrationOutcome:
+        session_dir, detected_platform = item
         try:
-            new_path = migrate_v0_session(session_dir, storage, detected_platform)
-            if new_path:
-                migrated += 1
-            else:
-                skipped += 1
+            new_path, session_index = _migrate_v0_session(
+                session_dir, storage, detected_platform, _v0_session_id(session_dir)
+            )
         except Exception as e:
-            failed += 1
-            errors.append(f"{session_dir.name}: {e}")
+            return session_dir, detected_platform, None, None, f"{session_dir.name}: {e}"
+        return session_dir, detected_platform, new_path, session_index, None
+
+    def _collect(outcomes: Iterable[_MigrationOutcome]) -> None:
+        nonlocal migrated, failed, skipped
+        last_report = 0.0
+        for done, outcome in enumerate(outcomes, 1):
+            session_dir, detected_platform, new_path, session_index, error = outcome
+            if error:
+                failed += 1
+                errors.append(error)
+            else:
+                if new_path:
+                    migrated += 1
+                    if session_index is not None:
+                        indexes.setdefault(detected_platform, []).append(session_index)
+                else:
+                    skipped += 1
+                # Checkpoint: this directory is skipped when the run is resumed
+                record = {
+                    "source": str(session_dir.resolve()),
+                    "path": str(new_path) if new_path else None,
+                    "index": session_index.to_dict() if session_index else None,
+                }
+                journal_file.write(json.dumps(record) + "\n")
+                journal_file.flush()
+
+            now = time.perf_counter()
+            if not quiet and (
+                now - last_report >= MIGRATION_PROGRESS_INTERVAL or done == len(pending)
+            ):
+                last_report = now
+                _print_migration_progress(done, len(pending), now - start)
+
+    with open(journal_path, "a" if resume else "w", encoding="utf-8") as journal_file:
+        if jobs == 1 or len(pending) <= 1:
+            _collect(map(_migrate, pending))
+        else:
+            pool = ThreadPoolExecutor(max_workers=jobs)
+            futures: List[Future[_MigrationOutcome]] = []
+            try:
+                futures = [pool.submit(_migrate, item) for item in pending]
+                _collect(future.result() for future in as_completed(futures))
+            finally:
+                # On interrupt, don't start the rest (the journal lets a rerun resume).
+                # Cancelled by hand: shutdown(cancel_futures=True) needs Python 3.9
+                for future in futures:
+                    future.cancel()
+                pool.shutdown()
+
+    # Single batched index update per platform
+    for index_platform, entries in indexes.items():
+        storage.update_indexes_for_sessions(index_platform, entries)
+    if indexes:
+        storage.invalidate_mtime_cache()
+
+    # Every directory is done, so there is nothing left to resume
+    if not failed:
+        journal_path.unlink(missing_ok=True)
 
     return {
         "total": total,
         "migrated": migrated,
         "failed": failed,
         "skipped": skipped,
+        "resumed": resumed,
         "errors": errors,
+        "elapsed_seconds": time.perf_counter() - start,
     }
 
 
+def _v0_session_id(v0_session_dir: Path) -> str:
+    """Session ID for a v0.x directory (the same on every run, unlike generate_session_id())."""
+    parts = v0_session_dir.name.rsplit("-", 4)
+    try:
+        timestamp = datetime.strptime("-".join(parts[-4:]), "%Y-%m-%d-%H%M%S")
+        ts_str = timestamp.strftime("%Y%m%dT%H%M%S")
+    except ValueError:
+        ts_str = "00000000T000000"
+    digest = hashlib.sha256(str(v0_session_dir.resolve()).encode()).hexdigest()[:6]
+    return f"session-{ts_str}-{digest}"
+
+
+def _load_migration_journal(journal_path: Path) -> Dict[str, Dict[str, Any]]:
+    """Journal records by source directory (a torn last line is ignored)."""
+    journal: Dict[str, Dict[str, Any]] = {}
+    try:
+        with open(journal_path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                    journal[record["source"]] = record
+                except (json.JSONDecodeError, KeyError, TypeError):
+                    continue
+    except OSError:
+        pass
+    return journal
+
+
+def _print_migration_progress(done: int, total: int, elapsed: float) -> None:
+    """Print a throughput and ETA line (stderr, overwritten in place)."""
+    rate = done / elapsed if elapsed > 0 else 0.0
+    eta = (total - done) / rate if rate > 0 else 0.0
+    end = "\n" if done == total else ""
+    print(
+        f"\rMigrated {done:,}/{total:,} sessions ({rate:,.1f} sessions/sec, ETA {eta:.0f}s)",
+        end=end,
+        file=sys.stderr,
+        flush=True,
+    )
+
+
 # =============================================================================
 # Testing
 # =============================================================================
@@ -1677,8 +2836,7 @@ def load_session_file(session_path: Path) -> Optional[Dict[str, Any]]:
         Session data as dict, or None if loading failed
     """
     try:
-        with open(session_path) as f:
-            result: Dict[str, Any] = json.load(f)
-            return result
+        result: Dict[str, Any] = read_session_file(session_path)
+        return result
     except (json.JSONDecodeError, OSError):
         return None
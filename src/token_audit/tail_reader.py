@@ -0,0 +1,178 @@
+"""Partial-line-safe tail reader for append-only JSONL files.
+
+Shared by the Claude Code and Codex CLI adapters and StreamingStorage.
+
+Reading an actively written JSONL file with ``f.read().split("\\n")`` breaks
+when the writer is halfway through a line: the fragment is parsed as broken
+JSON, reported, and the read position moves past it, so the event is lost.
+TailReader reads binary chunks, yields only newline-terminated lines, and
+holds the trailing fragment until the rest of the line arrives.
+
+Features:
+- Binary chunked reads (no per-poll full-string copies)
+- Trailing partial line buffered across polls
+- Memory cap for pathological lines (dropped and counted)
+- Complete lines yielded in batches
+- Truncation/rotation detection (inode change or file shrink restarts at 0)
+"""
+
+import os
+from pathlib import Path
+from typing import Iterator, List, Optional
+
+# Read size per os.read() call
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+# Longest line kept in memory; longer lines are dropped (Claude tool results
+# can be large, but a single line beyond this is treated as corrupt)
+DEFAULT_MAX_LINE_BYTES = 32 * 1024 * 1024
+
+# Lines per yielded batch
+DEFAULT_BATCH_SIZE = 256
+
+
+class TailReader:
+    """Incremental reader that yields complete lines appended to a file.
+
+    Usage:
+        reader = TailReader(path, offset=path.stat().st_size)  # track new lines only
+        for batch in reader.read_batches():
+            for line in batch:
+                handle(line)
+
+    Attributes:
+        path: File being tailed
+        offset: Byte offset just past the last complete line returned
+        inode: Inode of the file at the last read (None before the first read)
+        oversized_lines: Number of lines dropped for exceeding max_line_bytes
+        resets: Number of times truncation/rotation restarted the read at byte 0
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        offset: int = 0,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_line_bytes: int = DEFAULT_MAX_LINE_BYTES,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ):
+        self.path = path
+        self.offset = offset
+        self.inode: Optional[int] = None
+        self.chunk_size = chunk_size
+        self.max_line_bytes = max_line_bytes
+        self.batch_size = batch_size
+        self.oversized_lines = 0
+        self.resets = 0
+
+        self._partial = bytearray()  # Bytes after offset not yet newline-terminated
+        self._discarding = False  # Skipping the rest of an oversized line
+
+    @property
+    def pending_bytes(self) -> int:
+        """Bytes read past ``offset`` that are waiting for a newline."""
+        return len(self._partial)
+
+    def reset(self, offset: int = 0) -> None:
+        """Drop buffered state and resume reading at ``offset``."""
+        self.offset = offset
+        self._partial.clear()
+        self._discarding = False
+
+    def read_batches(self, final: bool = False) -> Iterator[List[bytes]]:
+        """Yield batches of complete lines appended since the last read.
+
+        Lines are returned without the trailing newline (and without a
+        trailing carriage return). Blank lines are skipped.
+
+        Args:
+            final: Also yield a trailing line that has no newline (use when
+                the writer is known to be finished, e.g. reading a closed file)
+
+        Raises:
+            OSError: If the file can't be opened or read
+        """
+        fd = os.open(self.path, os.O_RDONLY)
+        try:
+            st = os.fstat(fd)
+            rotated = self.inode is not None and st.st_ino != self.inode
+            read_pos = self.offset + len(self._partial)
+            if rotated or st.st_size < read_pos:
+                # File replaced or truncated - start over from the beginning
+                self.reset(0)
+                self.resets += 1
+                read_pos = 0
+            self.inode = st.st_ino
+
+            os.lseek(fd, read_pos, os.SEEK_SET)
+            batch: List[bytes] = []
+            while True:
+                chunk = os.read(fd, self.chunk_size)
+                if not chunk:
+                    break
+                for line in self._split(chunk):
+                    batch.append(line)
+                    if len(batch) >= self.batch_size:
+                        yield batch
+                        batch = []
+
+            if final and self._partial and not self._discarding:
+                line = bytes(self._partial).rstrip(b"\r")
+                self.offset += len(self._partial)
+                self._partial.clear()
+                if line.strip():
+                    batch.append(line)
+
+            if batch:
+                yield batch
+        finally:
+            os.close(fd)
+
+    def read_lines(self, final: bool = False) -> List[bytes]:
+        """Read all complete lines appended since the last read."""
+        lines: List[bytes] = []
+        for batch in self.read_batches(final=final):
+            lines.extend(batch)
+        return lines
+
+    def _split(self, chunk: bytes) -> Iterator[bytes]:
+        """Split a chunk into complete lines, buffering the trailing fragment."""
+        start = 0
+        while True:
+            newline = chunk.find(b"\n", start)
+            if newline == -1:
+                break
+            segment = chunk[start:newline]
+            consumed = len(self._partial) + len(segment) + 1
+            if self._discarding:
+                # End of an oversized line - skip it
+                self._discarding = False
+                self._partial.clear()
+                self.offset += consumed
+            else:
+                if self._partial:
+                    self._partial += segment
+                    line = bytes(self._partial)
+                    self._partial.clear()
+                else:
+                    line = segment
+                self.offset += consumed
+                line = line.rstrip(b"\r")
+                if line.strip():
+                    yield line
+            start = newline + 1
+
+        rest = chunk[start:]
+        if not rest:
+            return
+        if self._discarding:
+            # Count skipped bytes so offset stays aligned with the file
+            self.offset += len(rest)
+            return
+        self._partial += rest
+        if len(self._partial) > self.max_line_bytes:
+            # Pathologically long line - drop what we have and skip to its newline
+            self.oversized_lines += 1
+            self.offset += len(self._partial)
+            self._partial.clear()
+            self._discarding = True
@@ -0,0 +1,230 @@
+"""Content-addressed cache of token counts.
+
+The same text gets tokenized again and again: repeated file reads, identical
+search results, replays of the same session file. TokenEstimator looks counts
+up here first, keyed by a 128-bit BLAKE2b digest of the encoding name and
+the text:
+
+- In memory: an LRU bounded by entry count. Keys and counts are fixed-size,
+  so that also bounds its memory: about 190 bytes per entry, roughly 19 MB
+  at DEFAULT_MAX_ENTRIES
+- On disk (opt-in): an append-only file of fixed-size records, rewritten
+  from the LRU when it grows past its byte limit, so large outputs are
+  tokenized once per machine rather than once per run
+
+The shared cache is kept in memory by default. Set
+``TOKEN_AUDIT_TOKEN_CACHE=disk`` to also persist it to default_cache_path(),
+or ``TOKEN_AUDIT_TOKEN_CACHE=off`` to disable it.
+"""
+
+import atexit
+import hashlib
+import os
+import struct
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+TOKEN_CACHE_ENV_VAR = "TOKEN_AUDIT_TOKEN_CACHE"
+
+# Texts shorter than this are cheaper to tokenize than to hash and look up
+MIN_CACHED_CHARS = 128
+
+# In-memory entries (about 190 bytes each: digest, count and LRU bookkeeping)
+DEFAULT_MAX_ENTRIES = 100_000
+DEFAULT_MAX_DISK_BYTES = 8 * 1024 * 1024
+
+# Unwritten entries that trigger a flush to disk
+FLUSH_THRESHOLD = 4096
+
+# On-disk record: 16-byte digest + uint32 token count
+_RECORD = struct.Struct("<16sI")
+
+_default_cache: Optional["TokenCountCache"] = None
+_default_cache_created = False
+
+
+def default_cache_path() -> Path:
+    """Path of the shared on-disk cache (~/.cache/token-audit/token-counts-v1.bin)."""
+    return Path.home() / ".cache" / "token-audit" / "token-counts-v1.bin"
+
+
+class TokenCountCache:
+    """LRU of token counts, optionally persisted to disk.
+
+    Attributes:
+        hits: Lookups answered from the cache
+        misses: Lookups that had to be tokenized
+
+    Example:
+        >>> cache = TokenCountCache()
+        >>> key = cache.key("o200k_base", text)
+        >>> count = cache.get(key)
+        >>> if count is None:
+        ...     cache.put(key, tokenize(text))
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        path: Optional[Path] = None,
+        max_disk_bytes: int = DEFAULT_MAX_DISK_BYTES,
+    ):
+        """Initialize cache.
+
+        Args:
+            max_entries: Entries kept in memory (least recently used are evicted)
+            path: On-disk cache file (None keeps the cache in memory only)
+            max_disk_bytes: Size at which the disk file is rewritten from memory
+        """
+        self.max_entries = max_entries
+        self.path = path
+        self.max_disk_bytes = max_disk_bytes
+        self.hits = 0
+        self.misses = 0
+
+        self._entries: OrderedDict[bytes, int] = OrderedDict()
+        self._unwritten: List[Tuple[bytes, int]] = []
+        self._loaded = path is None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(encoding: str, text: str) -> bytes:
+        """Digest identifying ``text`` tokenized with ``encoding``."""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(encoding.encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(text.encode("utf-8", errors="surrogatepass"))
+        return digest.digest()
+
+    def get(self, key: bytes) -> Optional[int]:
+        """Return the cached count for ``key`` (None on a miss)."""
+        with self._lock:
+            if not self._loaded:
+                self._load()
+            count = self._entries.get(key)
+            if count is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return count
+
+    def put(self, key: bytes, count: int) -> None:
+        """Store the count for ``key``."""
+        with self._lock:
+            if not self._loaded:
+                self._load()
+            self._store(key, count)
+            if self.path is not None:
+                self._unwritten.append((key, count))
+                if len(self._unwritten) >= FLUSH_THRESHOLD:
+                    self._flush()
+
+    def flush(self) -> None:
+        """Write new entries to the disk file (no-op for memory-only caches)."""
+        with self._lock:
+            self._flush()
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups answered from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters and size, for diagnostics."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hit_rate,
+            "entries": len(self._entries),
+            "path": str(self.path) if self.path else None,
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _store(self, key: bytes, count: int) -> None:
+        self._entries[key] = count
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _load(self) -> None:
+        """Read the newest ``max_entries`` records from disk."""
+        self._loaded = True
+        if self.path is None:
+            return
+        try:
+            size = self.path.stat().st_size
+            with open(self.path, "rb") as f:
+                # Only the newest records fit in memory; skip a torn final record
+                usable = size - size % _RECORD.size
+                start = max(0, usable - self.max_entries * _RECORD.size)
+                f.seek(start)
+                data = f.read(usable - start)
+        except OSError:
+            return
+
+        loaded: OrderedDict[bytes, int] = OrderedDict()
+        for key, count in _RECORD.iter_unpack(data):
+            loaded[key] = count
+            loaded.move_to_end(key)
+        # Entries added before the load are newer than anything on disk
+        loaded.update(self._entries)
+        self._entries = loaded
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _flush(self) -> None:
+        if self.path is None or not self._unwritten:
+            return
+        records = b"".join(_RECORD.pack(key, count) for key, count in self._unwritten)
+        self._unwritten = []
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            try:
+                size = self.path.stat().st_size
+            except FileNotFoundError:
+                size = 0
+            if size + len(records) > self.max_disk_bytes:
+                self._rewrite()
+                return
+            # O_APPEND keeps concurrent writers' records whole
+            with open(self.path, "ab") as f:
+                f.write(records)
+        except OSError:
+            pass  # The cache is an optimization; never fail estimation
+
+    def _rewrite(self) -> None:
+        """Replace the disk file with the in-memory entries (oldest first)."""
+        assert self.path is not None
+        keep = max(1, self.max_disk_bytes // _RECORD.size // 2)
+        entries = list(self._entries.items())[-keep:]
+        temp_path = self.path.with_suffix(f".tmp{os.getpid()}")
+        with open(temp_path, "wb") as f:
+            f.write(b"".join(_RECORD.pack(key, count) for key, count in entries))
+        os.replace(temp_path, self.path)
+
+
+def get_default_cache() -> Optional[TokenCountCache]:
+    """Shared cache used by TokenEstimator (None when disabled).
+
+    In memory only, unless ``TOKEN_AUDIT_TOKEN_CACHE`` is ``disk``: then it is
+    persisted to default_cache_path() and flushed at exit.
+    """
+    global _default_cache, _default_cache_created
+
+    if not _default_cache_created:
+        _default_cache_created = True
+        mode = os.environ.get(TOKEN_CACHE_ENV_VAR, "").lower()
+        if mode == "off":
+            _default_cache = None
+        elif mode == "disk":
+            _default_cache = TokenCountCache(path=default_cache_path())
+            atexit.register(_default_cache.flush)
+        else:
+            _default_cache = TokenCountCache()
+    return _default_cache
@@ -12,7 +12,9 @@ token attribution. Estimates are based on tool arguments and results.
 import json
 import os
 from pathlib import Path
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from .token_cache import MIN_CACHED_CHARS, TokenCountCache, get_default_cache
 
 # HuggingFace model for Gemma tokenizer download
 GEMMA_TOKENIZER_REPO = "google/gemma-2b"
@@ -27,6 +29,9 @@ GITHUB_ASSET_PATTERN = "gemma-tokenizer-"
 # Without this, small calls are underestimated by 15-25 tokens
 FUNCTION_CALL_OVERHEAD = 25  # tokens per tool call
 
+# Worker threads for batch tokenization (tiktoken and SentencePiece release the GIL)
+BATCH_NUM_THREADS = min(8, os.cpu_count() or 1)
+
 # Try importing tokenizers (both are required deps, fallback for edge cases)
 try:
     import tiktoken
@@ -93,6 +98,7 @@ class TokenEstimator:
         encoding: str = "o200k_base",
         tokenizer_path: Optional[Path] = None,
         chars_per_token: float = DEFAULT_CHARS_PER_TOKEN,
+        use_cache: bool = True,
     ):
         """Initialize estimator.
 
@@ -102,6 +108,8 @@ class TokenEstimator:
                      For sentencepiece: ignored (uses tokenizer_path)
             tokenizer_path: Path to SentencePiece .model file (for Gemini)
             chars_per_token: Fallback ratio when tokenizers unavailable
+            use_cache: Look up counts in the shared token count cache
+                       (see token_cache.get_default_cache())
         """
         self._method = method
         self._encoding_name = encoding
@@ -109,6 +117,7 @@ class TokenEstimator:
         self._sp_processor: Optional[Any] = None
         self._is_fallback = False
         self._chars_per_token = chars_per_token
+        self._cache: Optional[TokenCountCache] = get_default_cache() if use_cache else None
 
         if method == "sentencepiece":
             self._init_sentencepiece(tokenizer_path)
@@ -248,6 +257,26 @@ class TokenEstimator:
         if not text:
             return 0
 
+        # Large texts: look up by content first (tokenized at most once per cache)
+        cache = self._active_cache(text)
+        if cache is not None:
+            key = cache.key(self._encoding_name, text)
+            count = cache.get(key)
+            if count is None:
+                count = self._count_tokens(text)
+                cache.put(key, count)
+            return count
+
+        return self._count_tokens(text)
+
+    def _active_cache(self, text: str) -> Optional[TokenCountCache]:
+        """The cache to use for text (None for short texts and fallback mode)."""
+        if self._cache is None or self._is_fallback or len(text) < MIN_CACHED_CHARS:
+            return None
+        return self._cache
+
+    def _count_tokens(self, text: str) -> int:
+        """Tokenize text with the active tokenizer (no cache)."""
         # SentencePiece (Gemini)
         if self._sp_processor is not None:
             try:
@@ -300,6 +329,87 @@ class TokenEstimator:
 
         return input_tokens, output_tokens
 
+    def estimate_tokens_batch(
+        self, texts: Sequence[str], num_threads: int = BATCH_NUM_THREADS
+    ) -> List[int]:
+        """Estimate token counts for many texts in one tokenizer call.
+
+        Counts match estimate_tokens() per text, but tiktoken's encode_batch
+        and SentencePiece's batch Encode tokenize on a thread pool.
+
+        Args:
+            texts: Texts to tokenize (empty strings count as 0)
+            num_threads: Tokenizer worker threads
+
+        Returns:
+            Token counts in the same order as texts
+        """
+        counts = [0] * len(texts)
+        positions: List[int] = []
+        cache_keys: Dict[int, bytes] = {}
+        for i, text in enumerate(texts):
+            if not text:
+                continue
+            cache = self._active_cache(text)
+            if cache is not None:
+                key = cache.key(self._encoding_name, text)
+                cached = cache.get(key)
+                if cached is not None:
+                    counts[i] = cached
+                    continue
+                cache_keys[i] = key
+            positions.append(i)
+        if not positions:
+            return counts
+        batch = [texts[i] for i in positions]
+
+        encoded: Optional[List[Any]] = None
+        try:
+            # SentencePiece (Gemini)
+            if self._sp_processor is not None:
+                encoded = self._sp_processor.Encode(batch, out_type=int, num_threads=num_threads)
+            # tiktoken (OpenAI/Codex)
+            elif self._encoding is not None:
+                encoded = self._encoding.encode_batch(batch, num_threads=num_threads)
+        except Exception:
+            # e.g. a text containing special tokens: count each text on its own
+            encoded = None
+
+        if encoded is None:
+            for i, text in zip(positions, batch):
+                counts[i] = self._count_tokens(text)
+        else:
+            for i, ids in zip(positions, encoded):
+                counts[i] = len(ids)
+
+        if self._cache is not None:
+            for i, key in cache_keys.items():
+                self._cache.put(key, counts[i])
+        return counts
+
+    def estimate_tool_calls_batch(
+        self,
+        calls: Sequence[Tuple[Optional[str], Optional[str]]],
+        include_overhead: bool = True,
+    ) -> List[Tuple[int, int]]:
+        """Estimate input and output tokens for many tool calls at once.
+
+        Args:
+            calls: (args, result) pairs, as passed to estimate_tool_call()
+            include_overhead: Add FUNCTION_CALL_OVERHEAD to each input count
+
+        Returns:
+            List of (input_tokens, output_tokens), one per call
+        """
+        texts: List[str] = []
+        for args, result in calls:
+            texts.append(args or "")
+            texts.append(result or "")
+        counts = self.estimate_tokens_batch(texts)
+
+        overhead = FUNCTION_CALL_OVERHEAD if include_overhead else 0
+        return [(counts[i] + overhead, counts[i + 1]) for i in range(0, len(counts), 2)]
+
     def estimate_tool_call_dict(
         self,
         arguments: Dict[str, Any],
@@ -319,6 +429,11 @@ class TokenEstimator:
         args_str = json.dumps(arguments, separators=(",", ":"))
         return self.estimate_tool_call(args_str, result, include_overhead)
 
+    @property
+    def cache(self) -> Optional[TokenCountCache]:
+        """Token count cache in use (None if disabled), with hit/miss counters."""
+        return self._cache
+
     @property
     def is_fallback(self) -> bool:
         """True if using character-based fallback."""
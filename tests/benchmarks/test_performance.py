@@ -14,10 +14,11 @@ Run with:
 """
 
 import json
+import statistics
 import tempfile
 import time
 import tracemalloc
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from pathlib import Path
 from typing import Any, Dict, List, Tuple
 
@@ -26,7 +27,7 @@ import pytest
 from token_audit.display.rich_display import RichDisplay
 from token_audit.display.snapshot import DisplaySnapshot
 from token_audit.session_manager import SessionManager
-from token_audit.storage import StorageManager
+from token_audit.storage import SessionIndex, StorageManager
 
 # MCP Server imports for benchmarking
 from token_audit.server.tools import (
@@ -41,7 +42,6 @@ from token_audit.server.tools import (
 )
 from token_audit.server.schemas import ServerPlatform, TrendPeriod
 
-
 # =============================================================================
 # Performance Targets (v0.9.0 - task-107.3, v1.0 - task-169)
 # =============================================================================
@@ -381,6 +381,210 @@ class TestSessionLoadPerformance:
         assert tool_call_count == 1000
 
 
+# =============================================================================
+# JSON Codec Performance Tests
+# =============================================================================
+def _best_of(fn: Any, repeat: int = 5) -> float:
+    """Best wall time of ``repeat`` runs, in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+class TestJSONCodecPerformance:
+    """json_codec (orjson when installed) vs stdlib json on the benchmark fixtures."""
+
+    def test_ingest_jsonl_speedup(self, large_session_file: Path) -> None:
+        """Decoding JSONL event lines (adapter/streaming ingest path)."""
+        from token_audit import json_codec
+
+        tool_calls = json.loads(large_session_file.read_text())["tool_calls"]
+        lines = [json.dumps(call).encode() for call in tool_calls] * 10
+
+        stdlib_s = _best_of(lambda: [json.loads(line) for line in lines])
+        codec_s = _best_of(lambda: [json_codec.loads(line) for line in lines])
+        speedup = stdlib_s / codec_s if codec_s > 0 else float("inf")
+
+        print(
+            f"\nJSONL ingest ({len(lines)} lines): stdlib {stdlib_s * 1000:.2f}ms, "
+            f"{json_codec.BACKEND} {codec_s * 1000:.2f}ms ({speedup:.1f}x)"
+        )
+
+        assert [json_codec.loads(line) for line in lines[:10]] == tool_calls[:10]
+        if json_codec.BACKEND == "orjson":
+            assert speedup > 1.0, f"orjson ingest slower than stdlib ({speedup:.2f}x)"
+
+    def test_load_and_save_speedup(self, large_session_file: Path) -> None:
+        """Loading and pretty-printing a 1000-call session file."""
+        from token_audit import json_codec
+
+        raw = large_session_file.read_bytes()
+        data = json.loads(raw)
+
+        load_stdlib = _best_of(lambda: json.loads(raw))
+        load_codec = _best_of(lambda: json_codec.loads(raw))
+        dump_stdlib = _best_of(lambda: json.dumps(data, indent=2, default=str))
+        dump_codec = _best_of(lambda: json_codec.dumps_bytes(data, indent=True, default=str))
+
+        print(
+            f"\n1000-call session load: stdlib {load_stdlib * 1000:.2f}ms, "
+            f"{json_codec.BACKEND} {load_codec * 1000:.2f}ms "
+            f"({load_stdlib / load_codec:.1f}x)"
+        )
+        print(
+            f"1000-call session save: stdlib {dump_stdlib * 1000:.2f}ms, "
+            f"{json_codec.BACKEND} {dump_codec * 1000:.2f}ms "
+            f"({dump_stdlib / dump_codec:.1f}x)"
+        )
+
+        assert json_codec.loads(json_codec.dumps_bytes(data, indent=True)) == data
+        if json_codec.BACKEND == "orjson":
+            assert load_codec < load_stdlib
+            assert dump_codec < dump_stdlib
+
+
+class TestLazySessionLoadPerformance:
+    """load_session(lazy=True) vs eager loads on a 20,000-call session."""
+
+    @pytest.fixture
+    def huge_session_file(self, large_session_file: Path) -> Path:
+        with open(large_session_file) as f:
+            data = json.load(f)
+        data["tool_calls"] = data["tool_calls"] * 20
+        with open(large_session_file, "w") as f:
+            json.dump(data, f, indent=2)
+        return large_session_file
+
+    def test_indexed_lazy_load_speedup(self, huge_session_file: Path) -> None:
+        manager = SessionManager()
+        manager.load_session(huge_session_file, lazy=True)  # Builds the call index
+
+        eager_s = _best_of(lambda: manager.load_session(huge_session_file), repeat=3)
+        lazy_s = _best_of(lambda: manager.load_session(huge_session_file, lazy=True))
+
+        print(
+            f"\n20k-call session load: eager {eager_s * 1000:.1f}ms, "
+            f"lazy {lazy_s * 1000:.1f}ms ({eager_s / lazy_s:.1f}x)"
+        )
+        assert lazy_s < eager_s / 5, f"Lazy load only {eager_s / lazy_s:.1f}x faster"
+
+    def test_lazy_load_memory(self, huge_session_file: Path) -> None:
+        manager = SessionManager()
+        manager.load_session(huge_session_file, lazy=True)
+
+        retained = {}
+        for lazy in (False, True):
+            tracemalloc.start()
+            session = manager.load_session(huge_session_file, lazy=lazy)
+            retained[lazy] = tracemalloc.get_traced_memory()[0] / (1024 * 1024)
+            tracemalloc.stop()
+            assert session is not None
+            del session
+
+        print(
+            f"\n20k-call session retained: eager {retained[False]:.2f}MB, "
+            f"lazy {retained[True]:.2f}MB"
+        )
+        assert retained[True] < retained[False] / 3
+
+
+# =============================================================================
+# Claude Code Transcript Parse Performance Tests
+# =============================================================================
+def _make_claude_transcript_lines(turns: int = 200, result_bytes: int = 20000) -> List[bytes]:
+    """Claude Code transcript shaped like real sessions: large tool results."""
+    cwd = "/home/dev/project"
+    usage = {
+        "input_tokens": 12,
+        "output_tokens": 340,
+        "cache_creation_input_tokens": 2100,
+        "cache_read_input_tokens": 48000,
+    }
+    events: List[Dict[str, Any]] = [{"type": "summary", "summary": "Benchmark session"}]
+    start = datetime(2025, 11, 20, 9, 0, 0)
+    for i in range(turns):
+        ts = (start + timedelta(seconds=i * 10)).isoformat() + "Z"
+        tool_id = f"toolu_{i:06d}"
+        events.append(
+            {
+                "type": "assistant",
+                "cwd": cwd,
+                "timestamp": ts,
+                "message": {
+                    "model": "claude-opus-4-5-20251101",
+                    "role": "assistant",
+                    "content": [
+                        {
+                            "type": "tool_use",
+                            "id": tool_id,
+                            "name": "mcp__zen__chat" if i % 3 == 0 else "Read",
+                            "input": {"file_path": f"{cwd}/src/module_{i}.py"},
+                        }
+                    ],
+                    "usage": usage,
+                },
+            }
+        )
+        events.append(
+            {
+                "type": "user",
+                "cwd": cwd,
+                "timestamp": ts,
+                "message": {
+                    "role": "user",
+                    "content": [
+                        {
+                            "type": "tool_result",
+                            "tool_use_id": tool_id,
+                            "content": f"{i}: def handler(event):\n    return event\n"
+                            * (result_bytes // 40),
+                        }
+                    ],
+                },
+                "toolUseResult": {"stdout": "ok", "lines": result_bytes // 40},
+            }
+        )
+    return [json.dumps(event).encode("utf-8") for event in events]
+
+
+class TestTranscriptParsePerformance:
+    """ClaudeCodeAdapter.parse_event pre-filter on tool-result-heavy transcripts."""
+
+    def test_prefilter_speedup(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Skipping non-assistant lines before decoding vs decoding every line."""
+        from token_audit import claude_code_adapter
+        from token_audit.claude_code_adapter import ClaudeCodeAdapter
+
+        lines = _make_claude_transcript_lines()
+        total_mb = sum(len(line) for line in lines) / (1024 * 1024)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            adapter = ClaudeCodeAdapter(project="bench", claude_dir=Path(tmpdir))
+
+            def parse_all() -> List[Any]:
+                return [adapter.parse_event(line) for line in lines]
+
+            filtered_results = parse_all()
+            filtered_s = _best_of(parse_all)
+            monkeypatch.setattr(claude_code_adapter, "_may_have_usage", lambda line: True)
+            unfiltered_results = parse_all()
+            unfiltered_s = _best_of(parse_all)
+
+        speedup = unfiltered_s / filtered_s if filtered_s > 0 else float("inf")
+        print(
+            f"\nTranscript parse ({len(lines)} lines, {total_mb:.1f}MB): "
+            f"decode all {unfiltered_s * 1000:.2f}ms, pre-filter {filtered_s * 1000:.2f}ms "
+            f"({speedup:.1f}x, {total_mb / filtered_s:.0f}MB/s)"
+        )
+
+        assert filtered_results == unfiltered_results
+        assert sum(1 for r in filtered_results if r is not None) == 200
+        assert speedup > 1.0, f"pre-filter slower than decoding every line ({speedup:.2f}x)"
+
+
 # =============================================================================
 # Report Generation Performance Tests
 # =============================================================================
@@ -413,6 +617,257 @@ class TestReportPerformance:
         assert elapsed_ms < 1000, f"Multi-session load took {elapsed_ms:.1f}ms, target <1000ms"
 
 
+class TestRollupPerformance:
+    """aggregate_monthly() with cold vs warm daily rollups."""
+
+    def test_monthly_from_rollups(self, tmp_path: Path, large_session_file: Path) -> None:
+        """60 days x 2 sessions of 1000 calls: first query vs repeat query."""
+        import shutil
+
+        from token_audit.aggregation import aggregate_monthly
+
+        storage = StorageManager(base_dir=tmp_path / "storage")
+        first_day = date(2025, 1, 1)
+        for d in range(60):
+            date_dir = storage.get_date_dir("claude_code", first_day + timedelta(days=d))
+            date_dir.mkdir(parents=True)
+            for i in range(2):
+                shutil.copy(large_session_file, date_dir / f"session-{d:03d}-{i}.json")
+
+        end = first_day + timedelta(days=59)
+        start = time.perf_counter()
+        cold = aggregate_monthly("claude_code", first_day, end, storage=storage)
+        cold_ms = (time.perf_counter() - start) * 1000
+
+        warm_ms = (
+            _best_of(lambda: aggregate_monthly("claude_code", first_day, end, storage=storage))
+            * 1000
+        )
+        warm = aggregate_monthly("claude_code", first_day, end, storage=storage)
+
+        print(
+            f"\nMonthly report over 120 sessions: cold {cold_ms:.0f}ms, "
+            f"from rollups {warm_ms:.1f}ms ({cold_ms / warm_ms:.0f}x)"
+        )
+
+        assert sum(m.session_count for m in cold) == 120
+        assert [m.to_dict() for m in warm] == [m.to_dict() for m in cold]
+        assert warm_ms < cold_ms / 5
+
+
+class TestParallelLoadPerformance:
+    """Cold aggregate_monthly() and smell trends, serial vs across workers."""
+
+    def test_cold_monthly_and_trends(
+        self, tmp_path: Path, large_session_file: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """50 days x 4 sessions of 1000 calls, rollups off."""
+        import os
+        import shutil
+
+        from token_audit.aggregation import ROLLUP_ENV_VAR, aggregate_monthly
+        from token_audit.smell_aggregator import SmellAggregator
+
+        monkeypatch.setenv(ROLLUP_ENV_VAR, "off")
+        first_day = date.today() - timedelta(days=49)
+        end = date.today()
+        jobs = os.cpu_count() or 1
+
+        def populate(name: str) -> StorageManager:
+            storage = StorageManager(base_dir=tmp_path / name)
+            for d in range(50):
+                date_dir = storage.get_date_dir("claude_code", first_day + timedelta(days=d))
+                date_dir.mkdir(parents=True)
+                for i in range(4):
+                    shutil.copy(large_session_file, date_dir / f"session-{d:03d}-{i}.json")
+            return storage
+
+        warmup = populate("warmup")  # Imports and page cache
+        aggregate_monthly("claude_code", first_day, end, storage=warmup, jobs=1)
+
+        timings = {}
+        results = {}
+        for label, n in (("serial", 1), ("parallel", jobs)):
+            # A fresh copy for each run: no call index sidecars yet
+            storage = populate(label)
+            start = time.perf_counter()
+            monthly = aggregate_monthly("claude_code", first_day, end, storage=storage, jobs=n)
+            trends = SmellAggregator(base_dir=storage.base_dir, jobs=n).aggregate(days=60)
+            timings[label] = (time.perf_counter() - start) * 1000
+            results[label] = ([m.to_dict() for m in monthly], trends.total_sessions)
+
+        print(
+            f"\nCold monthly + smell trends over 200 sessions: serial {timings['serial']:.0f}ms, "
+            f"{jobs} workers {timings['parallel']:.0f}ms "
+            f"({timings['serial'] / timings['parallel']:.1f}x)"
+        )
+
+        assert results["parallel"] == results["serial"]
+        assert sum(m["session_count"] for m in results["serial"][0]) == 200
+        assert results["serial"][1] == 200
+        if jobs >= 4:
+            assert timings["parallel"] < timings["serial"] / 1.5
+
+
+class TestCallTablePerformance:
+    """Top tools by tokens: nested call_history walk vs CallTable."""
+
+    def test_top_tools(self, large_session_file: Path) -> None:
+        """100 sessions of 1000 calls."""
+        import dataclasses
+        from collections import defaultdict
+
+        from token_audit import call_table
+        from token_audit.call_table import CallTable
+
+        loaded = SessionManager(base_dir=large_session_file.parent).load_session(large_session_file)
+        assert loaded is not None
+        sessions = [dataclasses.replace(loaded, session_id=f"s{i}") for i in range(100)]
+
+        def nested_top() -> List[Tuple[str, int]]:
+            totals: Dict[str, int] = defaultdict(int)
+            for session in sessions:
+                for server_session in session.server_sessions.values():
+                    for tool_name, tool_stats in server_session.tools.items():
+                        for call in tool_stats.call_history:
+                            totals[tool_name] += call.total_tokens
+            return sorted(totals.items(), key=lambda item: item[1], reverse=True)[:10]
+
+        start = time.perf_counter()
+        table = CallTable.from_sessions(sessions)
+        build_ms = (time.perf_counter() - start) * 1000
+
+        nested_ms = _best_of(nested_top) * 1000
+        table_ms = _best_of(lambda: table.top("tool", n=10)) * 1000
+        backend = "numpy" if call_table.np is not None else "python"
+
+        print(
+            f"\nTop tools over {len(table)} calls: nested walk {nested_ms:.1f}ms, "
+            f"call table ({backend}) {table_ms:.1f}ms ({nested_ms / table_ms:.1f}x), "
+            f"table built once in {build_ms:.0f}ms"
+        )
+
+        assert dict(table.top("tool", n=10)) == dict(nested_top())
+        if call_table.np is not None:
+            assert table_ms < nested_ms
+
+
+# =============================================================================
+# Index Update Performance Tests
+# =============================================================================
+def _index_entry(session_id: str, session_date: date) -> SessionIndex:
+    return SessionIndex(
+        schema_version="1.0.0",
+        session_id=session_id,
+        platform="claude_code",
+        date=session_date.strftime("%Y-%m-%d"),
+        started_at=f"{session_date}T10:00:00",
+        ended_at=f"{session_date}T11:00:00",
+        project="benchmark-project",
+        total_tokens=10000,
+        total_cost=0.1,
+        tool_count=5,
+        server_count=2,
+        is_complete=True,
+        file_path=f"claude_code/{session_date}/{session_id}.json",
+        file_size_bytes=1024,
+    )
+
+
+def _median_save_ms(storage: StorageManager, session_date: date, saves: int = 20) -> float:
+    """Median update_indexes_for_session() time for new sessions on one date."""
+    timings = []
+    for i in range(saves):
+        entry = _index_entry(f"save-{session_date}-{i}", session_date)
+        start = time.perf_counter()
+        storage.update_indexes_for_session("claude_code", session_date, entry)
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+class TestIndexUpdatePerformance:
+    """Session save cost should not grow with the number of stored dates."""
+
+    def test_save_latency_flat_over_dates(self, tmp_path: Path) -> None:
+        """update_indexes_for_session() at 10 vs 1,200 dates of history."""
+        first_day = date(2023, 1, 1)
+
+        small = StorageManager(base_dir=tmp_path / "small")
+        small.update_indexes_for_sessions(
+            "claude_code",
+            [_index_entry(f"s-{d}", first_day + timedelta(days=d)) for d in range(10)],
+        )
+        large = StorageManager(base_dir=tmp_path / "large")
+        large.update_indexes_for_sessions(
+            "claude_code",
+            [_index_entry(f"s-{d}", first_day + timedelta(days=d)) for d in range(1200)],
+        )
+
+        today = first_day + timedelta(days=1300)
+        small_ms = _median_save_ms(small, today)
+        large_ms = _median_save_ms(large, today)
+
+        print(
+            f"\nIndex update: {small_ms:.2f}ms at 10 dates, "
+            f"{large_ms:.2f}ms at 1200 dates ({large_ms / small_ms:.1f}x)"
+        )
+
+        platform_index = large.load_platform_index("claude_code")
+        assert platform_index is not None
+        assert platform_index.total_sessions == 1220
+        assert len(platform_index.dates) == 1201
+        # Recalculating from every daily index took ~25x longer at 1200 dates;
+        # the remaining growth is the platform index's date list
+        assert large_ms < small_ms * 5, f"Save latency grew {large_ms / small_ms:.1f}x"
+
+
+class TestMigrationPerformance:
+    """migrate_all_v0_sessions() vs migrating and indexing one session at a time."""
+
+    def test_legacy_migration_throughput(self, tmp_path: Path) -> None:
+        """500 legacy session directories, per-session vs pooled and batched."""
+        from token_audit.storage import migrate_all_v0_sessions, migrate_v0_session
+
+        v0_dir = tmp_path / "v0"
+        events = "".join(json.dumps({"type": "tool_call", "i": i}) + "\n" for i in range(200))
+        for i in range(500):
+            session_dir = v0_dir / f"proj-2025-{1 + i % 12:02d}-{1 + i % 28:02d}-10{i:04d}"
+            session_dir.mkdir(parents=True)
+            (session_dir / "events.jsonl").write_text(events)
+            (session_dir / "summary.json").write_text(
+                json.dumps({"project": "proj", "token_usage": {"total_tokens": 100}})
+            )
+        session_dirs = sorted(v0_dir.iterdir())
+
+        start = time.perf_counter()
+        serial = StorageManager(base_dir=tmp_path / "serial")
+        for session_dir in session_dirs:
+            migrate_v0_session(session_dir, serial)
+        serial_s = time.perf_counter() - start
+
+        pooled = StorageManager(base_dir=tmp_path / "pooled")
+        results = migrate_all_v0_sessions(v0_dir, pooled, jobs=8, quiet=True)
+        pooled_s = results["elapsed_seconds"]
+
+        start = time.perf_counter()
+        resumed = migrate_all_v0_sessions(v0_dir, pooled, jobs=8, quiet=True)
+        resumed_s = time.perf_counter() - start
+
+        print(
+            f"\nLegacy migration (500 sessions): per-session {serial_s * 1000:.0f}ms, "
+            f"pooled {pooled_s * 1000:.0f}ms ({serial_s / pooled_s:.1f}x), "
+            f"resumed no-op {resumed_s * 1000:.0f}ms"
+        )
+
+        assert results["migrated"] == 500
+        assert resumed["resumed"] == 500
+        serial_index = serial.load_platform_index("claude_code")
+        pooled_index = pooled.load_platform_index("claude_code")
+        assert serial_index is not None and pooled_index is not None
+        assert pooled_index.total_sessions == serial_index.total_sessions == 500
+        assert pooled_s < serial_s
+
+
 # =============================================================================
 # Memory Usage Tests
 # =============================================================================
@@ -485,16 +940,6 @@ class TestBaselineMeasurements:
     performance for comparison after optimizations.
     """
 
-    def test_measure_index_update_baseline(
-        self, storage_with_sessions: Tuple[StorageManager, List[Path]]
-    ) -> None:
-        """Measure current index update performance."""
-        storage, session_paths = storage_with_sessions
-
-        # This would measure update_indexes_for_session performance
-        # Currently just prints for baseline tracking
-        print("\nIndex update baseline: TBD (requires index write measurement)")
-
     def test_measure_snapshot_creation_baseline(self) -> None:
         """Measure DisplaySnapshot creation overhead."""
         iterations = 100
@@ -6,7 +6,9 @@ by installing it in editable mode or adding src to the path.
 """
 
 import sys
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
+from typing import Any, Callable, Dict
 
 import pytest
 
@@ -15,6 +17,15 @@ src_path = Path(__file__).parent.parent / "src"
 if src_path.exists() and str(src_path) not in sys.path:
     sys.path.insert(0, str(src_path))
 
+from token_audit.base_tracker import (  # noqa: E402
+    Call,
+    ServerSession,
+    Session,
+    TokenUsage,
+    ToolStats,
+)
+from token_audit.storage import StorageManager  # noqa: E402
+
 
 # Check if MCP server dependencies are available
 def _mcp_available() -> bool:
@@ -90,3 +101,132 @@ def temp_active_dir(tmp_path: Path) -> Path:
     active_dir = tmp_path / "sessions" / "active"
     active_dir.mkdir(parents=True, exist_ok=True)
     return active_dir
+
+
+@pytest.fixture
+def storage(tmp_path: Path) -> StorageManager:
+    """StorageManager rooted in a temporary directory."""
+    return StorageManager(base_dir=tmp_path)
+
+
+@pytest.fixture
+def make_session_data() -> Callable[..., Dict[str, Any]]:
+    """
+    Factory for completed session dicts in the v1.0.4 layout written by BaseTracker.
+
+    Sessions run 2025-01-15 10:00-11:00 UTC, cost $0.25 and carry three
+    smells (two CHATTY, one LOW_CACHE_HIT). ``calls`` tool calls use two
+    shapes: every second call also has the estimation fields.
+
+    Example:
+        def test_write(storage, make_session_data):
+            storage.write_session_file("claude_code", day, "a.json", make_session_data())
+    """
+
+    def build(
+        project: str = "alpha",
+        total_tokens: int = 1000,
+        model: str = "claude-opus-4-5",
+        calls: int = 7,
+    ) -> Dict[str, Any]:
+        tool_calls = []
+        for i in range(calls):
+            call: Dict[str, Any] = {
+                "index": i + 1,
+                "timestamp": "2025-01-15T10:01:00+00:00",
+                "tool": "mcp__zen__chat",
+                "server": "zen",
+                "input_tokens": 100,
+                "output_tokens": 50,
+                "total_tokens": 150,
+                "duration_ms": None,
+            }
+            if i % 2:
+                call["is_estimated"] = True
+                call["estimation_method"] = "tiktoken"
+            tool_calls.append(call)
+        return {
+            "_file": {"name": f"{project}.json", "schema_version": "1.7.0"},
+            "session": {
+                "project": project,
+                "platform": "claude-code",
+                "model": model,
+                "working_directory": f"/home/dev/{project}",
+                "started_at": "2025-01-15T10:00:00+00:00",
+                "ended_at": "2025-01-15T11:00:00+00:00",
+                "duration_seconds": 3600.0,
+            },
+            "token_usage": {"total_tokens": total_tokens},
+            "cost_estimate_usd": 0.25,
+            "mcp_summary": {"total_calls": calls, "unique_tools": 3, "unique_servers": 1},
+            "model_usage": {
+                "claude-haiku-4-5": {"call_count": 2},
+                model: {"call_count": 5},
+            },
+            "data_quality": {"accuracy_level": "estimated"},
+            "smells": [
+                {"pattern": "CHATTY", "severity": "warning", "tool": "mcp__zen__chat"},
+                {"pattern": "CHATTY", "severity": "info", "tool": "mcp__zen__chat"},
+                {"pattern": "LOW_CACHE_HIT"},
+            ],
+            "tool_calls": tool_calls,
+        }
+
+    return build
+
+
+# Start time of sessions built by make_session
+SESSION_START = datetime(2025, 11, 24, 10, 30, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def make_session() -> Callable[..., Session]:
+    """
+    Factory for Session objects with tool calls.
+
+    Call ``i`` (from 0) is made ``i`` seconds after ``timestamp`` by tool
+    ``mcp__srv{i % servers}__tool{i % (2 * servers)}`` and costs ``tokens``
+    tokens, so ``servers`` servers share ``2 * servers`` tools.
+
+    Example:
+        def test_save(make_session):
+            session = make_session(calls=12, servers=2)
+    """
+
+    def build(
+        timestamp: datetime = SESSION_START,
+        project: str = "demo",
+        calls: int = 30,
+        tokens: int = 150,
+        servers: int = 3,
+    ) -> Session:
+        session = Session(
+            project=project,
+            platform="claude-code",
+            timestamp=timestamp,
+            token_usage=TokenUsage(total_tokens=calls * tokens),
+        )
+        for i in range(calls):
+            server = f"srv{i % servers}"
+            tool = f"mcp__{server}__tool{i % (2 * servers)}"
+            server_session = session.server_sessions.setdefault(
+                server, ServerSession(server=server)
+            )
+            stats = server_session.tools.setdefault(tool, ToolStats())
+            stats.calls += 1
+            stats.total_tokens += tokens
+            stats.call_history.append(
+                Call(
+                    timestamp=timestamp + timedelta(seconds=i),
+                    tool_name=tool,
+                    server=server,
+                    index=i + 1,
+                    total_tokens=tokens,
+                    platform_data={"nested": {"tool": "not a call"}},
+                )
+            )
+            server_session.total_calls += 1
+            server_session.total_tokens += tokens
+        return session
+
+    return build
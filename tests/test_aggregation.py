@@ -12,6 +12,7 @@ Tests cover:
 - aggregate_daily() function
 - aggregate_weekly() function
 - aggregate_monthly() function
+- Daily rollups (reuse, invalidation by file size/mtime, opt-out)
 """
 
 import json
@@ -23,6 +24,9 @@ from pathlib import Path
 import pytest
 
 from token_audit.aggregation import (
+    ROLLUP_DIR_NAME,
+    ROLLUP_ENV_VAR,
+    ROLLUP_VERSION,
     AggregateModelUsage,
     DailyAggregate,
     MonthlyAggregate,
@@ -31,7 +35,9 @@ from token_audit.aggregation import (
     aggregate_daily,
     aggregate_monthly,
     aggregate_weekly,
+    server_call_counts,
 )
+from token_audit.session_manager import SessionManager
 from token_audit.storage import StorageManager
 
 # ============================================================================
@@ -1210,3 +1216,133 @@ class TestAggregateMonthly:
         assert result[0].project_breakdowns is not None
         assert "/project/a" in result[0].project_breakdowns
         assert "/project/b" in result[0].project_breakdowns
+
+
+# ============================================================================
+# Daily Rollup Tests
+# ============================================================================
+
+
+class TestDailyRollups:
+    """Tests for the persistent per-day rollups behind aggregate_daily()."""
+
+    @pytest.fixture
+    def loads(self, monkeypatch: pytest.MonkeyPatch) -> list:
+        """Session paths loaded by the aggregation."""
+        loaded: list = []
+        original = SessionManager.load_session
+
+        def spy(self: SessionManager, session_path: Path, lazy: bool = False) -> object:
+            loaded.append(session_path.name)
+            return original(self, session_path, lazy=lazy)
+
+        monkeypatch.setattr(SessionManager, "load_session", spy)
+        return loaded
+
+    def test_unchanged_sessions_not_reloaded(
+        self, storage: StorageManager, temp_storage_dir: Path, loads: list
+    ) -> None:
+        """A second query over the same days reads only the rollups."""
+        create_test_session_file(temp_storage_dir, "claude_code", date(2025, 1, 15), "s1")
+        create_test_session_file(temp_storage_dir, "claude_code", date(2025, 1, 16), "s2")
+
+        first = aggregate_daily(platform="claude_code", group_by_project=True, storage=storage)
+        assert sorted(loads) == ["session-s1.json", "session-s2.json"]
+        assert (temp_storage_dir / "claude-code" / ROLLUP_DIR_NAME / "2025-01-15.json").exists()
+
+        loads.clear()
+        second = aggregate_daily(platform="claude_code", group_by_project=True, storage=storage)
+        weekly = aggregate_weekly(platform="claude_code", storage=storage)
+        monthly = aggregate_monthly(platform="claude_code", storage=storage)
+
+        assert loads == []
+        assert [d.to_dict() for d in second] == [d.to_dict() for d in first]
+        assert sum(w.session_count for w in weekly) == 2
+        assert monthly[0].total_tokens == first[0].total_tokens * 2
+
+    def test_changed_and_new_sessions_reloaded(
+        self, storage: StorageManager, temp_storage_dir: Path, loads: list
+    ) -> None:
+        """Only sessions whose file changed, or that are new, are loaded again."""
+        day = date(2025, 1, 15)
+        create_test_session_file(temp_storage_dir, "claude_code", day, "s1", input_tokens=1000)
+        create_test_session_file(temp_storage_dir, "claude_code", day, "s2", input_tokens=1000)
+        aggregate_daily(platform="claude_code", storage=storage)
+
+        loads.clear()
+        create_test_session_file(temp_storage_dir, "claude_code", day, "s2", input_tokens=50000)
+        create_test_session_file(temp_storage_dir, "claude_code", day, "s3", input_tokens=10)
+        result = aggregate_daily(platform="claude_code", storage=storage)
+
+        assert sorted(loads) == ["session-s2.json", "session-s3.json"]
+        assert result[0].session_count == 3
+        assert result[0].input_tokens == 51010
+
+    def test_deleted_session_dropped(self, storage: StorageManager, temp_storage_dir: Path) -> None:
+        """A deleted session file no longer counts."""
+        day = date(2025, 1, 15)
+        create_test_session_file(temp_storage_dir, "claude_code", day, "s1")
+        gone = create_test_session_file(temp_storage_dir, "claude_code", day, "s2")
+        aggregate_daily(platform="claude_code", storage=storage)
+
+        gone.unlink()
+        result = aggregate_daily(platform="claude_code", storage=storage)
+
+        assert result[0].session_count == 1
+
+    def test_disabled_by_env(
+        self,
+        storage: StorageManager,
+        temp_storage_dir: Path,
+        loads: list,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """TOKEN_AUDIT_ROLLUPS=off loads every session and writes no rollups."""
+        monkeypatch.setenv(ROLLUP_ENV_VAR, "off")
+        create_test_session_file(temp_storage_dir, "claude_code", date(2025, 1, 15), "s1")
+
+        aggregate_daily(platform="claude_code", storage=storage)
+        aggregate_daily(platform="claude_code", storage=storage)
+
+        assert loads == ["session-s1.json", "session-s1.json"]
+        assert not (temp_storage_dir / "claude-code" / ROLLUP_DIR_NAME).exists()
+
+    def test_unreadable_rollup_rebuilt(
+        self, storage: StorageManager, temp_storage_dir: Path
+    ) -> None:
+        """A damaged rollup file is ignored and rewritten."""
+        create_test_session_file(temp_storage_dir, "claude_code", date(2025, 1, 15), "s1")
+        rollup_dir = temp_storage_dir / "claude-code" / ROLLUP_DIR_NAME
+        rollup_dir.mkdir(parents=True)
+        (rollup_dir / "2025-01-15.json").write_text("{not json")
+
+        result = aggregate_daily(platform="claude_code", storage=storage)
+
+        assert result[0].session_count == 1
+        assert json.loads((rollup_dir / "2025-01-15.json").read_text())["version"] == ROLLUP_VERSION
+
+    def test_server_call_counts(
+        self, storage: StorageManager, temp_storage_dir: Path, loads: list
+    ) -> None:
+        """Server call counts come from the rollups of the days in range."""
+        for day, session_id, calls in [(15, "s1", 3), (16, "s2", 4), (20, "s3", 50)]:
+            path = create_test_session_file(
+                temp_storage_dir, "claude_code", date(2025, 1, day), session_id
+            )
+            data = json.loads(path.read_text())
+            data["tool_calls"] = [{"tool": "mcp__zen__chat", "server": "zen"}] * calls + [
+                {"tool": "Read", "server": "builtin"}
+            ]
+            path.write_text(json.dumps(data))
+
+        counts = server_call_counts(
+            "claude_code", date(2025, 1, 15), date(2025, 1, 16), storage=storage
+        )
+        assert counts == {"zen": 7}
+        assert sorted(loads) == ["session-s1.json", "session-s2.json"]
+
+        loads.clear()
+        aggregate_daily(platform="claude_code", storage=storage)
+        assert loads == ["session-s3.json"]
+        assert server_call_counts("claude_code", storage=storage) == {"zen": 57}
+        assert loads == ["session-s3.json"]
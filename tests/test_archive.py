@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+"""
+Tests for the archive tier.
+
+Tests:
+1. StorageManager.archive_sessions() packing old date directories into monthly bundles
+2. Archived sessions loading (eager and lazy) and summarizing like the originals
+3. Archived sessions in catalog queries, the catalog-off fallback and aggregations
+4. Members read by random access from the mapped bundle
+5. The ``storage archive`` command
+"""
+
+import argparse
+import json
+import os
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Callable
+
+import pytest
+
+from token_audit import archive
+from token_audit.aggregation import aggregate_daily
+from token_audit.base_tracker import Session
+from token_audit.catalog import CATALOG_ENV_VAR
+from token_audit.session_manager import SessionManager
+from token_audit.session_summary import load_summary, summary_path
+from token_audit.storage import StorageManager
+
+OLD = datetime(2025, 1, 15, 10, 0, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def manager(storage: StorageManager) -> SessionManager:
+    return SessionManager(base_dir=storage.get_platform_dir("claude_code"))
+
+
+def save(manager: SessionManager, session: Session) -> Path:
+    return manager.save_session(session, manager.base_dir)["session"]
+
+
+def archived_path(storage: StorageManager, path: Path) -> Path:
+    bundle = archive.month_archive_path(storage.get_platform_dir("claude_code"), "2025-01")
+    return bundle / path.parent.name / path.name
+
+
+class TestArchiveSessions:
+    """Test packing date directories into bundles."""
+
+    def test_moves_old_sessions(
+        self, storage: StorageManager, manager: SessionManager, make_session: Callable[..., Session]
+    ) -> None:
+        first = save(manager, make_session(OLD))
+        second = save(manager, make_session(OLD + timedelta(days=3), project="other"))
+        recent = save(manager, make_session(datetime.now(timezone.utc)))
+        size = first.stat().st_size + second.stat().st_size
+
+        result = storage.archive_sessions(90)
+
+        assert (result.archived, result.bundles, result.failed) == (2, 1, 0)
+        assert result.bytes_before == size
+        assert 0 < result.bytes_after < size
+        assert not first.parent.exists()
+        assert not second.parent.exists()
+        assert recent.exists()
+        bundle = archive.month_archive_path(storage.get_platform_dir("claude_code"), "2025-01")
+        assert [m.name for m in archive.archive_members(bundle)] == [
+            f"2025-01-15/{first.name}",
+            f"2025-01-18/{second.name}",
+        ]
+
+    def test_extends_existing_bundle(
+        self, storage: StorageManager, manager: SessionManager, make_session: Callable[..., Session]
+    ) -> None:
+        first = save(manager, make_session(OLD))
+        storage.archive_sessions(90)
+        second = save(manager, make_session(OLD + timedelta(hours=1)))
+
+        result = storage.archive_sessions(90)
+
+        assert result.archived == 1
+        bundle = archived_path(storage, first).parent.parent
+        assert len(archive.archive_members(bundle)) == 2
+        assert manager.load_session(archived_path(storage, first)) is not None
+        assert manager.load_session(archived_path(storage, second)) is not None
+
+    def test_dry_run(
+        self, storage: StorageManager, manager: SessionManager, make_session: Callable[..., Session]
+    ) -> None:
+        path = save(manager, make_session(OLD))
+
+        result = storage.archive_sessions(90, dry_run=True)
+
+        assert (result.archived, result.bundles) == (1, 0)
+        assert path.exists()
+        assert archive.list_archives(storage.get_platform_dir("claude_code")) == []
+
+    def test_event_logs_left_in_place(
+        self, storage: StorageManager, manager: SessionManager, make_session: Callable[..., Session]
+    ) -> None:
+        path = save(manager, make_session(OLD))
+        events = path.with_suffix(".jsonl")
+        events.write_text("{}\n")
+
+        storage.archive_sessions(90)
+
+        assert not path.exists()
+        assert events.exists()
+        assert not summary_path(path).exists()
+        assert set(storage.list_sessions()) == {events, archived_path(storage, path)}
+
+
+class TestArchivedSessions:
+    """Test reading archived sessions."""
+
+    def test_load_matches_original(
+        self, storage: StorageManager, manager: SessionManager, make_session: Callable[..., Session]
+    ) -> None:
+        path = save(manager, make_session(OLD))
+        original = manager.load_session(path)
+        summary = load_summary(path)
+        storage.archive_sessions(90)
+
+        moved = archived_path(storage, path)
+        eager = manager.load_session(moved)
+        lazy = manager.load_session(moved, lazy=True)
+
+        assert original is not None and eager is not None and lazy is not None
+        assert eager.to_dict() == original.to_dict()
+        assert lazy.to_dict() == original.to_dict()
+        assert load_summary(moved) == summary
+        assert manager.list_sessions() == [moved]
+
+    def test_members_read_from_mapped_bundle(
+        self,
+        storage: StorageManager,
+        manager: SessionManager,
+        monkeypatch: pytest.MonkeyPatch,
+        make_session: Callable[..., Session],
+    ) -> None:
+        path = save(manager, make_session(OLD))
+        content = path.read_bytes()
+        storage.archive_sessions(90)
+
+        def fail(*args: Any, **kwargs: Any) -> None:
+            raise AssertionError("member read through ZipFile")
+
+        moved = archived_path(storage, path)
+        archive.is_archived(moved)  # Open the bundle first
+        monkeypatch.setattr(archive.zipfile, "ZipFile", fail)
+        assert archive.read_member(moved) == content
+
+    def test_missing_member(
+        self, storage: StorageManager, manager: SessionManager, make_session: Callable[..., Session]
+    ) -> None:
+        path = save(manager, make_session(OLD))
+        storage.archive_sessions(90)
+
+        missing = archived_path(storage, path).with_name("missing.json")
+        assert not archive.is_archived(missing)
+        with pytest.raises(FileNotFoundError):
+            archive.read_member(missing)
+        assert manager.load_session(missing) is None
+
+
+class TestArchivedQueries:
+    """Test archived sessions in listings and aggregations."""
+
+    @pytest.fixture(params=["on", "off"])
+    def catalog_mode(self, request: Any, monkeypatch: pytest.MonkeyPatch) -> str:
+        monkeypatch.setenv(CATALOG_ENV_VAR, request.param)
+        return str(request.param)
+
+    def test_storage_queries(
+        self,
+        catalog_mode: str,
+        storage: StorageManager,
+        manager: SessionManager,
+        make_session: Callable[..., Session],
+    ) -> None:
+        path = save(manager, make_session(OLD))
+        size = path.stat().st_size
+        StorageManager(base_dir=storage.base_dir).archive_sessions(90)
+
+        queried = StorageManager(base_dir=storage.base_dir)
+        moved = archived_path(storage, path)
+        assert queried.list_sessions() == [moved]
+        assert queried.list_sessions(start_date=date(2025, 2, 1)) == []
+        assert queried.find_session(path.stem) == moved
+        assert queried.get_date_range("claude_code") == (date(2025, 1, 15), date(2025, 1, 15))
+
+        [index] = queried.list_sessions_in_range("claude_code", date(2025, 1, 1), date(2025, 1, 31))
+        assert index.file_path == str(moved.relative_to(storage.base_dir))
+        assert index.total_tokens == 4500
+        assert index.file_size_bytes == size
+
+        stats = queried.get_storage_stats()["platforms"]["claude_code"]
+        assert (stats["session_count"], stats["size_bytes"]) == (1, size)
+
+    def test_aggregate_daily(
+        self,
+        catalog_mode: str,
+        storage: StorageManager,
+        manager: SessionManager,
+        make_session: Callable[..., Session],
+    ) -> None:
+        save(manager, make_session(OLD))
+        save(manager, make_session(OLD + timedelta(hours=2), calls=4))
+        before = aggregate_daily(
+            "claude_code", date(2025, 1, 1), date(2025, 1, 31), storage=storage
+        )
+
+        StorageManager(base_dir=storage.base_dir).archive_sessions(90)
+        after = aggregate_daily(
+            "claude_code",
+            date(2025, 1, 1),
+            date(2025, 1, 31),
+            storage=StorageManager(base_dir=storage.base_dir),
+        )
+
+        assert [(d.date, d.session_count, d.total_tokens) for d in after] == [
+            (d.date, d.session_count, d.total_tokens) for d in before
+        ]
+        assert after[0].session_count == 2
+
+    def test_catalog_follows_bundle_changes(
+        self, storage: StorageManager, manager: SessionManager, make_session: Callable[..., Session]
+    ) -> None:
+        path = save(manager, make_session(OLD))
+        storage.archive_sessions(90)
+        assert len(storage.list_sessions()) == 1
+
+        save(manager, make_session(OLD + timedelta(hours=1)))
+        storage.archive_sessions(90)
+        assert len(storage.list_sessions()) == 2
+
+        archived_path(storage, path).parent.parent.unlink()
+        assert storage.list_sessions() == []
+
+
+class TestArchiveCommand:
+    """Test ``token-audit storage archive``."""
+
+    def test_archive_command(
+        self,
+        storage: StorageManager,
+        manager: SessionManager,
+        monkeypatch: pytest.MonkeyPatch,
+        capsys: pytest.CaptureFixture[str],
+        make_session: Callable[..., Session],
+    ) -> None:
+        from token_audit import cli
+
+        path = save(manager, make_session(OLD))
+        monkeypatch.setenv("TOKEN_AUDIT_STORAGE_DIR", str(storage.base_dir))
+
+        args = argparse.Namespace(
+            storage_command="archive", older_than=90, platform=None, dry_run=False
+        )
+        assert cli.cmd_storage(args) == 0
+
+        assert "Archived 1 session files older than 90 days (0 failed)" in capsys.readouterr().out
+        assert not path.exists()
+        assert archive.is_archived(archived_path(storage, path))
+
+
+def test_index_member_lists_members(
+    storage: StorageManager, manager: SessionManager, make_session: Callable[..., Session]
+) -> None:
+    """The member index carries each session's summary and index entry."""
+    path = save(manager, make_session(OLD))
+    mtime_ns = path.stat().st_mtime_ns
+    storage.archive_sessions(90)
+
+    bundle = archived_path(storage, path).parent.parent
+    with archive.zipfile.ZipFile(bundle) as zf:
+        index = json.loads(zf.read(archive.INDEX_MEMBER))
+    entry = index["members"][f"2025-01-15/{path.name}"]
+    assert entry["mtime_ns"] == mtime_ns
+    assert set(entry["meta"]) == {"summary", "index"}
+    assert os.path.basename(entry["meta"]["index"]["file_path"]) == path.name
@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+"""
+Tests for historical Claude Code transcript import (collect --backfill).
+
+Tests:
+1. Batch processing of a single transcript by ClaudeCodeAdapter
+2. Transcript discovery across project directories
+3. Backfill writing sessions and indexes through StorageManager
+4. In-process and process-pool runs producing the same result
+"""
+
+import argparse
+import json
+import tempfile
+from datetime import date
+from pathlib import Path
+from typing import Any, Dict, Generator, List
+
+import pytest
+
+from token_audit.backfill import (
+    BackfillResult,
+    backfill_claude_code,
+    find_claude_transcripts,
+)
+from token_audit.claude_code_adapter import ClaudeCodeAdapter
+from token_audit.storage import StorageManager
+
+TRANSCRIPT_ID = "0f3c2a9e-1111-2222-3333-444455556666"
+
+
+def make_transcript(
+    path: Path,
+    cwd: str = "/home/dev/my-project",
+    start: str = "2025-11-20T09:00:00.000Z",
+    end: str = "2025-11-20T09:30:00.000Z",
+) -> List[Dict[str, Any]]:
+    """Write a small Claude Code transcript and return its events."""
+    usage = {
+        "input_tokens": 100,
+        "output_tokens": 50,
+        "cache_creation_input_tokens": 1000,
+        "cache_read_input_tokens": 500,
+    }
+    events: List[Dict[str, Any]] = [
+        {"type": "summary", "summary": "Backfill test"},
+        {"type": "user", "cwd": cwd, "timestamp": start, "message": {"content": "Hi"}},
+        {
+            "type": "assistant",
+            "cwd": cwd,
+            "timestamp": start,
+            "message": {
+                "model": "claude-opus-4-5-20251101",
+                "content": [{"type": "text", "text": "Hello!"}],
+                "usage": usage,
+            },
+        },
+        {
+            "type": "assistant",
+            "cwd": cwd,
+            "timestamp": end,
+            "message": {
+                "model": "claude-opus-4-5-20251101",
+                "content": [
+                    {"type": "tool_use", "name": "mcp__zen__chat", "input": {"prompt": "x"}}
+                ],
+                "usage": usage,
+            },
+        },
+    ]
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # No trailing newline: finished transcripts are read to the last byte
+    path.write_text("\n".join(json.dumps(e) for e in events))
+    return events
+
+
+@pytest.fixture
+def projects_dir() -> Generator[Path, None, None]:
+    """Create a temporary ~/.claude/projects equivalent."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield Path(tmpdir)
+
+
+class TestProcessSessionFileBatch:
+    """Test ClaudeCodeAdapter batch mode."""
+
+    def test_reads_whole_transcript(self, projects_dir: Path) -> None:
+        """All lines are parsed and the session is dated from the transcript."""
+        transcript = projects_dir / "-home-dev-my-project" / f"{TRANSCRIPT_ID}.jsonl"
+        make_transcript(transcript)
+
+        adapter = ClaudeCodeAdapter(project="", claude_dir=transcript.parent, git_metadata={})
+        lines = adapter.process_session_file_batch(transcript)
+
+        assert lines == 4
+        assert adapter.session.message_count == 2
+        assert adapter.session.token_usage.total_tokens == 2 * 1650
+        assert "zen" in adapter.server_sessions
+        assert adapter.project == "my-project"
+        assert adapter.session.working_directory == "/home/dev/my-project"
+        assert adapter.session.source_files == [transcript.name]
+        assert adapter.session.cost_estimate > 0
+        assert adapter.session.timestamp.utcoffset() is not None
+        assert adapter.session_id.endswith("-0f3c2a9e")
+        assert adapter.session_id.startswith("my-project-")
+
+        ended = adapter.transcript_end_time()
+        assert ended is not None
+        assert (ended - adapter.session.timestamp).total_seconds() == 1800
+
+    def test_explicit_project_is_kept(self, projects_dir: Path) -> None:
+        transcript = projects_dir / "proj" / f"{TRANSCRIPT_ID}.jsonl"
+        make_transcript(transcript)
+
+        adapter = ClaudeCodeAdapter(project="fixed", claude_dir=transcript.parent, git_metadata={})
+        adapter.process_session_file_batch(transcript)
+        assert adapter.session.project == "fixed"
+
+
+class TestFindClaudeTranscripts:
+    """Test transcript discovery."""
+
+    def test_finds_transcripts_in_project_dirs(self, projects_dir: Path) -> None:
+        a = projects_dir / "-a" / "one.jsonl"
+        b = projects_dir / "-b" / "two.jsonl"
+        make_transcript(a)
+        make_transcript(b)
+        (projects_dir / "-b" / "notes.txt").write_text("ignored")
+        (projects_dir / "stray.jsonl").write_text("ignored")
+
+        assert find_claude_transcripts(projects_dir) == [a, b]
+
+    def test_missing_directory(self, projects_dir: Path) -> None:
+        assert find_claude_transcripts(projects_dir / "missing") == []
+
+
+class TestBackfill:
+    """Test bulk import into storage."""
+
+    def _make_projects(self, projects_dir: Path) -> List[Path]:
+        transcripts = [
+            projects_dir / "-home-dev-alpha" / "aaaaaaaa-0000.jsonl",
+            projects_dir / "-home-dev-alpha" / "bbbbbbbb-0000.jsonl",
+            projects_dir / "-home-dev-beta" / "cccccccc-0000.jsonl",
+        ]
+        make_transcript(transcripts[0], cwd="/home/dev/alpha")
+        make_transcript(
+            transcripts[1],
+            cwd="/home/dev/alpha",
+            start="2025-11-21T12:00:00.000Z",
+            end="2025-11-21T12:05:00.000Z",
+        )
+        make_transcript(transcripts[2], cwd="/home/dev/beta")
+        return transcripts
+
+    def test_backfill_writes_sessions_and_indexes(
+        self, projects_dir: Path, storage: StorageManager
+    ) -> None:
+        transcripts = self._make_projects(projects_dir)
+        empty = projects_dir / "-home-dev-alpha" / "dddddddd-0000.jsonl"
+        empty.write_text(json.dumps({"type": "summary", "summary": "nothing"}) + "\n")
+        transcripts.append(empty)
+
+        result = backfill_claude_code(transcripts, storage, jobs=1)
+
+        assert result.files_total == 4
+        assert result.files_imported == 3
+        assert result.files_skipped == 1
+        assert result.files_failed == 0
+        assert result.events == 13
+        assert result.files_per_second > 0
+        assert result.events_per_second > 0
+
+        sessions = storage.list_sessions(platform="claude_code")
+        assert len(sessions) == 3
+        data = json.loads(sessions[0].read_text())
+        assert data["_file"]["name"] == sessions[0].name
+        assert data["session"]["ended_at"] is not None
+        assert data["session"]["duration_seconds"] >= 0
+
+        platform_index = storage.load_platform_index("claude_code")
+        assert platform_index is not None
+        assert platform_index.total_sessions == 3
+        assert platform_index.total_tokens == 3 * 2 * 1650
+
+        projects = []
+        for date_str in platform_index.dates:
+            daily = storage.load_daily_index("claude_code", date.fromisoformat(date_str))
+            assert daily is not None
+            projects.extend(s.project for s in daily.sessions)
+        assert sorted(projects) == ["alpha", "alpha", "beta"]
+
+    def test_backfill_is_idempotent(self, projects_dir: Path, storage: StorageManager) -> None:
+        transcripts = self._make_projects(projects_dir)
+
+        backfill_claude_code(transcripts, storage, jobs=1)
+        backfill_claude_code(transcripts, storage, jobs=1)
+
+        assert len(storage.list_sessions(platform="claude_code")) == 3
+        platform_index = storage.load_platform_index("claude_code")
+        assert platform_index is not None
+        assert platform_index.total_sessions == 3
+
+    def test_process_pool_matches_in_process(
+        self, projects_dir: Path, storage: StorageManager
+    ) -> None:
+        transcripts = self._make_projects(projects_dir)
+
+        result = backfill_claude_code(transcripts, storage, jobs=2, project="shared")
+
+        assert result.files_imported == 3
+        assert result.files_failed == 0
+        platform_index = storage.load_platform_index("claude_code")
+        assert platform_index is not None
+        assert platform_index.total_sessions == 3
+        for path in storage.list_sessions(platform="claude_code"):
+            assert json.loads(path.read_text())["session"]["project"] == "shared"
+
+    def test_unreadable_transcript_is_reported(
+        self, projects_dir: Path, storage: StorageManager
+    ) -> None:
+        result = backfill_claude_code([projects_dir / "missing.jsonl"], storage, jobs=1)
+
+        assert result == BackfillResult(
+            files_total=1,
+            files_failed=1,
+            elapsed_seconds=result.elapsed_seconds,
+            errors=result.errors,
+        )
+        assert result.errors[0].startswith("missing.jsonl")
+
+
+class TestCollectBackfillCommand:
+    """Test the collect --backfill CLI path."""
+
+    def test_reports_throughput(
+        self,
+        projects_dir: Path,
+        storage: StorageManager,
+        monkeypatch: pytest.MonkeyPatch,
+        capsys: pytest.CaptureFixture[str],
+    ) -> None:
+        from token_audit import cli
+
+        make_transcript(projects_dir / ".claude" / "projects" / "-p" / f"{TRANSCRIPT_ID}.jsonl")
+        monkeypatch.setenv("HOME", str(projects_dir))
+
+        args = argparse.Namespace(
+            backfill=True,
+            platform="auto",
+            output=storage.base_dir,
+            project=None,
+            jobs=1,
+            quiet=False,
+        )
+        assert cli.cmd_collect(args) == 0
+
+        out = capsys.readouterr().out
+        assert "Imported 1 sessions" in out
+        assert "files/sec" in out
+        assert "events/sec" in out
+        assert len(storage.list_sessions(platform="claude_code")) == 1
+
+    def test_rejects_other_platforms(
+        self, storage: StorageManager, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        from token_audit import cli
+
+        args = argparse.Namespace(
+            backfill=True,
+            platform="codex-cli",
+            output=storage.base_dir,
+            project=None,
+            jobs=None,
+            quiet=False,
+        )
+        assert cli.cmd_collect(args) == 1
+        assert "Claude Code transcripts only" in capsys.readouterr().out
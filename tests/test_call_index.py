@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Tests for lazy session loading and the tool call index.
+
+Tests:
+1. load_session(lazy=True) giving the same Session as an eager load
+2. Tool calls decoded per tool, only when call_history is accessed
+3. The index sidecar reused while current and rebuilt after changes
+4. Compact files and session files changed after loading
+"""
+
+import json
+from datetime import timedelta
+from pathlib import Path
+from typing import Any, Callable, List
+
+import pytest
+
+from token_audit import call_index
+from token_audit.base_tracker import Call, Session
+from token_audit.session_manager import SessionManager
+from token_audit.session_summary import CALL_INDEX_SUFFIX, remove_summary, summary_path
+
+
+@pytest.fixture
+def manager(tmp_path: Path) -> SessionManager:
+    return SessionManager(base_dir=tmp_path)
+
+
+def save(manager: SessionManager, session: Session) -> Path:
+    return manager.save_session(session, manager.base_dir)["session"]
+
+
+def index_path(path: Path) -> Path:
+    return summary_path(path, CALL_INDEX_SUFFIX)
+
+
+def histories(session: Session) -> List[List[Call]]:
+    return [
+        stats.call_history
+        for server in session.server_sessions.values()
+        for stats in server.tools.values()
+    ]
+
+
+class TestLazyLoad:
+    """Test lazy loads against eager loads."""
+
+    def test_same_session_as_eager(
+        self, manager: SessionManager, make_session: Callable[..., Session]
+    ) -> None:
+        path = save(manager, make_session())
+
+        eager = manager.load_session(path)
+        lazy = manager.load_session(path, lazy=True)
+
+        assert eager is not None and lazy is not None
+        assert lazy.to_dict() == eager.to_dict()
+        assert histories(lazy) == histories(eager)
+
+    def test_counts_without_decoding_calls(
+        self,
+        manager: SessionManager,
+        monkeypatch: pytest.MonkeyPatch,
+        make_session: Callable[..., Session],
+    ) -> None:
+        path = save(manager, make_session())
+        decoded: List[int] = []
+        original = call_index.read_indexed_calls
+
+        def spy(session_path: Path, index: Any, positions: List[int]) -> Any:
+            decoded.append(len(positions))
+            return original(session_path, index, positions)
+
+        monkeypatch.setattr("token_audit.session_manager.read_indexed_calls", spy)
+        session = manager.load_session(path, lazy=True)
+        assert session is not None
+
+        tool = session.server_sessions["srv1"].tools["mcp__srv1__tool1"]
+        assert (tool.calls, tool.total_tokens, tool.avg_tokens) == (5, 750, 150)
+        assert session.token_usage.total_tokens == 4500
+        assert decoded == []
+
+        assert [call.index for call in tool.call_history] == [2, 8, 14, 20, 26]
+        assert tool.call_history[0].timestamp == session.timestamp + timedelta(seconds=1)
+        assert decoded == [5]
+
+    def test_directory_path(
+        self, manager: SessionManager, make_session: Callable[..., Session]
+    ) -> None:
+        path = save(manager, make_session())
+
+        session = manager.load_session(path.parent, lazy=True)
+        assert session is not None
+        assert sum(len(history) for history in histories(session)) == 30
+
+
+class TestIndexSidecar:
+    """Test the index sidecar."""
+
+    def test_reused_while_current(
+        self,
+        manager: SessionManager,
+        monkeypatch: pytest.MonkeyPatch,
+        make_session: Callable[..., Session],
+    ) -> None:
+        path = save(manager, make_session())
+        manager.load_session(path, lazy=True)
+        assert index_path(path).exists()
+
+        def fail(*args: Any) -> None:
+            raise AssertionError("session file indexed again")
+
+        monkeypatch.setattr(call_index, "top_level_span", fail)
+        session = manager.load_session(path, lazy=True)
+        assert session is not None
+        assert len(session.server_sessions["srv0"].tools["mcp__srv0__tool0"].call_history) == 5
+
+    def test_rebuilt_after_rewrite(
+        self, manager: SessionManager, make_session: Callable[..., Session]
+    ) -> None:
+        path = save(manager, make_session(calls=30))
+        manager.load_session(path, lazy=True)
+
+        save(manager, make_session(calls=12))
+        session = manager.load_session(path, lazy=True)
+
+        assert session is not None
+        assert session.server_sessions["srv0"].tools["mcp__srv0__tool0"].calls == 2
+        assert json.loads(index_path(path).read_text())["offsets"][-1] < path.stat().st_size
+
+    def test_removed_with_summary(
+        self, manager: SessionManager, make_session: Callable[..., Session]
+    ) -> None:
+        path = save(manager, make_session())
+        manager.load_session(path, lazy=True)
+
+        remove_summary(path)
+        assert not index_path(path).exists()
+        assert not summary_path(path).exists()
+
+
+class TestFallbacks:
+    """Test files the offsets can't be used for."""
+
+    def test_compact_file(
+        self,
+        manager: SessionManager,
+        monkeypatch: pytest.MonkeyPatch,
+        make_session: Callable[..., Session],
+    ) -> None:
+        monkeypatch.setenv("TOKEN_AUDIT_SESSION_FORMAT", "compact")
+        path = save(manager, make_session())
+
+        eager = manager.load_session(path)
+        lazy = manager.load_session(path, lazy=True)
+
+        assert eager is not None and lazy is not None
+        assert lazy.to_dict() == eager.to_dict()
+        assert not index_path(path).exists()
+
+    def test_file_changed_after_load(
+        self, manager: SessionManager, make_session: Callable[..., Session]
+    ) -> None:
+        path = save(manager, make_session(calls=30))
+        session = manager.load_session(path, lazy=True)
+        assert session is not None
+
+        save(manager, make_session(calls=12, tokens=7))
+        tool = session.server_sessions["srv0"].tools["mcp__srv0__tool0"]
+
+        assert [call.total_tokens for call in tool.call_history] == [7, 7]
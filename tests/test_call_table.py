@@ -0,0 +1,249 @@
+"""
+Tests for the columnar call table.
+
+Tests cover:
+- Flattening sessions into columns with interned strings
+- concat() and between()
+- Group-by sums, counts, top-N and percentiles (NumPy and plain Python backends)
+- repeats(), matches() and label()
+- BucketClassifier.classify_table() against classify_session()
+- build_call_table() over stored sessions
+"""
+
+import statistics
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, List, Optional
+
+import pytest
+
+from token_audit import call_table
+from token_audit.aggregation import build_call_table
+from token_audit.base_tracker import Call, ServerSession, Session, ToolStats
+from token_audit.buckets import BucketClassifier
+from token_audit.call_table import CallTable
+from token_audit.session_manager import SessionManager
+from token_audit.storage import StorageManager
+
+START = datetime(2025, 3, 1, 9, 0, 0, tzinfo=timezone.utc)
+
+
+def add_call(
+    session: Session,
+    server: str,
+    tool: str,
+    total_tokens: int,
+    content_hash: Optional[str] = None,
+    output_tokens: int = 0,
+    model: Optional[str] = None,
+) -> None:
+    """Append a call (one second after the session's previous call)."""
+    server_session = session.server_sessions.setdefault(server, ServerSession(server=server))
+    stats = server_session.tools.setdefault(tool, ToolStats())
+    index = sum(s.total_calls for s in session.server_sessions.values())
+    stats.call_history.append(
+        Call(
+            timestamp=session.timestamp + timedelta(seconds=index),
+            tool_name=tool,
+            server=server,
+            index=index,
+            output_tokens=output_tokens,
+            total_tokens=total_tokens,
+            content_hash=content_hash,
+            model=model,
+        )
+    )
+    stats.calls += 1
+    stats.total_tokens += total_tokens
+    server_session.total_calls += 1
+    server_session.total_tokens += total_tokens
+
+
+def build_sessions() -> List[Session]:
+    first = Session(project="demo", platform="claude-code", session_id="s1", timestamp=START)
+    add_call(first, "zen", "mcp__zen__chat", 500, "h1", model="opus")
+    add_call(first, "zen", "mcp__zen__chat", 300, "h1", model="opus")
+    add_call(first, "backlog", "mcp__backlog__task_list", 9000, output_tokens=8000)
+    add_call(first, "zen", "mcp__zen__introspect_tools", 200)
+
+    second = Session(
+        project="demo",
+        platform="claude-code",
+        session_id="s2",
+        timestamp=START + timedelta(days=1),
+    )
+    add_call(second, "zen", "mcp__zen__chat", 100, "h1")
+    add_call(second, "backlog", "mcp__backlog__task_view", 700, "h2")
+    add_call(second, "backlog", "mcp__backlog__task_view", 900, "h2")
+    return [first, second]
+
+
+@pytest.fixture(params=["numpy", "python"])
+def backend(request: Any, monkeypatch: pytest.MonkeyPatch) -> str:
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(call_table, "np", None)
+    return str(request.param)
+
+
+@pytest.fixture
+def table(backend: str) -> CallTable:
+    return CallTable.from_sessions(build_sessions())
+
+
+class TestBuild:
+    """Test flattening sessions."""
+
+    def test_columns(self, table: CallTable) -> None:
+        assert len(table) == 7
+        assert list(table.column("total_tokens")) == [500, 300, 200, 9000, 100, 700, 900]
+        assert table.strings("tool") == [
+            "mcp__zen__chat",
+            "mcp__zen__introspect_tools",
+            "mcp__backlog__task_list",
+            "mcp__backlog__task_view",
+        ]
+        assert table.decoded("session") == ["s1"] * 4 + ["s2"] * 3
+        assert table.decoded("model")[:3] == ["opus", "opus", None]
+        assert table.column("timestamp")[0] == START.timestamp()
+
+    def test_concat(self, table: CallTable) -> None:
+        first, second = build_sessions()
+        joined = CallTable.concat(
+            [CallTable.from_sessions([second]), CallTable.from_sessions([first])]
+        )
+
+        assert len(joined) == 7
+        assert joined.decoded("tool")[:3] == [
+            "mcp__zen__chat",
+            "mcp__backlog__task_view",
+            "mcp__backlog__task_view",
+        ]
+        assert joined.group_sum("tool") == {
+            "mcp__zen__chat": 900,
+            "mcp__backlog__task_view": 1600,
+            "mcp__zen__introspect_tools": 200,
+            "mcp__backlog__task_list": 9000,
+        }
+
+    def test_between(self, table: CallTable) -> None:
+        day_two = table.between(start=START + timedelta(hours=12))
+
+        assert len(day_two) == 3
+        assert day_two.group_count("session") == {"s2": 3}
+        assert len(table.between(end=START + timedelta(seconds=2))) == 2
+
+
+class TestAggregation:
+    """Test group-by helpers."""
+
+    def test_group_sum_and_count(self, table: CallTable) -> None:
+        assert table.group_sum("server") == {"zen": 1100, "backlog": 10600}
+        assert table.group_count("server") == {"zen": 4, "backlog": 3}
+        assert table.group_sum("model") == {"opus": 800}
+        assert table.total() == 11700
+
+    def test_multi_column_groups(self, table: CallTable) -> None:
+        assert table.group_count(("session", "content_hash")) == {
+            ("s1", "h1"): 2,
+            ("s2", "h1"): 1,
+            ("s2", "h2"): 2,
+        }
+
+    def test_top(self, table: CallTable) -> None:
+        assert table.top("tool", n=2) == [
+            ("mcp__backlog__task_list", 9000),
+            ("mcp__backlog__task_view", 1600),
+        ]
+
+    def test_percentile(self, table: CallTable) -> None:
+        tokens = [500, 300, 200, 9000, 100, 700, 900]
+        assert table.percentile("total_tokens", 50) == statistics.median(tokens)
+        assert table.percentile("total_tokens", 90) == pytest.approx(
+            statistics.quantiles(tokens, n=10, method="inclusive")[-1]
+        )
+        assert table.percentile("total_tokens", 50, by="server") == {
+            "zen": 250.0,
+            "backlog": 900.0,
+        }
+        assert CallTable().percentile("total_tokens", 50) == 0.0
+
+    def test_where(self, table: CallTable) -> None:
+        large = table.at_least("total_tokens", 700)
+
+        assert table.group_sum("server", where=large) == {"backlog": 10600}
+        assert table.total(where=large) == 10600
+
+
+class TestMasks:
+    """Test repeats(), matches() and label()."""
+
+    def test_repeats(self, table: CallTable) -> None:
+        repeats = table.repeats(("session", "content_hash"))
+        assert [bool(r) for r in repeats] == [False, True, False, False, False, False, True]
+
+        three = table.repeats(("session", "content_hash"), min_count=3)
+        assert not any(three)
+
+    def test_label(self, table: CallTable) -> None:
+        chat = table.matches("tool", lambda t: t.endswith("chat"))
+        table.label(
+            "kind", [("chat", [chat]), ("large", [table.at_least("total_tokens", 900)])], "other"
+        )
+
+        assert table.decoded("kind") == ["chat", "chat", "other", "large", "chat", "other", "large"]
+        assert table.group_count("kind") == {"chat": 3, "large": 2, "other": 2}
+
+
+class TestClassifyTable:
+    """Test BucketClassifier.classify_table()."""
+
+    def test_matches_classify_session(self, backend: str) -> None:
+        classifier = BucketClassifier()
+        for session in build_sessions():
+            expected = classifier.classify_session(session)
+            result = classifier.classify_table(CallTable.from_sessions([session]))
+            assert [r.to_dict() for r in result] == [r.to_dict() for r in expected]
+
+    def test_pools_sessions(self, table: CallTable) -> None:
+        classifier = BucketClassifier()
+        per_session = [classifier.classify_session(s) for s in build_sessions()]
+
+        pooled = {r.bucket: r for r in classifier.classify_table(table)}
+
+        for bucket, result in pooled.items():
+            assert result.tokens == sum(
+                r.tokens for results in per_session for r in results if r.bucket == bucket
+            )
+            assert result.call_count == sum(
+                r.call_count for results in per_session for r in results if r.bucket == bucket
+            )
+
+
+class TestBuildCallTable:
+    """Test build_call_table() over stored sessions."""
+
+    @pytest.mark.parametrize("jobs", [1, 2])
+    def test_loads_range(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, jobs: int) -> None:
+        from token_audit import session_loader
+
+        monkeypatch.setattr(session_loader, "MIN_PARALLEL_SESSIONS", 1)
+        storage = StorageManager(base_dir=tmp_path)
+        manager = SessionManager(base_dir=storage.get_platform_dir("claude_code"))
+        for session in build_sessions():
+            manager.save_session(session, manager.base_dir)
+
+        table = build_call_table(
+            "claude_code", date(2025, 3, 1), date(2025, 3, 31), storage=storage, jobs=jobs
+        )
+        assert len(table) == 7
+        assert table.top("tool", n=1) == [("mcp__backlog__task_list", 9000)]
+
+        only_first = build_call_table(
+            "claude_code", date(2025, 3, 1), date(2025, 3, 1), storage=storage, jobs=jobs
+        )
+        assert only_first.group_count("session") == {"s1": 4}
+
+    def test_no_sessions(self, tmp_path: Path) -> None:
+        assert len(build_call_table(storage=StorageManager(base_dir=tmp_path))) == 0
@@ -0,0 +1,359 @@
+#!/usr/bin/env python3
+"""
+Tests for the SQLite session catalog.
+
+Tests:
+1. Rows written by StorageManager, BaseTracker.save_session() and the directory scan
+2. Changed, added and deleted files picked up from directory mtimes
+3. StorageManager queries answered from the catalog (find_session without a scan)
+4. Rebuild, delete and the fallback when the catalog is disabled or unusable
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+from datetime import date
+from pathlib import Path
+from typing import Any, Callable, Dict
+
+import pytest
+
+from token_audit.catalog import CATALOG_ENV_VAR, CATALOG_FILE_NAME, SessionCatalog
+from token_audit.storage import SessionIndex, StorageManager
+
+
+def write_raw(storage: StorageManager, day: date, name: str, data: Any) -> Path:
+    """Write a session file directly, bypassing StorageManager."""
+    path = storage.get_date_dir("claude_code", day) / name
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data))
+    return path
+
+
+def settle(storage: StorageManager) -> None:
+    """Mark every catalogued directory as scanned long after its last change."""
+    catalog = storage._get_catalog()
+    assert catalog is not None
+    catalog.sync()
+    catalog._connection().execute("UPDATE dirs SET synced_ns = mtime_ns + 10000000000")
+
+
+DAY = date(2025, 1, 15)
+
+
+class TestCatalogRows:
+    """Test what the catalog stores."""
+
+    def test_row_from_write_session_file(
+        self, storage: StorageManager, make_session_data: Callable[..., Dict[str, Any]]
+    ) -> None:
+        path = storage.write_session_file("claude_code", DAY, "alpha-1.json", make_session_data())
+
+        catalog = storage._get_catalog()
+        assert catalog is not None
+        (entry,) = catalog.entries("claude_code")
+        assert entry.model == "claude-opus-4-5"
+        assert entry.smells_count == 3
+        assert entry.duration_seconds == 3600.0
+        assert entry.index.project == "alpha"
+        assert entry.index.total_tokens == 1000
+        assert entry.index.total_cost == 0.25
+        assert entry.index.is_complete
+        assert entry.index.file_path == str(path.relative_to(storage.base_dir))
+        assert entry.index.file_size_bytes == path.stat().st_size
+        assert (storage.base_dir / CATALOG_FILE_NAME).exists()
+
+    def test_wal_mode(self, storage: StorageManager) -> None:
+        storage.list_sessions()
+        conn = sqlite3.connect(storage.base_dir / CATALOG_FILE_NAME)
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        conn.close()
+
+    def test_non_session_files_listed_but_not_indexed(self, storage: StorageManager) -> None:
+        events = storage.create_session_file("claude_code", "events", DAY)
+        storage.write_session_events(events, [{"type": "tool_call"}])
+        write_raw(storage, DAY, "broken.json", "not a session")
+
+        assert len(storage.list_sessions()) == 2
+        assert storage.list_sessions_in_range("claude_code", DAY, DAY) == []
+
+    def test_save_session_records_in_place_rewrite(
+        self, storage: StorageManager, make_session_data: Callable[..., Dict[str, Any]]
+    ) -> None:
+        """BaseTracker.save_session() rewrites in place, which leaves the dir mtime alone."""
+        from token_audit.catalog import record_session_file
+
+        path = write_raw(storage, DAY, "alpha-1.json", make_session_data(total_tokens=1))
+        settle(storage)
+
+        path.write_text(json.dumps(make_session_data(total_tokens=2)))
+        record_session_file(storage.base_dir, path)
+
+        (index,) = storage.list_sessions_in_range("claude_code", DAY, DAY)
+        assert index.total_tokens == 2
+
+
+class TestDirectorySync:
+    """Test picking up files written by other processes."""
+
+    def test_added_and_removed_files(
+        self, storage: StorageManager, make_session_data: Callable[..., Dict[str, Any]]
+    ) -> None:
+        first = write_raw(storage, DAY, "a.json", make_session_data())
+        assert storage.list_sessions() == [first]
+
+        second = write_raw(storage, DAY, "b.json", make_session_data())
+        first.unlink()
+        assert storage.list_sessions() == [second]
+
+    def test_removed_date_directory(
+        self, storage: StorageManager, make_session_data: Callable[..., Dict[str, Any]]
+    ) -> None:
+        path = write_raw(storage, DAY, "a.json", make_session_data())
+        storage.list_sessions()
+
+        path.unlink()
+        path.parent.rmdir()
+        assert storage.list_sessions() == []
+        assert storage.get_storage_stats()["total_sessions"] == 0
+
+    def test_settled_directory_not_rescanned(
+        self,
+        storage: StorageManager,
+        monkeypatch: pytest.MonkeyPatch,
+        make_session_data: Callable[..., Dict[str, Any]],
+    ) -> None:
+        write_raw(storage, DAY, "a.json", make_session_data())
+        settle(storage)
+
+        def fail(*args: Any) -> None:
+            raise AssertionError("settled directory was rescanned")
+
+        monkeypatch.setattr(SessionCatalog, "_sync_dir", fail)
+        assert len(storage.list_sessions()) == 1
+
+    def test_changed_directory_rescans_changed_files_only(
+        self,
+        storage: StorageManager,
+        monkeypatch: pytest.MonkeyPatch,
+        make_session_data: Callable[..., Dict[str, Any]],
+    ) -> None:
+        write_raw(storage, DAY, "a.json", make_session_data())
+        settle(storage)
+        write_raw(storage, DAY, "b.json", make_session_data())
+
+        built = []
+        original = SessionCatalog._build_row
+
+        def spy(self: SessionCatalog, path: Path, *args: Any) -> Any:
+            built.append(path.name)
+            return original(self, path, *args)
+
+        monkeypatch.setattr(SessionCatalog, "_build_row", spy)
+        assert len(storage.list_sessions()) == 2
+        assert built == ["b.json"]
+
+    def test_in_place_write_through_storage_manager(self, storage: StorageManager) -> None:
+        path = storage.create_session_file("claude_code", "events", DAY)
+        settle(storage)
+
+        storage.append_event(path, {"type": "tool_call"})
+        assert storage.get_storage_stats()["total_size_bytes"] == path.stat().st_size
+
+
+class TestStorageQueries:
+    """Test StorageManager query methods backed by the catalog."""
+
+    def test_list_sessions_filters_and_order(
+        self, storage: StorageManager, make_session_data: Callable[..., Dict[str, Any]]
+    ) -> None:
+        old = write_raw(storage, date(2025, 1, 10), "old.json", make_session_data())
+        new = write_raw(storage, date(2025, 1, 20), "new.json", make_session_data())
+        os.utime(old, ns=(1_000_000_000, 1_000_000_000))
+
+        assert storage.list_sessions() == [new, old]
+        assert storage.list_sessions(limit=1) == [new]
+        assert storage.list_sessions(start_date=date(2025, 1, 15)) == [new]
+        assert storage.list_sessions(end_date=date(2025, 1, 15)) == [old]
+        assert storage.list_sessions(platform="codex_cli") == []
+
+    def test_date_range_and_find(
+        self, storage: StorageManager, make_session_data: Callable[..., Dict[str, Any]]
+    ) -> None:
+        write_raw(storage, date(2025, 1, 10), "s-1.json", make_session_data())
+        events = storage.create_session_file("claude_code", "s-2", date(2025, 1, 20))
+        json_path = write_raw(storage, date(2025, 1, 20), "s-2.json", make_session_data())
+
+        assert storage.get_date_range() == (date(2025, 1, 10), date(2025, 1, 20))
+        assert storage.get_date_range("codex_cli") == (None, None)
+        assert storage.find_session("s-2") == json_path
+        assert events.exists()
+        assert storage.find_session("missing") is None
+
+    def test_find_does_not_scan_directories(
+        self,
+        storage: StorageManager,
+        monkeypatch: pytest.MonkeyPatch,
+        make_session_data: Callable[..., Dict[str, Any]],
+    ) -> None:
+        path = storage.write_session_file("claude_code", DAY, "s-1.json", make_session_data())
+        write_raw(storage, date(2025, 1, 16), "other.json", make_session_data())
+
+        def fail(*args: Any) -> None:
+            raise AssertionError("find_session scanned directories")
+
+        monkeypatch.setattr(SessionCatalog, "sync", fail)
+        assert storage.find_session("s-1") == path
+
+    def test_find_heals_stale_entries(
+        self, storage: StorageManager, make_session_data: Callable[..., Dict[str, Any]]
+    ) -> None:
+        path = storage.write_session_file("claude_code", DAY, "s-1.json", make_session_data())
+        settle(storage)
+        moved = write_raw(storage, date(2025, 1, 16), "s-1.json", make_session_data())
+        path.unlink()
+
+        assert storage.find_session("s-1") == moved
+        catalog = storage._get_catalog()
+        assert catalog is not None
+        rows = catalog._connection().execute(
+            "SELECT file_path FROM sessions WHERE session_id = 's-1'"
+        )
+        assert [row[0] for row in rows] == [str(moved.relative_to(storage.base_dir))]
+
+    @pytest.mark.parametrize("catalog_setting", ["on", "off"])
+    def test_jsonl_sessions_in_range(
+        self, storage: StorageManager, monkeypatch: pytest.MonkeyPatch, catalog_setting: str
+    ) -> None:
+        monkeypatch.setenv(CATALOG_ENV_VAR, catalog_setting)
+        storage = StorageManager(base_dir=storage.base_dir)
+        streamed = storage.create_session_file("claude_code", "streamed", DAY)
+        storage.append_event(
+            streamed,
+            {
+                "_file": {
+                    "schema_version": "1.7.0",
+                    "started_at": "2025-01-15T10:00:00",
+                    "total_tokens": 500,
+                    "project": "stream",
+                }
+            },
+        )
+        storage.append_event(streamed, {"type": "tool_call"})
+
+        # Migrated sessions keep their metadata in the DailyIndex only
+        migrated_day = date(2025, 1, 16)
+        migrated = storage.create_session_file("claude_code", "migrated", migrated_day)
+        storage.append_event(migrated, {"type": "tool_call"})
+        storage.update_indexes_for_session(
+            "claude_code",
+            migrated_day,
+            SessionIndex(
+                schema_version="1.0.0",
+                session_id="migrated",
+                platform="claude_code",
+                date=migrated_day.isoformat(),
+                started_at="2025-01-16T09:00:00",
+                ended_at=None,
+                project="old",
+                total_tokens=700,
+                total_cost=0.1,
+                tool_count=1,
+                server_count=1,
+                is_complete=True,
+                file_path=str(migrated.relative_to(storage.base_dir)),
+                file_size_bytes=migrated.stat().st_size,
+            ),
+        )
+
+        found = storage.list_sessions_in_range("claude_code", DAY, migrated_day)
+        assert sorted((idx.session_id, idx.project, idx.total_tokens) for idx in found) == [
+            ("migrated", "old", 700),
+            ("streamed", "stream", 500),
+        ]
+        assert (storage.base_dir / CATALOG_FILE_NAME).exists() == (catalog_setting == "on")
+
+    def test_storage_stats(
+        self, storage: StorageManager, make_session_data: Callable[..., Dict[str, Any]]
+    ) -> None:
+        path = write_raw(storage, DAY, "a.json", make_session_data())
+        storage.get_date_dir("claude_code", date(2025, 1, 16)).mkdir()
+
+        stats = storage.get_storage_stats()
+        assert stats["platforms"]["claude_code"] == {
+            "session_count": 1,
+            "date_count": 2,
+            "size_bytes": path.stat().st_size,
+        }
+
+
+class TestMaintenance:
+    """Test rebuild, delete and fallbacks."""
+
+    def test_rebuild(
+        self, storage: StorageManager, make_session_data: Callable[..., Dict[str, Any]]
+    ) -> None:
+        write_raw(storage, DAY, "a.json", make_session_data())
+        storage.list_sessions()
+        catalog = storage._get_catalog()
+        assert catalog is not None
+        settle(storage)
+        catalog._connection().execute("DELETE FROM sessions")
+        assert storage.list_sessions() == []
+
+        assert storage.rebuild_catalog() == 1
+        assert len(storage.list_sessions()) == 1
+
+    def test_delete_session(
+        self, storage: StorageManager, make_session_data: Callable[..., Dict[str, Any]]
+    ) -> None:
+        path = storage.write_session_file("claude_code", DAY, "s.json", make_session_data())
+        companion = path.with_suffix(".jsonl")
+        companion.write_text("{}\n")
+
+        storage.delete_session(path)
+
+        assert not path.exists()
+        assert not companion.exists()
+        assert storage.find_session("s") is None
+
+    def test_disabled_by_env(
+        self,
+        storage: StorageManager,
+        monkeypatch: pytest.MonkeyPatch,
+        make_session_data: Callable[..., Dict[str, Any]],
+    ) -> None:
+        monkeypatch.setenv(CATALOG_ENV_VAR, "off")
+        path = write_raw(storage, DAY, "a.json", make_session_data())
+
+        assert StorageManager(base_dir=storage.base_dir).list_sessions() == [path]
+        assert not (storage.base_dir / CATALOG_FILE_NAME).exists()
+        with pytest.raises(RuntimeError, match="disabled"):
+            storage.rebuild_catalog()
+
+    def test_unusable_database_falls_back(
+        self, storage: StorageManager, make_session_data: Callable[..., Dict[str, Any]]
+    ) -> None:
+        (storage.base_dir / CATALOG_FILE_NAME).write_bytes(b"not a database" * 100)
+        path = write_raw(storage, DAY, "a.json", make_session_data())
+
+        assert storage.list_sessions() == [path]
+        assert storage.find_session("a") is None  # Directory scan looks for .jsonl only
+        assert storage._catalog_failed
+
+    def test_reindex_command(
+        self,
+        storage: StorageManager,
+        monkeypatch: pytest.MonkeyPatch,
+        capsys: pytest.CaptureFixture[str],
+        make_session_data: Callable[..., Dict[str, Any]],
+    ) -> None:
+        from token_audit import cli
+
+        write_raw(storage, DAY, "a.json", make_session_data())
+        monkeypatch.setenv("TOKEN_AUDIT_STORAGE_DIR", str(storage.base_dir))
+
+        args = argparse.Namespace(sessions_command="reindex")
+        assert cli.cmd_sessions(args) == 0
+        assert "Catalogued 1 session files" in capsys.readouterr().out
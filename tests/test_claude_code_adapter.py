@@ -14,13 +14,14 @@ import json
 import tempfile
 import threading
 import time
+import warnings
 from pathlib import Path
-from typing import Generator
+from typing import Any, Generator, List, Optional, Tuple
 
 import pytest
 
 from token_audit.claude_code_adapter import ClaudeCodeAdapter
-from token_audit.display import NullDisplay
+from token_audit.display import DisplaySnapshot, NullDisplay
 
 
 @pytest.fixture
@@ -221,6 +222,76 @@ class TestEventParsing:
         assert result is None
 
 
+class TestPreFilter:
+    """Test the byte-level pre-filter that skips lines before JSON decoding."""
+
+    USAGE = {"input_tokens": 10, "output_tokens": 5}
+
+    def _counting_adapter(
+        self, mock_claude_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> Tuple[ClaudeCodeAdapter, List[Any]]:
+        from token_audit import json_codec
+
+        decoded: List[Any] = []
+        real_loads = json_codec.loads
+
+        def counting_loads(data: Any) -> Any:
+            decoded.append(data)
+            return real_loads(data)
+
+        monkeypatch.setattr(json_codec, "loads", counting_loads)
+        adapter = ClaudeCodeAdapter(project="test-project", claude_dir=mock_claude_dir)
+        return adapter, decoded
+
+    def test_tool_result_lines_not_decoded(
+        self, mock_claude_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """After the first event, user/tool_result lines are skipped undecoded."""
+        adapter, decoded = self._counting_adapter(mock_claude_dir, monkeypatch)
+        first = json.dumps({"type": "user", "timestamp": "2025-11-20T09:00:00Z", "cwd": "/p"})
+        tool_result = json.dumps(
+            {
+                "type": "user",
+                "timestamp": "2025-11-20T09:00:05Z",
+                "message": {"content": [{"type": "tool_result", "content": "x" * 10000}]},
+            }
+        ).encode("utf-8")
+
+        assert adapter.parse_event(first) is None
+        assert adapter.parse_event(tool_result) is None
+        assert adapter.parse_event(b'{"type": "summary", "summary": "s"}') is None
+        assert len(decoded) == 1
+        assert adapter._transcript_cwd == "/p"
+
+    def test_compact_assistant_line_parsed(
+        self, mock_claude_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Lines without spaces after separators still pass the filter."""
+        adapter, _ = self._counting_adapter(mock_claude_dir, monkeypatch)
+        adapter.parse_event('{"type":"user","timestamp":"2025-11-20T09:00:00Z"}')
+        line = json.dumps(
+            {"type": "assistant", "message": {"content": [], "usage": self.USAGE}},
+            separators=(",", ":"),
+        )
+
+        for event in (line, line.encode("utf-8")):
+            result = adapter.parse_event(event)
+            assert result is not None
+            assert result[0] == "__session__"
+            assert result[1]["input_tokens"] == 10
+
+    def test_false_positive_settled_by_decode(
+        self, mock_claude_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A user line that mentions both markers is decoded and still skipped."""
+        adapter, decoded = self._counting_adapter(mock_claude_dir, monkeypatch)
+        adapter.parse_event('{"type": "user", "timestamp": "2025-11-20T09:00:00Z"}')
+        line = json.dumps({"type": "user", "message": {"assistant": 1, "usage": 2}})
+
+        assert adapter.parse_event(line) is None
+        assert len(decoded) == 2
+
+
 class TestTokenAccumulation:
     """Test token accumulation via _process_tool_call."""
 
@@ -861,3 +932,126 @@ class TestSourceFilesTracking:
         assert "session" in session_dict
         assert "source_files" in session_dict["session"]
         assert session_dict["session"]["source_files"] == ["test-session.jsonl"]
+
+
+class TestWatcherProcessing:
+    """Test watcher-driven processing of changed files."""
+
+    def test_process_changed_files_reads_only_new_content(
+        self, mock_claude_dir: Path, sample_jsonl_content: str
+    ) -> None:
+        """Only content appended after tracking start is processed."""
+        test_file = mock_claude_dir / "session.jsonl"
+        test_file.write_text(sample_jsonl_content)
+
+        adapter = ClaudeCodeAdapter(project="test-project", claude_dir=mock_claude_dir)
+        adapter._tracking_start_time = time.time()
+        adapter._init_file_positions(adapter._find_jsonl_files())
+
+        # Nothing new yet
+        assert adapter._process_changed_files({test_file}) == 0
+        assert adapter.session.token_usage.total_tokens == 0
+
+        with open(test_file, "a") as f:
+            f.write(sample_jsonl_content + "\n")
+
+        assert adapter._process_changed_files({test_file}) == 2
+        assert adapter.session.token_usage.total_tokens == 4950
+        assert adapter._active_source_files == {"session.jsonl"}
+
+    def test_new_file_read_from_beginning(
+        self, mock_claude_dir: Path, sample_jsonl_content: str
+    ) -> None:
+        """Files created after tracking started are read from byte 0."""
+        adapter = ClaudeCodeAdapter(project="test-project", claude_dir=mock_claude_dir)
+        adapter._tracking_start_time = time.time() - 1.0
+
+        new_file = mock_claude_dir / "new_session.jsonl"
+        new_file.write_text(sample_jsonl_content + "\n")
+
+        assert adapter._process_changed_files({new_file}) == 2
+        assert adapter.session.token_usage.total_tokens == 4950
+
+    def test_partial_line_held_until_complete(
+        self, mock_claude_dir: Path, sample_jsonl_content: str
+    ) -> None:
+        """A line still being written is processed once its newline arrives."""
+        adapter = ClaudeCodeAdapter(project="test-project", claude_dir=mock_claude_dir)
+        adapter._tracking_start_time = time.time() - 1.0
+
+        last_line = sample_jsonl_content.split("\n")[-1]
+        new_file = mock_claude_dir / "new_session.jsonl"
+        new_file.write_text(last_line[:40])
+
+        # Must not be reported as a parse error
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            assert adapter._process_changed_files({new_file}) == 0
+        assert adapter.file_positions[new_file] == 0
+
+        with open(new_file, "a") as f:
+            f.write(last_line[40:] + "\n")
+
+        assert adapter._process_changed_files({new_file}) == 1
+        assert adapter.session.token_usage.total_tokens == 3300
+        assert adapter.file_positions[new_file] == new_file.stat().st_size
+
+    def test_deleted_file_is_skipped(self, mock_claude_dir: Path) -> None:
+        """A file that disappeared before it could be read is ignored."""
+        adapter = ClaudeCodeAdapter(project="test-project", claude_dir=mock_claude_dir)
+        adapter._tracking_start_time = time.time()
+
+        assert adapter._process_changed_files({mock_claude_dir / "gone.jsonl"}) == 0
+
+    def test_display_latency_recorded(
+        self, mock_claude_dir: Path, sample_jsonl_content: str
+    ) -> None:
+        """Events-to-display latency is sampled once per display update."""
+        adapter = ClaudeCodeAdapter(project="test-project", claude_dir=mock_claude_dir)
+        adapter._tracking_start_time = time.time() - 1.0
+        assert adapter.get_display_latency_stats()["samples"] == 0
+
+        new_file = mock_claude_dir / "new_session.jsonl"
+        new_file.write_text(sample_jsonl_content)
+        adapter._process_changed_files({new_file})
+        assert adapter._pending_event_time is not None
+
+        adapter._record_display_latency()
+        stats = adapter.get_display_latency_stats()
+        assert stats["samples"] == 1
+        assert stats["max_ms"] >= 0.0
+        assert adapter._pending_event_time is None
+
+        # No pending events - nothing recorded
+        adapter._record_display_latency()
+        assert adapter.get_display_latency_stats()["samples"] == 1
+
+    def test_monitor_loop_with_watcher(
+        self, mock_claude_dir: Path, sample_jsonl_content: str
+    ) -> None:
+        """monitor() picks up appended content via the watcher and quits on request."""
+        test_file = mock_claude_dir / "session.jsonl"
+        test_file.write_text("")
+
+        adapter = ClaudeCodeAdapter(project="test-project", claude_dir=mock_claude_dir)
+
+        class QuitAfterTokens(NullDisplay):
+            def update(self, snapshot: DisplaySnapshot) -> Optional[str]:
+                return "quit" if snapshot.total_tokens > 0 else None
+
+        def append_later() -> None:
+            time.sleep(0.3)
+            with open(test_file, "a") as f:
+                f.write(sample_jsonl_content + "\n")
+
+        writer = threading.Thread(target=append_later)
+        writer.start()
+        monitor_thread = threading.Thread(target=adapter.monitor, args=(QuitAfterTokens(),))
+        monitor_thread.start()
+        monitor_thread.join(timeout=10)
+        writer.join()
+
+        assert not monitor_thread.is_alive()
+        assert adapter.session.token_usage.total_tokens == 4950
+        assert adapter.get_platform_metadata()["watcher_backend"] in ("inotify", "polling")
+        assert adapter.get_display_latency_stats()["samples"] >= 1
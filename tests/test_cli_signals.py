@@ -232,6 +232,8 @@ class TestSignalRegistration:
                 args.platform = "auto"
                 args.project = None
                 args.no_logs = True
+                args.backfill = False
+                args.multi = False
 
                 cli.cmd_collect(args)
 
@@ -271,6 +273,8 @@ class TestSignalRegistration:
                 args.platform = "auto"
                 args.project = None
                 args.no_logs = True
+                args.backfill = False
+                args.multi = False
 
                 cli.cmd_collect(args)
 
@@ -6,6 +6,8 @@ Tests CodexCLIAdapter implementation for parsing Codex CLI session JSONL files.
 """
 
 import json
+import os
+import time
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List
@@ -718,6 +720,229 @@ class TestBatchProcessing:
         assert session.mcp_tool_calls.total_calls == 1
         assert "zen" in adapter.server_sessions
 
+    def _tool_call_events(self) -> List[Dict[str, Any]]:
+        events: List[Dict[str, Any]] = [make_session_meta_event()]
+        for i in range(3):
+            events.append(make_mcp_tool_call_event(arguments={"n": i}, call_id=f"call_{i}"))
+            events.append(make_function_call_output_event(call_id=f"call_{i}", output="x" * 40 * i))
+        events.append(make_turn_context_event("gpt-5.1"))
+        shell_call = make_mcp_tool_call_event("shell", {"cmd": ["ls"]}, call_id="call_shell")
+        events.append(shell_call)
+        events.append(make_function_call_output_event(call_id="call_shell", output="a\nb"))
+        return events
+
+    def test_batch_estimation_matches_per_call(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Deferred batch estimation records the same tokens as per-call estimation."""
+        events = self._tool_call_events()
+        session_file = tmp_path / "rollout.jsonl"
+        session_file.write_text("".join(json.dumps(e) + "\n" for e in events))
+
+        live = CodexCLIAdapter(project="test", codex_dir=tmp_path)
+        for event in events:
+            result = live.parse_event(event)
+            if result:
+                live._process_tool_call(*result)
+
+        batch = CodexCLIAdapter(project="test", codex_dir=tmp_path)
+        batch_sizes: List[int] = []
+        estimate_batch = batch._estimator.estimate_tool_calls_batch
+        monkeypatch.setattr(
+            batch._estimator,
+            "estimate_tool_calls_batch",
+            lambda calls: batch_sizes.append(len(calls)) or estimate_batch(calls),
+        )
+        monkeypatch.setattr(
+            batch._estimator,
+            "estimate_tool_call",
+            lambda *args: pytest.fail("per-call estimation in batch mode"),
+        )
+        batch.process_session_file_batch(session_file)
+
+        assert batch_sizes == [4]
+        assert batch._deferred_estimates == []
+        assert batch._estimated_tool_calls == 4
+        live_calls = live.server_sessions["zen"].tools["mcp__zen__chat"].call_history
+        batch_calls = batch.server_sessions["zen"].tools["mcp__zen__chat"].call_history
+        assert [(c.input_tokens, c.output_tokens) for c in batch_calls] == [
+            (c.input_tokens, c.output_tokens) for c in live_calls
+        ]
+        assert batch.session.builtin_tool_stats == live.session.builtin_tool_stats
+        assert batch.session.builtin_tool_stats["shell"]["tokens"] > 0
+
+    def test_batch_records_model_at_call_time(self, tmp_path: Path) -> None:
+        """Deferred calls keep the model that was active when they completed."""
+        session_file = tmp_path / "rollout.jsonl"
+        session_file.write_text("".join(json.dumps(e) + "\n" for e in self._tool_call_events()))
+
+        adapter = CodexCLIAdapter(project="test", codex_dir=tmp_path)
+        adapter.process_session_file_batch(session_file)
+
+        calls = adapter.server_sessions["zen"].tools["mcp__zen__chat"].call_history
+        assert [c.model for c in calls] == [None, None, None]
+        shell_calls = adapter.server_sessions["builtin"].tools["__builtin__:shell"].call_history
+        assert shell_calls[0].model == "gpt-5.1"
+        assert adapter.detected_model == "gpt-5.1"
+
+    def test_flush_leaves_adapter_model_alone(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Deferred calls carry their model; the adapter's model isn't swapped while recording."""
+        session_file = tmp_path / "rollout.jsonl"
+        session_file.write_text("".join(json.dumps(e) + "\n" for e in self._tool_call_events()))
+        adapter = CodexCLIAdapter(project="test", codex_dir=tmp_path)
+        seen: List[Any] = []
+        record = adapter.record_tool_call
+        monkeypatch.setattr(
+            adapter,
+            "record_tool_call",
+            lambda **kwargs: seen.append(adapter.detected_model) or record(**kwargs),
+        )
+
+        adapter.process_session_file_batch(session_file)
+
+        assert seen == ["gpt-5.1"] * 4
+
+    def test_session_event_recorded_after_earlier_calls(
+        self, adapter: CodexCLIAdapter, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A live poll records queued tool calls before a later token_count event."""
+        session_file = tmp_path / "live.jsonl"
+        events = [
+            make_mcp_tool_call_event(call_id="call_1"),
+            make_function_call_output_event(call_id="call_1", output="done"),
+            make_token_count_event(),
+        ]
+        session_file.write_text("".join(json.dumps(e) + "\n" for e in events))
+        totals: List[int] = []
+        record = adapter.record_tool_call
+        monkeypatch.setattr(
+            adapter,
+            "record_tool_call",
+            lambda **kwargs: totals.append(adapter.session.token_usage.total_tokens)
+            or record(**kwargs),
+        )
+
+        adapter._process_session_file(session_file)
+
+        assert totals == [0]
+        assert adapter.session.token_usage.total_tokens > 0
+
+
+class TestIncrementalFileProcessing:
+    """Tests for byte-offset resume in live file tracking."""
+
+    def _append(self, path: Path, events: List[Dict[str, Any]]) -> None:
+        with open(path, "a") as f:
+            for event in events:
+                f.write(json.dumps(event) + "\n")
+
+    def test_resumes_from_byte_offset(self, adapter: CodexCLIAdapter, tmp_path: Path) -> None:
+        """Each call reads only bytes appended since the previous call."""
+        session_file = tmp_path / "live.jsonl"
+        self._append(session_file, [make_turn_context_event(), make_token_count_event()])
+
+        adapter._process_session_file(session_file)
+        assert adapter._processed_lines == 2
+        assert adapter._tail is not None
+        assert adapter._tail.offset == session_file.stat().st_size
+        assert adapter.session.token_usage.input_tokens == 300
+
+        self._append(session_file, [make_token_count_event(input_tokens=500)])
+        adapter._process_session_file(session_file)
+        assert adapter._processed_lines == 3
+        assert adapter._tail.offset == session_file.stat().st_size
+
+    def test_unchanged_file_is_skipped(self, adapter: CodexCLIAdapter, tmp_path: Path) -> None:
+        """No read happens when size and mtime are unchanged."""
+        session_file = tmp_path / "live.jsonl"
+        self._append(session_file, [make_turn_context_event()])
+
+        adapter._process_session_file(session_file)
+        assert adapter._tail is not None
+        adapter._tail.reset(0)  # Would re-read everything if not skipped
+        adapter._process_session_file(session_file)
+        assert adapter._processed_lines == 1
+
+    def test_truncation_restarts_from_beginning(
+        self, adapter: CodexCLIAdapter, tmp_path: Path
+    ) -> None:
+        """A file smaller than the saved offset is re-read from byte 0."""
+        session_file = tmp_path / "live.jsonl"
+        self._append(session_file, [make_turn_context_event(), make_token_count_event()])
+        adapter._process_session_file(session_file)
+
+        session_file.write_text(json.dumps(make_turn_context_event()) + "\n")
+        adapter._process_session_file(session_file)
+        assert adapter._processed_lines == 1
+        assert adapter._tail is not None
+        assert adapter._tail.offset == session_file.stat().st_size
+
+    def test_replaced_file_restarts_from_beginning(
+        self, adapter: CodexCLIAdapter, tmp_path: Path
+    ) -> None:
+        """A new inode at the same path (rotation) is re-read from byte 0."""
+        session_file = tmp_path / "live.jsonl"
+        self._append(session_file, [make_turn_context_event()])
+        adapter._process_session_file(session_file)
+
+        replacement = tmp_path / "replacement.jsonl"
+        self._append(
+            replacement,
+            [make_turn_context_event(), make_token_count_event(), make_token_count_event()],
+        )
+        replacement.replace(session_file)
+        adapter._process_session_file(session_file)
+        assert adapter._processed_lines == 3
+
+    def test_partial_line_held_until_complete(
+        self, adapter: CodexCLIAdapter, tmp_path: Path
+    ) -> None:
+        """A line still being written is not consumed until its newline arrives."""
+        session_file = tmp_path / "live.jsonl"
+        line = json.dumps(make_token_count_event())
+        session_file.write_text(line[:30])
+
+        adapter._process_session_file(session_file)
+        assert adapter._processed_lines == 0
+        assert adapter.session.token_usage.input_tokens == 0
+
+        with open(session_file, "a") as f:
+            f.write(line[30:] + "\n")
+        adapter._process_session_file(session_file)
+        assert adapter._processed_lines == 1
+        assert adapter.session.token_usage.input_tokens == 300
+
+    def test_init_file_position_seeks_to_end(
+        self, adapter: CodexCLIAdapter, tmp_path: Path
+    ) -> None:
+        """Live tracking of a fresh file starts at end-of-file without scanning it."""
+        session_file = tmp_path / "live.jsonl"
+        self._append(session_file, [make_turn_context_event(), make_token_count_event()])
+
+        adapter._init_file_position(session_file)
+        assert adapter._from_start is False
+        assert adapter._tail is not None
+        assert adapter._tail.offset == session_file.stat().st_size
+
+        adapter._last_file_mtime = 0.0
+        adapter._process_session_file(session_file)
+        assert adapter._processed_lines == 0
+
+    def test_init_file_position_stale_file_reads_from_start(
+        self, adapter: CodexCLIAdapter, tmp_path: Path
+    ) -> None:
+        """A stale file with data auto-enables from_start."""
+        session_file = tmp_path / "old.jsonl"
+        self._append(session_file, [make_turn_context_event()])
+        old = time.time() - 60
+        os.utime(session_file, (old, old))
+
+        adapter._init_file_position(session_file)
+        assert adapter._from_start is True
+        assert adapter._tail is None
+
 
 # ============================================================================
 # Platform Metadata Tests
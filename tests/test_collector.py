@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+"""
+Tests for the multi-source collector (collect --multi).
+
+Tests:
+1. Claude Code, Codex CLI and Gemini CLI sources tracked from one watcher
+2. Content written before start-up skipped; new files read from the start
+3. Directories created after start-up picked up by the rescan
+4. Idle and max_sources eviction saving sessions and resuming at the saved position
+"""
+
+import json
+import tempfile
+import time
+from datetime import date, datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Generator, List
+
+import pytest
+
+from token_audit import collector as collector_module
+from token_audit.collector import MultiCollector
+from token_audit.storage import StorageManager
+
+USAGE = {
+    "input_tokens": 100,
+    "output_tokens": 50,
+    "cache_creation_input_tokens": 1000,
+    "cache_read_input_tokens": 500,
+}
+EVENT_TOKENS = 1650
+
+
+def claude_line(cwd: str = "/home/dev/alpha") -> str:
+    """One usage-bearing Claude Code transcript line."""
+    event = {
+        "type": "assistant",
+        "cwd": cwd,
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "message": {
+            "model": "claude-opus-4-5-20251101",
+            "content": [{"type": "text", "text": "Hello!"}],
+            "usage": USAGE,
+        },
+    }
+    return json.dumps(event) + "\n"
+
+
+def codex_lines(cwd: str = "/home/dev/gamma") -> str:
+    """A Codex CLI session: metadata, then one token_count event."""
+    usage = {
+        "input_tokens": 300,
+        "cached_input_tokens": 0,
+        "output_tokens": 150,
+        "reasoning_output_tokens": 0,
+        "total_tokens": 450,
+    }
+    events: List[Dict[str, Any]] = [
+        {"type": "session_meta", "payload": {"id": "s", "cwd": cwd, "cli_version": "0.63.0"}},
+        {"type": "turn_context", "payload": {"cwd": cwd, "model": "gpt-5.1"}},
+        {
+            "type": "event_msg",
+            "payload": {
+                "type": "token_count",
+                "info": {"last_token_usage": usage, "total_token_usage": usage},
+            },
+        },
+    ]
+    return "".join(json.dumps(e) + "\n" for e in events)
+
+
+def gemini_message(msg_id: str, timestamp: str, total: int = 100) -> Dict[str, Any]:
+    return {
+        "id": msg_id,
+        "type": "gemini",
+        "content": "Response",
+        "model": "gemini-2.5-pro",
+        "tokens": {"input": total, "output": 0, "cached": 0, "thoughts": 0, "tool": 0},
+        "timestamp": timestamp,
+    }
+
+
+def write_gemini_chat(path: Path, messages: List[Dict[str, Any]]) -> None:
+    chat = {
+        "sessionId": "gemini-session",
+        "projectHash": path.parent.parent.name,
+        "startTime": "2025-11-07T05:10:41.717Z",
+        "lastUpdated": "2025-11-07T05:15:00.000Z",
+        "messages": messages,
+    }
+    path.write_text(json.dumps(chat, indent=2))
+
+
+@pytest.fixture
+def home() -> Generator[Path, None, None]:
+    """Temporary home with Claude, Codex and Gemini directories."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield Path(tmpdir)
+
+
+@pytest.fixture
+def storage(home: Path) -> StorageManager:
+    return StorageManager(base_dir=home / "sessions")
+
+
+def make_collector(home: Path, storage: StorageManager, **kwargs: Any) -> MultiCollector:
+    return MultiCollector(
+        storage,
+        claude_dir=home / "claude" / "projects",
+        codex_dir=home / "codex",
+        gemini_dir=home / "gemini",
+        **kwargs,
+    )
+
+
+def poll_until(collector: MultiCollector, condition: Callable[[], bool]) -> None:
+    """Poll until ``condition`` holds (watchers may report changes a poll late)."""
+    deadline = time.monotonic() + 5
+    while not condition():
+        assert time.monotonic() < deadline, "collector did not pick up the change"
+        collector.poll(0.1)
+
+
+def saved_sessions(storage: StorageManager, platform: str) -> List[Dict[str, Any]]:
+    return [json.loads(p.read_text()) for p in storage.list_sessions(platform=platform)]
+
+
+class TestClaudeSources:
+    """Test Claude Code transcripts."""
+
+    def test_existing_content_skipped(self, home: Path, storage: StorageManager) -> None:
+        transcript = home / "claude" / "projects" / "-home-dev-alpha" / "aaaaaaaa-1111.jsonl"
+        transcript.parent.mkdir(parents=True)
+        transcript.write_text(claude_line() * 3)
+
+        collector = make_collector(home, storage)
+        collector.start()
+        with open(transcript, "a") as f:
+            f.write(claude_line())
+        poll_until(collector, lambda: collector.active_sources == 1)
+        collector.close()
+
+        sessions = saved_sessions(storage, "claude_code")
+        assert len(sessions) == 1
+        session = sessions[0]["session"]
+        assert session["project"] == "alpha"
+        assert session["source_files"] == [transcript.name]
+        assert sessions[0]["token_usage"]["total_tokens"] == EVENT_TOKENS
+        assert session["id"].endswith("-aaaaaaaa")
+        # Priced from the transcript's model, not only in the live display
+        assert sessions[0]["cost_estimate_usd"] > 0
+        assert sessions[0]["cost_no_cache_usd"] > sessions[0]["cost_estimate_usd"]
+
+        platform_index = storage.load_platform_index("claude_code")
+        assert platform_index is not None
+        assert platform_index.total_sessions == 1
+
+    def test_explicit_project(self, home: Path, storage: StorageManager) -> None:
+        project_dir = home / "claude" / "projects" / "-p"
+        project_dir.mkdir(parents=True)
+
+        collector = make_collector(home, storage, project="fixed")
+        collector.start()
+        (project_dir / "t.jsonl").write_text(claude_line())
+        poll_until(collector, lambda: collector.active_sources == 1)
+        collector.close()
+
+        assert saved_sessions(storage, "claude_code")[0]["session"]["project"] == "fixed"
+
+    def test_new_project_directory(
+        self, home: Path, storage: StorageManager, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(collector_module, "RESCAN_INTERVAL", 0.0)
+        projects = home / "claude" / "projects"
+        (projects / "-existing").mkdir(parents=True)
+
+        collector = make_collector(home, storage)
+        collector.start()
+        (projects / "-home-dev-beta").mkdir()
+        (projects / "-home-dev-beta" / "t.jsonl").write_text(claude_line("/home/dev/beta") * 2)
+        poll_until(collector, lambda: collector.active_sources == 1)
+        collector.close()
+
+        sessions = saved_sessions(storage, "claude_code")
+        assert sessions[0]["session"]["project"] == "beta"
+        assert sessions[0]["token_usage"]["total_tokens"] == 2 * EVENT_TOKENS
+
+    def test_source_without_usage_not_saved(self, home: Path, storage: StorageManager) -> None:
+        project_dir = home / "claude" / "projects" / "-p"
+        project_dir.mkdir(parents=True)
+
+        collector = make_collector(home, storage)
+        collector.start()
+        (project_dir / "t.jsonl").write_text(json.dumps({"type": "summary"}) + "\n")
+        poll_until(collector, lambda: collector.active_sources == 1)
+        collector.close()
+
+        assert collector.stats.sessions_saved == 0
+        assert storage.list_sessions(platform="claude_code") == []
+
+
+class TestOtherPlatforms:
+    """Test Codex CLI and Gemini CLI sources."""
+
+    def test_codex_session_file(self, home: Path, storage: StorageManager) -> None:
+        day_dir = home / "codex" / "sessions" / date.today().strftime("%Y/%m/%d")
+        day_dir.mkdir(parents=True)
+
+        collector = make_collector(home, storage, platforms=["codex-cli"])
+        collector.start()
+        (day_dir / "rollout-abcdef12.jsonl").write_text(codex_lines())
+        poll_until(collector, lambda: collector.active_sources == 1)
+        collector.close()
+
+        sessions = saved_sessions(storage, "codex_cli")
+        assert len(sessions) == 1
+        assert sessions[0]["session"]["project"] == "gamma"
+        assert sessions[0]["token_usage"]["input_tokens"] == 300
+        assert sessions[0]["cost_estimate_usd"] > 0
+
+    def test_gemini_skips_messages_before_start(self, home: Path, storage: StorageManager) -> None:
+        chat = home / "gemini" / "tmp" / ("b" * 64) / "chats" / "session-1.json"
+        chat.parent.mkdir(parents=True)
+        old = gemini_message("old", "2025-11-07T05:11:00.000Z", total=5000)
+        write_gemini_chat(chat, [old])
+
+        collector = make_collector(home, storage, platforms=["gemini-cli"])
+        collector.start()
+        now = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z"
+        write_gemini_chat(chat, [old, gemini_message("new", now, total=100)])
+        poll_until(collector, lambda: collector.active_sources == 1)
+        collector.close()
+
+        sessions = saved_sessions(storage, "gemini_cli")
+        assert len(sessions) == 1
+        assert sessions[0]["token_usage"]["input_tokens"] == 100
+        assert sessions[0]["session"]["project"] == "b" * 12
+
+    def test_one_watcher_for_all_platforms(self, home: Path, storage: StorageManager) -> None:
+        (home / "claude" / "projects" / "-p").mkdir(parents=True)
+        (home / "codex" / "sessions" / date.today().strftime("%Y/%m/%d")).mkdir(parents=True)
+        (home / "gemini" / "tmp" / "h" / "chats").mkdir(parents=True)
+
+        collector = make_collector(home, storage)
+        collector.start()
+
+        assert collector._watcher is not None
+        assert len(collector._watcher.directories) == 3
+        collector.close()
+
+
+class TestEviction:
+    """Test bounded tracker state."""
+
+    def test_idle_source_saved_and_resumed(self, home: Path, storage: StorageManager) -> None:
+        transcript = home / "claude" / "projects" / "-home-dev-alpha" / "t.jsonl"
+        transcript.parent.mkdir(parents=True)
+
+        collector = make_collector(home, storage, idle_timeout=0.0)
+        collector.start()
+        transcript.write_text(claude_line())
+        poll_until(collector, lambda: collector.stats.sessions_saved == 1)
+        assert collector.active_sources == 0
+        assert collector._resume[transcript] == transcript.stat().st_size
+
+        # Only lines after the saved position count towards the next session
+        # (started a second later: session IDs have one-second resolution)
+        time.sleep(1.0)
+        with open(transcript, "a") as f:
+            f.write(claude_line() * 2)
+        poll_until(collector, lambda: collector.stats.sessions_saved == 2)
+        collector.close()
+
+        assert collector.stats.evictions == 2
+        totals = sorted(
+            json.loads(p.read_text())["token_usage"]["total_tokens"]
+            for p in storage.list_sessions(platform="claude_code")
+        )
+        assert totals == [EVENT_TOKENS, 2 * EVENT_TOKENS]
+
+    def test_max_sources_evicts_least_recent(self, home: Path, storage: StorageManager) -> None:
+        project_dir = home / "claude" / "projects" / "-p"
+        project_dir.mkdir(parents=True)
+
+        collector = make_collector(home, storage, max_sources=1)
+        collector.start()
+        first, second = project_dir / "first.jsonl", project_dir / "second.jsonl"
+        first.write_text(claude_line())
+        poll_until(collector, lambda: first in collector._sources)
+        second.write_text(claude_line())
+        poll_until(collector, lambda: second in collector._sources)
+
+        assert collector.active_sources == 1
+        assert collector.stats.evictions == 1
+        assert collector.stats.sessions_saved == 1
+        collector.close()
+        assert collector.stats.sessions_saved == 2
+
+    def test_run_saves_on_stop(self, home: Path, storage: StorageManager) -> None:
+        project_dir = home / "claude" / "projects" / "-p"
+        project_dir.mkdir(parents=True)
+        (project_dir / "t.jsonl").write_text(claude_line())
+
+        collector = make_collector(home, storage)
+        stats = collector.run(duration=0.2)
+
+        assert stats.sources_opened == 0  # Pre-existing content is skipped
+        assert collector._watcher is None
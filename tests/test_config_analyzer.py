@@ -5,6 +5,7 @@ pinned server detection, and the analyze_config MCP tool.
 """
 
 import json
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any, Dict
 
@@ -27,7 +28,6 @@ from token_audit.config_analyzer.analyzer import (
     MANY_SERVER_THRESHOLD,
 )
 
-
 # =============================================================================
 # Fixtures
 # =============================================================================
@@ -594,6 +594,64 @@ class TestPinnedServerDetection:
         names = [p.name for p in pinned]
         assert names.count("another-server") == 1
 
+    def test_detect_pinned_historical_usage(
+        self, sample_claude_config: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test high-usage detection from stored sessions in the window only."""
+        from token_audit.base_tracker import Call, ServerSession, Session, ToolStats
+        from token_audit.config_analyzer.pinned_servers import PinnedServerDetector
+        from token_audit.pinned_config import EffectiveConfig
+        from token_audit.session_manager import SessionManager
+        from token_audit.storage import StorageManager
+
+        storage = StorageManager(base_dir=tmp_path / "sessions")
+        manager = SessionManager(base_dir=storage.get_platform_dir("claude_code"))
+        now = datetime.now(timezone.utc)
+        for days_ago, server, calls in [
+            (1, "zen", 40),
+            (2, "brave-search", 10),
+            (60, "brave-search", 500),
+        ]:
+            session = Session(
+                project="demo", platform="claude-code", timestamp=now - timedelta(days=days_ago)
+            )
+            for name, tool, count in [
+                (server, f"mcp__{server}__search", calls),
+                ("builtin", "Read", 5),
+            ]:
+                stats = ToolStats(calls=count)
+                stats.call_history = [
+                    Call(timestamp=session.timestamp, tool_name=tool, server=name, index=i)
+                    for i in range(count)
+                ]
+                session.server_sessions[name] = ServerSession(
+                    server=name, tools={tool: stats}, total_calls=count
+                )
+            manager.save_session(session, manager.base_dir)
+
+        config = parse_json_config(sample_claude_config, "claude_code")
+        effective = EffectiveConfig(
+            auto_detect_local=False, explicit_servers=[], high_usage_threshold=0.5, exclusions=[]
+        )
+        detector = PinnedServerDetector(base_dir=storage.base_dir)
+
+        loaded: list = []
+        original = SessionManager.load_session
+
+        def spy(self: SessionManager, session_path: Path, lazy: bool = False) -> Any:
+            loaded.append(session_path)
+            return original(self, session_path, lazy=lazy)
+
+        monkeypatch.setattr(SessionManager, "load_session", spy)
+
+        pinned = detector.detect(config, effective, platform="claude_code", days=30)
+        assert [(p.name, p.token_share) for p in pinned] == [("zen", 0.8)]
+        assert len(loaded) == 2  # The 60-day-old session is outside the window
+
+        loaded.clear()
+        assert detector._load_historical_usage("claude-code") == {"zen": 40, "brave-search": 10}
+        assert loaded == []  # Read from the rollups
+
     def test_detect_pinned_empty_config(self, tmp_path: Path) -> None:
         """Test pinned detection with empty config."""
         config_file = tmp_path / ".mcp.json"
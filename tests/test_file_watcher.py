@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Tests for the file watcher module.
+
+Tests the watcher backends' ability to:
+1. Report newly created files
+2. Report appended files and ignore untouched ones
+3. Filter by suffix
+4. Fall back to polling when inotify is unavailable
+5. Watch further directories, each with its own suffix
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+from typing import Generator
+
+import pytest
+
+from token_audit.file_watcher import (
+    InotifyWatcher,
+    PollingWatcher,
+    create_watcher,
+)
+
+requires_linux = pytest.mark.skipif(
+    not sys.platform.startswith("linux"), reason="inotify is Linux-only"
+)
+
+
+@pytest.fixture
+def watch_dir() -> Generator[Path, None, None]:
+    """Create a temporary directory to watch."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield Path(tmpdir)
+
+
+class TestPollingWatcher:
+    """Test the portable polling backend."""
+
+    def test_no_changes_returns_empty(self, watch_dir: Path) -> None:
+        """Untouched files are not reported."""
+        (watch_dir / "a.jsonl").write_text("{}\n")
+        watcher = PollingWatcher(watch_dir, interval=0.01)
+        assert watcher.wait(timeout=0.05) == set()
+
+    def test_reports_appended_file_only(self, watch_dir: Path) -> None:
+        """Only the file that grew is reported."""
+        a = watch_dir / "a.jsonl"
+        b = watch_dir / "b.jsonl"
+        a.write_text("{}\n")
+        b.write_text("{}\n")
+        watcher = PollingWatcher(watch_dir, interval=0.01)
+
+        with open(a, "a") as f:
+            f.write('{"more": 1}\n')
+
+        assert watcher.wait(timeout=0.5) == {a}
+        # Change is consumed
+        assert watcher.wait(timeout=0.05) == set()
+
+    def test_reports_new_file_and_filters_suffix(self, watch_dir: Path) -> None:
+        """New matching files are reported, other suffixes are ignored."""
+        watcher = PollingWatcher(watch_dir, interval=0.01)
+        (watch_dir / "notes.txt").write_text("ignored")
+        new_file = watch_dir / "new.jsonl"
+        new_file.write_text("")
+
+        assert watcher.wait(timeout=0.5) == {new_file}
+
+    def test_missing_directory(self, watch_dir: Path) -> None:
+        """A missing directory yields no changes instead of raising."""
+        watcher = PollingWatcher(watch_dir / "missing", interval=0.01)
+        assert watcher.wait(timeout=0.02) == set()
+        assert watcher.list_files() == []
+
+    def test_add_directory_with_own_suffix(self, watch_dir: Path) -> None:
+        """Added directories are watched for their own suffix; existing files are baseline."""
+        other = watch_dir / "chats"
+        other.mkdir()
+        existing = other / "old.json"
+        existing.write_text("{}")
+        watcher = PollingWatcher(watch_dir, interval=0.01)
+        assert watcher.add_directory(other, ".json")
+
+        new_file = other / "new.json"
+        new_file.write_text("{}")
+        (other / "ignored.jsonl").write_text("")
+
+        assert watcher.wait(timeout=0.5) == {new_file}
+        assert sorted(watcher.list_files()) == [new_file, existing]
+
+
+@requires_linux
+class TestInotifyWatcher:
+    """Test the Linux inotify backend."""
+
+    def test_reports_appended_file(self, watch_dir: Path) -> None:
+        """Appending to a file wakes the watcher for that file only."""
+        a = watch_dir / "a.jsonl"
+        a.write_text("")
+        (watch_dir / "b.jsonl").write_text("")
+
+        with InotifyWatcher(watch_dir) as watcher:
+            with open(a, "a") as f:
+                f.write("{}\n")
+            assert watcher.wait(timeout=1.0) == {a}
+            assert watcher.wait(timeout=0.05) == set()
+
+    def test_reports_created_file(self, watch_dir: Path) -> None:
+        """Creating a file is reported, other suffixes are ignored."""
+        with InotifyWatcher(watch_dir) as watcher:
+            (watch_dir / "other.log").write_text("x")
+            new_file = watch_dir / "new.jsonl"
+            new_file.write_text("")
+            assert watcher.wait(timeout=1.0) == {new_file}
+
+    def test_missing_directory_raises(self, watch_dir: Path) -> None:
+        """Watching a missing directory raises OSError."""
+        with pytest.raises(OSError):
+            InotifyWatcher(watch_dir / "missing")
+
+    def test_add_directory(self, watch_dir: Path) -> None:
+        """One inotify instance reports changes across directories."""
+        first = watch_dir / "a"
+        second = watch_dir / "b"
+        first.mkdir()
+        second.mkdir()
+
+        with InotifyWatcher(first) as watcher:
+            assert watcher.add_directory(second, ".json")
+            assert not watcher.add_directory(watch_dir / "missing")
+            a = first / "t.jsonl"
+            b = second / "chat.json"
+            a.write_text("{}\n")
+            b.write_text("{}")
+            (second / "t.jsonl").write_text("")
+
+            changed = watcher.wait(timeout=1.0)
+            changed |= watcher.wait(timeout=0.05)
+            assert changed == {a, b}
+
+
+class TestCreateWatcher:
+    """Test backend selection."""
+
+    @requires_linux
+    def test_prefers_inotify_on_linux(self, watch_dir: Path) -> None:
+        watcher = create_watcher(watch_dir)
+        try:
+            assert watcher.backend == "inotify"
+        finally:
+            watcher.close()
+
+    def test_falls_back_for_missing_directory(self, watch_dir: Path) -> None:
+        watcher = create_watcher(watch_dir / "missing")
+        assert watcher.backend == "polling"
+
+    def test_env_var_forces_polling(self, watch_dir: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("TOKEN_AUDIT_WATCHER", "polling")
+        watcher = create_watcher(watch_dir)
+        assert watcher.backend == "polling"
+
+    def test_prefer_native_false(self, watch_dir: Path) -> None:
+        watcher = create_watcher(watch_dir, prefer_native=False)
+        assert watcher.backend == "polling"
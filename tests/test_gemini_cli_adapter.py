@@ -12,6 +12,7 @@ from pathlib import Path
 from typing import Any, Dict
 
 from token_audit.gemini_cli_adapter import (
+    GeminiChatReader,
     GeminiCLIAdapter,
     GeminiMessage,
     GeminiSession,
@@ -907,6 +908,215 @@ class TestBatchProcessing:
 
         assert adapter.detected_model == "gemini-2.5-pro"
 
+    def test_batch_estimates_tool_calls_in_one_pass(
+        self,
+        tmp_path: Path,
+        sample_session_data: Dict[str, Any],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """All tool calls are estimated in one batch, with per-call results."""
+        tool_message = sample_session_data["messages"][2]
+        tool_message["toolCalls"].append(
+            {"id": "call-2", "name": "read_file", "args": {"path": "/a.py"}, "result": "x = 1"}
+        )
+        tool_message["toolCalls"].append({"id": "call-3", "name": "unknown_tool", "args": {}})
+        session_file = tmp_path / "session.json"
+        session_file.write_text(json.dumps(sample_session_data))
+
+        adapter = GeminiCLIAdapter(project="test", gemini_dir=tmp_path)
+        estimator = adapter._token_estimator
+        batches = []
+        estimate_batch = estimator.estimate_tool_calls_batch
+        monkeypatch.setattr(
+            estimator,
+            "estimate_tool_calls_batch",
+            lambda calls: batches.append(list(calls)) or estimate_batch(calls),
+        )
+        monkeypatch.setattr(
+            estimator,
+            "estimate_tool_call",
+            lambda *args: pytest.fail("per-call estimation in batch mode"),
+        )
+        adapter.process_session_file_batch(session_file)
+
+        assert batches == [[('{"prompt":"test"}', "Result"), ('{"path":"/a.py"}', "x = 1")]]
+        assert adapter._batch_estimates == {}
+        assert adapter._estimated_tool_calls == 2
+        mcp_call = adapter.server_sessions["zen"].tools["mcp__zen__chat"].call_history[0]
+        expected = estimate_batch(batches[0])
+        assert (mcp_call.input_tokens, mcp_call.output_tokens) == expected[0]
+        read_stats = adapter.session.builtin_tool_stats["read_file"]
+        assert read_stats["tokens"] == sum(expected[1])
+
+
+# ============================================================================
+# Incremental Ingestion Tests
+# ============================================================================
+
+
+def make_gemini_message(msg_id: str, total: int = 100) -> Dict[str, Any]:
+    """Create a gemini message with token data."""
+    return {
+        "id": msg_id,
+        "type": "gemini",
+        "content": "Response with unicode \u2713",
+        "model": "gemini-2.5-pro",
+        "tokens": {
+            "input": total,
+            "output": 0,
+            "cached": 0,
+            "thoughts": 0,
+            "tool": 0,
+            "total": total,
+        },
+        "timestamp": "2025-11-07T05:11:00.000Z",
+    }
+
+
+def rewrite_session(path: Path, data: Dict[str, Any]) -> None:
+    """Rewrite the whole file the way Gemini CLI does (pretty-printed)."""
+    path.write_text(json.dumps(data, indent=2, ensure_ascii=False))
+
+
+class TestGeminiChatReader:
+    """Tests for incremental chat-file ingestion."""
+
+    def test_first_read_is_full_parse(
+        self, sample_session_file: Path, sample_session_data: Dict[str, Any]
+    ) -> None:
+        """The first read parses the whole file and primes the offset."""
+        reader = GeminiChatReader(sample_session_file)
+        messages = reader.read_new_messages()
+
+        assert [m["id"] for m in messages] == ["msg-001", "msg-002", "msg-003"]
+        assert reader.full_parses == 1
+        assert reader.message_count == 3
+        assert reader.offset > 0
+
+    def test_appended_messages_read_incrementally(
+        self, sample_session_file: Path, sample_session_data: Dict[str, Any]
+    ) -> None:
+        """Messages appended by a whole-file rewrite are decoded from the tail only."""
+        rewrite_session(sample_session_file, sample_session_data)
+        reader = GeminiChatReader(sample_session_file)
+        reader.read_new_messages()
+
+        sample_session_data["lastUpdated"] = "2025-11-07T05:16:00.000Z"
+        sample_session_data["messages"].append(make_gemini_message("msg-004"))
+        sample_session_data["messages"].append(make_gemini_message("msg-005"))
+        rewrite_session(sample_session_file, sample_session_data)
+
+        messages = reader.read_new_messages()
+        assert [m["id"] for m in messages] == ["msg-004", "msg-005"]
+        assert reader.full_parses == 1
+        assert reader.incremental_reads == 1
+        assert reader.message_count == 5
+
+        # Nothing new
+        assert reader.read_new_messages() == []
+
+    def test_partial_write_waits_for_complete_message(
+        self, sample_session_file: Path, sample_session_data: Dict[str, Any]
+    ) -> None:
+        """A half-written message is not returned until it is complete."""
+        rewrite_session(sample_session_file, sample_session_data)
+        reader = GeminiChatReader(sample_session_file)
+        reader.read_new_messages()
+
+        sample_session_data["messages"].append(make_gemini_message("msg-004"))
+        full_text = json.dumps(sample_session_data, indent=2, ensure_ascii=False)
+        cut = full_text.index('"msg-004"') + 20
+        sample_session_file.write_text(full_text[:cut])
+
+        assert reader.read_new_messages() == []
+
+        sample_session_file.write_text(full_text)
+        assert [m["id"] for m in reader.read_new_messages()] == ["msg-004"]
+
+    def test_rewritten_history_falls_back_to_full_parse(
+        self, sample_session_file: Path, sample_session_data: Dict[str, Any]
+    ) -> None:
+        """Changes before the saved offset trigger a full parse."""
+        rewrite_session(sample_session_file, sample_session_data)
+        reader = GeminiChatReader(sample_session_file)
+        reader.read_new_messages()
+
+        # Edit the last message in place (shifts the bytes before the offset)
+        sample_session_data["messages"][-1]["content"] = "Edited response"
+        sample_session_data["messages"].append(make_gemini_message("msg-004"))
+        rewrite_session(sample_session_file, sample_session_data)
+
+        messages = reader.read_new_messages()
+        assert reader.full_parses == 2
+        assert [m["id"] for m in messages][-1] == "msg-004"
+        assert len(messages) == 4
+
+    def test_messages_key_not_last(self, tmp_path: Path) -> None:
+        """Top-level keys after the messages array do not break tail reads."""
+        chat = tmp_path / "chat.json"
+        data: Dict[str, Any] = {"messages": [make_gemini_message("a")], "trailer": {"x": [1]}}
+        rewrite_session(chat, data)
+        reader = GeminiChatReader(chat)
+        assert [m["id"] for m in reader.read_new_messages()] == ["a"]
+
+        data["messages"].append(make_gemini_message("b"))
+        rewrite_session(chat, data)
+        assert [m["id"] for m in reader.read_new_messages()] == ["b"]
+        assert reader.incremental_reads == 1
+
+    def test_invalid_file_raises(self, tmp_path: Path) -> None:
+        """A file that is not a chat JSON object raises ValueError."""
+        chat = tmp_path / "chat.json"
+        chat.write_text("[1, 2, 3]")
+        with pytest.raises(ValueError):
+            GeminiChatReader(chat).read_new_messages()
+
+
+class TestIncrementalSessionFileProcessing:
+    """Tests for live processing through the incremental reader."""
+
+    def test_live_tracking_processes_only_new_messages(
+        self,
+        adapter: GeminiCLIAdapter,
+        sample_session_file: Path,
+        sample_session_data: Dict[str, Any],
+    ) -> None:
+        """Live tracking skips existing messages and counts only appended ones."""
+        rewrite_session(sample_session_file, sample_session_data)
+        adapter._skip_existing_messages(sample_session_file)
+        assert adapter._processed_message_ids == {"msg-001", "msg-002", "msg-003"}
+
+        sample_session_data["messages"].append(make_gemini_message("msg-004", total=700))
+        rewrite_session(sample_session_file, sample_session_data)
+        adapter._process_session_file(sample_session_file)
+
+        assert adapter.session.message_count == 1
+        assert adapter._native_total_tokens == 700
+        assert adapter._chat_reader is not None
+        assert adapter._chat_reader.full_parses == 1
+
+    def test_from_start_matches_batch_processing(
+        self, adapter: GeminiCLIAdapter, sample_session_file: Path
+    ) -> None:
+        """Processing from start counts every message once."""
+        adapter._process_session_file(sample_session_file)
+        assert adapter.session.message_count == 2
+        assert "msg-003" in adapter._processed_message_ids
+
+    def test_switching_files_resets_reader(
+        self, adapter: GeminiCLIAdapter, sample_session_file: Path, tmp_path: Path
+    ) -> None:
+        """A different session file gets a fresh reader."""
+        adapter._process_session_file(sample_session_file)
+        first_reader = adapter._chat_reader
+
+        other = tmp_path / "session-other.json"
+        rewrite_session(other, make_sample_session(include_mcp_tools=False))
+        adapter._process_session_file(other)
+        assert adapter._chat_reader is not first_reader
+        assert adapter._chat_reader is not None
+        assert adapter._chat_reader.file_path == other
+
 
 # ============================================================================
 # Platform Metadata Tests
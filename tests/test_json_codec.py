@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Tests for the json_codec module.
+
+Both backends (orjson when installed, stdlib always) must:
+1. Round-trip documents from str and bytes
+2. Raise json.JSONDecodeError on invalid input
+3. Apply ``default`` to datetimes instead of native serialization
+4. Accept what the stdlib accepts (NaN, big ints)
+"""
+
+import io
+import json
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Generator
+
+import pytest
+
+from token_audit import json_codec
+
+BACKENDS = ["stdlib"] + (["orjson"] if json_codec._HAS_ORJSON else [])
+
+
+@pytest.fixture(params=BACKENDS)
+def backend(request: pytest.FixtureRequest) -> Generator[str, None, None]:
+    """Run a test against each available backend."""
+    original = json_codec._USE_ORJSON
+    json_codec._USE_ORJSON = request.param == "orjson"
+    yield request.param
+    json_codec._USE_ORJSON = original
+
+
+@dataclass
+class _Point:
+    x: int
+
+
+class TestDecode:
+    """Test loads/load."""
+
+    def test_str_and_bytes(self, backend: str) -> None:
+        doc = {"type": "assistant", "usage": {"input_tokens": 5}, "text": "héllo"}
+        encoded = json.dumps(doc)
+        assert json_codec.loads(encoded) == doc
+        assert json_codec.loads(encoded.encode("utf-8")) == doc
+
+    def test_invalid_raises_stdlib_error(self, backend: str) -> None:
+        with pytest.raises(json.JSONDecodeError, match="Expecting value"):
+            json_codec.loads("not json")
+
+    def test_invalid_utf8_bytes(self, backend: str) -> None:
+        """Undecodable bytes are replaced rather than raising UnicodeDecodeError."""
+        assert json_codec.loads(b'{"a": "\xff"}') == {"a": "�"}
+
+    def test_nan_accepted(self, backend: str) -> None:
+        result = json_codec.loads('{"a": NaN}')
+        assert result["a"] != result["a"]
+
+    def test_load_binary_file(self, backend: str) -> None:
+        assert json_codec.load(io.BytesIO(b'{"a": [1, 2]}')) == {"a": [1, 2]}
+
+
+class TestEncode:
+    """Test dumps/dumps_bytes/dump."""
+
+    def test_round_trip_indent(self, backend: str) -> None:
+        doc = {"b": [1, {"c": None}], "a": "é"}
+        text = json_codec.dumps(doc, indent=True)
+        assert text.startswith("{\n  ")
+        assert json.loads(text) == doc
+        assert "é" in text  # UTF-8, not \\u escapes
+
+    def test_sort_keys(self, backend: str) -> None:
+        assert json.loads(json_codec.dumps({"b": 1, "a": 2}, sort_keys=True)) == {"a": 2, "b": 1}
+        assert json_codec.dumps({"b": 1, "a": 2}, sort_keys=True).index('"a"') < 5
+
+    def test_default_applies_to_datetime_and_dataclass(self, backend: str) -> None:
+        when = datetime(2025, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+        result = json.loads(json_codec.dumps({"when": when, "p": _Point(1)}, default=str))
+        assert result == {"when": str(when), "p": str(_Point(1))}
+
+    def test_unserializable_without_default(self, backend: str) -> None:
+        with pytest.raises(TypeError):
+            json_codec.dumps({"when": datetime.now()})
+
+    def test_non_str_keys_and_big_ints(self, backend: str) -> None:
+        assert json.loads(json_codec.dumps({1: 2**70})) == {"1": 2**70}
+
+    def test_dump_to_binary_file(self, backend: str) -> None:
+        buf = io.BytesIO()
+        json_codec.dump({"a": 1}, buf, indent=True)
+        assert json.loads(buf.getvalue()) == {"a": 1}
+
+
+def test_backend_name() -> None:
+    assert json_codec.BACKEND in ("orjson", "json")
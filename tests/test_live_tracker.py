@@ -788,3 +788,19 @@ class TestIntegration:
         # Verify schema version
         assert data["_file"]["schema_version"] == SCHEMA_VERSION
         assert data["_file"]["source"] == "token-audit-server"
+
+    def test_buffered_storage(self, tmp_path: Path) -> None:
+        """Test a full session through the buffered writer."""
+        storage = StreamingStorage(base_dir=tmp_path, buffered=True)
+        tracker = LiveTracker(storage=storage)
+
+        tracker.start_session(platform="claude_code")
+        for i in range(50):
+            tracker.record_tool_call(tool="Read", server="builtin", tokens_in=i)
+        stopped = tracker.stop_session()
+        storage.close()
+
+        with open(stopped.file_path) as f:
+            data = json.load(f)
+        assert len(data["events"]) == 52  # start + 50 tools + end
+        assert [e["tokens_in"] for e in data["events"][1:-1]] == list(range(50))
@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+Tests for the compact session file format.
+
+Tests:
+1. tool_calls packed as positional rows and restored exactly
+2. Compressed files detected from their leading bytes; corrupt files rejected
+3. SessionManager, StorageManager, peek_session_header, the catalog and the
+   sessions commands reading compact files written through
+   TOKEN_AUDIT_SESSION_FORMAT=compact
+4. Converting existing history (storage compact) and back
+"""
+
+import argparse
+import gzip
+import json
+import os
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Callable, Dict
+
+import pytest
+
+from token_audit import session_format
+from token_audit.base_tracker import Call, ServerSession, Session, TokenUsage, ToolStats
+from token_audit.session_format import (
+    COMPACT_KEY,
+    SESSION_FORMAT_ENV_VAR,
+    decode_session,
+    encode_session,
+    file_is_compact,
+    pack_session,
+    read_session_file,
+    read_session_prefix,
+)
+from token_audit.session_manager import SessionManager
+from token_audit.storage import StorageManager
+
+DAY = date(2025, 1, 15)
+
+
+@pytest.fixture
+def compact(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv(SESSION_FORMAT_ENV_VAR, "compact")
+
+
+class TestEncoding:
+    """Test packing and compression."""
+
+    def test_round_trip(self, make_session_data: Callable[..., Dict[str, Any]]) -> None:
+        data = make_session_data()
+        encoded = encode_session(data, compact=True)
+
+        assert decode_session(encoded) == data
+        assert list(decode_session(encoded)) == list(data)  # Key order (header first)
+        assert len(encoded) < len(encode_session(data, compact=False))
+
+    def test_rows_share_shapes(self, make_session_data: Callable[..., Dict[str, Any]]) -> None:
+        packed = pack_session(make_session_data(calls=4))
+
+        assert len(packed["tool_calls"]["shapes"]) == 2
+        assert packed["tool_calls"]["rows"][1][0] == 1
+        assert packed[COMPACT_KEY] == {"version": 1}
+
+    def test_default_follows_env(
+        self, monkeypatch: pytest.MonkeyPatch, make_session_data: Callable[..., Dict[str, Any]]
+    ) -> None:
+        assert encode_session(make_session_data()).startswith(b"{")
+        monkeypatch.setenv(SESSION_FORMAT_ENV_VAR, "compact")
+        assert encode_session(make_session_data()).startswith(session_format.GZIP_MAGIC) or (
+            encode_session(make_session_data()).startswith(session_format.ZSTD_MAGIC)
+        )
+
+    def test_non_dict_calls_left_alone(self) -> None:
+        data = {"_file": {}, "tool_calls": ["odd"]}
+        assert decode_session(encode_session(data, compact=True)) == data
+
+    def test_datetimes_serialized_with_default(self) -> None:
+        data = {"_file": {}, "generated": datetime(2025, 11, 24)}
+        assert decode_session(encode_session(data, compact=True))["generated"] == str(
+            datetime(2025, 11, 24)
+        )
+
+
+class TestDecoding:
+    """Test reading files in either format."""
+
+    def test_plain_json_unchanged(
+        self, tmp_path: Path, make_session_data: Callable[..., Dict[str, Any]]
+    ) -> None:
+        path = tmp_path / "s.json"
+        path.write_text(json.dumps(make_session_data()))
+
+        assert read_session_file(path) == make_session_data()
+        assert not file_is_compact(path)
+
+    def test_prefix_of_compact_file(
+        self, tmp_path: Path, make_session_data: Callable[..., Dict[str, Any]]
+    ) -> None:
+        path = tmp_path / "s.json"
+        path.write_bytes(encode_session(make_session_data(calls=500), compact=True))
+
+        prefix = read_session_prefix(path, 64)
+        assert len(prefix) == 64
+        assert prefix.startswith(b'{"_file"')
+        assert file_is_compact(path)
+
+    def test_corrupt_compressed_file(self) -> None:
+        with pytest.raises(json.JSONDecodeError):
+            decode_session(gzip.compress(b"{}")[:-6])
+
+    def test_gzip_readable_without_zstd(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        make_session_data: Callable[..., Dict[str, Any]],
+    ) -> None:
+        raw = json.dumps(pack_session(make_session_data())).encode()
+        path = tmp_path / "s.json"
+        path.write_bytes(session_format.compress(raw, "gzip"))
+        monkeypatch.setattr(session_format, "_HAS_ZSTD", False)
+
+        assert read_session_file(path) == make_session_data()
+
+
+class TestTransparentReads:
+    """Test the session readers on compact files."""
+
+    def test_session_manager_round_trip(self, tmp_path: Path, compact: None) -> None:
+        session = Session(
+            project="demo",
+            platform="claude-code",
+            timestamp=datetime(2025, 11, 24, 10, 30, 0),
+            token_usage=TokenUsage(input_tokens=100, output_tokens=50, total_tokens=150),
+        )
+        server = ServerSession(server="zen", total_calls=1, total_tokens=150)
+        server.tools["mcp__zen__chat"] = ToolStats(
+            calls=1,
+            total_tokens=150,
+            call_history=[
+                Call(tool_name="mcp__zen__chat", server="zen", index=1, total_tokens=150)
+            ],
+        )
+        session.server_sessions["zen"] = server
+
+        manager = SessionManager(base_dir=tmp_path)
+        path = manager.save_session(session, tmp_path)["session"]
+
+        assert file_is_compact(path)
+        loaded = manager.load_session(path)
+        assert loaded is not None
+        assert loaded.token_usage.total_tokens == 150
+        assert "mcp__zen__chat" in loaded.server_sessions["zen"].tools
+        assert manager.list_sessions() == [path]
+
+    def test_storage_manager_readers(
+        self,
+        storage: StorageManager,
+        compact: None,
+        make_session_data: Callable[..., Dict[str, Any]],
+    ) -> None:
+        path = storage.write_session_file("claude_code", DAY, "demo.json", make_session_data())
+
+        assert file_is_compact(path)
+        header = storage.peek_session_header(path)
+        assert header is not None
+        assert header["schema_version"] == "1.7.0"
+        assert storage.rebuild_catalog() == 1  # Row built from the file on disk
+        (index,) = storage.list_sessions_in_range("claude_code", DAY, DAY)
+        assert index.total_tokens == 1000
+        assert index.file_size_bytes == path.stat().st_size
+
+    def test_sessions_commands(
+        self,
+        storage: StorageManager,
+        compact: None,
+        monkeypatch: pytest.MonkeyPatch,
+        capsys: pytest.CaptureFixture[str],
+        make_session_data: Callable[..., Dict[str, Any]],
+    ) -> None:
+        from token_audit import cli
+
+        path = storage.write_session_file("claude_code", DAY, "demo.json", make_session_data())
+        assert file_is_compact(path)
+        monkeypatch.setenv("TOKEN_AUDIT_STORAGE_DIR", str(storage.base_dir))
+
+        args = argparse.Namespace(sessions_command="show", session_id="demo", json=True)
+        assert cli.cmd_sessions(args) == 0
+        shown = json.loads(capsys.readouterr().out)
+        assert shown["data"] == make_session_data()
+
+        args = argparse.Namespace(
+            sessions_command="list", platform=None, all=True, json=True, verbose=True
+        )
+        assert cli.cmd_sessions(args) == 0
+        (listed,) = json.loads(capsys.readouterr().out)["sessions"]
+        assert "parse_error" not in listed
+        assert listed["project"] == "alpha"
+        assert listed["total_tokens"] == 1000
+
+
+class TestConversion:
+    """Test converting stored sessions."""
+
+    def test_compact_and_expand(
+        self, storage: StorageManager, make_session_data: Callable[..., Dict[str, Any]]
+    ) -> None:
+        path = storage.write_session_file(
+            "claude_code", DAY, "demo.json", make_session_data(calls=200)
+        )
+        storage.create_session_file("claude_code", "events", DAY)
+        os.utime(path, ns=(1_000_000_000, 1_000_000_000))
+        original_size = path.stat().st_size
+
+        result = storage.convert_session_files()
+
+        assert result.converted == 1
+        assert result.bytes_before == original_size
+        assert result.bytes_after == path.stat().st_size < original_size
+        assert path.stat().st_mtime_ns == 1_000_000_000
+        assert read_session_file(path) == make_session_data(calls=200)
+        assert storage.get_storage_stats()["total_size_bytes"] == path.stat().st_size
+
+        assert storage.convert_session_files().already_converted == 1
+        assert storage.convert_session_files(compact=False).converted == 1
+        assert not file_is_compact(path)
+        assert json.loads(path.read_text()) == make_session_data(calls=200)
+
+    def test_dry_run(
+        self, storage: StorageManager, make_session_data: Callable[..., Dict[str, Any]]
+    ) -> None:
+        path = storage.write_session_file("claude_code", DAY, "demo.json", make_session_data())
+
+        result = storage.convert_session_files(dry_run=True)
+
+        assert result.converted == 1
+        assert result.bytes_after < result.bytes_before
+        assert not file_is_compact(path)
+
+    def test_storage_compact_command(
+        self,
+        storage: StorageManager,
+        monkeypatch: pytest.MonkeyPatch,
+        capsys: pytest.CaptureFixture[str],
+        make_session_data: Callable[..., Dict[str, Any]],
+    ) -> None:
+        from token_audit import cli
+
+        storage.write_session_file("claude_code", DAY, "demo.json", make_session_data())
+        monkeypatch.setenv("TOKEN_AUDIT_STORAGE_DIR", str(storage.base_dir))
+
+        args = argparse.Namespace(
+            storage_command="compact", platform=None, expand=False, dry_run=False
+        )
+        assert cli.cmd_storage(args) == 0
+
+        out = capsys.readouterr().out
+        assert "Converted 1 session files to compact format" in out
+        assert "smaller" in out
+        assert "Load time" in out
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Tests for parallel session loading.
+
+Tests:
+1. load_sessions() results in path order, in-process and across workers
+2. Unreadable sessions mapped to None in place
+3. aggregate_daily() and SmellAggregator giving the same results for any jobs
+4. ``--jobs`` validation in the daily and report commands
+"""
+
+import argparse
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Callable, List
+
+import pytest
+
+from token_audit import session_loader
+from token_audit.aggregation import ROLLUP_ENV_VAR, aggregate_daily
+from token_audit.base_tracker import Session, Smell, TokenUsage
+from token_audit.session_loader import full_session, load_sessions
+from token_audit.session_manager import SessionManager
+from token_audit.smell_aggregator import SmellAggregator
+from token_audit.storage import StorageManager
+
+NOW = datetime.now(timezone.utc).replace(microsecond=0)
+
+
+def session_tokens(session: Session) -> int:
+    return session.token_usage.total_tokens
+
+
+@pytest.fixture
+def session_paths(storage: StorageManager, make_session: Callable[..., Session]) -> List[Path]:
+    """40 sessions an hour apart, with a smell on every third one."""
+    manager = SessionManager(base_dir=storage.get_platform_dir("claude_code"))
+    paths = []
+    for i in range(40):
+        session = make_session(NOW - timedelta(hours=i), project=f"project-{i % 3}", calls=0)
+        session.token_usage = TokenUsage(
+            input_tokens=100 * i, output_tokens=10, total_tokens=100 * i + 10
+        )
+        session.cost_estimate = 0.001 * i
+        if i % 3 == 0:
+            session.smells = [Smell(pattern="CHATTY", severity="warning", tool=f"tool{i % 2}")]
+        paths.append(manager.save_session(session, manager.base_dir)["session"])
+    return paths
+
+
+@pytest.fixture
+def parallel(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Use workers whatever the number of sessions."""
+    monkeypatch.setattr(session_loader, "MIN_PARALLEL_SESSIONS", 1)
+
+
+class TestLoadSessions:
+    """Test load_sessions()."""
+
+    @pytest.mark.parametrize("jobs", [1, 2])
+    def test_results_in_path_order(
+        self, parallel: None, storage: StorageManager, session_paths: List[Path], jobs: int
+    ) -> None:
+        results = load_sessions(session_paths, session_tokens, storage.base_dir, jobs=jobs)
+
+        assert results == [100 * i + 10 for i in range(40)]
+
+    def test_unreadable_sessions_are_none(
+        self, parallel: None, storage: StorageManager, session_paths: List[Path]
+    ) -> None:
+        session_paths[1].write_text("{not json")
+        paths = session_paths[:3] + [session_paths[0].with_name("missing.json")]
+
+        results = load_sessions(paths, session_tokens, storage.base_dir, jobs=2)
+
+        assert results == [10, None, 210, None]
+
+    def test_full_sessions(
+        self, parallel: None, storage: StorageManager, session_paths: List[Path]
+    ) -> None:
+        manager = SessionManager(base_dir=storage.base_dir)
+        expected = [manager.load_session(p).to_dict() for p in session_paths[:4]]  # type: ignore[union-attr]
+
+        results = load_sessions(
+            session_paths[:4], full_session, storage.base_dir, jobs=2, lazy=False
+        )
+
+        assert [s.to_dict() for s in results] == expected
+
+
+class TestParallelQueries:
+    """Test queries giving the same results for any number of workers."""
+
+    def test_aggregate_daily(
+        self,
+        parallel: None,
+        storage: StorageManager,
+        session_paths: List[Path],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setenv(ROLLUP_ENV_VAR, "off")
+        start = NOW.date() - timedelta(days=3)
+
+        serial = aggregate_daily("claude_code", start, NOW.date(), True, storage, jobs=1)
+        workers = aggregate_daily("claude_code", start, NOW.date(), True, storage, jobs=4)
+
+        assert [d.to_dict() for d in workers] == [d.to_dict() for d in serial]
+        assert sum(d.session_count for d in workers) == 40
+
+    def test_aggregate_daily_rollups(
+        self, parallel: None, storage: StorageManager, session_paths: List[Path]
+    ) -> None:
+        start = NOW.date() - timedelta(days=3)
+
+        cold = aggregate_daily("claude_code", start, NOW.date(), storage=storage, jobs=2)
+        warm = aggregate_daily("claude_code", start, NOW.date(), storage=storage, jobs=2)
+
+        assert [d.to_dict() for d in warm] == [d.to_dict() for d in cold]
+        assert sum(d.total_tokens for d in cold) == sum(100 * i + 10 for i in range(40))
+
+    def test_smell_aggregator(
+        self, parallel: None, storage: StorageManager, session_paths: List[Path]
+    ) -> None:
+        serial = SmellAggregator(base_dir=storage.base_dir, jobs=1).aggregate(days=7)
+        workers = SmellAggregator(base_dir=storage.base_dir, jobs=2).aggregate(days=7)
+
+        assert workers.total_sessions == serial.total_sessions == 40
+        assert workers.sessions_with_smells == 14
+        assert [s.to_dict() for s in workers.aggregated_smells] == [
+            s.to_dict() for s in serial.aggregated_smells
+        ]
+
+
+class TestJobsOption:
+    """Test ``--jobs`` validation."""
+
+    def test_daily_rejects_zero(self, capsys: pytest.CaptureFixture[str]) -> None:
+        from token_audit import cli
+
+        args = argparse.Namespace(
+            platform=None, days=7, json=False, instances=False, breakdown=False, jobs=0
+        )
+        assert cli.cmd_daily(args) == 1
+        assert "--jobs must be at least 1" in capsys.readouterr().out
+
+    def test_report_loads_with_jobs(
+        self,
+        parallel: None,
+        storage: StorageManager,
+        session_paths: List[Path],
+        capsys: pytest.CaptureFixture[str],
+    ) -> None:
+        from token_audit import cli
+
+        args = argparse.Namespace(
+            session_dir=storage.get_platform_dir("claude_code"),
+            format="json",
+            output=storage.base_dir / "report.json",
+            aggregate=False,
+            platform=None,
+            top_n=10,
+            jobs=2,
+        )
+        assert cli.cmd_report(args) == 0
+        assert "Loaded 40 session(s)" in capsys.readouterr().out
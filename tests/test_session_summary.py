@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""
+Tests for session summary sidecars.
+
+Tests:
+1. Sidecars written next to sessions by StorageManager and SessionManager
+2. Missing, stale and outdated sidecars rebuilt from the session file
+3. The session browser, SessionManager.list_sessions() and the MCP
+   list_sessions tool listing from sidecars without reading session bodies
+4. Smell trends (MCP get_trends) read from the sidecars' smell digests
+"""
+
+import json
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict
+
+import pytest
+
+from token_audit import session_summary
+from token_audit.session_summary import (
+    SUMMARY_DIR_NAME,
+    SessionSummary,
+    load_summary,
+    summary_path,
+)
+from token_audit.storage import StorageManager
+
+DAY = date(2025, 1, 15)
+
+
+@pytest.fixture
+def no_body_reads(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Fail if a session body is read while building a summary."""
+
+    def fail(path: Any) -> None:
+        raise AssertionError(f"session body read: {path}")
+
+    monkeypatch.setattr(session_summary, "read_session_file", fail)
+
+
+class TestSidecarFiles:
+    """Test writing sidecars."""
+
+    def test_written_with_session(
+        self, storage: StorageManager, make_session_data: Callable[..., Dict[str, Any]]
+    ) -> None:
+        path = storage.write_session_file("claude_code", DAY, "alpha.json", make_session_data())
+
+        sidecar = summary_path(path)
+        assert sidecar == path.parent / SUMMARY_DIR_NAME / "alpha.json"
+        summary = SessionSummary.from_dict(json.loads(sidecar.read_text()))
+        assert summary is not None
+        assert summary.matches(path.stat())
+        assert summary.schema_version == "1.7.0"
+        assert summary.project == "alpha"
+        assert summary.primary_model == "claude-opus-4-5"
+        assert summary.total_tokens == 1000
+        assert summary.cost_usd == 0.25
+        assert summary.mcp_calls == 7
+        assert summary.unique_tools == 3
+        assert summary.smells_count == 3
+        assert summary.smells == {
+            "CHATTY": {
+                "count": 2,
+                "severity": {"warning": 1, "info": 1},
+                "tools": {"mcp__zen__chat": 2},
+            },
+            "LOW_CACHE_HIT": {"count": 1, "severity": {"info": 1}, "tools": {}},
+        }
+        assert summary.accuracy_level == "estimated"
+
+    def test_sidecar_not_listed_as_session(
+        self, storage: StorageManager, make_session_data: Callable[..., Dict[str, Any]]
+    ) -> None:
+        path = storage.write_session_file("claude_code", DAY, "alpha.json", make_session_data())
+
+        assert storage.list_sessions() == [path]
+        assert storage.get_storage_stats()["total_sessions"] == 1
+        assert list(path.parent.glob("*.json")) == [path]
+
+    def test_removed_with_session(
+        self, storage: StorageManager, make_session_data: Callable[..., Dict[str, Any]]
+    ) -> None:
+        path = storage.write_session_file("claude_code", DAY, "alpha.json", make_session_data())
+
+        storage.delete_session(path)
+        assert not summary_path(path).exists()
+
+    def test_legacy_fallbacks(self, tmp_path: Path) -> None:
+        path = tmp_path / "old.json"
+        path.write_text(
+            json.dumps(
+                {
+                    "project": "legacy",
+                    "timestamp": "2025-01-15T10:00:00",
+                    "cost_estimate": 0.5,
+                    "mcp_tool_calls": {"total_calls": 3, "unique_tools": 2},
+                }
+            )
+        )
+
+        summary = load_summary(path)
+        assert summary is not None
+        assert summary.schema_version is None
+        assert summary.project == "legacy"
+        assert summary.started_at == "2025-01-15T10:00:00"
+        assert summary.cost_usd == 0.5
+        assert summary.mcp_calls == 3
+
+
+class TestRebuild:
+    """Test sidecars rebuilt on read."""
+
+    def test_missing_sidecar_rebuilt(
+        self, storage: StorageManager, make_session_data: Callable[..., Dict[str, Any]]
+    ) -> None:
+        path = storage.write_session_file("claude_code", DAY, "alpha.json", make_session_data())
+        summary_path(path).unlink()
+
+        summary = load_summary(path)
+        assert summary is not None
+        assert summary.total_tokens == 1000
+        assert summary_path(path).exists()
+
+    def test_stale_sidecar_rebuilt(
+        self, storage: StorageManager, make_session_data: Callable[..., Dict[str, Any]]
+    ) -> None:
+        path = storage.write_session_file("claude_code", DAY, "alpha.json", make_session_data())
+        path.write_text(json.dumps(make_session_data(total_tokens=2)))  # Rewritten by another tool
+
+        summary = load_summary(path)
+        assert summary is not None
+        assert summary.total_tokens == 2
+
+    def test_other_version_rebuilt(
+        self, storage: StorageManager, make_session_data: Callable[..., Dict[str, Any]]
+    ) -> None:
+        path = storage.write_session_file("claude_code", DAY, "alpha.json", make_session_data())
+        sidecar = json.loads(summary_path(path).read_text())
+        sidecar.update(version=0, total_tokens=5)
+        summary_path(path).write_text(json.dumps(sidecar))
+
+        summary = load_summary(path)
+        assert summary is not None
+        assert summary.total_tokens == 1000
+
+    def test_unreadable_session(self, tmp_path: Path) -> None:
+        path = tmp_path / "broken.json"
+        path.write_text("{not json")
+
+        assert load_summary(path) is None
+        assert load_summary(tmp_path / "missing.json") is None
+
+    def test_read_only_storage(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        make_session_data: Callable[..., Dict[str, Any]],
+    ) -> None:
+        path = tmp_path / "s.json"
+        path.write_text(json.dumps(make_session_data()))
+
+        def fail(*args: Any) -> None:
+            raise PermissionError("read-only")
+
+        monkeypatch.setattr(session_summary, "_write_sidecar", fail)
+        summary = load_summary(path)
+
+        assert summary is not None
+        assert summary.total_tokens == 1000
+        assert not summary_path(path).exists()
+
+
+class TestListings:
+    """Test list views reading sidecars only."""
+
+    def test_session_manager_list(self, tmp_path: Path, no_body_reads: None) -> None:
+        from token_audit.base_tracker import Session, TokenUsage
+        from token_audit.session_manager import SessionManager
+
+        manager = SessionManager(base_dir=tmp_path)
+        paths = []
+        for hour in (9, 11, 10):
+            session = Session(
+                project="demo",
+                platform="claude-code",
+                timestamp=datetime(2025, 11, 24, hour, 0, 0),
+                token_usage=TokenUsage(total_tokens=150),
+            )
+            paths.append(manager.save_session(session, tmp_path)["session"])
+
+        assert manager.list_sessions() == [paths[1], paths[2], paths[0]]
+
+    def test_session_browser_entry(
+        self,
+        storage: StorageManager,
+        no_body_reads: None,
+        make_session_data: Callable[..., Dict[str, Any]],
+    ) -> None:
+        from token_audit.display.session_browser import SessionBrowser
+
+        path = storage.write_session_file("claude_code", DAY, "alpha.json", make_session_data())
+        browser = SessionBrowser(storage=storage)
+
+        entry = browser._load_session_entry(path)
+        assert entry is not None
+        assert entry.project == "alpha"
+        assert entry.total_tokens == 1000
+        assert entry.cost_estimate == 0.25
+        assert entry.tool_count == 3
+        assert entry.smell_count == 3
+        assert entry.model_name == "claude-opus-4-5"
+        assert entry.accuracy_level == "estimated"
+        assert entry.is_live
+
+    @pytest.mark.requires_server
+    def test_mcp_list_sessions(
+        self,
+        storage: StorageManager,
+        monkeypatch: pytest.MonkeyPatch,
+        no_body_reads: None,
+        make_session_data: Callable[..., Dict[str, Any]],
+    ) -> None:
+        from token_audit.server import tools
+
+        storage.write_session_file("claude_code", DAY, "alpha.json", make_session_data())
+        monkeypatch.setenv("TOKEN_AUDIT_STORAGE_DIR", str(storage.base_dir))
+
+        result = tools.list_sessions(project="/home/dev/alpha")
+
+        (entry,) = result.sessions
+        assert entry.session_id == "alpha"
+        assert entry.duration_seconds == 3600
+        assert entry.model == "claude-opus-4-5"
+        assert entry.tool_calls == 7
+        assert entry.smells_detected == 3
+        assert entry.data_quality == tools.DataQuality.EXACT
+        assert tools.list_sessions(project="/elsewhere").sessions == []
+
+    @pytest.mark.requires_server
+    def test_mcp_get_trends(
+        self,
+        storage: StorageManager,
+        monkeypatch: pytest.MonkeyPatch,
+        no_body_reads: None,
+    ) -> None:
+        from token_audit.base_tracker import Session, Smell
+        from token_audit.server import tools
+        from token_audit.session_manager import SessionManager
+
+        manager = SessionManager(base_dir=storage.get_platform_dir("claude_code"))
+        now = datetime.now(timezone.utc)
+        for i in range(4):
+            session = Session(
+                project="demo", platform="claude-code", timestamp=now - timedelta(days=20 * i)
+            )
+            if i < 2:  # Only the recent half
+                session.smells = [
+                    Smell(pattern="CHATTY", severity="warning", tool="mcp__zen__chat")
+                ]
+            manager.save_session(session, manager.base_dir)
+
+        def fail(*args: Any, **kwargs: Any) -> None:
+            raise AssertionError("session body loaded")
+
+        monkeypatch.setattr(SessionManager, "load_session", fail)
+        monkeypatch.setenv("TOKEN_AUDIT_STORAGE_DIR", str(storage.base_dir))
+
+        result = tools.get_trends(period=tools.TrendPeriod.LAST_90_DAYS)
+
+        assert result.sessions_analyzed == 4
+        (trend,) = result.patterns
+        assert (trend.pattern, trend.occurrences, trend.trend) == ("CHATTY", 2, "worsening")
+        assert result.top_affected_tools == ["mcp__zen__chat"]
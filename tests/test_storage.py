@@ -7,19 +7,23 @@ Tests the standardized JSONL directory structure:
 """
 
 import json
+import os
 import tempfile
+import time
 from datetime import date, datetime
 from pathlib import Path
-from typing import Generator
+from typing import Any, Generator, Optional
 
 import pytest
 
+from token_audit import storage as storage_module
 from token_audit.storage import (
     ACTIVE_SESSION_DIR,
     FILE_LOCK_TIMEOUT,
     STORAGE_SCHEMA_VERSION,
     SUPPORTED_PLATFORMS,
     DailyIndex,
+    DirectoryListingCache,
     PlatformIndex,
     SessionIndex,
     StorageManager,
@@ -27,6 +31,7 @@ from token_audit.storage import (
     _atomic_write_json,
     _HAS_FILELOCK,
     _index_file_lock,
+    MIGRATION_JOURNAL_NAME,
     get_default_base_dir,
     migrate_all_v0_sessions,
     migrate_v0_session,
@@ -551,6 +556,142 @@ class TestIndexManagement:
         assert platform is not None
         assert "2025-11-25" in platform.dates
 
+    def test_update_indexes_for_sessions_batch(
+        self, storage: StorageManager, sample_session_index: SessionIndex
+    ) -> None:
+        """Batch update groups entries by date and replaces existing IDs."""
+        storage.update_indexes_for_session(
+            platform="claude_code",
+            session_date=date(2025, 11, 25),
+            session_index=sample_session_index,
+        )
+
+        replaced = SessionIndex.from_dict({**sample_session_index.to_dict(), "total_tokens": 5000})
+        added = SessionIndex.from_dict(
+            {**sample_session_index.to_dict(), "session_id": "other", "date": "2025-11-26"}
+        )
+        storage.update_indexes_for_sessions("claude_code", [replaced, added])
+
+        daily = storage.load_daily_index("claude_code", date(2025, 11, 25))
+        assert daily is not None
+        assert daily.session_count == 1
+        assert daily.total_tokens == 5000
+
+        platform = storage.load_platform_index("claude_code")
+        assert platform is not None
+        assert platform.dates == ["2025-11-25", "2025-11-26"]
+        assert platform.total_sessions == 2
+        assert platform.total_tokens == 7000
+        assert platform.last_session_date == "2025-11-26"
+
+    def test_update_indexes_for_sessions_empty(self, storage: StorageManager) -> None:
+        """An empty batch writes no index files."""
+        storage.update_indexes_for_sessions("claude_code", [])
+        assert storage.load_platform_index("claude_code") is None
+
+    def test_update_indexes_reads_only_session_date(
+        self,
+        storage: StorageManager,
+        sample_session_index: SessionIndex,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Platform totals are adjusted incrementally, not reloaded from every day."""
+        for day in range(1, 21):
+            entry = SessionIndex.from_dict(
+                {**sample_session_index.to_dict(), "session_id": f"s-{day}"}
+            )
+            storage.update_indexes_for_session("claude_code", date(2025, 11, day), entry)
+
+        loaded_dates = []
+        original = storage.load_daily_index
+
+        def spy(platform: str, session_date: date) -> Optional[DailyIndex]:
+            loaded_dates.append(session_date)
+            return original(platform, session_date)
+
+        monkeypatch.setattr(storage, "load_daily_index", spy)
+        updated = SessionIndex.from_dict(
+            {**sample_session_index.to_dict(), "session_id": "s-5", "total_tokens": 4000}
+        )
+        storage.update_indexes_for_session("claude_code", date(2025, 11, 5), updated)
+
+        assert loaded_dates == [date(2025, 11, 5)]
+        platform = storage.load_platform_index("claude_code")
+        assert platform is not None
+        assert platform.total_sessions == 20
+        assert platform.total_tokens == 19 * 2000 + 4000
+        assert platform.first_session_date == "2025-11-01"
+        assert platform.last_session_date == "2025-11-20"
+
+    def test_unregistered_daily_index_counted_in_full(
+        self, storage: StorageManager, sample_session_index: SessionIndex
+    ) -> None:
+        """A daily index missing from the platform index contributes all its sessions."""
+        storage.update_indexes_for_session("claude_code", date(2025, 11, 25), sample_session_index)
+        storage.get_platform_index_path("claude_code").unlink()
+
+        other = SessionIndex.from_dict({**sample_session_index.to_dict(), "session_id": "other"})
+        storage.update_indexes_for_session("claude_code", date(2025, 11, 25), other)
+
+        platform = storage.load_platform_index("claude_code")
+        assert platform is not None
+        assert platform.total_sessions == 2
+        assert platform.total_tokens == 4000
+
+    def test_rebuild_platform_index(
+        self, storage: StorageManager, sample_session_index: SessionIndex
+    ) -> None:
+        """A full recalculation repairs drifted totals and dates."""
+        for day in (24, 25):
+            entry = SessionIndex.from_dict(
+                {**sample_session_index.to_dict(), "session_id": f"s-{day}"}
+            )
+            storage.update_indexes_for_session("claude_code", date(2025, 11, day), entry)
+        drifted = storage.load_platform_index("claude_code")
+        assert drifted is not None
+        drifted.total_tokens = 1
+        drifted.dates.append("2025-11-30")
+        storage.save_platform_index(drifted)
+
+        rebuilt = storage.rebuild_platform_index("claude_code")
+
+        assert rebuilt.dates == ["2025-11-24", "2025-11-25"]
+        assert rebuilt.total_tokens == 4000
+        assert rebuilt.total_sessions == 2
+        assert storage.load_platform_index("claude_code") == rebuilt
+
+    def test_write_session_file_and_build_index(self, storage: StorageManager) -> None:
+        """Written session files produce index entries without re-reading."""
+        session_data = {
+            "_file": {"schema_version": "1.7.0"},
+            "session": {
+                "project": "demo",
+                "started_at": "2025-11-25T10:00:00+00:00",
+                "ended_at": "2025-11-25T10:30:00+00:00",
+            },
+            "token_usage": {"total_tokens": 1234},
+            "cost_estimate_usd": 0.5,
+            "mcp_summary": {"unique_tools": 3, "unique_servers": 2},
+            "generated": datetime(2025, 11, 25),  # Non-JSON type falls back to str
+        }
+        path = storage.write_session_file(
+            "claude_code", date(2025, 11, 25), "demo-2025-11-25T10-00-00.json", session_data
+        )
+
+        assert path.parent == storage.get_date_dir("claude_code", date(2025, 11, 25))
+        assert json.loads(path.read_text())["token_usage"]["total_tokens"] == 1234
+
+        index = storage.build_session_index(path, "claude_code", session_data)
+        assert index.session_id == "demo-2025-11-25T10-00-00"
+        assert index.date == "2025-11-25"
+        assert index.total_tokens == 1234
+        assert index.total_cost == 0.5
+        assert index.tool_count == 3
+        assert index.server_count == 2
+        assert index.is_complete
+        assert index.file_path == str(path.relative_to(storage.base_dir))
+        assert index.file_size_bytes == path.stat().st_size
+
 
 # =============================================================================
 # Test: Session Discovery
@@ -646,6 +787,86 @@ class TestSessionDiscovery:
         assert found is None
 
 
+class TestDirectoryListingCache:
+    """Test scandir listings cached by directory mtime."""
+
+    @staticmethod
+    def age(directory: Path) -> None:
+        """Set a directory's mtime well before now (outside the racy window)."""
+        old = time.time_ns() - 60_000_000_000
+        os.utime(directory, ns=(old, old))
+
+    def test_unchanged_directory_not_relisted(
+        self, temp_storage_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A listing is reused until the directory's mtime changes."""
+        cache = DirectoryListingCache()
+        (temp_storage_dir / "a.json").write_text("{}")
+        self.age(temp_storage_dir)
+        first = cache.list(temp_storage_dir)
+
+        scans = []
+        real_scandir = os.scandir
+
+        def counting_scandir(path: Any) -> Any:
+            scans.append(path)
+            return real_scandir(path)
+
+        monkeypatch.setattr(os, "scandir", counting_scandir)
+        assert cache.list(temp_storage_dir) == first
+        assert scans == []
+
+        (temp_storage_dir / "b.json").write_text("{}")
+        assert {e.name for e in cache.list(temp_storage_dir)} == {"a.json", "b.json"}
+        assert len(scans) == 1
+
+    def test_entries_carry_stat_info(self, temp_storage_dir: Path) -> None:
+        """Files have size and mtime; directories are flagged."""
+        (temp_storage_dir / "a.json").write_text("12345")
+        (temp_storage_dir / "2025-11-25").mkdir()
+
+        entries = {e.name: e for e in DirectoryListingCache().list(temp_storage_dir)}
+
+        assert entries["a.json"].size == 5
+        assert entries["a.json"].mtime == (temp_storage_dir / "a.json").stat().st_mtime
+        assert entries["2025-11-25"].is_dir
+        assert DirectoryListingCache().list(temp_storage_dir / "missing") == []
+
+    def test_lru_bound(self, temp_storage_dir: Path) -> None:
+        """At most max_dirs listings are kept."""
+        cache = DirectoryListingCache(max_dirs=2)
+        for name in ("a", "b", "c"):
+            (temp_storage_dir / name).mkdir()
+            cache.list(temp_storage_dir / name)
+        assert list(cache._listings) == [temp_storage_dir / "b", temp_storage_dir / "c"]
+
+    def test_in_place_write_invalidates_listing(
+        self, storage: StorageManager, sample_events: list, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Appending to a session file refreshes sizes in the scan fallback."""
+        monkeypatch.setenv("TOKEN_AUDIT_CATALOG", "off")
+        path = storage.create_session_file("claude_code", "s1", date(2025, 11, 25))
+        self.age(path.parent)
+        assert storage.get_storage_stats()["total_size_bytes"] == 0
+
+        storage.append_event(path, sample_events[0])
+
+        assert storage.get_storage_stats()["total_size_bytes"] == path.stat().st_size
+
+    def test_list_sessions_scan_sorted_by_mtime(
+        self, storage: StorageManager, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Without the catalog, sessions come newest first from the listings."""
+        monkeypatch.setenv("TOKEN_AUDIT_CATALOG", "off")
+        old = storage.create_session_file("claude_code", "old", date(2025, 11, 25))
+        new = storage.create_session_file("claude_code", "new", date(2025, 11, 24))
+        (old.parent / ".index.json").write_text("{}")
+        os.utime(old, (1_000_000, 1_000_000))
+
+        assert storage.list_sessions() == [new, old]
+        assert storage.get_storage_stats()["total_sessions"] == 2
+
+
 # =============================================================================
 # Test: Storage Statistics
 # =============================================================================
@@ -777,6 +998,94 @@ class TestMigration:
         sessions = v1_storage.list_sessions(platform="codex_cli")
         assert len(sessions) == 1
 
+    @staticmethod
+    def _make_v0_sessions(v0_dir: Path, count: int) -> None:
+        for i in range(count):
+            session_dir = v0_dir / f"proj-2025-11-{1 + i % 28:02d}-10{i:04d}"
+            session_dir.mkdir(parents=True)
+            (session_dir / "events.jsonl").write_text('{"type": "test"}\n')
+            (session_dir / "summary.json").write_text(
+                json.dumps({"project": "proj", "token_usage": {"total_tokens": 10}})
+            )
+
+    def test_migrate_all_parallel_batches_indexes(
+        self, temp_storage_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Parallel migration updates the indexes once, at the end."""
+        v0_dir = temp_storage_dir / "v0_sessions"
+        self._make_v0_sessions(v0_dir, 40)
+        v1_storage = StorageManager(base_dir=temp_storage_dir / "v1_sessions")
+        batches: list = []
+        original = StorageManager.update_indexes_for_sessions
+
+        def spy(self: StorageManager, platform: str, entries: Any) -> None:
+            batches.append(len(entries))
+            original(self, platform, entries)
+
+        monkeypatch.setattr(StorageManager, "update_indexes_for_sessions", spy)
+        results = migrate_all_v0_sessions(v0_dir, v1_storage, jobs=4, quiet=True)
+
+        assert (results["total"], results["migrated"], results["failed"]) == (40, 40, 0)
+        assert batches == [40]
+        platform_index = v1_storage.load_platform_index("claude_code")
+        assert platform_index is not None
+        assert platform_index.total_sessions == 40
+        assert platform_index.total_tokens == 400
+
+    def test_migrate_all_resumes_from_journal(
+        self, temp_storage_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """An interrupted migration resumes where it stopped without duplicating sessions."""
+        v0_dir = temp_storage_dir / "v0_sessions"
+        self._make_v0_sessions(v0_dir, 6)
+        v1_storage = StorageManager(base_dir=temp_storage_dir / "v1_sessions")
+        original = storage_module._migrate_v0_session
+
+        def flaky(session_dir: Path, *args: Any) -> Any:
+            if session_dir.name.endswith("3"):
+                raise OSError("disk went away")
+            return original(session_dir, *args)
+
+        monkeypatch.setattr(storage_module, "_migrate_v0_session", flaky)
+        first = migrate_all_v0_sessions(v0_dir, v1_storage, jobs=2, quiet=True)
+        assert (first["migrated"], first["failed"]) == (5, 1)
+        assert len((v1_storage.base_dir / MIGRATION_JOURNAL_NAME).read_text().splitlines()) == 5
+
+        calls: list = []
+
+        def counting(session_dir: Path, *args: Any) -> Any:
+            calls.append(session_dir.name)
+            return original(session_dir, *args)
+
+        monkeypatch.setattr(storage_module, "_migrate_v0_session", counting)
+        second = migrate_all_v0_sessions(v0_dir, v1_storage, jobs=2, quiet=True)
+
+        assert calls == ["proj-2025-11-04-100003"]
+        assert (second["migrated"], second["resumed"], second["failed"]) == (6, 5, 0)
+        assert not (v1_storage.base_dir / MIGRATION_JOURNAL_NAME).exists()
+        assert len(v1_storage.list_sessions(platform="claude_code")) == 6
+        daily = v1_storage.load_daily_index("claude_code", date(2025, 11, 4))
+        assert daily is not None and daily.session_count == 1
+
+    def test_migrate_all_prints_progress(
+        self, temp_storage_dir: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """A throughput and ETA line is printed to stderr."""
+        v0_dir = temp_storage_dir / "v0_sessions"
+        self._make_v0_sessions(v0_dir, 3)
+        v1_storage = StorageManager(base_dir=temp_storage_dir / "v1_sessions")
+
+        migrate_all_v0_sessions(v0_dir, v1_storage, jobs=1)
+
+        err = capsys.readouterr().err
+        assert "Migrated 3/3 sessions (" in err
+        assert "sessions/sec, ETA 0s)" in err
+
+    def test_migrate_all_rejects_zero_jobs(self, temp_storage_dir: Path) -> None:
+        v1_storage = StorageManager(base_dir=temp_storage_dir / "v1_sessions")
+        with pytest.raises(ValueError, match="jobs"):
+            migrate_all_v0_sessions(temp_storage_dir, v1_storage, jobs=0)
+
 
 # =============================================================================
 # Test: Supported Platforms
@@ -939,6 +1248,43 @@ class TestStreamingStorageSessionLifecycle:
         with pytest.raises(FileNotFoundError):
             list(streaming_storage.read_events("nonexistent"))
 
+    def test_tail_events_returns_only_new_events(self, streaming_storage: StreamingStorage) -> None:
+        """Tailing returns events appended since the previous call."""
+        session_id = "test-session"
+        streaming_storage.create_active_session(session_id)
+        streaming_storage.append_event(session_id, {"index": 0})
+
+        events, reader = streaming_storage.tail_events(session_id)
+        assert [e["index"] for e in events] == [0]
+
+        streaming_storage.append_event(session_id, {"index": 1})
+        streaming_storage.append_event(session_id, {"index": 2})
+        events, reader = streaming_storage.tail_events(session_id, reader)
+        assert [e["index"] for e in events] == [1, 2]
+
+        events, reader = streaming_storage.tail_events(session_id, reader)
+        assert events == []
+
+    def test_tail_events_holds_partial_line(self, streaming_storage: StreamingStorage) -> None:
+        """A partially written event is returned once its line is complete."""
+        session_id = "test-session"
+        path = streaming_storage.create_active_session(session_id)
+        with open(path, "a") as f:
+            f.write('{"index": ')
+
+        events, reader = streaming_storage.tail_events(session_id)
+        assert events == []
+
+        with open(path, "a") as f:
+            f.write("7}\n")
+        events, reader = streaming_storage.tail_events(session_id, reader)
+        assert events == [{"index": 7}]
+
+    def test_tail_events_nonexistent_session(self, streaming_storage: StreamingStorage) -> None:
+        """Tailing a nonexistent session should raise error."""
+        with pytest.raises(FileNotFoundError):
+            streaming_storage.tail_events("nonexistent")
+
 
 class TestStreamingStorageMoveToComplete:
     """Test moving active sessions to completed directory."""
@@ -1091,6 +1437,120 @@ class TestStreamingStorageFileLocking:
         assert len(events) == 10
 
 
+class TestStreamingStorageBufferedWriter:
+    """Test the buffered (group-commit) active session writer."""
+
+    @pytest.fixture
+    def buffered_storage(self, temp_storage_dir: Path) -> Generator[StreamingStorage, None, None]:
+        storage = StreamingStorage(base_dir=temp_storage_dir, buffered=True)
+        yield storage
+        storage.close()
+
+    def test_append_queues_until_flushed(self, buffered_storage: StreamingStorage) -> None:
+        """Appends are batched and written by flush()."""
+        path = buffered_storage.create_active_session("buffered")
+        for i in range(100):
+            buffered_storage.append_event("buffered", {"index": i})
+
+        buffered_storage.flush()
+
+        lines = path.read_bytes().splitlines()
+        assert [json.loads(line)["index"] for line in lines] == list(range(100))
+
+    def test_flush_thread_writes_batches(self, buffered_storage: StreamingStorage) -> None:
+        """Queued events reach the file without an explicit flush."""
+        path = buffered_storage.create_active_session("background")
+        buffered_storage.append_event("background", {"index": 0})
+
+        deadline = time.monotonic() + 5
+        while not path.read_bytes() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert path.read_bytes() == b'{"index":0}\n'
+
+    def test_readers_see_queued_events(self, buffered_storage: StreamingStorage) -> None:
+        """read_events and tail_events flush the session first."""
+        buffered_storage.create_active_session("reader")
+        buffered_storage.append_event("reader", {"index": 0})
+        assert [e["index"] for e in buffered_storage.read_events("reader")] == [0]
+
+        buffered_storage.append_event("reader", {"index": 1})
+        events, _ = buffered_storage.tail_events("reader")
+        assert [e["index"] for e in events] == [0, 1]
+
+    def test_append_missing_session(self, buffered_storage: StreamingStorage) -> None:
+        """Unknown sessions still raise FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            buffered_storage.append_event("missing", {"index": 0})
+
+    def test_move_to_complete_writes_queued_events(
+        self, buffered_storage: StreamingStorage, temp_storage_dir: Path
+    ) -> None:
+        """Completing a session writes its queued events and closes its file."""
+        buffered_storage.create_active_session("done")
+        buffered_storage.append_event("done", {"index": 0})
+
+        path = buffered_storage.move_to_complete(
+            "done", "claude_code", date(2025, 1, 15), {"session_id": "done"}
+        )
+
+        assert path.exists()
+        assert not buffered_storage.has_active_session("done")
+        assert "done" not in buffered_storage._handles
+
+    def test_cleanup_discards_queued_events(self, buffered_storage: StreamingStorage) -> None:
+        """cleanup_active_session drops events that were never written."""
+        path = buffered_storage.create_active_session("dropped")
+        buffered_storage.append_event("dropped", {"index": 0})
+
+        buffered_storage.cleanup_active_session("dropped")
+        buffered_storage.flush()
+
+        assert not path.exists()
+
+    def test_flushed_events_survive_for_recovery(self, temp_storage_dir: Path) -> None:
+        """Another reader sees every flushed event without close()."""
+        writer = StreamingStorage(base_dir=temp_storage_dir, buffered=True)
+        writer.create_active_session("crash")
+        for i in range(10):
+            writer.append_event("crash", {"index": i})
+        writer.flush()
+
+        recovered = StreamingStorage(base_dir=temp_storage_dir).load_all_events("crash")
+        assert [e["index"] for e in recovered] == list(range(10))
+        writer.close()
+
+    def test_fsync_per_batch(self, temp_storage_dir: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """durability="fsync" syncs once per batch, not per event."""
+        synced: list = []
+        monkeypatch.setattr(os, "fsync", synced.append)
+        storage = StreamingStorage(base_dir=temp_storage_dir, buffered=True, durability="fsync")
+        storage.create_active_session("synced")
+        with storage._pending_cond:  # Hold off the flush thread
+            for i in range(5):
+                storage.append_event("synced", {"index": i})
+
+        storage.flush()
+        storage.close()
+
+        assert len(synced) == 1
+
+    def test_settings_from_environment(
+        self, temp_storage_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """TOKEN_AUDIT_STREAM_WRITER / _DURABILITY select the writer mode."""
+        assert not StreamingStorage(base_dir=temp_storage_dir).buffered
+
+        monkeypatch.setenv("TOKEN_AUDIT_STREAM_WRITER", "buffered")
+        monkeypatch.setenv("TOKEN_AUDIT_STREAM_DURABILITY", "none")
+        storage = StreamingStorage(base_dir=temp_storage_dir)
+        assert storage.buffered
+        assert storage.durability == "none"
+
+        monkeypatch.setenv("TOKEN_AUDIT_STREAM_DURABILITY", "sometimes")
+        with pytest.raises(ValueError):
+            StreamingStorage(base_dir=temp_storage_dir)
+
+
 class TestActiveSessionDirConstant:
     """Test ACTIVE_SESSION_DIR constant."""
 
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared partial-line-safe tail reader.
+
+Tests TailReader's ability to:
+1. Yield only newline-terminated lines
+2. Buffer a trailing partial line across reads
+3. Cap memory for oversized lines
+4. Batch lines
+5. Restart after truncation or rotation
+"""
+
+from pathlib import Path
+
+from token_audit.tail_reader import TailReader
+
+
+class TestCompleteLines:
+    """Test basic line reading."""
+
+    def test_reads_complete_lines(self, tmp_path: Path) -> None:
+        path = tmp_path / "log.jsonl"
+        path.write_bytes(b'{"a": 1}\n{"b": 2}\n')
+
+        reader = TailReader(path)
+        assert reader.read_lines() == [b'{"a": 1}', b'{"b": 2}']
+        assert reader.offset == path.stat().st_size
+
+    def test_skips_blank_lines_and_carriage_returns(self, tmp_path: Path) -> None:
+        path = tmp_path / "log.jsonl"
+        path.write_bytes(b"one\r\n\n  \ntwo\n")
+
+        assert TailReader(path).read_lines() == [b"one", b"two"]
+
+    def test_starts_at_offset(self, tmp_path: Path) -> None:
+        path = tmp_path / "log.jsonl"
+        path.write_bytes(b"old\n")
+        reader = TailReader(path, offset=path.stat().st_size)
+
+        with open(path, "ab") as f:
+            f.write(b"new\n")
+        assert reader.read_lines() == [b"new"]
+
+    def test_no_new_data(self, tmp_path: Path) -> None:
+        path = tmp_path / "log.jsonl"
+        path.write_bytes(b"line\n")
+        reader = TailReader(path)
+        reader.read_lines()
+        assert reader.read_lines() == []
+
+
+class TestPartialLines:
+    """Test buffering of lines that are still being written."""
+
+    def test_partial_line_buffered_until_newline(self, tmp_path: Path) -> None:
+        path = tmp_path / "log.jsonl"
+        path.write_bytes(b'{"a": 1}\n{"b": ')
+        reader = TailReader(path)
+
+        assert reader.read_lines() == [b'{"a": 1}']
+        assert reader.offset == len(b'{"a": 1}\n')
+        assert reader.pending_bytes == len(b'{"b": ')
+
+        with open(path, "ab") as f:
+            f.write(b"2}\n")
+        assert reader.read_lines() == [b'{"b": 2}']
+        assert reader.offset == path.stat().st_size
+        assert reader.pending_bytes == 0
+
+    def test_line_split_across_chunks(self, tmp_path: Path) -> None:
+        path = tmp_path / "log.jsonl"
+        lines = [(b"x" * 50) + str(i).encode() for i in range(20)]
+        path.write_bytes(b"\n".join(lines) + b"\n")
+
+        reader = TailReader(path, chunk_size=7)
+        assert reader.read_lines() == lines
+
+    def test_final_returns_trailing_line(self, tmp_path: Path) -> None:
+        path = tmp_path / "log.jsonl"
+        path.write_bytes(b"one\ntwo")
+
+        reader = TailReader(path)
+        assert reader.read_lines(final=True) == [b"one", b"two"]
+        assert reader.offset == path.stat().st_size
+
+    def test_multibyte_character_split(self, tmp_path: Path) -> None:
+        path = tmp_path / "log.jsonl"
+        data = '{"text": "日本語"}\n'.encode()
+        path.write_bytes(data[:12])
+        reader = TailReader(path)
+        assert reader.read_lines() == []
+
+        with open(path, "ab") as f:
+            f.write(data[12:])
+        assert reader.read_lines()[0].decode("utf-8") == '{"text": "日本語"}'
+
+
+class TestMemoryCap:
+    """Test the per-line memory cap."""
+
+    def test_oversized_line_dropped(self, tmp_path: Path) -> None:
+        path = tmp_path / "log.jsonl"
+        path.write_bytes(b"small\n" + b"x" * 1000 + b"\nafter\n")
+
+        reader = TailReader(path, chunk_size=64, max_line_bytes=100)
+        assert reader.read_lines() == [b"small", b"after"]
+        assert reader.oversized_lines == 1
+        assert reader.offset == path.stat().st_size
+        assert reader.pending_bytes == 0
+
+    def test_oversized_line_across_reads(self, tmp_path: Path) -> None:
+        path = tmp_path / "log.jsonl"
+        path.write_bytes(b"x" * 500)
+        reader = TailReader(path, chunk_size=64, max_line_bytes=100)
+        assert reader.read_lines() == []
+        assert reader.pending_bytes == 0
+
+        with open(path, "ab") as f:
+            f.write(b"x" * 500 + b"\nok\n")
+        assert reader.read_lines() == [b"ok"]
+        assert reader.oversized_lines == 1
+        assert reader.offset == path.stat().st_size
+
+
+class TestBatching:
+    """Test batched output."""
+
+    def test_batches_respect_batch_size(self, tmp_path: Path) -> None:
+        path = tmp_path / "log.jsonl"
+        path.write_bytes(b"".join(b"%d\n" % i for i in range(10)))
+
+        batches = list(TailReader(path, batch_size=4).read_batches())
+        assert [len(b) for b in batches] == [4, 4, 2]
+
+
+class TestRotation:
+    """Test truncation and rotation handling."""
+
+    def test_truncation_restarts_at_zero(self, tmp_path: Path) -> None:
+        path = tmp_path / "log.jsonl"
+        path.write_bytes(b"one\ntwo\nthree\n")
+        reader = TailReader(path)
+        reader.read_lines()
+
+        path.write_bytes(b"new\n")
+        assert reader.read_lines() == [b"new"]
+        assert reader.resets == 1
+
+    def test_replaced_file_restarts_at_zero(self, tmp_path: Path) -> None:
+        path = tmp_path / "log.jsonl"
+        path.write_bytes(b"one\n")
+        reader = TailReader(path)
+        reader.read_lines()
+
+        replacement = tmp_path / "other.jsonl"
+        replacement.write_bytes(b"a\nb\nc\n")
+        replacement.replace(path)
+        assert reader.read_lines() == [b"a", b"b", b"c"]
+        assert reader.resets == 1
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+Tests for the token_cache module.
+
+Tests:
+1. LRU lookups, eviction and hit/miss counters
+2. Persistence to disk, torn records and the byte limit
+3. TokenEstimator consulting the cache (single and batch estimation)
+"""
+
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from token_audit import token_cache
+from token_audit.token_cache import MIN_CACHED_CHARS, TokenCountCache
+from token_audit.token_estimator import TokenEstimator
+
+
+class _CountingEncoding:
+    """tiktoken-like encoding that records every text it tokenizes."""
+
+    def __init__(self) -> None:
+        self.encoded: List[str] = []
+
+    def encode(self, text: str) -> List[str]:
+        self.encoded.append(text)
+        return text.split()
+
+    def encode_batch(self, texts: List[str], num_threads: int = 8) -> List[List[str]]:
+        return [self.encode(text) for text in texts]
+
+
+def _estimator(cache: TokenCountCache, encoding_name: str = "o200k_base") -> TokenEstimator:
+    estimator = TokenEstimator(use_cache=False)
+    estimator._encoding = _CountingEncoding()
+    estimator._encoding_name = encoding_name
+    estimator._is_fallback = False
+    estimator._cache = cache
+    return estimator
+
+
+LONG_TEXT = "word " * MIN_CACHED_CHARS
+
+
+class TestTokenCountCache:
+    """Test the in-memory LRU."""
+
+    def test_get_put_and_counters(self) -> None:
+        cache = TokenCountCache()
+        key = cache.key("o200k_base", "hello")
+
+        assert cache.get(key) is None
+        cache.put(key, 7)
+        assert cache.get(key) == 7
+        assert cache.hits == 1
+        assert cache.misses == 1
+        assert cache.hit_rate == 0.5
+        assert cache.stats()["entries"] == 1
+
+    def test_key_includes_encoding(self) -> None:
+        assert TokenCountCache.key("o200k_base", "x") != TokenCountCache.key("cl100k_base", "x")
+        assert TokenCountCache.key("o200k_base", "x") == TokenCountCache.key("o200k_base", "x")
+
+    def test_key_accepts_lone_surrogates(self) -> None:
+        assert len(TokenCountCache.key("o200k_base", "\ud800")) == 16
+
+    def test_evicts_least_recently_used(self) -> None:
+        cache = TokenCountCache(max_entries=2)
+        a, b, c = (cache.key("e", t) for t in "abc")
+        cache.put(a, 1)
+        cache.put(b, 2)
+        cache.get(a)  # a is now more recent than b
+        cache.put(c, 3)
+
+        assert len(cache) == 2
+        assert cache.get(b) is None
+        assert cache.get(a) == 1
+        assert cache.get(c) == 3
+
+
+class TestDiskCache:
+    """Test persistence to the on-disk file."""
+
+    def test_round_trip(self, tmp_path: Path) -> None:
+        path = tmp_path / "cache" / "counts.bin"
+        cache = TokenCountCache(path=path)
+        key = cache.key("o200k_base", "persisted")
+        cache.put(key, 42)
+        cache.flush()
+
+        reopened = TokenCountCache(path=path)
+        assert reopened.get(key) == 42
+        assert reopened.hits == 1
+
+    def test_torn_record_ignored(self, tmp_path: Path) -> None:
+        path = tmp_path / "counts.bin"
+        cache = TokenCountCache(path=path)
+        key = cache.key("o200k_base", "whole")
+        cache.put(key, 5)
+        cache.flush()
+        with open(path, "ab") as f:
+            f.write(b"\x01\x02\x03")
+
+        assert TokenCountCache(path=path).get(key) == 5
+
+    def test_loads_newest_entries_only(self, tmp_path: Path) -> None:
+        path = tmp_path / "counts.bin"
+        cache = TokenCountCache(path=path)
+        keys = [cache.key("e", str(i)) for i in range(10)]
+        for i, key in enumerate(keys):
+            cache.put(key, i)
+        cache.flush()
+
+        small = TokenCountCache(max_entries=3, path=path)
+        assert small.get(keys[9]) == 9
+        assert small.get(keys[0]) is None
+        assert len(small) == 3
+
+    def test_file_bounded_by_bytes(self, tmp_path: Path) -> None:
+        path = tmp_path / "counts.bin"
+        cache = TokenCountCache(path=path, max_disk_bytes=400)
+        keys = [cache.key("e", str(i)) for i in range(100)]
+        for i, key in enumerate(keys):
+            cache.put(key, i)
+            cache.flush()
+
+        assert path.stat().st_size <= 400
+        assert TokenCountCache(path=path).get(keys[-1]) == 99
+
+    def test_memory_only_flush_is_noop(self, tmp_path: Path) -> None:
+        cache = TokenCountCache()
+        cache.put(cache.key("e", "x"), 1)
+        cache.flush()
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestDefaultCache:
+    """Test get_default_cache() environment handling."""
+
+    @pytest.mark.parametrize(
+        "mode,expected_path", [("", None), ("memory", None), ("disk", "default")]
+    )
+    def test_modes(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path, mode: str, expected_path: object
+    ) -> None:
+        monkeypatch.setattr(token_cache, "_default_cache", None)
+        monkeypatch.setattr(token_cache, "_default_cache_created", False)
+        monkeypatch.setattr(token_cache, "default_cache_path", lambda: tmp_path / "c.bin")
+        monkeypatch.setattr(token_cache.atexit, "register", lambda fn: fn)
+        monkeypatch.setenv(token_cache.TOKEN_CACHE_ENV_VAR, mode)
+
+        cache = token_cache.get_default_cache()
+        assert cache is not None
+        assert cache is token_cache.get_default_cache()
+        assert cache.path == (None if expected_path is None else tmp_path / "c.bin")
+
+    def test_off(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(token_cache, "_default_cache", None)
+        monkeypatch.setattr(token_cache, "_default_cache_created", False)
+        monkeypatch.setenv(token_cache.TOKEN_CACHE_ENV_VAR, "off")
+
+        assert token_cache.get_default_cache() is None
+        assert TokenEstimator(use_cache=True).cache is None
+
+
+class TestEstimatorCache:
+    """Test TokenEstimator lookups through the cache."""
+
+    def test_large_text_tokenized_once(self) -> None:
+        cache = TokenCountCache()
+        estimator = _estimator(cache)
+
+        first = estimator.estimate_tokens(LONG_TEXT)
+        second = estimator.estimate_tokens(LONG_TEXT)
+
+        assert first == second == MIN_CACHED_CHARS
+        assert estimator._encoding.encoded == [LONG_TEXT]
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_short_text_bypasses_cache(self) -> None:
+        cache = TokenCountCache()
+        estimator = _estimator(cache)
+
+        estimator.estimate_tokens("short text")
+        estimator.estimate_tokens("short text")
+
+        assert len(estimator._encoding.encoded) == 2
+        assert (cache.hits, cache.misses) == (0, 0)
+
+    def test_encodings_do_not_share_counts(self) -> None:
+        cache = TokenCountCache()
+        _estimator(cache, "o200k_base").estimate_tokens(LONG_TEXT)
+        other = _estimator(cache, "cl100k_base")
+        other.estimate_tokens(LONG_TEXT)
+
+        assert other._encoding.encoded == [LONG_TEXT]
+
+    def test_fallback_mode_not_cached(self) -> None:
+        cache = TokenCountCache()
+        estimator = _estimator(cache)
+        estimator._encoding = None
+        estimator._is_fallback = True
+
+        estimator.estimate_tokens(LONG_TEXT)
+        assert len(cache) == 0
+
+    def test_batch_uses_and_fills_cache(self) -> None:
+        cache = TokenCountCache()
+        estimator = _estimator(cache)
+        estimator.estimate_tokens(LONG_TEXT)
+        other_text = "other " * MIN_CACHED_CHARS
+
+        counts = estimator.estimate_tokens_batch([LONG_TEXT, other_text, "tiny"])
+
+        assert counts == [MIN_CACHED_CHARS, MIN_CACHED_CHARS, 1]
+        assert estimator._encoding.encoded == [LONG_TEXT, other_text, "tiny"]
+        assert estimator.estimate_tokens(other_text) == MIN_CACHED_CHARS
+        assert cache.hits == 2
@@ -239,6 +239,94 @@ class TestFallbackMode:
         assert tokens >= 1
 
 
+class _SplitEncoding:
+    """tiktoken-like encoding counting whitespace-separated words."""
+
+    def __init__(self):
+        self.batches = []
+
+    def encode(self, text):
+        if "<|endoftext|>" in text:
+            raise ValueError("special token")
+        return text.split()
+
+    def encode_batch(self, texts, num_threads=8):
+        self.batches.append(list(texts))
+        return [self.encode(text) for text in texts]
+
+
+class _SplitProcessor:
+    """SentencePiece-like processor counting whitespace-separated words."""
+
+    def __init__(self):
+        self.batches = []
+
+    def EncodeAsIds(self, text):
+        return text.split()
+
+    def Encode(self, input, out_type=int, num_threads=None):
+        self.batches.append(list(input))
+        return [text.split() for text in input]
+
+
+class TestBatchEstimation:
+    """Test estimate_tokens_batch and estimate_tool_calls_batch."""
+
+    TEXTS = ["one two three", "", "four", "five six"]
+
+    def _estimator(self, encoding=None, processor=None):
+        estimator = TokenEstimator()
+        estimator._is_fallback = encoding is None and processor is None
+        estimator._encoding = encoding
+        estimator._sp_processor = processor
+        return estimator
+
+    def test_tiktoken_single_batch_call(self):
+        encoding = _SplitEncoding()
+        estimator = self._estimator(encoding=encoding)
+
+        assert estimator.estimate_tokens_batch(self.TEXTS) == [3, 0, 1, 2]
+        # Empty strings never reach the tokenizer
+        assert encoding.batches == [["one two three", "four", "five six"]]
+
+    def test_sentencepiece_single_batch_call(self):
+        processor = _SplitProcessor()
+        estimator = self._estimator(processor=processor)
+
+        assert estimator.estimate_tokens_batch(self.TEXTS) == [3, 0, 1, 2]
+        assert len(processor.batches) == 1
+
+    def test_matches_per_text_estimates(self):
+        for estimator in (
+            self._estimator(encoding=_SplitEncoding()),
+            self._estimator(processor=_SplitProcessor()),
+            self._estimator(),
+        ):
+            expected = [estimator.estimate_tokens(text) for text in self.TEXTS]
+            assert estimator.estimate_tokens_batch(self.TEXTS) == expected
+
+    def test_batch_error_falls_back_per_text(self):
+        """A text the batch rejects is counted the way estimate_tokens() counts it."""
+        estimator = self._estimator(encoding=_SplitEncoding())
+        texts = ["a b", "x <|endoftext|> y"]
+
+        assert estimator.estimate_tokens_batch(texts) == [
+            estimator.estimate_tokens(text) for text in texts
+        ]
+
+    def test_empty_batch(self):
+        assert self._estimator(encoding=_SplitEncoding()).estimate_tokens_batch([]) == []
+
+    def test_tool_calls_batch_matches_estimate_tool_call(self):
+        estimator = self._estimator(encoding=_SplitEncoding())
+        calls = [('{"q": "a b"}', "r1 r2 r3"), (None, None), ("", "out")]
+
+        assert estimator.estimate_tool_calls_batch(calls) == [
+            estimator.estimate_tool_call(args, result) for args, result in calls
+        ]
+        assert estimator.estimate_tool_calls_batch(calls, include_overhead=False)[1] == (0, 0)
+
+
 class TestModuleLevelFunctions:
     """Test module-level convenience functions."""
 